@@ -1,17 +1,19 @@
 from fastapi import APIRouter, HTTPException, Request, Header, Depends
 from fastapi.responses import JSONResponse, StreamingResponse
 from datetime import datetime
+import asyncio
 import uuid
 import time
 import os
 import hashlib
 import json as json_module
-from typing import Optional, Dict, Any
+from typing import Annotated, Optional, Dict, Any
 from collections import OrderedDict
 from threading import Lock
 
 from src.core.config import config
 from src.core.logging import logger
+from src.services.logging.hot_log import get_hot_logger
 from src.core.client import OpenAIClient, VibeProxyUnavailableError
 from src.core.fusion import (
     apply_fusion_to_openai_request,
@@ -20,6 +22,9 @@ from src.core.fusion import (
 )
 from src.models.claude import ClaudeMessagesRequest, ClaudeTokenCountRequest
 from src.services.conversion.request_converter import convert_claude_to_openai
+from src.services.conversion.image_store import image_store
+from src.services.conversion.prompt_prefix import prompt_prefix
+from src.services.conversion.tool_output_compactor import tool_output_compactor
 from src.services.conversion.response_converter import (
     convert_openai_to_claude_response,
     convert_openai_streaming_to_claude_with_cancellation,
@@ -31,6 +36,14 @@ from src.services.models.provider_detector import validate_provider_configuratio
 # usage_tracker logging moved to client for per-attempt metrics (T072, T073)
 from src.services.usage.model_limits import check_model_limits
 from src.services.usage.usage_tracker import usage_tracker
+from src.services.single_flight import single_flight
+from src.services.tools.tool_pipeline import tool_pipeline
+from src.core.stage_timing import observe_stage, stage_start, time_stream_translation
+from src.api.request_parser import (
+    ENABLED as FAST_REQUEST_PARSE,
+    parse_messages_request,
+    request_parser,
+)
 from src.services.models.model_filter import filter_models
 from src.services.prompts.prompt_injection_middleware import inject_system_prompts
 from src.services.usage.model_limits import get_model_limits
@@ -47,15 +60,19 @@ from src.models.crosstalk import (
     CrosstalkError,
 )
 
+hot_log = get_hot_logger(logger)
+
 # Request snapshot dependency for in-flight config isolation (T056)
 from src.core.config_resolver import get_resolver, set_snapshot, reset_snapshot
 
 
 async def config_snapshot_dep():
     """Capture a config snapshot at request entry and install it for the request context."""
+    start = stage_start()
     resolver = get_resolver()
     snap = resolver.snapshot()
     token = set_snapshot(snap)
+    observe_stage("config_snapshot", start)
     try:
         yield
     finally:
@@ -111,13 +128,34 @@ class RequestDeduplicator:
     When Claude Code retries a request (e.g., after malformed tool call response),
     this prevents processing the same request multiple times and causing duplicate
     terminal output.
+
+    - Entries are kept in arrival order, so expiry pops from the front until the
+      oldest entry is fresh instead of scanning the whole cache.
+    - Message hashing is incremental per session: the messages, their digests
+      and a running digest are kept per (session, client). A message that is
+      the same object as last time (the fast request parser reuses validated
+      messages) reuses its digest, so only new or replaced turns are hashed;
+      the running digest is resumed only when every earlier digest still
+      matches, otherwise it is rebuilt.
+    - Identical non-streaming requests that arrive while the first one is still
+      running await the first one's result instead of calling the provider again.
     """
 
-    def __init__(self, window_seconds: float = 5.0, max_cache_size: int = 100):
+    def __init__(
+        self,
+        window_seconds: float = 5.0,
+        max_cache_size: int = 100,
+        max_sessions: int = 256,
+    ):
         self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self._lock = Lock()
         self._window_seconds = window_seconds
         self._max_cache_size = max_cache_size
+        # (session fingerprint, client ip) -> incremental conversation digest
+        self._sessions: OrderedDict[tuple, Dict[str, Any]] = OrderedDict()
+        self._max_sessions = max_sessions
+        # request hash -> future resolved with the first request's response
+        self._in_flight: Dict[str, "asyncio.Future"] = {}
 
     def _extract_session_fingerprint(self, request: "ClaudeMessagesRequest") -> str:
         """Extract a stable per-session fingerprint from Claude Code metadata."""
@@ -139,6 +177,87 @@ class RequestDeduplicator:
 
         return "unknown-session"
 
+    @staticmethod
+    def _message_digest(msg: Any) -> bytes:
+        """Digest of the retry-relevant parts of one message."""
+        content_parts = [getattr(msg, "role", "")]
+        content = getattr(msg, "content", None)
+        if isinstance(content, str):
+            content_parts.append(content[:400])
+        elif isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict):
+                    block_type = block.get("type", "")
+                    content_parts.append(block_type)
+                    if block_type == "text":
+                        text = block.get("text", "")
+                        if text:
+                            content_parts.append(text[:200])
+                    if block_type == "tool_use":
+                        content_parts.append(block.get("id", ""))
+                        content_parts.append(block.get("name", ""))
+                    if block_type == "tool_result":
+                        content_parts.append(block.get("tool_use_id", ""))
+                else:
+                    block_type = getattr(block, "type", "")
+                    content_parts.append(block_type)
+                    if block_type == "text":
+                        text = getattr(block, "text", "")
+                        if text:
+                            content_parts.append(text[:200])
+                    if block_type == "tool_use":
+                        content_parts.append(getattr(block, "id", ""))
+                        content_parts.append(getattr(block, "name", ""))
+                    if block_type == "tool_result":
+                        content_parts.append(getattr(block, "tool_use_id", ""))
+        return hashlib.blake2b(
+            "|".join(str(x) for x in content_parts).encode(), digest_size=16
+        ).digest()
+
+    def _messages_digest(self, session_key: tuple, messages: list) -> str:
+        """Running digest over ``messages``, reusing this session's previous state.
+
+        Messages are never mutated in place after parsing, so one that is the
+        same object at the same position as on the session's last request keeps
+        its stored digest. The stored running hash is resumed only when every
+        previously recorded digest still matches (an edited middle message
+        forces a rehash).
+        """
+        with self._lock:
+            state = self._sessions.get(session_key)
+            if state is not None:
+                self._sessions.move_to_end(session_key)
+
+        seen_messages = state["messages"] if state is not None else []
+        seen_digests = state["digests"] if state is not None else []
+        digests = [
+            seen_digests[i]
+            if i < len(seen_messages) and seen_messages[i] is msg
+            else self._message_digest(msg)
+            for i, msg in enumerate(messages)
+        ]
+
+        seen = len(seen_digests)
+        if seen and seen <= len(digests) and digests[:seen] == seen_digests:
+            running = state["running"].copy()
+        else:
+            running = hashlib.sha256()
+            seen = 0
+        for digest in digests[seen:]:
+            running.update(digest)
+
+        if digests:
+            with self._lock:
+                self._sessions[session_key] = {
+                    "messages": list(messages),
+                    "digests": digests,
+                    "running": running.copy(),
+                }
+                self._sessions.move_to_end(session_key)
+                while len(self._sessions) > self._max_sessions:
+                    self._sessions.popitem(last=False)
+        return running.hexdigest()
+
     def _compute_hash(
         self, request: "ClaudeMessagesRequest", client_ip: str = "unknown"
     ) -> str:
@@ -161,45 +280,25 @@ class RequestDeduplicator:
             tool_names = [getattr(tool, "name", "") for tool in request.tools]
             content_parts.append(",".join(tool_names))
 
-        for msg in request.messages:
-            content_parts.append(getattr(msg, "role", ""))
-            if hasattr(msg, "content"):
-                content = msg.content
-                if isinstance(content, str):
-                    content_parts.append(content[:400])
-                elif isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict):
-                            block_type = block.get("type", "")
-                            content_parts.append(block_type)
-                            if block_type == "text":
-                                text = block.get("text", "")
-                                if text:
-                                    content_parts.append(text[:200])
-                            if block_type == "tool_use":
-                                content_parts.append(block.get("id", ""))
-                                content_parts.append(block.get("name", ""))
-                            if block_type == "tool_result":
-                                content_parts.append(block.get("tool_use_id", ""))
-                        else:
-                            block_type = getattr(block, "type", "")
-                            content_parts.append(block_type)
-                            if block_type == "text":
-                                text = getattr(block, "text", "")
-                                if text:
-                                    content_parts.append(text[:200])
-                            if block_type == "tool_use":
-                                content_parts.append(getattr(block, "id", ""))
-                                content_parts.append(getattr(block, "name", ""))
-                            if block_type == "tool_result":
-                                content_parts.append(getattr(block, "tool_use_id", ""))
+        content_parts.append(
+            self._messages_digest((session_fingerprint, client_ip), request.messages)
+        )
 
         content_str = "|".join(str(x) for x in content_parts)
         return hashlib.sha256(content_str.encode()).hexdigest()[:16]
 
+    def _expire(self, now: float) -> None:
+        """Drop entries older than the window. Caller holds the lock."""
+        cache = self._cache
+        while cache:
+            oldest = next(iter(cache))
+            if now - cache[oldest]["timestamp"] <= self._window_seconds:
+                break
+            del cache[oldest]
+
     def check_duplicate(
         self, request: "ClaudeMessagesRequest", client_ip: str = "unknown"
-    ) -> tuple[bool, str, Optional[Dict]]:
+    ) -> tuple[bool, str, Optional[Any]]:
         """
         Check if request is a duplicate within the time window.
         Uses client IP to distinguish between different sessions.
@@ -209,50 +308,63 @@ class RequestDeduplicator:
             client_ip: Client IP address to include in hash for session isolation
 
         Returns:
-            (is_duplicate, request_hash, cached_response or None)
+            (is_duplicate, request_hash, cached_response or None). For a
+            non-streaming request identical to one still in flight, the third
+            element is an ``asyncio.Future`` resolving to that request's
+            response (or None if it failed) — see ``wait_for``.
         """
         request_hash = self._compute_hash(request, client_ip)
-        current_time = time.time()
+        current_time = time.monotonic()
+        streaming = bool(getattr(request, "stream", False))
 
         with self._lock:
-            # Clean expired entries
-            expired = []
-            for h, data in self._cache.items():
-                if current_time - data["timestamp"] > self._window_seconds:
-                    expired.append(h)
-            for h in expired:
-                del self._cache[h]
+            self._expire(current_time)
 
             # Check if this request is in cache
-            if request_hash in self._cache:
-                cached = self._cache[request_hash]
+            cached = self._cache.get(request_hash)
+            if cached is not None:
                 age = current_time - cached["timestamp"]
-
-                if age < self._window_seconds:
-                    # Only treat as duplicate if we have a cached response
-                    # Streaming requests should NOT be deduplicated
-                    if cached.get("response") and not getattr(request, "stream", False):
-                        cached["count"] += 1
-                        logger.warning(
-                            f"Duplicate request detected (hash={request_hash[:8]}, "
-                            f"count={cached['count']}, age={age:.2f}s)"
-                        )
-                        return True, request_hash, cached.get("response")
-                    # No cached response yet - request is still processing
-                    # Log but don't block - let it through
-                    logger.debug(
-                        f"Request {request_hash[:8]} similar to in-flight request "
-                        f"(age={age:.2f}s, count={cached['count']}) - allowing"
+                # Only treat as duplicate if we have a cached response
+                # Streaming requests should NOT be deduplicated
+                if cached.get("response") and not streaming:
+                    cached["count"] += 1
+                    logger.warning(
+                        f"Duplicate request detected (hash={request_hash[:8]}, "
+                        f"count={cached['count']}, age={age:.2f}s)"
                     )
+                    return True, request_hash, cached.get("response")
+
+            if not streaming:
+                pending = self._in_flight.get(request_hash)
+                if pending is not None and not pending.done():
+                    logger.warning(
+                        f"Duplicate request detected (hash={request_hash[:8]}) "
+                        f"while original is in flight - awaiting its response"
+                    )
+                    return True, request_hash, pending
+                try:
+                    self._in_flight[request_hash] = (
+                        asyncio.get_running_loop().create_future()
+                    )
+                except RuntimeError:
+                    pass  # no event loop (sync caller) - nothing to coalesce onto
+
+            if cached is not None:
+                # No cached response yet - request is still processing
+                # Log but don't block - let it through
+                hot_log.debug(
+                    "Request %s similar to in-flight request (age=%.2fs, count=%s) - allowing",
+                    request_hash[:8],
+                    current_time - cached["timestamp"],
+                    cached["count"],
+                )
 
-            # Not a duplicate, add to cache
+            # Not a duplicate, add to cache (re-inserting keeps arrival order)
             self._cache[request_hash] = {
                 "timestamp": current_time,
                 "count": 1,
                 "response": None,
             }
-
-            # Move to end (most recent)
             self._cache.move_to_end(request_hash)
 
             # Trim cache if too large
@@ -261,11 +373,28 @@ class RequestDeduplicator:
 
             return False, request_hash, None
 
+    async def wait_for(self, pending: "asyncio.Future") -> Optional[Dict]:
+        """Await an in-flight original; None means it failed and the caller should proceed."""
+        try:
+            return await asyncio.shield(pending)
+        except Exception:
+            return None
+
     def cache_response(self, request_hash: str, response: Dict):
         """Cache a response for potential duplicate requests."""
         with self._lock:
             if request_hash in self._cache:
                 self._cache[request_hash]["response"] = response
+            pending = self._in_flight.pop(request_hash, None)
+        if pending is not None and not pending.done():
+            pending.set_result(response)
+
+    def release(self, request_hash: str):
+        """Finish an in-flight request; waiters not served by cache_response get None."""
+        with self._lock:
+            pending = self._in_flight.pop(request_hash, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
 
 
 # Global deduplicator instance
@@ -332,6 +461,32 @@ openai_client = OpenAIClient(
 openai_client.configure_per_model_clients(config)
 
 
+def _coalesce_key(
+    openai_request: Dict[str, Any],
+    kind: str,
+    tier: str,
+    api_key: Optional[str],
+    endpoint: Optional[str],
+    client: Any,
+    assignment_id: Optional[str],
+) -> str:
+    """Single-flight key: identical bodies only coalesce on the same upstream.
+
+    The endpoint can come from a use-case route, profile, binding or
+    OpenRouter override; the client's own base URL also covers overrides
+    (e.g. the headroom bypass) that do not update ``endpoint``.
+    """
+    return single_flight.key(
+        openai_request,
+        kind,
+        tier,
+        api_key,
+        endpoint or "",
+        getattr(client, "default_base_url", "") or "",
+        assignment_id or "",
+    )
+
+
 @router.post("/api/proxy/reload-models")
 async def reload_model_scan_bindings():
     """Reload model-scan snapshot bindings into assignments and profile overlays."""
@@ -385,8 +540,6 @@ async def model_scan_probe():
     Probes whatever the request path would currently route to (the active overlay). Endpoint/key
     are gap-filled from the provider registry; missing providers are reported, not probed.
     """
-    import asyncio
-
     from src.core.model_scan_runtime import get_active_binding
     from src.services.probe_runtime import probe_targets, targets_from_binding
 
@@ -423,15 +576,15 @@ async def validate_and_extract_api_key(
     # Extract Anthropic API key from headers (for Claude client validation)
     if x_api_key:
         client_api_key = x_api_key
-        logger.debug(f"API key from x-api-key header: {client_api_key[:8]}...")
+        hot_log.debug("API key from x-api-key header: %s...", client_api_key[:8])
     elif authorization and authorization.startswith("Bearer "):
         client_api_key = authorization.replace("Bearer ", "")
-        logger.debug(f"API key from Authorization header: {client_api_key[:8]}...")
+        hot_log.debug("API key from Authorization header: %s...", client_api_key[:8])
 
     # Extract OpenAI API key from headers (for passthrough mode)
     if openai_api_key:
         openai_key = openai_api_key
-        logger.debug(f"OpenAI API key from header: {openai_key[:8]}...")
+        hot_log.debug("OpenAI API key from header: %s...", openai_key[:8])
 
     # Passthrough mode: Require OpenAI API key from user
     if config.passthrough_mode:
@@ -448,7 +601,7 @@ async def validate_and_extract_api_key(
                 detail="Invalid OpenAI API key format. Key must start with 'sk-' and be at least 20 characters",
             )
 
-        logger.debug("Passthrough mode: OpenAI API key validated")
+        hot_log.debug("Passthrough mode: OpenAI API key validated")
         return openai_key
 
     # Proxy mode: Validate Anthropic client key if configured
@@ -461,15 +614,23 @@ async def validate_and_extract_api_key(
                 status_code=401,
                 detail="Invalid API key. Please provide a valid Anthropic API key.",
             )
-        logger.debug("Proxy mode: Anthropic API key validation passed")
+        hot_log.debug("Proxy mode: Anthropic API key validation passed")
 
     return None  # Proxy mode: use server-configured API key
 
 
+# FAST_REQUEST_PARSE swaps FastAPI's body validation for the incremental
+# parser in src/api/request_parser.py (validated messages reused by hash).
+if FAST_REQUEST_PARSE:
+    MessagesRequestBody = Annotated[ClaudeMessagesRequest, Depends(parse_messages_request)]
+else:
+    MessagesRequestBody = ClaudeMessagesRequest
+
+
 @router.post("/p/{profile}/v1/messages")
 async def create_message_with_profile(
     profile: str,
-    request: ClaudeMessagesRequest,
+    request: MessagesRequestBody,
     http_request: Request,
     openai_api_key: Optional[str] = Depends(validate_and_extract_api_key),
     _snapshot: Any = Depends(config_snapshot_dep),
@@ -495,13 +656,15 @@ async def create_message_with_profile(
 
 @router.post("/v1/messages")
 async def create_message(
-    request: ClaudeMessagesRequest,
+    request: MessagesRequestBody,
     http_request: Request,
     openai_api_key: Optional[str] = Depends(validate_and_extract_api_key),
     _snapshot: Any = Depends(config_snapshot_dep),
 ):
     # Log full request for debugging
     await log_request_body(http_request)
+    # 1-in-N requests emit their hot-path debug lines at INFO (LOG_DEBUG_SAMPLE_RATE)
+    hot_log.begin_request()
 
     request_start_time = time.time()
     request_id = str(uuid.uuid4())
@@ -520,6 +683,10 @@ async def create_message(
         is_duplicate, request_hash, cached_response = (
             request_deduplicator.check_duplicate(request, client_ip)
         )
+        if is_duplicate and isinstance(cached_response, asyncio.Future):
+            # Identical non-streaming request in flight: share its upstream call
+            cached_response = await request_deduplicator.wait_for(cached_response)
+            request_hash = None  # the original owns the cache entry
         if is_duplicate and cached_response:
             # Return cached response for duplicate non-streaming request
             logger.info(
@@ -528,11 +695,13 @@ async def create_message(
             return JSONResponse(content=cached_response)
 
     try:
-        logger.debug(
-            f"Processing Claude request: model={request.model}, stream={request.stream}"
+        hot_log.debug(
+            "Processing Claude request: model=%s, stream=%s",
+            request.model,
+            request.stream,
         )
-        logger.debug(f"Request ID: {request_id}")
-        logger.debug("Request deduplication check passed")
+        hot_log.debug("Request ID: %s", request_id)
+        hot_log.debug("Request deduplication check passed")
 
         # Parse model to get routing info and reasoning config
         routed_model, reasoning_config = model_manager.parse_and_map_model(
@@ -578,9 +747,11 @@ async def create_message(
                 routed_model = config.big_model  # Use big model on the default provider
 
         # Convert Claude request to OpenAI format with provider-specific transformations
+        _stage_t = stage_start()
         openai_request = convert_claude_to_openai(
             request, model_manager, target_provider=provider
         )
+        observe_stage("conversion", _stage_t)
 
         # Update the openai_request with the routed model
         openai_request["model"] = routed_model
@@ -838,8 +1009,8 @@ async def create_message(
         # Log API configuration — INFO emits a single line per request showing
         # the auth method used. This is the line you want when diagnosing 401s
         # like the cldo-OAuth-missing failure mode (was silent before).
-        logger.debug(f"Request {request_id}: Routing to endpoint: {endpoint}")
-        logger.debug(f"Request {request_id}: Using model: {routed_model}")
+        hot_log.debug("Request %s: Routing to endpoint: %s", request_id, endpoint)
+        hot_log.debug("Request %s: Using model: %s", request_id, routed_model)
 
         # Determine and log auth method (visible at INFO level)
         _auth_method = "NO KEY"
@@ -926,7 +1097,7 @@ async def create_message(
                 return None
             except Exception as e:
                 # If workspace extraction fails, just return None - don't break the request
-                logger.debug(f"Workspace name extraction failed: {e}")
+                hot_log.debug("Workspace name extraction failed: %s", e)
                 return None
 
         # Separate stable header (system + tools — identical every turn in a session)
@@ -947,13 +1118,9 @@ async def create_message(
                         if not workspace_name and block.text:
                             workspace_name = extract_workspace_name(block.text)
 
-        # Append tool schema text to stable portion (same every turn)
-        if request.tools:
-            import json as _json
-            stable_text += _json.dumps([
-                {"name": t.name, "desc": t.description or ""}
-                for t in request.tools if t.name
-            ], separators=(",", ":"))
+        # Tool header tokens (same every turn) are counted once per tool set
+        _stage_t = stage_start()
+        tool_tokens = tool_pipeline.token_count(request.tools) if request.tools else 0
 
         variable_text = ""
         for msg in request.messages:
@@ -974,7 +1141,8 @@ async def create_message(
         # Count tokens: stable portion hits the LRU cache every turn after turn 1;
         # variable portion (new messages) is always encoded fresh.
         from src.services.token_cache import count_tokens
-        input_tokens = count_tokens(stable_text) + count_tokens(variable_text)
+        input_tokens = count_tokens(stable_text) + tool_tokens + count_tokens(variable_text)
+        observe_stage("token_count", _stage_t)
 
         # ── Semantic dedup cache ──────────────────────────────────────────────
         # Only for non-streaming requests — streaming responses are generators,
@@ -1079,9 +1247,11 @@ async def create_message(
                     _direct_url,
                     config.request_timeout,
                 )
-                logger.debug(
-                    f"Headroom bypass: {input_tokens} tks < threshold {_bypass_threshold} "
-                    f"→ direct to {_direct_url}"
+                hot_log.debug(
+                    "Headroom bypass: %s tks < threshold %s → direct to %s",
+                    input_tokens,
+                    _bypass_threshold,
+                    _direct_url,
                 )
         # ─────────────────────────────────────────────────────────────────────
 
@@ -1155,7 +1325,7 @@ async def create_message(
 
         if request.stream:
             # Streaming response - wrap in error handling
-            logger.debug(f"Starting streaming response for request_id: {request_id}")
+            hot_log.debug("Starting streaming response for request_id: %s", request_id)
             try:
                 active_openai_client = custom_client if custom_client else openai_client
                 tier = openai_request.pop("_force_tier", None) or (
@@ -1167,26 +1337,44 @@ async def create_message(
                     "middle": getattr(config, "middle_enabled", True),
                     "small": getattr(config, "small_enabled", True),
                 }.get(tier, True)
-                if config.model_cascade and tier and tier_enabled:
-                    openai_stream = (
-                        active_openai_client.create_chat_completion_stream_with_cascade(
+                use_cascade = bool(config.model_cascade and tier and tier_enabled)
+
+                # The shared upstream gets its own id: this client's disconnect
+                # must not cancel it for other subscribers.
+                upstream_request_id = single_flight.shared_request_id(request_id)
+
+                def _open_stream():
+                    if use_cascade:
+                        return active_openai_client.create_chat_completion_stream_with_cascade(
                             openai_request,
                             tier=tier,
                             config=config,
-                            request_id=request_id,
+                            request_id=upstream_request_id,
                             api_key=active_api_key,
                         )
-                    )
-                else:
-                    openai_stream = active_openai_client.create_chat_completion_stream(
+                    return active_openai_client.create_chat_completion_stream(
                         openai_request,
-                        request_id=request_id,
+                        request_id=upstream_request_id,
                         config=config,
                         api_key=active_api_key,
                         assignment_id=assignment_id,
                         incoming_identifier=incoming_identifier,
                     )
-                logger.debug(f"OpenAI stream created for request_id: {request_id}")
+
+                # Identical concurrent streams share one upstream call (teed, with replay)
+                openai_stream = single_flight.stream(
+                    _coalesce_key(
+                        openai_request,
+                        "stream",
+                        tier if use_cascade else "",
+                        active_api_key,
+                        endpoint,
+                        active_openai_client,
+                        assignment_id,
+                    ),
+                    _open_stream,
+                )
+                hot_log.debug("OpenAI stream created for request_id: %s", request_id)
 
                 # Callback fired when the streaming generator completes.
                 # This is the ONLY place to capture streaming usage data because the
@@ -1196,6 +1384,7 @@ async def create_message(
                     stream_usage, stop_reason, duration_ms, error, actual_model=None
                 ):
                     """Log streaming request completion to usage tracker and request logger."""
+                    _log_t = stage_start()
                     try:
                         # status computed for usage_tracker below
                         # Many providers don't send usage in streaming chunks.
@@ -1205,6 +1394,12 @@ async def create_message(
                             stream_input = input_tokens
                         stream_output = stream_usage.get("output_tokens", 0)
 
+                        # Upstream prompt-cache hit rate (only real usage counts)
+                        if stream_usage.get("input_tokens") and not error:
+                            prompt_prefix.record_usage(
+                                provider, (request.metadata or {}).get("user_id"), stream_usage
+                            )
+
                         # Build a usage dict for the logger if empty
                         if not stream_usage or not stream_usage.get("input_tokens"):
                             stream_usage = {
@@ -1273,6 +1468,9 @@ async def create_message(
                                 transformed=True,
                                 transform_type=f"claude->openai/{routed_model.split('/')[0] if '/' in routed_model else 'unknown'}",
                                 profile=_cpn(),
+                                request_content=request.model_dump_json(exclude_none=True)
+                                if usage_tracker.log_full_content
+                                else None,
                             )
                         except Exception as ut_e:
                             logger.error(f"Failed to log to usage_tracker: {ut_e}")
@@ -1290,18 +1488,22 @@ async def create_message(
                         )
                     except Exception as cb_err:
                         logger.warning(f"Stream completion callback error: {cb_err}")
+                    observe_stage("post_response_log", _log_t)
 
                 return StreamingResponse(
-                    convert_openai_streaming_to_claude_with_cancellation(
+                    time_stream_translation(
                         openai_stream,
-                        request,
-                        logger,
-                        http_request,
-                        active_openai_client,
-                        request_id,
-                        config,
-                        provider,
-                        on_complete=_on_stream_complete,
+                        lambda upstream: convert_openai_streaming_to_claude_with_cancellation(
+                            upstream,
+                            request,
+                            logger,
+                            http_request,
+                            active_openai_client,
+                            request_id,
+                            config,
+                            provider,
+                            on_complete=_on_stream_complete,
+                        ),
                     ),
                     media_type="text/event-stream",
                     headers={
@@ -1384,15 +1586,12 @@ async def create_message(
                 return JSONResponse(status_code=500, content=error_response)
         else:
             # Non-streaming response
-            logger.debug(
-                f"Starting non-streaming response for request_id: {request_id}"
-            )
-            logger.debug("Request deduplication check passed")
+            hot_log.debug("Starting non-streaming response for request_id: %s", request_id)
+            hot_log.debug("Request deduplication check passed")
 
             # Seamless Key Rotation / Retry Loop
             # If we get a 401, we wait for the user to fix the key via the wizard
             from src.utils.key_reloader import key_reloader
-            import asyncio
 
             max_retries = 5   # Wait up to 10 seconds then fail with diagnostics
             retry_count = 0
@@ -1412,27 +1611,43 @@ async def create_message(
                         "middle": getattr(config, "middle_enabled", True),
                         "small": getattr(config, "small_enabled", True),
                     }.get(tier, True)
-                    if config.model_cascade and tier and tier_enabled:
-                        openai_response = await active_openai_client.create_chat_completion_with_cascade(
-                            openai_request,
-                            tier=tier,
-                            config=config,
-                            request_id=request_id,
-                            api_key=active_api_key,
-                            assignment_id=assignment_id,
-                            incoming_identifier=incoming_identifier,
-                        )
-                    else:
-                        openai_response = (
-                            await active_openai_client.create_chat_completion(
+                    use_cascade = bool(config.model_cascade and tier and tier_enabled)
+
+                    upstream_request_id = single_flight.shared_request_id(request_id)
+
+                    def _upstream_call():
+                        if use_cascade:
+                            return active_openai_client.create_chat_completion_with_cascade(
                                 openai_request,
-                                request_id=request_id,
+                                tier=tier,
                                 config=config,
+                                request_id=upstream_request_id,
                                 api_key=active_api_key,
                                 assignment_id=assignment_id,
                                 incoming_identifier=incoming_identifier,
                             )
+                        return active_openai_client.create_chat_completion(
+                            openai_request,
+                            request_id=upstream_request_id,
+                            config=config,
+                            api_key=active_api_key,
+                            assignment_id=assignment_id,
+                            incoming_identifier=incoming_identifier,
                         )
+
+                    # Identical concurrent requests share one upstream call
+                    openai_response = await single_flight.call(
+                        _coalesce_key(
+                            openai_request,
+                            "call",
+                            tier if use_cascade else "",
+                            active_api_key,
+                            endpoint,
+                            active_openai_client,
+                            assignment_id,
+                        ),
+                        _upstream_call,
+                    )
                     break  # Success!
 
                 except VibeProxyUnavailableError as e:
@@ -1504,11 +1719,15 @@ async def create_message(
                     else:
                         raise e  # Re-raise other errors immediately
 
-            logger.debug(f"OpenAI response received for request_id: {request_id}")
-            logger.debug("Request deduplication check passed")
+            hot_log.debug("OpenAI response received for request_id: %s", request_id)
+            hot_log.debug("Request deduplication check passed")
             # Log comprehensive completion with all metadata
+            _log_t = stage_start()
             duration_ms = (time.time() - request_start_time) * 1000
             usage = openai_response.get("usage") or {}
+            prompt_prefix.record_usage(
+                provider, (request.metadata or {}).get("user_id"), usage
+            )
 
             # Detect JSON for TOON analysis
             has_json_content = False
@@ -1597,14 +1816,21 @@ async def create_message(
                     profile=__import__(
                         "src.core.profiles", fromlist=["current_profile_name"]
                     ).current_profile_name(),
+                    request_content=request.model_dump_json(exclude_none=True)
+                    if usage_tracker.log_full_content
+                    else None,
+                    response_content=json_module.dumps(openai_response, default=str)
+                    if usage_tracker.log_full_content
+                    else None,
                 )
             except Exception as ut_e:
                 logger.error(f"Failed to log to usage_tracker: {ut_e}")
+            observe_stage("post_response_log", _log_t)
 
             claude_response = convert_openai_to_claude_response(
                 openai_response, request, provider
             )
-            logger.debug(f"Claude response created for request_id: {request_id}")
+            hot_log.debug("Claude response created for request_id: %s", request_id)
 
             # Cache response for deduplication (non-streaming only)
             if ENABLE_DEDUP and request_hash:
@@ -1618,7 +1844,7 @@ async def create_message(
                         response_dict = claude_response
                     request_deduplicator.cache_response(request_hash, response_dict)
                 except Exception as cache_err:
-                    logger.debug(f"Failed to cache response for dedup: {cache_err}")
+                    hot_log.debug("Failed to cache response for dedup: %s", cache_err)
 
             # Store in semantic cache for near-duplicate future requests
             if _sem_cache_key and not request.tools and input_tokens >= _MIN_TOKENS:
@@ -1766,6 +1992,10 @@ async def create_message(
         )
 
         raise HTTPException(status_code=500, detail=error_message)
+    finally:
+        if request_hash:
+            # Wake coalesced duplicates if no response was cached (e.g. on error)
+            request_deduplicator.release(request_hash)
 
 
 @router.post("/v1/messages/count_tokens")
@@ -1881,6 +2111,42 @@ async def semantic_cache_clear():
     return {"status": "cleared"}
 
 
+@router.get("/api/single-flight/stats")
+async def single_flight_stats():
+    """Stats for upstream call coalescing (coalesced calls, saved tokens)."""
+    return single_flight.stats()
+
+
+@router.get("/api/request-parser/stats")
+async def request_parser_stats():
+    """Validated-message reuse of the FAST_REQUEST_PARSE body parser."""
+    return request_parser.stats()
+
+
+@router.get("/api/image-store/stats")
+async def image_store_stats():
+    """Image dedup and old-turn image policy savings."""
+    return image_store.stats()
+
+
+@router.get("/api/prompt-cache/stats")
+async def prompt_cache_stats():
+    """Upstream cached-token hit rates and system/tool prefix drift."""
+    return prompt_prefix.stats()
+
+
+@router.get("/api/tool-compaction/stats")
+async def tool_compaction_stats():
+    """Characters and estimated tokens removed from old tool results."""
+    return tool_output_compactor.stats()
+
+
+@router.get("/api/tool-pipeline/stats")
+async def tool_pipeline_stats():
+    """Hit rate of the memoized tool-declaration pipeline."""
+    return tool_pipeline.stats()
+
+
 @router.get("/api/pipelines")
 async def list_pipelines():
     """List configured API pipelines from proxy_chain.json."""
@@ -8,6 +8,10 @@ brings their own Grafana (or any scraper) — no docker-compose bundled.
 Why a small custom registry instead of the default `prometheus_client.REGISTRY`:
 the default registry leaks process/python collectors that aren't useful for
 proxy-level observability. We expose only the application-specific series.
+
+Per-stage latency (proxy_stage_duration_seconds{stage=...}) is timed by
+``src.core.stage_timing``; importing this module registers the histogram as
+its observer (``STAGE_METRICS`` is read there).
 """
 
 from __future__ import annotations
@@ -25,6 +29,8 @@ from prometheus_client import (
     CONTENT_TYPE_LATEST,
 )
 
+from src.core.stage_timing import STAGES, register_stage_observers
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -74,6 +80,21 @@ request_duration_seconds = Histogram(
     registry=REGISTRY,
 )
 
+stage_duration_seconds = Histogram(
+    "proxy_stage_duration_seconds",
+    "Time spent in each proxy pipeline stage (stream_translate is per upstream chunk).",
+    ["stage"],
+    # In-process stages are tens of µs to a few ms; upstream_ttfb runs to tens of seconds
+    buckets=(
+        0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+        0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+    ),
+    registry=REGISTRY,
+)
+
+# Label children resolved once so an observation skips the labels() lookup
+register_stage_observers({stage: stage_duration_seconds.labels(stage=stage).observe for stage in STAGES})
+
 cascade_depth_histogram = Histogram(
     "proxy_cascade_depth",
     "How deep into the cascade chain a request had to go (0 = primary worked).",
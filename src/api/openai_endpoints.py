@@ -12,9 +12,10 @@ backends through this proxy.
 """
 
 import json
+import os
 import time
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any, List
 from fastapi import APIRouter, Request, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -46,6 +47,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Relay upstream SSE bytes as-is for streamed chunks that need no rewriting
+# (no tool_calls, no usage, no model spoof) instead of going through the SDK's
+# chunk models, model_dump() and json.dumps per token.
+STREAM_PASSTHROUGH = os.environ.get("OPENAI_STREAM_PASSTHROUGH", "true").lower() != "false"
+
 
 # ═══════════════════════════════════════════════════════════════
 # REQUEST MODELS (OpenAI Format)
@@ -325,6 +331,50 @@ def _emit_terminal_complete(
         pass
 
 
+async def _iter_sse_data(byte_chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield the payload of every ``data:`` line in an SSE byte stream."""
+    buffer = b""
+    async for chunk in byte_chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.startswith(b"data:"):
+                yield line[5:].strip()
+    if buffer.startswith(b"data:"):
+        yield buffer[5:].strip()
+
+
+def _chunk_needs_transform(payload: bytes) -> bool:
+    """Cheap byte scan: does this chunk carry tool calls, a usage object or an error?
+
+    A literal ``"usage"`` or ``"error"`` can only be a key or a whole string
+    value (quotes inside JSON strings are escaped), so false positives just
+    cost one parse.
+    """
+    if b'"tool_calls"' in payload or b'"error"' in payload:
+        return True
+    idx = payload.find(b'"usage"')
+    if idx == -1:
+        return False
+    return not payload[idx + 7 : idx + 16].lstrip(b": ").startswith(b"null")
+
+
+def _raise_stream_error(chunk: Any) -> None:
+    """Abort the stream on an in-stream error, as the SDK's stream does.
+
+    Any mapping with a truthy ``"error"`` counts, wherever the key appears.
+    """
+    if not isinstance(chunk, dict) or not chunk.get("error"):
+        return
+    error = chunk["error"]
+    message = error.get("message") if isinstance(error, dict) else None
+    if not message or not isinstance(message, str):
+        message = "An error occurred during streaming"
+    raise RuntimeError(message)
+
+
 # ═══════════════════════════════════════════════════════════════
 # MAIN ENDPOINT
 # ═══════════════════════════════════════════════════════════════
@@ -676,20 +726,46 @@ async def openai_chat_completions(request: Request, body: OpenAIChatRequest):
                                 saw_done = True
                                 yield "data: [DONE]\n\n"
                                 break
-                            chunk_dict = json.loads(payload)
                             saw_data_chunk = True
+                            if (
+                                STREAM_PASSTHROUGH
+                                and not _spoof_response_to
+                                and not _chunk_needs_transform(payload.encode())
+                            ):
+                                yield f"data: {payload}\n\n"
+                                continue
+                            chunk_dict = json.loads(payload)
                             for output in transform_chunk_dict(chunk_dict):
                                 yield output
                     else:
                         openai_request.pop("stream", None)  # avoid duplicate kwarg
-                        stream = await client.chat.completions.create(
-                            **openai_request, stream=True
-                        )
-                        async for chunk in stream:
-                            chunk_dict = chunk.model_dump()
-                            saw_data_chunk = True
-                            for output in transform_chunk_dict(chunk_dict):
-                                yield output
+                        if STREAM_PASSTHROUGH:
+                            # Raw SSE over the SDK client's pooled httpx connection;
+                            # only chunks that need rewriting are parsed.
+                            async with client.chat.completions.with_streaming_response.create(
+                                **openai_request, stream=True
+                            ) as raw_response:
+                                async for payload in _iter_sse_data(raw_response.iter_bytes()):
+                                    if payload == b"[DONE]":
+                                        break
+                                    if _spoof_response_to or _chunk_needs_transform(payload):
+                                        chunk_dict = json.loads(payload)
+                                        _raise_stream_error(chunk_dict)
+                                        saw_data_chunk = True
+                                        for output in transform_chunk_dict(chunk_dict):
+                                            yield output
+                                    else:
+                                        saw_data_chunk = True
+                                        yield b"data: " + payload + b"\n\n"
+                        else:
+                            stream = await client.chat.completions.create(
+                                **openai_request, stream=True
+                            )
+                            async for chunk in stream:
+                                chunk_dict = chunk.model_dump()
+                                saw_data_chunk = True
+                                for output in transform_chunk_dict(chunk_dict):
+                                    yield output
 
                         if not saw_data_chunk:
                             logger.error(
@@ -0,0 +1,164 @@
+"""
+Opt-in fast path for parsing ``/v1/messages`` request bodies.
+
+By default FastAPI decodes the body and validates it into
+``ClaudeMessagesRequest``, building a model object for every content block of
+every message — hundreds of KB per turn for a long Claude Code session, almost
+all of it history that was already validated on the previous turn.
+
+With the fast path on, the body is decoded once (orjson when installed), the
+top-level envelope is validated, and each message is looked up by a hash of
+its re-encoded JSON in a bounded cache of already-validated ``ClaudeMessage``
+objects; only messages not seen before (normally just the new tail of the
+conversation) go through pydantic. The tool list is cached the same way. The
+resulting ``ClaudeMessagesRequest`` holds the same objects the converter and
+its caches already work with, so nothing downstream changes.
+
+Any validation failure falls back to validating the whole body, so clients get
+the same 422 details as without the fast path.
+
+Configuration (env vars):
+  FAST_REQUEST_PARSE=false    Enable the fast path (default: false)
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, List, Tuple
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from src.core.stage_timing import observe_stage, stage_start
+from src.models.claude import ClaudeMessage, ClaudeMessagesRequest, ClaudeTool
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+ENABLED = os.environ.get("FAST_REQUEST_PARSE", "false").lower() == "true"
+
+_tools_adapter = TypeAdapter(List[ClaudeTool])
+
+
+def _key(obj: Any) -> Tuple[int, int]:
+    # Python's keyed SipHash of the canonical bytes: ~3x cheaper than sha256
+    # on multi-MB histories, and a per-process random key makes crafted
+    # collisions impractical.
+    raw = _dumps(obj)
+    return len(raw), hash(raw)
+
+
+class MessagesRequestParser:
+    """Parse request bodies, validating each distinct message only once."""
+
+    def __init__(self, max_messages: int = 8192, max_tool_sets: int = 16):
+        self.max_messages = max_messages
+        self.max_tool_sets = max_tool_sets
+        self._messages: "OrderedDict[Tuple[int, int], ClaudeMessage]" = OrderedDict()
+        self._tools: "OrderedDict[Tuple[int, int], List[ClaudeTool]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.validated_messages = 0
+        self.reused_messages = 0
+        self.fallbacks = 0
+
+    def parse(self, body: bytes) -> ClaudeMessagesRequest:
+        """Return the validated request for ``body``.
+
+        Raises ``pydantic.ValidationError`` exactly as
+        ``ClaudeMessagesRequest.model_validate_json`` would.
+        """
+        try:
+            return self._parse_fast(body)
+        except (ValidationError, ValueError, TypeError):
+            self.fallbacks += 1
+            return ClaudeMessagesRequest.model_validate_json(body)
+
+    def _parse_fast(self, body: bytes) -> ClaudeMessagesRequest:
+        data = _loads(body)
+        if not isinstance(data, dict) or not isinstance(data.get("messages"), list):
+            raise ValueError("not a messages request")
+
+        envelope = dict(data)
+        raw_messages = envelope.pop("messages")
+        raw_tools = envelope.pop("tools") if isinstance(data.get("tools"), list) else None
+        header = ClaudeMessagesRequest.model_validate({**envelope, "messages": []})
+
+        messages = [self._message(raw) for raw in raw_messages]
+        tools = self._tool_list(raw_tools) if raw_tools is not None else header.tools
+
+        fields = {name: getattr(header, name) for name in ClaudeMessagesRequest.model_fields}
+        fields["messages"] = messages
+        fields["tools"] = tools
+        fields_set = set(header.model_fields_set)
+        if raw_tools is not None:
+            fields_set.add("tools")
+        return ClaudeMessagesRequest.model_construct(_fields_set=fields_set, **fields)
+
+    def _message(self, raw: Any) -> ClaudeMessage:
+        key = _key(raw)
+        with self._lock:
+            cached = self._messages.get(key)
+            if cached is not None:
+                self._messages.move_to_end(key)
+                self.reused_messages += 1
+                return cached
+        message = ClaudeMessage.model_validate(raw)
+        with self._lock:
+            self.validated_messages += 1
+            self._messages[key] = message
+            while len(self._messages) > self.max_messages:
+                self._messages.popitem(last=False)
+        return message
+
+    def _tool_list(self, raw: list) -> List[ClaudeTool]:
+        key = _key(raw)
+        with self._lock:
+            cached = self._tools.get(key)
+            if cached is not None:
+                self._tools.move_to_end(key)
+                return cached
+        tools = _tools_adapter.validate_python(raw)
+        with self._lock:
+            self._tools[key] = tools
+            while len(self._tools) > self.max_tool_sets:
+                self._tools.popitem(last=False)
+        return tools
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": ENABLED,
+                "cached_messages": len(self._messages),
+                "cached_tool_sets": len(self._tools),
+                "validated_messages": self.validated_messages,
+                "reused_messages": self.reused_messages,
+                "fallbacks": self.fallbacks,
+            }
+
+
+request_parser = MessagesRequestParser()
+
+
+async def parse_messages_request(http_request: Request) -> ClaudeMessagesRequest:
+    """FastAPI dependency replacing the ``ClaudeMessagesRequest`` body param."""
+    body = await http_request.body()
+    start = stage_start()
+    try:
+        parsed = request_parser.parse(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()], body=body
+        )
+    observe_stage("parse", start)
+    return parsed
@@ -6,10 +6,11 @@ Provides real-time dashboard updates via WebSocket connections.
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
-from typing import Set
+from typing import Optional, Set
 import json
-import asyncio
+import time
 from pathlib import Path
+from src.api.websocket_hub import FanoutHub
 from src.core.logging import logger
 
 router = APIRouter()
@@ -22,35 +23,29 @@ class DashboardBroadcaster:
     """Broadcasts dashboard updates to all connected clients"""
 
     def __init__(self):
-        self.connections: Set[WebSocket] = set()
+        self.hub = FanoutHub("ws_dashboard")
+
+    @property
+    def connections(self) -> Set[WebSocket]:
+        return self.hub.connections
 
     async def connect(self, websocket: WebSocket):
         """Add a new WebSocket connection"""
-        await websocket.accept()
-        self.connections.add(websocket)
-        logger.info(f"WebSocket client connected. Total connections: {len(self.connections)}")
+        await self.hub.connect(websocket)
+        logger.info(f"WebSocket client connected. Total connections: {self.hub.client_count}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
-        self.connections.discard(websocket)
-        logger.info(f"WebSocket client disconnected. Total connections: {len(self.connections)}")
+        self.hub.disconnect(websocket)
+        logger.info(f"WebSocket client disconnected. Total connections: {self.hub.client_count}")
+
+    def publish(self, message: dict, coalesce_key: Optional[str] = None):
+        """Queue a message for all connected clients without awaiting any of them"""
+        self.hub.publish(message, topic=message.get("type", "default"), coalesce_key=coalesce_key)
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        if not self.connections:
-            return
-
-        disconnected = set()
-        for connection in self.connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"Error broadcasting to WebSocket client: {e}")
-                disconnected.add(connection)
-
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.connections.discard(conn)
+        self.publish(message)
 
 
 # Global broadcaster instance
@@ -70,7 +65,7 @@ async def websocket_dashboard(websocket: WebSocket):
             'type': 'initial_state',
             'data': dashboard_hooks.get_stats()
         }
-        await websocket.send_json(initial_state)
+        dashboard_broadcaster.hub.send_to(websocket, initial_state)
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -109,12 +104,20 @@ async def broadcast_dashboard_update(update_type: str, data: dict):
         update_type: Type of update (e.g., 'request_start', 'request_complete', 'stats_update')
         data: Update data
     """
+    publish_dashboard_update(update_type, data)
+
+
+def publish_dashboard_update(update_type: str, data: dict):
+    """Synchronous form of broadcast_dashboard_update (no task per update)."""
     message = {
         'type': update_type,
         'data': data,
-        'timestamp': asyncio.get_event_loop().time()
+        'timestamp': time.monotonic()
     }
-    await dashboard_broadcaster.broadcast(message)
+    # Stats snapshots supersede each other; a slow client only gets the latest.
+    dashboard_broadcaster.publish(
+        message, coalesce_key=update_type if update_type == "stats_update" else None
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -125,38 +128,29 @@ class LogsBroadcaster:
     """Broadcasts log messages to connected web UI clients"""
 
     def __init__(self):
-        self.connections: Set[WebSocket] = set()
+        self.hub = FanoutHub("ws_ui_logs")
+
+    @property
+    def connections(self) -> Set[WebSocket]:
+        return self.hub.connections
 
     async def connect(self, websocket: WebSocket):
         """Add a new WebSocket connection"""
-        await websocket.accept()
-        self.connections.add(websocket)
-        logger.info(f"Logs WebSocket client connected. Total: {len(self.connections)}")
+        await self.hub.connect(websocket)
+        logger.info(f"Logs WebSocket client connected. Total: {self.hub.client_count}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
-        self.connections.discard(websocket)
-        logger.info(f"Logs WebSocket client disconnected. Total: {len(self.connections)}")
+        self.hub.disconnect(websocket)
+        logger.info(f"Logs WebSocket client disconnected. Total: {self.hub.client_count}")
+
+    def publish(self, message: str, level: str = "info"):
+        """Queue a log message for all connected clients without awaiting any of them"""
+        self.hub.publish({"message": message, "level": level}, topic=level)
 
     async def broadcast(self, message: str, level: str = "info"):
         """Broadcast a log message to all connected clients"""
-        if not self.connections:
-            return
-
-        payload = {
-            "message": message,
-            "level": level
-        }
-
-        disconnected = set()
-        for connection in self.connections:
-            try:
-                await connection.send_json(payload)
-            except Exception:
-                disconnected.add(connection)
-
-        for conn in disconnected:
-            self.connections.discard(conn)
+        self.publish(message, level)
 
 
 # Global logs broadcaster instance
@@ -170,7 +164,7 @@ async def websocket_logs(websocket: WebSocket):
 
     try:
         # Send welcome message
-        await websocket.send_json({
+        logs_broadcaster.hub.send_to(websocket, {
             "message": "Connected to live log stream",
             "level": "info"
         })
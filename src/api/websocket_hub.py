@@ -0,0 +1,261 @@
+"""
+WebSocket fan-out hub shared by the log, dashboard, live-metrics and
+crosstalk streams.
+
+The previous broadcasters awaited ``send_json`` on every connection in turn,
+so one slow client stalled each event for everybody, and every event was
+re-serialized per client. The hub decouples producers from sockets:
+
+  - ``publish()`` is synchronous and cheap: the message is serialized once
+    and the same text frame is appended to each matching subscriber's queue.
+  - Each subscriber has a bounded queue drained by its own sender task. When
+    the queue is full the oldest frame is dropped; frames published with a
+    ``coalesce_key`` (e.g. periodic metrics snapshots) replace a still-queued
+    frame with the same key instead of queueing behind it.
+  - Subscribers can filter by topic (``None`` = everything).
+  - ``stats()`` reports queue depth, sent/dropped/coalesced counts and
+    send lag (time between publish and the frame hitting the socket) per client.
+
+Usage:
+    hub = FanoutHub("logs")
+    sub = await hub.connect(websocket, topics={"cascade"})
+    hub.publish({"level": "info", ...}, topic="cascade")
+    ...
+    hub.disconnect(websocket)
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fastapi import WebSocket
+
+from src.core.logging import logger
+
+DEFAULT_QUEUE_SIZE = 256
+
+_subscriber_ids = count(1)
+
+
+class Subscriber:
+    """One connected client: bounded frame queue plus its sender task."""
+
+    __slots__ = (
+        "id",
+        "websocket",
+        "topics",
+        "max_queue",
+        "_queue",
+        "_pending",
+        "_wakeup",
+        "_task",
+        "sent",
+        "dropped",
+        "coalesced",
+        "last_lag_ms",
+        "max_lag_ms",
+        "connected_at",
+    )
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        topics: Optional[Iterable[str]] = None,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self.id = next(_subscriber_ids)
+        self.websocket = websocket
+        self.topics: Optional[Set[str]] = set(topics) if topics is not None else None
+        self.max_queue = max_queue
+        # Entries are [coalesce_key, frame, enqueued_at]; mutable so a
+        # coalescing publish can swap the frame in place.
+        self._queue: deque = deque()
+        self._pending: Dict[str, list] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.connected_at = time.time()
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def push(self, frame: str, coalesce_key: Optional[str] = None) -> None:
+        """Queue a frame. Must run on the hub's event loop."""
+        now = time.monotonic()
+        if coalesce_key is not None:
+            entry = self._pending.get(coalesce_key)
+            if entry is not None:
+                entry[1] = frame
+                entry[2] = now
+                self.coalesced += 1
+                return
+        if len(self._queue) >= self.max_queue:
+            oldest = self._queue.popleft()
+            if oldest[0] is not None and self._pending.get(oldest[0]) is oldest:
+                del self._pending[oldest[0]]
+            self.dropped += 1
+        entry = [coalesce_key, frame, now]
+        self._queue.append(entry)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = entry
+        self._wakeup.set()
+
+    async def _run(self, hub: "FanoutHub") -> None:
+        try:
+            while True:
+                while not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                entry = self._queue.popleft()
+                key, frame, enqueued_at = entry
+                if key is not None and self._pending.get(key) is entry:
+                    del self._pending[key]
+                await self.websocket.send_text(frame)
+                lag = (time.monotonic() - enqueued_at) * 1000
+                self.last_lag_ms = lag
+                if lag > self.max_lag_ms:
+                    self.max_lag_ms = lag
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"[{hub.name}] WebSocket subscriber {self.id} send failed: {e}")
+            hub._remove(self)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "topics": sorted(self.topics) if self.topics is not None else None,
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "connected_seconds": round(time.time() - self.connected_at, 1),
+        }
+
+
+class FanoutHub:
+    """Serialize-once broadcast to per-subscriber bounded queues."""
+
+    def __init__(self, name: str, max_queue: int = DEFAULT_QUEUE_SIZE):
+        self.name = name
+        self.max_queue = max_queue
+        self._subscribers: Dict[WebSocket, Subscriber] = {}
+        # Guards _subscribers: publish() may iterate it from another thread
+        # while attach/_remove mutate it on the loop thread.
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self.published = 0
+
+    # ── connection lifecycle ────────────────────────────────────────────
+    def attach(
+        self, websocket: WebSocket, topics: Optional[Iterable[str]] = None
+    ) -> Subscriber:
+        """Register an already-accepted websocket and start its sender task."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        sub = Subscriber(websocket, topics, self.max_queue)
+        with self._lock:
+            self._subscribers[websocket] = sub
+        sub._task = asyncio.create_task(sub._run(self))
+        return sub
+
+    async def connect(
+        self, websocket: WebSocket, topics: Optional[Iterable[str]] = None
+    ) -> Subscriber:
+        """Accept ``websocket`` and subscribe it."""
+        await websocket.accept()
+        return self.attach(websocket, topics)
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            self._remove(sub)
+
+    def _remove(self, sub: Subscriber) -> None:
+        with self._lock:
+            if self._subscribers.get(sub.websocket) is sub:
+                del self._subscribers[sub.websocket]
+        task = sub._task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+
+    def subscribe(self, websocket: WebSocket, topics: Optional[Iterable[str]]) -> None:
+        """Replace a subscriber's topic filter (``None`` = all topics)."""
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            sub.topics = set(topics) if topics is not None else None
+
+    # ── publishing ──────────────────────────────────────────────────────
+    def publish(
+        self,
+        message: Any,
+        topic: str = "default",
+        coalesce_key: Optional[str] = None,
+    ) -> int:
+        """Queue ``message`` for every subscriber of ``topic``.
+
+        Never blocks on a socket. Safe to call from other threads. Returns the
+        number of subscribers the frame was queued for.
+        """
+        with self._lock:
+            targets = [s for s in self._subscribers.values() if s.wants(topic)]
+            if not targets:
+                return 0
+            self.published += 1
+        frame = message if isinstance(message, str) else json.dumps(message, default=str)
+        if threading.get_ident() == self._loop_thread:
+            for sub in targets:
+                sub.push(frame, coalesce_key)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._push_all, targets, frame, coalesce_key)
+            except RuntimeError:
+                return 0  # hub's loop already closed (shutdown)
+        return len(targets)
+
+    def send_to(self, websocket: WebSocket, message: Any) -> None:
+        """Queue a message for one subscriber (history replay, initial state)."""
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            frame = message if isinstance(message, str) else json.dumps(message, default=str)
+            sub.push(frame)
+
+    @staticmethod
+    def _push_all(targets: List[Subscriber], frame: str, coalesce_key: Optional[str]) -> None:
+        for sub in targets:
+            sub.push(frame, coalesce_key)
+
+    # ── introspection ───────────────────────────────────────────────────
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def connections(self) -> Set[WebSocket]:
+        with self._lock:
+            return set(self._subscribers)
+
+    def topic_count(self, topic: str) -> int:
+        with self._lock:
+            return sum(1 for s in self._subscribers.values() if s.wants(topic))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        return {
+            "hub": self.name,
+            "published": self.published,
+            "clients": [s.stats() for s in subscribers],
+        }
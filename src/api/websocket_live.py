@@ -15,17 +15,21 @@ import asyncio
 import json
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Dict, List
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter
 from pathlib import Path
 
+from src.api.websocket_hub import FanoutHub
 from src.core.logging import logger
 from src.services.usage.usage_tracker import usage_tracker
 
 router = APIRouter()
 
-# Active connections
-active_connections: Set[WebSocket] = set()
+# /ws/live subscribers. Topics: "metrics", "alerts", "request_feed".
+live_hub = FanoutHub("ws_live")
+
+# /ws/crosstalk/{session_id} subscribers, one topic per session.
+crosstalk_hub = FanoutHub("ws_crosstalk")
 
 # Live metrics cache
 metrics_cache = {
@@ -196,7 +200,7 @@ class LiveMetricsManager:
 
     async def _broadcast_metrics(self):
         """Broadcast metrics to all connected clients"""
-        if not active_connections:
+        if not live_hub.topic_count("metrics"):
             return
 
         message = {
@@ -205,16 +209,8 @@ class LiveMetricsManager:
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        disconnected = set()
-        for connection in active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as _e:
-                disconnected.add(connection)
-
-        # Remove disconnected clients
-        for conn in disconnected:
-            active_connections.discard(conn)
+        # A client that falls behind gets the latest snapshot, not a backlog.
+        live_hub.publish(message, topic="metrics", coalesce_key="metrics")
 
     async def _check_alerts(self):
         """Check alert rules and trigger notifications"""
@@ -432,15 +428,7 @@ class LiveMetricsManager:
 
     async def _broadcast_alert(self, alert: Dict):
         """Broadcast alert to all connected clients"""
-        disconnected = set()
-        for connection in active_connections:
-            try:
-                await connection.send_json(alert)
-            except Exception as _e:
-                disconnected.add(connection)
-
-        for conn in disconnected:
-            active_connections.discard(conn)
+        live_hub.publish(alert, topic="alerts")
 
     async def _send_webhook(self, url: str, payload: Dict):
         """Send webhook notification"""
@@ -470,30 +458,31 @@ async def websocket_live_metrics(websocket: WebSocket):
     - request_feed: Streaming request events
 
     Client can send:
-    - subscribe: Subscribe to specific feeds
+    - subscribe: Subscribe to specific feeds ("metrics", "alerts", "request_feed")
     - ping: Connection health check
     """
-    await websocket.accept()
-    active_connections.add(websocket)
+    await live_hub.connect(websocket)
 
     try:
         # Send initial metrics
-        await websocket.send_json(
+        live_hub.send_to(
+            websocket,
             {
                 "type": "metrics",
                 "data": metrics_cache,
                 "timestamp": datetime.utcnow().isoformat(),
-            }
+            },
         )
 
         # Send recent request feed
         if request_feed_buffer:
-            await websocket.send_json(
+            live_hub.send_to(
+                websocket,
                 {
                     "type": "request_feed",
                     "data": request_feed_buffer[-10:],  # Last 10 requests
                     "timestamp": datetime.utcnow().isoformat(),
-                }
+                },
             )
 
         # Listen for client messages
@@ -502,30 +491,33 @@ async def websocket_live_metrics(websocket: WebSocket):
                 data = await websocket.receive_json()
 
                 if data.get("type") == "ping":
-                    await websocket.send_json(
-                        {"type": "pong", "timestamp": datetime.utcnow().isoformat()}
+                    live_hub.send_to(
+                        websocket,
+                        {"type": "pong", "timestamp": datetime.utcnow().isoformat()},
                     )
 
                 elif data.get("type") == "subscribe":
                     # Handle subscription to specific feeds
                     feeds = data.get("feeds", ["metrics"])
-                    await websocket.send_json(
+                    live_hub.subscribe(websocket, feeds)
+                    live_hub.send_to(
+                        websocket,
                         {
                             "type": "subscribed",
                             "feeds": feeds,
                             "timestamp": datetime.utcnow().isoformat(),
-                        }
+                        },
                     )
 
             except TimeoutError:
                 continue
 
     except WebSocketDisconnect:
-        active_connections.discard(websocket)
+        live_hub.disconnect(websocket)
         logger.info("WebSocket client disconnected")
 
     except Exception as e:
-        active_connections.discard(websocket)
+        live_hub.disconnect(websocket)
         logger.error(f"WebSocket error: {e}")
         try:
             await websocket.close()
@@ -546,30 +538,28 @@ async def websocket_crosstalk_session(websocket: WebSocket, session_id: str):
     Path params:
         session_id: Crosstalk session ID
     """
-    await websocket.accept()
-
     # Track this connection for the specific session
+    await crosstalk_hub.connect(websocket, topics={f"crosstalk:{session_id}"})
+
     if session_id not in crosstalk_sessions:
         crosstalk_sessions[session_id] = {
-            "connections": set(),
             "last_update": None,
             "cost": 0,
             "tokens": 0,
             "round": 0,
         }
 
-    crosstalk_sessions[session_id]["connections"].add(websocket)
-
     try:
         # Send current session state if available
         session_data = crosstalk_sessions.get(session_id)
         if session_data:
-            await websocket.send_json(
+            crosstalk_hub.send_to(
+                websocket,
                 {
                     "type": "session_status",
                     "data": session_data,
                     "timestamp": datetime.utcnow().isoformat(),
-                }
+                },
             )
 
         # Listen for updates
@@ -577,13 +567,13 @@ async def websocket_crosstalk_session(websocket: WebSocket, session_id: str):
             data = await websocket.receive_json()
 
             if data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                crosstalk_hub.send_to(websocket, {"type": "pong"})
 
     except WebSocketDisconnect:
-        if session_id in crosstalk_sessions:
-            crosstalk_sessions[session_id]["connections"].discard(websocket)
+        crosstalk_hub.disconnect(websocket)
 
     except Exception as e:
+        crosstalk_hub.disconnect(websocket)
         logger.error(f"Crosstalk WebSocket error: {e}")
         try:
             await websocket.close()
@@ -610,22 +600,13 @@ async def broadcast_request_event(request_data: Dict):
         "timestamp": datetime.utcnow().isoformat(),
     }
 
-    disconnected = set()
-    for connection in active_connections:
-        try:
-            await connection.send_json(message)
-        except Exception as _e:
-            disconnected.add(connection)
-
-    for conn in disconnected:
-        active_connections.discard(conn)
+    live_hub.publish(message, topic="request_feed")
 
 
 async def update_crosstalk_session(session_id: str, round_data: Dict):
     """Update crosstalk session with new round data"""
     if session_id not in crosstalk_sessions:
         crosstalk_sessions[session_id] = {
-            "connections": set(),
             "last_update": None,
             "cost": 0,
             "tokens": 0,
@@ -650,15 +631,7 @@ async def update_crosstalk_session(session_id: str, round_data: Dict):
         "timestamp": datetime.utcnow().isoformat(),
     }
 
-    disconnected = set()
-    for connection in session["connections"]:
-        try:
-            await connection.send_json(message)
-        except Exception as _e:
-            disconnected.add(connection)
-
-    for conn in disconnected:
-        session["connections"].discard(conn)
+    crosstalk_hub.publish(message, topic=f"crosstalk:{session_id}")
 
 
 # Start metrics manager on module load
@@ -680,4 +653,6 @@ __all__ = [
     "stop_live_metrics",
     "broadcast_request_event",
     "update_crosstalk_session",
+    "live_hub",
+    "crosstalk_hub",
 ]
@@ -1,12 +1,13 @@
 """WebSocket endpoints for live log streaming and real-time updates."""
 
-import asyncio
 from collections import deque
 from datetime import datetime, timezone
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, Iterable, Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import json
 
+from src.api.websocket_hub import FanoutHub
+
 router = APIRouter()
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -17,68 +18,53 @@ class LogBroadcaster:
     """
     Manages WebSocket connections and broadcasts log messages to all connected clients.
     Acts as a central hub for log events from the proxy.
+
+    Delivery goes through a FanoutHub: each entry is serialized once and queued
+    per client, so a slow dashboard never delays the proxy or other clients.
+    Entries are published under their ``event_type`` topic ("log" when unset).
     """
     
     def __init__(self, max_history: int = 100):
-        self.connections: Set[WebSocket] = set()
+        self.hub = FanoutHub("ws_logs")
         self.history: deque = deque(maxlen=max_history)
-        self._lock = asyncio.Lock()
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, topics: Optional[Iterable[str]] = None):
         """Accept a new WebSocket connection."""
-        await websocket.accept()
-        async with self._lock:
-            self.connections.add(websocket)
-        # Send recent history to new connection
+        await self.hub.connect(websocket, topics)
+        # Queue recent history ahead of any new entries
         for log_entry in self.history:
-            try:
-                await websocket.send_json(log_entry)
-            except Exception:
-                pass
+            self.hub.send_to(websocket, log_entry)
     
     async def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        async with self._lock:
-            self.connections.discard(websocket)
+        self.hub.disconnect(websocket)
     
-    async def broadcast(self, log_entry: Dict[str, Any]):
-        """Broadcast a log entry to all connected clients."""
+    def publish(self, log_entry: Dict[str, Any]) -> None:
+        """Timestamp, record and fan out a log entry without awaiting any client."""
         log_entry["timestamp"] = datetime.now().isoformat()
         self.history.append(log_entry)
-        
-        # Send to all connections
-        disconnected = set()
-        for connection in self.connections:
-            try:
-                await connection.send_json(log_entry)
-            except Exception:
-                disconnected.add(connection)
-        
-        # Clean up disconnected
-        async with self._lock:
-            self.connections -= disconnected
+        self.hub.publish(log_entry, topic=log_entry.get("event_type") or "log")
+    
+    async def broadcast(self, log_entry: Dict[str, Any]):
+        """Broadcast a log entry to all connected clients."""
+        self.publish(log_entry)
     
     def log(self, level: str, message: str, **kwargs):
-        """Synchronous log method that schedules async broadcast."""
+        """Synchronous log method; queues the entry for every subscribed client."""
         log_entry = {
             "level": level,
             "message": message,
             **kwargs
         }
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self.broadcast(log_entry))
-            else:
-                loop.run_until_complete(self.broadcast(log_entry))
-        except RuntimeError:
-            # No event loop, just store in history
-            log_entry["timestamp"] = datetime.now().isoformat()
-            self.history.append(log_entry)
+        self.publish(log_entry)
+    
+    @property
+    def connections(self) -> Set[WebSocket]:
+        return self.hub.connections
     
     @property
     def client_count(self) -> int:
-        return len(self.connections)
+        return self.hub.client_count
 
 
 # Global broadcaster instance
@@ -106,6 +92,9 @@ async def websocket_logs(websocket: WebSocket):
         "request_id": "optional request id",
         ...additional context
     }
+
+    Clients may send {"type": "subscribe", "topics": [...]} to receive only
+    some event types ("log", "cascade", "crosstalk", "request").
     """
     await log_broadcaster.connect(websocket)
     try:
@@ -114,11 +103,39 @@ async def websocket_logs(websocket: WebSocket):
             data = await websocket.receive_text()
             # Handle client commands if needed
             if data == "ping":
-                await websocket.send_json({"type": "pong"})
+                log_broadcaster.hub.send_to(websocket, {"type": "pong"})
+            elif data.startswith("{"):
+                # {"type": "subscribe", "topics": ["cascade", "crosstalk"]}
+                # narrows the stream; "topics": null restores everything.
+                try:
+                    command = json.loads(data)
+                except ValueError:
+                    continue
+                if command.get("type") == "subscribe":
+                    log_broadcaster.hub.subscribe(websocket, command.get("topics"))
     except WebSocketDisconnect:
+        pass
+    finally:
         await log_broadcaster.disconnect(websocket)
 
 
+@router.get("/api/ws/stats")
+async def websocket_stats():
+    """Per-client queue depth, drops, coalescing and send lag for every WebSocket hub."""
+    from src.api.websocket_dashboard import dashboard_broadcaster, logs_broadcaster
+    from src.api.websocket_live import crosstalk_hub, live_hub
+
+    return {
+        "hubs": [
+            log_broadcaster.hub.stats(),
+            dashboard_broadcaster.hub.stats(),
+            logs_broadcaster.hub.stats(),
+            live_hub.stats(),
+            crosstalk_hub.stats(),
+        ]
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # LOG HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -136,6 +153,7 @@ def log_request(
     log_broadcaster.log(
         level="info" if status == "success" else "error",
         message=f"Request completed: {model}",
+        event_type="request",
         request_id=request_id,
         model=model,
         input_tokens=input_tokens,
@@ -333,14 +351,10 @@ def log_cascade(
     try:
         from src.api.websocket_dashboard import logs_broadcaster
 
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.create_task(
-                logs_broadcaster.broadcast(
-                    f"[cascade] {message}",
-                    "warning" if action == "switch" else "info",
-                )
-            )
+        logs_broadcaster.publish(
+            f"[cascade] {message}",
+            "warning" if action == "switch" else "info",
+        )
     except Exception:
         # Keep cascade path resilient; observability must not break requests.
         pass
@@ -398,6 +412,7 @@ def log_crosstalk(
     log_broadcaster.log(
         level="info",
         message=f"Crosstalk turn {turn}: {speaker} → {listener}",
+        event_type="crosstalk",
         session_id=session_id,
         turn=turn,
         speaker=speaker,
@@ -5,9 +5,19 @@ Based on Exchange-of-Thought (EoT) research with 4 paradigms:
 - Report: Models report findings to each other
 - Relay: Chain communication through models
 - Debate: Contradictory reasoning with confidence evaluation
+
+Calls that don't depend on each other within a round (memory analysis and
+review, debate openings and each challenge round) run concurrently, capped
+at CROSSTALK_MAX_CONCURRENCY in-flight calls; their messages are appended
+to the history in model order regardless of completion order. Report and
+relay turns build on the previous message and stay sequential.
+
+Configuration (env vars):
+  CROSSTALK_MAX_CONCURRENCY=4      Max concurrent model calls per round (1 = sequential)
 """
 
 import asyncio
+import os
 import uuid
 import time
 from typing import Dict, List, Optional, Any, Tuple
@@ -20,6 +30,8 @@ from src.services.prompts.prompt_injection_middleware import inject_system_promp
 from src.core.config import config
 from src.core.client import OpenAIClient
 
+_MAX_CONCURRENCY = int(os.environ.get("CROSSTALK_MAX_CONCURRENCY", "4"))
+
 
 class CrosstalkParadigm(Enum):
     """EoT communication paradigms."""
@@ -60,10 +72,11 @@ class CrosstalkSession:
 class CrosstalkOrchestrator:
     """Orchestrates model-to-model conversations using EoT paradigms."""
 
-    def __init__(self, config_obj):
+    def __init__(self, config_obj, max_concurrency: int = _MAX_CONCURRENCY):
         self.config = config_obj
         self.active_sessions: Dict[str, CrosstalkSession] = {}
         self.openai_client = None
+        self.max_concurrency = max(1, max_concurrency)
 
     def _get_or_create_client(self):
         """Lazily initialize OpenAIClient when actually needed."""
@@ -248,15 +261,14 @@ class CrosstalkOrchestrator:
         models = session.models
 
         # Each model solves the problem and stores its reasoning
-        for model in models:
-            # Model analyzes topic independently
-            prompt = f"""
+        # (models analyze the topic independently, so the round runs concurrently)
+        prompt = f"""
             Analyze the following topic and provide your insights:
             {session.topic}
 
             Provide a detailed analysis with reasoning.
             """
-            response = await self._call_model(model, prompt, session.system_prompts.get(model, ""))
+        for model, response in await self._call_round(session, [(model, prompt) for model in models]):
             session.history.append(CrosstalkMessage(
                 speaker=model,
                 listener="memory",
@@ -271,6 +283,7 @@ class CrosstalkOrchestrator:
             session.memory_store[model].append(response)
 
         # Second round: models review each other's insights
+        calls = []
         for model in models:
             other_insights = []
             for other_model in models:
@@ -286,14 +299,16 @@ class CrosstalkOrchestrator:
 
                 Review these insights and provide your final analysis.
                 """
-                response = await self._call_model(model, prompt, session.system_prompts.get(model, ""))
-                session.history.append(CrosstalkMessage(
-                    speaker=model,
-                    listener="memory",
-                    content=response,
-                    iteration=1,
-                    message_type="synthesis"
-                ))
+                calls.append((model, prompt))
+
+        for model, response in await self._call_round(session, calls):
+            session.history.append(CrosstalkMessage(
+                speaker=model,
+                listener="memory",
+                content=response,
+                iteration=1,
+                message_type="synthesis"
+            ))
 
     async def _execute_report_paradigm(self, session: CrosstalkSession):
         """Report paradigm: Sequential reporting between models."""
@@ -359,13 +374,13 @@ class CrosstalkOrchestrator:
             raise ValueError("Debate requires at least 2 models")
 
         # First round: each model states its position
-        for i, model in enumerate(models):
-            prompt = f"""
+        prompt = f"""
             Debate topic: {session.topic}
 
             State your position and initial reasoning. Be confident in your stance.
             """
-            response = await self._call_model(model, prompt, session.system_prompts.get(model, ""))
+        openings = await self._call_round(session, [(model, prompt) for model in models])
+        for i, (model, response) in enumerate(openings):
             confidence = 0.8 + (i * 0.05)  # Simulated confidence
 
             session.history.append(CrosstalkMessage(
@@ -377,8 +392,11 @@ class CrosstalkOrchestrator:
                 message_type="opening"
             ))
 
-        # Debate rounds: challenge each other
+        # Debate rounds: challenge each other (each challenger answers the
+        # previous round, so challenges within a round run concurrently)
         for iteration in range(1, session.iterations):
+            calls = []
+            opponents = []
             for i, challenger in enumerate(models):
                 opponent = models[(i + 1) % len(models)]
 
@@ -399,8 +417,11 @@ class CrosstalkOrchestrator:
                 Challenge this position and defend your own view on: {session.topic}
                 Provide counterarguments with evidence.
                 """
-                response = await self._call_model(challenger, prompt, session.system_prompts.get(challenger, ""))
+                calls.append((challenger, prompt))
+                opponents.append(opponent)
 
+            responses = await self._call_round(session, calls)
+            for (challenger, response), opponent in zip(responses, opponents):
                 # Simulated confidence based on argument strength
                 confidence = 0.7 + (iteration * 0.02)
 
@@ -413,6 +434,24 @@ class CrosstalkOrchestrator:
                     message_type="challenge"
                 ))
 
+    async def _call_round(
+        self, session: CrosstalkSession, calls: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        """Run independent (model, prompt) calls concurrently; results keep call order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call(model: str, prompt: str) -> str:
+            async with semaphore:
+                return await self._call_model(model, prompt, session.system_prompts.get(model, ""))
+
+        responses = await asyncio.gather(
+            *(call(model, prompt) for model, prompt in calls), return_exceptions=True
+        )
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+        return [(model, response) for (model, _), response in zip(calls, responses)]
+
     async def _call_model(self, model: str, prompt: str, system_prompt: str = "") -> str:
         """Call a model with prompt and system prompt."""
         messages = []
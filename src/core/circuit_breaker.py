@@ -253,6 +253,26 @@ class CircuitBreaker:
                 f"→ equivalent hard failure triggered"
             )
 
+    def record_health(self, healthy: bool, reason: str = "") -> None:
+        """
+        Apply an out-of-band health probe result (e.g. a background monitor).
+
+        Unhealthy holds the circuit OPEN, refreshing the cooldown so it does not
+        drift to HALF_OPEN while probes keep failing; healthy closes it at once.
+        """
+        if healthy:
+            if self.stats.state != CircuitState.CLOSED:
+                self._set_state(CircuitState.CLOSED)
+                logger.info(f"Circuit breaker '{self.name}' CLOSED by health probe")
+            self.stats.failure_count = 0
+            self.stats.success_count = 0
+            return
+        self.stats.last_failure_time = time.time()
+        if self.stats.state != CircuitState.OPEN:
+            self.stats.total_failures += 1
+            self._set_state(CircuitState.OPEN)
+            logger.warning(f"Circuit breaker '{self.name}' OPEN by health probe: {reason}")
+
     def record_parse_ok(self, response: dict) -> bool:
         """
         Check structural validity of a non-streaming response and record the
@@ -12,7 +12,12 @@ from openai._exceptions import (
     BadRequestError,
 )
 
+from src.core.stage_timing import observe_stage, stage_start
+from src.services.conversion.prompt_prefix import prompt_prefix
+from src.services.logging.hot_log import TIMESTAMP, get_hot_logger
+
 logger = logging.getLogger(__name__)
+hot_log = get_hot_logger(logger)
 
 # Providers whose APIs expect bare model names (no provider prefix like "opencode_go/").
 # The proxy stores models as "provider/model" for routing, but these endpoints
@@ -33,8 +38,11 @@ def _maybe_strip_model_prefix(model: str, base_url: str) -> str:
     ]:
         if prefix == known_prefix and url_fragment in base_url:
             stripped = model.split("/", 1)[1]
-            logger.debug(
-                f"Stripped provider prefix for {known_prefix}: '{model}' → '{stripped}'"
+            hot_log.debug(
+                "Stripped provider prefix for %s: '%s' → '%s'",
+                known_prefix,
+                model,
+                stripped,
             )
             return stripped
     return model
@@ -200,9 +208,7 @@ class OpenAIClient:
         check_health: bool = True,
     ):
         """Create an OpenAI or Azure client."""
-        import time
-
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
 
         # Detect provider type from URL
         from src.services.providers.provider_detector import (
@@ -218,13 +224,15 @@ class OpenAIClient:
         if is_kiro:
             from src.services.providers.kiro_token_manager import get_token_manager
 
-            logger.debug(f"[Kiro {timestamp}] CLIENT CREATION for Kiro provider")
+            hot_log.debug("[Kiro %s] CLIENT CREATION for Kiro provider", timestamp)
             kiro_manager = get_token_manager()
             token = kiro_manager.get_access_token()
 
             if token:
-                logger.debug(
-                    f"[Kiro {timestamp}] Using Kiro access token (first 20 chars): {token[:20]}..."
+                hot_log.debug(
+                    "[Kiro %s] Using Kiro access token (first 20 chars): %s...",
+                    timestamp,
+                    token[:20],
                 )
                 api_key = token
             else:
@@ -240,9 +248,9 @@ class OpenAIClient:
         elif is_vibeproxy:
             # Check VibeProxy/CLIProxyAPI availability BEFORE attempting to use it
             if check_health:
-                from src.services.antigravity import check_vibeproxy_health
+                from src.services.antigravity import read_vibeproxy_health
 
-                available, error_msg = check_vibeproxy_health()
+                available, error_msg = read_vibeproxy_health()
                 if not available:
                     logger.warning(
                         f"[VibeProxy {timestamp}] VibeProxy/CLIProxyAPI is NOT available: {error_msg}"
@@ -257,19 +265,24 @@ class OpenAIClient:
             # use it directly — CLIProxyAPI handles OAuth internally.
             # Only fetch Antigravity token if no key was provided.
             if api_key and api_key not in ("dummy", "your-api-key-here", ""):
-                logger.debug(
-                    f"[VibeProxy {timestamp}] Using provided API key for CLIProxyAPI (first 10 chars): {api_key[:10]}..."
+                hot_log.debug(
+                    "[VibeProxy %s] Using provided API key for CLIProxyAPI (first 10 chars): %s...",
+                    timestamp,
+                    api_key[:10],
                 )
             else:
                 from src.services.antigravity import get_antigravity_token
 
-                logger.debug(
-                    f"[VibeProxy {timestamp}] No explicit API key - fetching Antigravity token..."
+                hot_log.debug(
+                    "[VibeProxy %s] No explicit API key - fetching Antigravity token...",
+                    timestamp,
                 )
                 antigravity_token = get_antigravity_token()
                 if antigravity_token:
-                    logger.debug(
-                        f"[VibeProxy {timestamp}] Token retrieved successfully (first 20 chars): {antigravity_token[:20]}..."
+                    hot_log.debug(
+                        "[VibeProxy %s] Token retrieved successfully (first 20 chars): %s...",
+                        timestamp,
+                        antigravity_token[:20],
                     )
                     api_key = antigravity_token
                 else:
@@ -282,18 +295,18 @@ class OpenAIClient:
 
         # Diagnostic logging for special providers
         if is_vibeproxy:
-            logger.debug(f"[VibeProxy {timestamp}] Creating NEW OpenAI client instance")
-            logger.debug(f"[VibeProxy {timestamp}] Endpoint: {base_url}")
-            logger.debug(
-                f"[VibeProxy {timestamp}] Token in use (first 20 chars): {api_key[:20] if api_key else 'None'}..."
+            hot_log.debug("[VibeProxy %s] Creating NEW OpenAI client instance", timestamp)
+            hot_log.debug("[VibeProxy %s] Endpoint: %s", timestamp, base_url)
+            hot_log.debug(
+                "[VibeProxy %s] Token in use (first 20 chars): %s...",
+                timestamp,
+                api_key[:20] if api_key else "None",
             )
-            logger.debug(f"[VibeProxy {timestamp}] Custom headers: {custom_headers}")
+            hot_log.debug("[VibeProxy %s] Custom headers: %s", timestamp, custom_headers)
         elif is_kiro:
-            logger.debug(
-                f"[Kiro {timestamp}] Creating NEW OpenAI client instance for Kiro"
-            )
-            logger.debug(f"[Kiro {timestamp}] Endpoint: {base_url}")
-            logger.debug(f"[Kiro {timestamp}] Custom headers: {custom_headers}")
+            hot_log.debug("[Kiro %s] Creating NEW OpenAI client instance for Kiro", timestamp)
+            hot_log.debug("[Kiro %s] Endpoint: %s", timestamp, base_url)
+            hot_log.debug("[Kiro %s] Custom headers: %s", timestamp, custom_headers)
 
         # For Kiro (Claude API compatible), use empty API key and add Kiro token in headers
         # Kiro expects Bearer token in Authorization header, not api_key parameter
@@ -372,9 +385,7 @@ class OpenAIClient:
         3. If tier is disabled, skip it (falls through to default)
         4. Fall back to the default client (OpenRouter)
         """
-        import time
-
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
         if not config:
             return self.client
 
@@ -405,8 +416,10 @@ class OpenAIClient:
 
             # Skip disabled tiers entirely
             if not tier_enabled_map.get(tier_lower, True):
-                logger.debug(
-                    f"[Client Selection {timestamp}] {tier_name} tier DISABLED — skipping"
+                hot_log.debug(
+                    "[Client Selection %s] %s tier DISABLED — skipping",
+                    timestamp,
+                    tier_name,
                 )
                 continue
 
@@ -424,17 +437,26 @@ class OpenAIClient:
                 )
                 client = self._get_provider_client(provider)
                 if client:
-                    logger.debug(
-                        f"[Client Selection {timestamp}] {tier_name}→provider '{provider}' for '{model}'"
+                    hot_log.debug(
+                        "[Client Selection %s] %s→provider '%s' for '%s'",
+                        timestamp,
+                        tier_name,
+                        provider,
+                        model,
                     )
                     return client
-                logger.debug(
-                    f"[Client Selection {timestamp}] {tier_name} matched but provider '{provider}' not in registry, using DEFAULT"
+                hot_log.debug(
+                    "[Client Selection %s] %s matched but provider '%s' not in registry, using DEFAULT",
+                    timestamp,
+                    tier_name,
+                    provider,
                 )
                 return self.client
 
-        logger.debug(
-            f"[Client Selection {timestamp}] No tier matched for '{model}', using DEFAULT client"
+        hot_log.debug(
+            "[Client Selection %s] No tier matched for '%s', using DEFAULT client",
+            timestamp,
+            model,
         )
         return self.client
 
@@ -457,11 +479,11 @@ class OpenAIClient:
             # Check if this provider exists in the registry
             provider_client = self._get_provider_client(prefix)
             if provider_client:
-                import time
-
-                logger.debug(
-                    f"[Cascade Client {time.strftime('%H:%M:%S')}] Cross-provider: "
-                    f"'{model}' → provider '{prefix}'"
+                hot_log.debug(
+                    "[Cascade Client %s] Cross-provider: '%s' → provider '%s'",
+                    TIMESTAMP,
+                    model,
+                    prefix,
                 )
                 return provider_client
 
@@ -499,9 +521,7 @@ class OpenAIClient:
             config: Optional config object
             api_key: Optional per-request API key (for passthrough mode)
         """
-        import time
-
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
 
         # Get the appropriate client based on the model
         # If api_key is provided (passthrough mode), create a temporary client
@@ -534,9 +554,9 @@ class OpenAIClient:
             # Allow refresh for any tier (including small) if it points to VibeProxy/CLIProxyAPI
             if is_vibeproxy:
                 # Check CLIProxyAPI/VibeProxy health BEFORE attempting to use it
-                from src.services.antigravity import check_vibeproxy_health
+                from src.services.antigravity import read_vibeproxy_health
 
-                available, error_msg = check_vibeproxy_health()
+                available, error_msg = read_vibeproxy_health()
                 if not available:
                     logger.error(
                         f"[VibeProxy {timestamp}] CLIProxyAPI/VibeProxy is NOT available: {error_msg}"
@@ -555,22 +575,26 @@ class OpenAIClient:
                     "your-api-key-here",
                     "",
                 ):
-                    logger.debug(
-                        f"[VibeProxy {timestamp}] CLIProxyAPI mode - using provided API key, skipping token refresh"
+                    hot_log.debug(
+                        "[VibeProxy %s] CLIProxyAPI mode - using provided API key, skipping token refresh",
+                        timestamp,
                     )
                 else:
                     # Legacy: direct Antigravity token refresh from macOS SQLite DB
                     from src.services.antigravity import get_antigravity_auth
 
-                    logger.debug(
-                        f"[VibeProxy {timestamp}] Refreshing client with fresh Antigravity token for request"
+                    hot_log.debug(
+                        "[VibeProxy %s] Refreshing client with fresh Antigravity token for request",
+                        timestamp,
                     )
                     auth = get_antigravity_auth()
                     fresh_token = auth.get_token(force_refresh=True)
 
                     if fresh_token:
-                        logger.debug(
-                            f"[VibeProxy {timestamp}] Creating new client with fresh token (first 20 chars): {fresh_token[:20]}..."
+                        hot_log.debug(
+                            "[VibeProxy %s] Creating new client with fresh token (first 20 chars): %s...",
+                            timestamp,
+                            fresh_token[:20],
                         )
                         client = self._create_client(
                             fresh_token,
@@ -628,8 +652,10 @@ class OpenAIClient:
             # Keys like _session_fingerprint, _original_model, _force_tier are proxy
             # annotations that the upstream OpenAI SDK rejects as unknown kwargs.
             api_request = {k: v for k, v in request.items() if not k.startswith("_")}
+            api_request = prompt_prefix.cache_markers(api_request, str(getattr(client, "base_url", "")))
 
             # Create task that can be cancelled
+            upstream_start = stage_start()
             completion_task = asyncio.create_task(
                 client.chat.completions.create(**api_request)
             )
@@ -659,6 +685,8 @@ class OpenAIClient:
                 completion = await completion_task
             else:
                 completion = await completion_task
+            # Non-streaming: the first byte arrives with the complete response
+            observe_stage("upstream_ttfb", upstream_start)
 
             # Convert to dict format that matches the original interface
             return completion.model_dump()
@@ -704,9 +732,7 @@ class OpenAIClient:
             config: Optional config object
             api_key: Optional per-request API key (for passthrough mode)
         """
-        import time
-
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
 
         # Get the appropriate client based on the model
         # If api_key is provided (passthrough mode), create a temporary client
@@ -740,20 +766,24 @@ class OpenAIClient:
                     "your-api-key-here",
                     "",
                 ):
-                    logger.debug(
-                        f"[VibeProxy {timestamp}] CLIProxyAPI mode - using provided API key for streaming, skipping token refresh"
+                    hot_log.debug(
+                        "[VibeProxy %s] CLIProxyAPI mode - using provided API key for streaming, skipping token refresh",
+                        timestamp,
                     )
                 else:
-                    logger.debug(
-                        f"[VibeProxy {timestamp}] Refreshing client with fresh Antigravity token for streaming request"
+                    hot_log.debug(
+                        "[VibeProxy %s] Refreshing client with fresh Antigravity token for streaming request",
+                        timestamp,
                     )
                     from src.services.antigravity import get_antigravity_auth
 
                     auth = get_antigravity_auth()
                     fresh_token = auth.get_token(force_refresh=True)
                     if fresh_token:
-                        logger.debug(
-                            f"[VibeProxy {timestamp}] Creating new client with fresh token (first 20 chars): {fresh_token[:20]}..."
+                        hot_log.debug(
+                            "[VibeProxy %s] Creating new client with fresh token (first 20 chars): %s...",
+                            timestamp,
+                            fresh_token[:20],
                         )
                         client = self._create_client(
                             fresh_token,
@@ -768,8 +798,10 @@ class OpenAIClient:
                             f"[VibeProxy {timestamp}] Failed to retrieve fresh token! Using cached client (may fail)"
                         )
             elif is_small_tier:
-                logger.debug(
-                    f"[Client Selection {timestamp}] SMALL tier streaming - routing to {config.small_endpoint} (not VibeProxy)"
+                hot_log.debug(
+                    "[Client Selection %s] SMALL tier streaming - routing to %s (not VibeProxy)",
+                    timestamp,
+                    config.small_endpoint,
                 )
 
         # Strip provider prefix from model name for APIs that don't support it
@@ -818,11 +850,17 @@ class OpenAIClient:
 
             # Strip internal proxy metadata keys before forwarding to SDK.
             api_request = {k: v for k, v in request.items() if not k.startswith("_")}
+            api_request = prompt_prefix.cache_markers(api_request, str(getattr(client, "base_url", "")))
 
             # Create the streaming completion
+            upstream_start = stage_start()
             streaming_completion = await client.chat.completions.create(**api_request)
 
             async for chunk in streaming_completion:
+                if upstream_start:
+                    observe_stage("upstream_ttfb", upstream_start)
+                    upstream_start = 0.0
+
                 # Check for cancellation before yielding each chunk
                 if request_id and request_id in self.active_requests:
                     if self.active_requests[request_id].is_set():
@@ -868,7 +906,7 @@ class OpenAIClient:
         error_str = str(error_detail).lower()
 
         # Debug logging for error classification
-        logger.debug(f"Classifying error: {error_str}")
+        hot_log.debug("Classifying error: %s", error_str)
 
         # VibeProxy/Gemini-specific errors
         if (
@@ -948,11 +986,10 @@ class OpenAIClient:
         """
         import ssl
         import httpx
-        import time
         from src.api.websocket_logs import log_cascade
         from src.services.usage.usage_tracker import usage_tracker
 
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
 
         if not config or not config.model_cascade:
             # Cascade disabled - use normal call
@@ -979,8 +1016,9 @@ class OpenAIClient:
             if config:
                 toolcall_max_retries = getattr(config, "toolcall_max_retries", 2) or 2
             if toolcall_models:
-                logger.debug(
-                    f"[CASCADE] Tool-call request — prepending {len(toolcall_models)} tool-capable models"
+                hot_log.debug(
+                    "[CASCADE] Tool-call request — prepending %s tool-capable models",
+                    len(toolcall_models),
                 )
 
         # Estimate input tokens for context filtering
@@ -1012,9 +1050,7 @@ class OpenAIClient:
             if effective_context >= estimated_input_tokens + required_output:
                 valid_models.append(m)
             else:
-                logger.debug(
-                    f"[CASCADE] Skipping {m} (context limit {ctx_limit} too small)"
-                )
+                hot_log.debug("[CASCADE] Skipping %s (context limit %s too small)", m, ctx_limit)
 
         if not valid_models:
             # If all models are filtered out, throw a clear 400 error immediately
@@ -1069,7 +1105,7 @@ class OpenAIClient:
 
         models_to_try = ([primary_valid] if primary_valid else []) + fallbacks
 
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
         last_error = None
 
         # Track retry counts per model for soft failures
@@ -1089,10 +1125,10 @@ class OpenAIClient:
             # Skip models whose circuit is OPEN (tripped by recent failures)
             cb = _get_circuit_breaker(model)
             if cb.is_open:
-                import time as _time
-
-                logger.debug(
-                    f"[CASCADE {_time.strftime('%H:%M:%S')}] ⚡ Circuit OPEN for {model} — skipping"
+                hot_log.debug(
+                    "[CASCADE %s] ⚡ Circuit OPEN for %s — skipping",
+                    TIMESTAMP,
+                    model,
                 )
                 model_idx += 1
                 continue
@@ -1109,8 +1145,11 @@ class OpenAIClient:
                         if model_idx + 1 < len(models_to_try)
                         else None
                     )
-                    logger.debug(
-                        f"[CASCADE] Skipping {model} (daily limit {daily_count}/{daily_limit})"
+                    hot_log.debug(
+                        "[CASCADE] Skipping %s (daily limit %s/%s)",
+                        model,
+                        daily_count,
+                        daily_limit,
                     )
                     log_cascade(
                         model=model,
@@ -1175,8 +1214,9 @@ class OpenAIClient:
                         has_tool_response = bool(msg.get("tool_calls"))
                     tool_choice = request.get("tool_choice", "auto")
                     if tool_choice == "required" and not has_tool_response:
-                        logger.debug(
-                            f"[CASCADE] {model} returned no tool_calls despite tool_choice=required"
+                        hot_log.debug(
+                            "[CASCADE] %s returned no tool_calls despite tool_choice=required",
+                            model,
                         )
                         cb.record_soft_failure()
                         model_idx += 1
@@ -1197,8 +1237,10 @@ class OpenAIClient:
             except (ssl.SSLCertVerificationError, ssl.SSLError) as e:
                 # SSL/Cert errors: switch IMMEDIATELY (hard failure) + trip the circuit
                 _get_circuit_breaker(model)._record_failure(e)
-                logger.debug(
-                    f"[CASCADE] SSL/Cert error on {model} - switching immediately: {e}"
+                hot_log.debug(
+                    "[CASCADE] SSL/Cert error on %s - switching immediately: %s",
+                    model,
+                    e,
                 )
                 next_model = (
                     models_to_try[model_idx + 1]
@@ -1221,8 +1263,11 @@ class OpenAIClient:
 
             except httpx.ConnectError as e:
                 retry_counts[model] += 1
-                logger.debug(
-                    f"[CASCADE] Connection error on {model} ({retry_counts[model]}/{MAX_RETRIES_BEFORE_CASCADE})"
+                hot_log.debug(
+                    "[CASCADE] Connection error on %s (%s/%s)",
+                    model,
+                    retry_counts[model],
+                    MAX_RETRIES_BEFORE_CASCADE,
                 )
                 log_cascade(
                     model=model,
@@ -1235,9 +1280,7 @@ class OpenAIClient:
                 )
                 last_error = e
                 if retry_counts[model] >= MAX_RETRIES_BEFORE_CASCADE:
-                    logger.debug(
-                        f"[CASCADE] Max retries reached for {model}, switching to next"
-                    )
+                    hot_log.debug("[CASCADE] Max retries reached for %s, switching to next", model)
                     next_model = (
                         models_to_try[model_idx + 1]
                         if model_idx + 1 < len(models_to_try)
@@ -1258,8 +1301,11 @@ class OpenAIClient:
 
             except httpx.TimeoutException as e:
                 retry_counts[model] += 1
-                logger.debug(
-                    f"[CASCADE] Timeout on {model} ({retry_counts[model]}/{MAX_RETRIES_BEFORE_CASCADE})"
+                hot_log.debug(
+                    "[CASCADE] Timeout on %s (%s/%s)",
+                    model,
+                    retry_counts[model],
+                    MAX_RETRIES_BEFORE_CASCADE,
                 )
                 log_cascade(
                     model=model,
@@ -1272,9 +1318,7 @@ class OpenAIClient:
                 )
                 last_error = e
                 if retry_counts[model] >= MAX_RETRIES_BEFORE_CASCADE:
-                    logger.debug(
-                        f"[CASCADE] Max retries reached for {model}, switching to next"
-                    )
+                    hot_log.debug("[CASCADE] Max retries reached for %s, switching to next", model)
                     next_model = (
                         models_to_try[model_idx + 1]
                         if model_idx + 1 < len(models_to_try)
@@ -1303,8 +1347,9 @@ class OpenAIClient:
                     or "scale requests more smoothly" in error_str
                 )
                 if is_alibaba_rampup:
-                    logger.debug(
-                        f"[CASCADE] Alibaba ramp-up limit on {model} — cascading immediately to next provider"
+                    hot_log.debug(
+                        "[CASCADE] Alibaba ramp-up limit on %s — cascading immediately to next provider",
+                        model,
                     )
                     next_model = (
                         models_to_try[model_idx + 1]
@@ -1358,8 +1403,11 @@ class OpenAIClient:
                                 header_backoff = max(1.0, reset_val - now + 1.0)
                             else:
                                 header_backoff = max(1.0, reset_val + 1.0)
-                            logger.debug(
-                                f"[CASCADE] X-RateLimit-Reset on {model}: {reset_raw} → backoff {header_backoff:.1f}s"
+                            hot_log.debug(
+                                "[CASCADE] X-RateLimit-Reset on %s: %s → backoff %.1fs",
+                                model,
+                                reset_raw,
+                                header_backoff,
                             )
                 except Exception:
                     pass
@@ -1370,8 +1418,12 @@ class OpenAIClient:
                     backoff = min(
                         30.0, (2 ** min(retry_counts[model], 4)) * _random.uniform(0.8, 1.2)
                     )
-                logger.debug(
-                    f"[CASCADE] Rate limit on {model} ({retry_counts[model]}/{MAX_RETRIES_BEFORE_CASCADE}), backoff {backoff:.1f}s"
+                hot_log.debug(
+                    "[CASCADE] Rate limit on %s (%s/%s), backoff %.1fs",
+                    model,
+                    retry_counts[model],
+                    MAX_RETRIES_BEFORE_CASCADE,
+                    backoff,
                 )
                 log_cascade(
                     model=model,
@@ -1384,9 +1436,7 @@ class OpenAIClient:
                 )
                 last_error = e
                 if retry_counts[model] >= MAX_RETRIES_BEFORE_CASCADE:
-                    logger.debug(
-                        f"[CASCADE] Max retries reached for {model}, switching to next"
-                    )
+                    hot_log.debug("[CASCADE] Max retries reached for %s, switching to next", model)
                     next_model = (
                         models_to_try[model_idx + 1]
                         if model_idx + 1 < len(models_to_try)
@@ -1432,8 +1482,11 @@ class OpenAIClient:
                         )
                     except Exception:
                         pass
-                    logger.debug(
-                        f"[CASCADE {timestamp}] 🚫 Request error on {model} - switching immediately: {e}"
+                    hot_log.debug(
+                        "[CASCADE %s] 🚫 Request error on %s - switching immediately: %s",
+                        timestamp,
+                        model,
+                        e,
                     )
                 next_model = (
                     models_to_try[model_idx + 1]
@@ -1458,8 +1511,12 @@ class OpenAIClient:
                 # 502, 503, 504: retry with count
                 if hasattr(e, "status_code") and e.status_code in [502, 503, 504]:
                     retry_counts[model] += 1
-                    logger.debug(
-                        f"[CASCADE] Server error {e.status_code} on {model} ({retry_counts[model]}/{MAX_RETRIES_BEFORE_CASCADE})"
+                    hot_log.debug(
+                        "[CASCADE] Server error %s on %s (%s/%s)",
+                        e.status_code,
+                        model,
+                        retry_counts[model],
+                        MAX_RETRIES_BEFORE_CASCADE,
                     )
                     log_cascade(
                         model=model,
@@ -1472,9 +1529,7 @@ class OpenAIClient:
                     )
                     last_error = e
                 if retry_counts[model] >= MAX_RETRIES_BEFORE_CASCADE:
-                    logger.debug(
-                        f"[CASCADE] Max retries reached for {model}, switching to next"
-                    )
+                    hot_log.debug("[CASCADE] Max retries reached for %s, switching to next", model)
                     next_model = (
                         models_to_try[model_idx + 1]
                         if model_idx + 1 < len(models_to_try)
@@ -1585,11 +1640,10 @@ class OpenAIClient:
         """
         import ssl
         import httpx
-        import time
         from src.api.websocket_logs import log_cascade
         from src.services.usage.usage_tracker import usage_tracker
 
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
 
         if not config or not config.model_cascade:
             async for line in self.create_chat_completion_stream(
@@ -1609,7 +1663,7 @@ class OpenAIClient:
         local_enabled = getattr(config, "local_enabled", False)
         if local_enabled and local_model and local_model not in cascade_models:
             cascade_models = list(cascade_models) + [local_model]
-            logger.debug(f"[CASCADE] LOCAL tier appended: {local_model} @ {local_endpoint}")
+            hot_log.debug("[CASCADE] LOCAL tier appended: %s @ %s", local_model, local_endpoint)
 
         # Tool-call-aware cascade: prepend TOOLCALL_MODELS when request has tools
         is_tool_request = bool(request.get("tools")) or bool(request.get("tool_choice"))
@@ -1625,8 +1679,9 @@ class OpenAIClient:
             if config:
                 toolcall_max_retries = getattr(config, "toolcall_max_retries", 2) or 2
             if toolcall_models:
-                logger.debug(
-                    f"[CASCADE] Tool-call streaming request — prepending {len(toolcall_models)} tool-capable models"
+                hot_log.debug(
+                    "[CASCADE] Tool-call streaming request — prepending %s tool-capable models",
+                    len(toolcall_models),
                 )
 
         # Estimate input tokens for context filtering
@@ -1640,7 +1695,7 @@ class OpenAIClient:
 
         # Deduplicate while preserving priority order
         # Priority: primary → tool-call models → tier cascade → dynamic rankings
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = TIMESTAMP
         raw_models_to_try = []
         seen_stream: set = set()
         for model_name in (
@@ -1661,9 +1716,7 @@ class OpenAIClient:
             if effective_context >= estimated_input_tokens + required_output:
                 valid_models.append(m)
             else:
-                logger.debug(
-                    f"[CASCADE] Skipping {m} (context limit {ctx_limit} too small)"
-                )
+                hot_log.debug("[CASCADE] Skipping %s (context limit %s too small)", m, ctx_limit)
 
         if not valid_models:
             max_limit = (
@@ -1731,10 +1784,10 @@ class OpenAIClient:
             # Skip models with OPEN circuit breakers (same as non-streaming cascade)
             _cb_stream = _get_circuit_breaker(model)
             if _cb_stream.is_open:
-                import time as _t
-
-                logger.debug(
-                    f"[CASCADE {_t.strftime('%H:%M:%S')}] ⚡ Circuit OPEN for {model} (stream) — skipping"
+                hot_log.debug(
+                    "[CASCADE %s] ⚡ Circuit OPEN for %s (stream) — skipping",
+                    TIMESTAMP,
+                    model,
                 )
                 model_idx += 1
                 continue
@@ -1750,8 +1803,11 @@ class OpenAIClient:
                         if model_idx + 1 < len(models_to_try)
                         else None
                     )
-                    logger.debug(
-                        f"[CASCADE] Skipping {model} (stream) - daily limit {daily_count}/{daily_limit}"
+                    hot_log.debug(
+                        "[CASCADE] Skipping %s (stream) - daily limit %s/%s",
+                        model,
+                        daily_count,
+                        daily_limit,
                     )
                     log_cascade(
                         model=model,
@@ -1969,8 +2025,10 @@ class OpenAIClient:
 
                     # Rate-limit (streaming): cascade after 1 retry to avoid long backoff
                     retry_counts[model] += 1
-                    logger.debug(
-                        f"[CASCADE] Streaming rate limit on {model} ({retry_counts[model]}/1), cascading next"
+                    hot_log.debug(
+                        "[CASCADE] Streaming rate limit on %s (%s/1), cascading next",
+                        model,
+                        retry_counts[model],
                     )
                     log_cascade(
                         model=model,
@@ -1987,8 +2045,12 @@ class OpenAIClient:
 
                 if status_code in (500, 502, 503, 504):
                     retry_counts[model] += 1
-                    logger.debug(
-                        f"[CASCADE] Streaming server error {status_code} on {model} ({retry_counts[model]}/{max_retries_before_cascade})"
+                    hot_log.debug(
+                        "[CASCADE] Streaming server error %s on %s (%s/%s)",
+                        status_code,
+                        model,
+                        retry_counts[model],
+                        max_retries_before_cascade,
                     )
                     log_cascade(
                         model=model,
@@ -2000,8 +2062,9 @@ class OpenAIClient:
                         error=str(e.detail),
                     )
                     if retry_counts[model] >= max_retries_before_cascade:
-                        logger.debug(
-                            f"[CASCADE] Max retries reached for {model}, switching to next"
+                        hot_log.debug(
+                            "[CASCADE] Max retries reached for %s, switching to next",
+                            model,
                         )
                         next_model = (
                             models_to_try[model_idx + 1]
@@ -2027,8 +2090,10 @@ class OpenAIClient:
             except (ssl.SSLCertVerificationError, ssl.SSLError) as e:
                 if emitted_any_chunk:
                     raise
-                logger.debug(
-                    f"[CASCADE] Streaming SSL/Cert error on {model} - switching immediately: {e}"
+                hot_log.debug(
+                    "[CASCADE] Streaming SSL/Cert error on %s - switching immediately: %s",
+                    model,
+                    e,
                 )
                 next_model = (
                     models_to_try[model_idx + 1]
@@ -2053,8 +2118,11 @@ class OpenAIClient:
                 if emitted_any_chunk:
                     raise
                 retry_counts[model] += 1
-                logger.debug(
-                    f"[CASCADE] Streaming network error on {model} ({retry_counts[model]}/{max_retries_before_cascade})"
+                hot_log.debug(
+                    "[CASCADE] Streaming network error on %s (%s/%s)",
+                    model,
+                    retry_counts[model],
+                    max_retries_before_cascade,
                 )
                 log_cascade(
                     model=model,
@@ -2067,9 +2135,7 @@ class OpenAIClient:
                 )
                 last_error = e
                 if retry_counts[model] >= max_retries_before_cascade:
-                    logger.debug(
-                        f"[CASCADE] Max retries reached for {model}, switching to next"
-                    )
+                    hot_log.debug("[CASCADE] Max retries reached for %s, switching to next", model)
                     next_model = (
                         models_to_try[model_idx + 1]
                         if model_idx + 1 < len(models_to_try)
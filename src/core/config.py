@@ -10,7 +10,12 @@ import os
 import re
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from src.core.config_resolver import resolver as _resolver, ConfigLayer
+from src.core.config_resolver import (
+    resolver as _resolver,
+    ConfigLayer,
+    ConfigSnapshot,
+    get_snapshot,
+)
 
 # ── API key format patterns (unchanged from legacy) ────────────────────────────
 API_KEY_PATTERNS: Dict[str, re.Pattern] = {
@@ -29,7 +34,12 @@ API_KEY_PATTERNS: Dict[str, re.Pattern] = {
 
 
 class ConfigField:
-    """Descriptor that resolves a config field on every access with optional cast."""
+    """Descriptor that reads a config field from the current snapshot with optional cast.
+
+    The resolver rebuilds its snapshot only when a layer changes; immutable
+    cast results are memoized on the snapshot, so repeated reads are a
+    couple of dict lookups.
+    """
 
     def __init__(self, field_path: str, cast: Callable[[Any], Any] = lambda x: x):
         self.field_path = field_path
@@ -38,16 +48,17 @@ class ConfigField:
     def __get__(self, instance, owner):
         try:
             # Prefer request-scoped snapshot if present (US3 in-flight isolation)
-            from src.core.config_resolver import get_snapshot
-
             snap = get_snapshot()
-            if snap is not None and self.field_path in snap:
-                rv = snap[self.field_path]
-                return self.cast(rv.value)
-            rv = _resolver.resolve(self.field_path)
-            return self.cast(rv.value)
+            if snap is None or self.field_path not in snap:
+                snap = _resolver.current()
+            if isinstance(snap, ConfigSnapshot):
+                return snap.cast(self.field_path, self.cast)
+            return self.cast(snap[self.field_path].value)
         except KeyError:
-            return None
+            try:
+                return self.cast(_resolver.resolve(self.field_path).value)
+            except KeyError:
+                return None
 
     def __set__(self, instance, value):
         raise AttributeError("Config is read-only; use resolver API to mutate")
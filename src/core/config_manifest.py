@@ -71,6 +71,22 @@ SETTINGS: List[Setting] = [
     Setting("MAX_RETRIES", int, 2, "Max upstream retries before cascade", "server",
             cli_flag="--max-retries", tui_widget="number", web_component="number",
             min_val=0, max_val=10),
+    Setting("FAST_REQUEST_PARSE", bool, False,
+            "Parse /v1/messages bodies incrementally, re-validating only new messages",
+            "server", cli_flag="--fast-request-parse", tui_widget="toggle",
+            web_component="switch"),
+    Setting("OPENAI_STREAM_PASSTHROUGH", bool, True,
+            "Relay /v1/chat/completions SSE bytes as-is unless a chunk needs rewriting",
+            "server", cli_flag="--stream-passthrough", tui_widget="toggle",
+            web_component="switch"),
+    Setting("MODEL_USAGE_FLUSH_SECONDS", float, 5.0,
+            "Batch model-usage counts in memory and write data/model_usage.json at most this often",
+            "server", cli_flag="--model-usage-flush-seconds", tui_widget="number",
+            web_component="number", units="s", min_val=0, max_val=3600),
+    Setting("SERVER_PROFILE", str, "full",
+            "Which subsystems load: full (all routers), lazy (optional routers on first use), core (/v1 + /metrics only)",
+            "server", cli_flag="--server-profile", choices=["full", "lazy", "core"],
+            tui_widget="select", web_component="select"),
 
     # ════════════════════════════════════════════════════════════════════════
     # GROUP: models
@@ -233,6 +249,55 @@ SETTINGS: List[Setting] = [
     Setting("TOKEN_COUNT_CACHE_SIZE", int, 512,
             "LRU cache slots for tiktoken encoding results", "compression",
             cli_flag="--token-cache-size", tui_widget="number", web_component="number"),
+    Setting("SINGLE_FLIGHT_ENABLED", bool, True,
+            "Share one upstream call among identical concurrent requests (streams are teed)",
+            "compression", cli_flag="--single-flight", tui_widget="toggle",
+            web_component="switch"),
+    Setting("TOOL_PIPELINE_CACHE_ENABLED", bool, True,
+            "Memoize the converted tool array and its token count per tool set",
+            "compression", cli_flag="--tool-pipeline-cache", tui_widget="toggle",
+            web_component="switch"),
+    Setting("CONVERSION_CACHE_ENABLED", bool, True,
+            "Reuse each session's converted message history; convert only new turns",
+            "compression", cli_flag="--conversion-cache", tui_widget="toggle",
+            web_component="switch"),
+    Setting("IMAGE_STORE_ENABLED", bool, True,
+            "Share one data URL per distinct image across turns and requests",
+            "compression", cli_flag="--image-store", tui_widget="toggle",
+            web_component="switch"),
+    Setting("IMAGE_HISTORY_POLICY", str, "keep",
+            "Images in older turns: send as-is, replace with a placeholder, or downsample",
+            "compression", cli_flag="--image-history-policy",
+            choices=["keep", "strip", "downsample"],
+            tui_widget="select", web_component="select"),
+    Setting("IMAGE_KEEP_RECENT_TURNS", int, 2,
+            "Most recent user turns whose images are never stripped or downsampled",
+            "compression", cli_flag="--image-keep-recent", tui_widget="number",
+            web_component="number", min_val=1, max_val=50),
+    Setting("IMAGE_DOWNSAMPLE_MAX_PX", int, 512,
+            "Long-side pixel limit for downsampled history images (needs Pillow)",
+            "compression", cli_flag="--image-downsample-px", tui_widget="number",
+            web_component="number", units="px", min_val=64, max_val=4096),
+    Setting("PROMPT_PREFIX_STABILIZE", bool, True,
+            "Keep each session's tool order fixed so upstream prompt caching keeps hitting",
+            "compression", cli_flag="--prompt-prefix-stabilize", tui_widget="toggle",
+            web_component="switch"),
+    Setting("PROMPT_CACHE_MARKERS", bool, False,
+            "Add a cache_control breakpoint to the system message on OpenRouter Anthropic/Gemini models",
+            "compression", cli_flag="--prompt-cache-markers", tui_widget="toggle",
+            web_component="switch"),
+    Setting("TOOL_OUTPUT_COMPACTION", bool, False,
+            "Compact old tool results: dedupe repeated reads, elide lines shown earlier, collapse repeats",
+            "compression", cli_flag="--tool-output-compaction", tui_widget="toggle",
+            web_component="switch"),
+    Setting("TOOL_COMPACT_KEEP_RECENT", int, 4,
+            "Most recent assistant turns whose tool results are always sent verbatim",
+            "compression", cli_flag="--tool-compact-keep-recent", tui_widget="number",
+            web_component="number", min_val=1, max_val=100),
+    Setting("TOOL_COMPACT_MIN_CHARS", int, 1000,
+            "Tool results shorter than this are never compacted",
+            "compression", cli_flag="--tool-compact-min-chars", tui_widget="number",
+            web_component="number", units="chars", min_val=0, max_val=100000),
 
     # ════════════════════════════════════════════════════════════════════════
     # GROUP: local_gpu
@@ -301,6 +366,11 @@ SETTINGS: List[Setting] = [
             "Suppress full traffic logging even at LOG_LEVEL=debug. For debug Python logs WITHOUT the heavy traffic dump.",
             "logging",
             cli_flag="--debug-traffic-quiet", tui_widget="toggle", web_component="switch"),
+    Setting("LOG_DEBUG_SAMPLE_RATE", int, 0,
+            "Emit full hot-path debug detail for 1 in N requests at INFO level (0=off)",
+            "logging",
+            cli_flag="--log-debug-sample-rate", tui_widget="number", web_component="number",
+            min_val=0),
 
     # ════════════════════════════════════════════════════════════════════════
     # GROUP: watchdog
@@ -329,6 +399,10 @@ SETTINGS: List[Setting] = [
     Setting("USAGE_TRACKING_DB_PATH", str, "usage_tracking.db",
             "SQLite database file path for usage tracking", "usage_tracking",
             cli_flag="--usage-db", tui_widget="input", web_component="input"),
+    Setting("STAGE_METRICS", bool, True,
+            "Record per-stage latency histograms (proxy_stage_duration_seconds) on /metrics",
+            "usage_tracking", cli_flag="--stage-metrics", tui_widget="toggle",
+            web_component="switch"),
     Setting("SILENCE_DEPRECATION_WARNINGS", bool, False,
             "Suppress deprecated env-var warnings on startup", "usage_tracking",
             cli_flag="--silence-deprecation-warnings",
@@ -5,6 +5,14 @@ Precedence: CLI > shell env > .env > stored config > defaults.
 
 See specs/001-unified-config-system/contracts/resolver.md for the full contract.
 Implementation lands in Phase 2 (tasks T006-T014 in specs/001-unified-config-system/tasks.md).
+
+Reads are served from a frozen ``ConfigSnapshot`` of every registered field.
+It is rebuilt only after a layer or schema changes (every layer dict bumps
+the resolver's version on write, including the direct ``_layers[...]``
+writes in the CLI overlay and assignment sync) or after an environment
+variable referenced by a ``${VAR}`` value changes; until then ``snapshot()``
+hands out the same object, so per-request config cost does not grow with
+the number of fields.
 """
 
 from __future__ import annotations
@@ -13,10 +21,12 @@ import contextvars
 import os
 import re
 import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Iterator
 
 from dotenv import load_dotenv
 
@@ -64,14 +74,103 @@ class ConfigValidationError(ValueError):
     pass
 
 
+_ENV_REF = re.compile(r"\$\{([^}]+)\}")
+
+# Cast results that can be shared between readers of one snapshot.
+_IMMUTABLE = (str, int, float, bool, type(None), tuple, frozenset)
+
+
+class ConfigSnapshot(Mapping):
+    """Immutable ``{field_path: ResolvedValue}`` view of one resolver version."""
+
+    __slots__ = ("version", "_values", "_env_refs", "_casts")
+
+    def __init__(
+        self,
+        version: int,
+        values: dict[str, ResolvedValue],
+        env_refs: dict[str, str | None],
+    ) -> None:
+        self.version = version
+        self._values = MappingProxyType(values)
+        self._env_refs = env_refs  # ${VAR} names used → value at build time
+        self._casts: dict[tuple[str, Callable], Any] = {}
+
+    def __getitem__(self, field_path: str) -> ResolvedValue:
+        return self._values[field_path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def env_changed(self) -> bool:
+        return any(os.environ.get(name) != value for name, value in self._env_refs.items())
+
+    def cast(self, field_path: str, cast: Callable[[Any], Any]) -> Any:
+        """``cast(self[field_path].value)``, computed once per snapshot when immutable."""
+        try:
+            return self._casts[(field_path, cast)]
+        except KeyError:
+            value = cast(self._values[field_path].value)
+            if isinstance(value, _IMMUTABLE):
+                self._casts[(field_path, cast)] = value
+            return value
+
+
+class _TrackedLayer(dict):
+    """Layer dict that bumps the owning resolver's version on every write."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "ConfigResolver") -> None:
+        super().__init__()
+        self._owner = owner
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._owner._touch()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._owner._touch()
+
+    def pop(self, *args):
+        try:
+            return super().pop(*args)
+        finally:
+            self._owner._touch()
+
+    def popitem(self):
+        try:
+            return super().popitem()
+        finally:
+            self._owner._touch()
+
+    def setdefault(self, key, default=None):
+        try:
+            return super().setdefault(key, default)
+        finally:
+            self._owner._touch()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._owner._touch()
+
+    def clear(self):
+        super().clear()
+        self._owner._touch()
+
+
 # ── Snapshot context ───────────────────────────────────────────────────────────
 
-_snapshot_ctx: contextvars.ContextVar[Optional[dict[str, ResolvedValue]]] = (
+_snapshot_ctx: contextvars.ContextVar[Mapping[str, ResolvedValue] | None] = (
     contextvars.ContextVar("config_snapshot", default=None)
 )
 
 
-def set_snapshot(snap: dict) -> contextvars.Token:
+def set_snapshot(snap: Mapping[str, ResolvedValue]) -> contextvars.Token:
     return _snapshot_ctx.set(snap)
 
 
@@ -79,7 +178,7 @@ def reset_snapshot(token: contextvars.Token) -> None:
     _snapshot_ctx.reset(token)
 
 
-def get_snapshot() -> Optional[dict]:
+def get_snapshot() -> Mapping[str, ResolvedValue] | None:
     return _snapshot_ctx.get()
 
 
@@ -88,13 +187,10 @@ def get_snapshot() -> Optional[dict]:
 
 class ConfigResolver:
     def __init__(self) -> None:
-        self._layers = {
-            ConfigLayer.CLI: {},
-            ConfigLayer.SHELL_ENV: {},
-            ConfigLayer.DOTENV: {},
-            ConfigLayer.STORED: {},
-            ConfigLayer.DEFAULT: {},
-        }
+        self._version = 0
+        self._version_lock = threading.Lock()
+        self._current: ConfigSnapshot | None = None
+        self._layers = {layer: _TrackedLayer(self) for layer in LAYERS_BY_PRECEDENCE}
         self._schemas: dict[str, FieldSchema] = {}
         # Legacy env-var names actually present in the environment (not just registered).
         self._deprecated_aliases: set[str] = set()
@@ -323,50 +419,71 @@ class ConfigResolver:
     def register_schema(self, field_path: str, schema: FieldSchema) -> None:
         with self._lock:
             self._schemas[field_path] = schema
+            self._touch()
+
+    def _touch(self) -> None:
+        with self._version_lock:
+            self._version += 1
 
     def resolve(self, field_path: str) -> ResolvedValue:
         self._ensure_initialized()
         snap = get_snapshot()
         if snap is not None and field_path in snap:
             return snap[field_path]
+        current = self.current()
+        try:
+            return current[field_path]
+        except KeyError:
+            pass
         with self._lock:
-            schema = self._schemas.get(field_path)
-            if schema is None:
+            if field_path not in self._schemas:
                 raise KeyError(f"Unknown field: {field_path}")
-            for layer in LAYERS_BY_PRECEDENCE:
-                if field_path in self._layers[layer]:
-                    raw = self._layers[layer][field_path]
-                    val = self._expand_env_vars(raw)
-                    try:
-                        if schema.type and val is not None:
-                            if schema.type is bool:
-                                val = (
-                                    val.lower() in ("true", "1", "yes")
-                                    if isinstance(val, str)
-                                    else bool(val)
-                                )
-                            elif schema.type is int:
-                                val = int(val)
-                            elif schema.type is float:
-                                val = float(val)
-                            else:
-                                val = schema.type(val)
-                    except Exception:
-                        val = raw
-                    return ResolvedValue(
-                        field_path=field_path,
-                        value=val,
-                        source_layer=layer,
-                        raw_value=raw,
-                    )
-            if schema.default is not None:
+            return self._resolve_layers(field_path, {})
+
+    def _resolve_layers(
+        self, field_path: str, env_refs: dict[str, str | None]
+    ) -> ResolvedValue:
+        """Walk the layers for one field (caller holds the lock)."""
+        schema = self._schemas.get(field_path)
+        if schema is None:
+            raise KeyError(f"Unknown field: {field_path}")
+        for layer in LAYERS_BY_PRECEDENCE:
+            if field_path in self._layers[layer]:
+                raw = self._layers[layer][field_path]
+                if isinstance(raw, str) and "${" in raw:
+                    for name in _ENV_REF.findall(raw):
+                        env_refs[name] = os.environ.get(name)
+                val = self._expand_env_vars(raw)
+                try:
+                    if schema.type and val is not None:
+                        if schema.type is bool:
+                            val = (
+                                val.lower() in ("true", "1", "yes")
+                                if isinstance(val, str)
+                                else bool(val)
+                            )
+                        elif schema.type is int:
+                            val = int(val)
+                        elif schema.type is float:
+                            val = float(val)
+                        else:
+                            val = schema.type(val)
+                except Exception:
+                    val = raw
                 return ResolvedValue(
                     field_path=field_path,
-                    value=schema.default,
-                    source_layer=ConfigLayer.DEFAULT,
-                    raw_value=None,
+                    value=val,
+                    source_layer=layer,
+                    raw_value=raw,
                 )
-            raise KeyError(f"Field {field_path} has no value and no default")
+        if schema.default is not None:
+            return ResolvedValue(
+                field_path=field_path,
+                value=schema.default,
+                source_layer=ConfigLayer.DEFAULT,
+                raw_value=None,
+            )
+        raise KeyError(f"Field {field_path} has no value and no default")
 
     def _expand_env_vars(self, value: Any) -> Any:
         if not isinstance(value, str):
@@ -495,18 +612,29 @@ class ConfigResolver:
     def _increment_seq(self) -> None:
         self._seq += 1
 
-    def snapshot(self) -> dict[str, ResolvedValue]:
+    def current(self) -> ConfigSnapshot:
+        """The frozen snapshot of the current version, rebuilt only after a change."""
         self._ensure_initialized()
+        snap = self._current
+        if snap is not None and snap.version == self._version and not snap.env_changed():
+            return snap
         with self._lock:
-            field_paths = list(self._schemas.keys())
-        result: dict[str, ResolvedValue] = {}
-        for fp in field_paths:
-            try:
-                rv = self.resolve(fp)
-                result[fp] = rv
-            except KeyError:
-                pass
-        return result
+            # Tagged with the version read before resolving: a write racing
+            # the build leaves a newer version, so the next read rebuilds.
+            version = self._version
+            values: dict[str, ResolvedValue] = {}
+            env_refs: dict[str, str | None] = {}
+            for fp in list(self._schemas):
+                try:
+                    values[fp] = self._resolve_layers(fp, env_refs)
+                except KeyError:
+                    pass
+            snap = ConfigSnapshot(version, values, env_refs)
+            self._current = snap
+        return snap
+
+    def snapshot(self) -> ConfigSnapshot:
+        return self.current()
 
     @property
     def deprecated_aliases_in_use(self) -> set[str]:
@@ -4,6 +4,11 @@ Routes upstream identifiers (Anthropic model names, Hermes agent roles,
 future Anthropic task types) to assignments without code changes.
 
 See specs/001-unified-config-system/data-model.md#identifiermapping.
+
+Lookups go through an exact-match index (identifier → winning mapping) that
+is rebuilt only when the mappings change: any IdentifierMapping field write
+or construction bumps a module version, and the chain's list is checked by
+identity and length.
 """
 
 from __future__ import annotations
@@ -12,6 +17,15 @@ import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
+_version = 0
+_version_lock = threading.Lock()
+
+
+def _touch() -> None:
+    global _version
+    with _version_lock:
+        _version += 1
+
 
 @dataclass
 class IdentifierMapping:
@@ -23,6 +37,10 @@ class IdentifierMapping:
     priority: int = 0
     notes: str = ""
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        _touch()
+
     def to_dict(self) -> dict:
         """Serialize to dict for JSON API responses."""
         return {
@@ -59,6 +77,8 @@ class IdentifierMappingRegistry:
 
     def __init__(self) -> None:
         self._lock = threading.RLock()
+        # (mappings list, its length, _version, {identifier: winning mapping})
+        self._index: tuple = (None, -1, -1, {})
 
     def _chain(self):
         from src.core.proxy_chain import get_chain
@@ -94,6 +114,7 @@ class IdentifierMappingRegistry:
             # Validate that assignment_id exists (FK check)
             self._validate_assignment_exists(mapping.assignment_id, chain)
             chain.identifier_mappings.append(mapping)
+            _touch()
             self._persist()
             return mapping
 
@@ -128,6 +149,7 @@ class IdentifierMappingRegistry:
                 if m.incoming_identifier != incoming_identifier:
                     continue
                 chain.identifier_mappings.pop(i)
+                _touch()
                 self._persist()
                 return
             raise IdentifierMappingError(
@@ -142,16 +164,25 @@ class IdentifierMappingRegistry:
         On no match, returns None — caller falls back to existing tier-based
         resolution (FR-003b, FR-003c).
         """
+        mappings = self._chain().identifier_mappings
+        index = self._index
+        if index[0] is not mappings or index[1] != len(mappings) or index[2] != _version:
+            index = self._rebuild_index(mappings)
+        return index[3].get(incoming_identifier)
+
+    def _rebuild_index(self, mappings: list) -> tuple:
         with self._lock:
-            candidates = [
-                m
-                for m in self._chain().identifier_mappings
-                if m.enabled and m.incoming_identifier == incoming_identifier
-            ]
-            if not candidates:
-                return None
-            candidates.sort(key=lambda m: m.priority, reverse=True)
-            return candidates[0]
+            version = _version
+            best: dict[str, IdentifierMapping] = {}
+            for m in mappings:
+                if not m.enabled:
+                    continue
+                current = best.get(m.incoming_identifier)
+                # Strictly greater: ties keep the earliest mapping, as the stable sort did
+                if current is None or m.priority > current.priority:
+                    best[m.incoming_identifier] = m
+            self._index = (mappings, len(mappings), version, best)
+            return self._index
 
     def _validate_assignment_exists(self, assignment_id: str, chain) -> None:
         """FK-style check: referenced assignment must exist."""
@@ -7,7 +7,66 @@ would provide token savings.
 
 import json
 import re
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Iterator
+
+# An opener followed by something that can continue a JSON object/array
+_CANDIDATE = re.compile(r'\{\s*["}]|\[\s*["{\[\]\-0-9tfn]')
+_decoder = json.JSONDecoder()
+_WINDOW = 256
+
+
+def _decode_at(text: str, start: int) -> Tuple[Any, int]:
+    """``raw_decode`` of the value at ``start``, parsing a growing window.
+
+    ``JSONDecodeError`` counts newlines from the start of the document it was
+    given, so decoding against the whole text would make every failed
+    candidate O(len(text)). Failures near the window edge may just be
+    truncation and are retried with a larger window.
+    """
+    size = _WINDOW
+    while True:
+        window = text[start : start + size]
+        try:
+            value, end = _decoder.raw_decode(window)
+            return value, start + end
+        except json.JSONDecodeError as e:
+            truncated = start + size < len(text) and (
+                e.pos >= len(window) - 8 or e.msg.startswith("Unterminated string")
+            )
+            if not truncated:
+                raise json.JSONDecodeError(e.msg, window, e.pos) from None
+            size *= 4
+        except RecursionError:
+            # Pathologically deep nesting: give up on the whole window so
+            # the openers inside it are not each re-parsed to the same depth.
+            raise json.JSONDecodeError("Nesting too deep", window, len(window)) from None
+
+
+def iter_json_values(text: str, min_size: int = 0) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Yield ``(start, end, value)`` for each top-level JSON object/array in text.
+
+    One forward pass: the regex engine finds the next ``{``/``[`` that can
+    start a JSON value and the C decoder parses it. A parse that fails resumes
+    the search just after the failed opener, so a valid value nested inside a
+    malformed or truncated one is still found; each attempt is bounded by its
+    decode window, and nesting depth is unbounded — unlike a nested-brace
+    regex, which only sees two levels and backtracks on unbalanced input.
+    """
+    pos = 0
+    while True:
+        match = _CANDIDATE.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+        try:
+            value, end = _decode_at(text, start)
+        except json.JSONDecodeError:
+            pos = start + 1
+            continue
+        if end - start >= min_size:
+            yield start, end, value
+        pos = end
 
 
 class JSONDetector:
@@ -17,9 +76,6 @@ class JSONDetector:
     Used for session-level TOON conversion analysis, not per-request.
     """
 
-    # Regex to find JSON-like structures
-    JSON_PATTERN = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}|\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]')
-
     # Minimum JSON size to consider (bytes)
     MIN_JSON_SIZE = 100
 
@@ -40,29 +96,15 @@ class JSONDetector:
         json_objects = []
         total_bytes = 0
 
-        # Find potential JSON structures
-        matches = JSONDetector.JSON_PATTERN.finditer(text)
-
-        for match in matches:
-            json_str = match.group(0)
-
-            # Try to parse as JSON
-            try:
-                obj = json.loads(json_str)
-                size = len(json_str)
-
-                # Only count significant JSON (not tiny objects)
-                if size >= JSONDetector.MIN_JSON_SIZE:
-                    json_objects.append({
-                        "size": size,
-                        "type": "object" if isinstance(obj, dict) else "array",
-                        "depth": JSONDetector._get_depth(obj)
-                    })
-                    total_bytes += size
-
-            except (json.JSONDecodeError, ValueError):
-                # Not valid JSON, skip
-                continue
+        # Find JSON structures in a single pass (only significant sizes)
+        for start, end, obj in iter_json_values(text, JSONDetector.MIN_JSON_SIZE):
+            size = end - start
+            json_objects.append({
+                "size": size,
+                "type": "object" if isinstance(obj, dict) else "array",
+                "depth": JSONDetector._get_depth(obj)
+            })
+            total_bytes += size
 
         has_json = len(json_objects) > 0
         return has_json, total_bytes, json_objects
@@ -70,16 +112,21 @@ class JSONDetector:
     @staticmethod
     def _get_depth(obj: Any, current_depth: int = 0) -> int:
         """Calculate nesting depth of JSON object."""
-        if not isinstance(obj, (dict, list)):
-            return current_depth
-
-        if not obj:
-            return current_depth
-
-        if isinstance(obj, dict):
-            return max((JSONDetector._get_depth(v, current_depth + 1) for v in obj.values()), default=current_depth)
-        else:  # list
-            return max((JSONDetector._get_depth(item, current_depth + 1) for item in obj), default=current_depth)
+        # Iterative: detected values can be large and arbitrarily deep
+        depth = current_depth
+        stack = [(obj, current_depth)]
+        while stack:
+            node, level = stack.pop()
+            if isinstance(node, dict):
+                node = node.values()
+            elif not isinstance(node, list):
+                depth = max(depth, level)
+                continue
+            if not node:
+                depth = max(depth, level)
+                continue
+            stack.extend((child, level + 1) for child in node)
+        return depth
 
     @staticmethod
     def analyze_tool_calls(tool_calls: List[Dict[str, Any]]) -> Tuple[bool, int]:
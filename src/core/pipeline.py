@@ -1,5 +1,5 @@
 """
-API Pipeline Orchestration — sequential API handoff chains.
+API Pipeline Orchestration — API handoff chains with optional parallel steps.
 
 Pipelines are defined in config/proxy_chain.json under the "pipelines" key:
 
@@ -37,18 +37,39 @@ Pipelines are defined in config/proxy_chain.json under the "pipelines" key:
         }
     }
 
+Independent steps can run concurrently by grouping them under "parallel".
+Every branch receives the same input; the group's output is a dict of
+branch id → output, which becomes the input of the next step (fan-in):
+
+    {"id": "enrich", "parallel": [
+        {"id": "summary", "url": "...", "output_field": "text"},
+        {"id": "tags", "url": "...", "output_field": "tags"}
+    ]}
+
+Failed attempts are retried (``max_retries`` per step) after an exponential
+backoff of ``retry_backoff`` seconds (default PIPELINE_RETRY_BACKOFF) doubled
+per attempt. Definitions are cached until proxy_chain.json changes, and all
+runs share one pooled HTTP client (closed at shutdown via ``close_client``).
+
+Configuration (env vars):
+  PIPELINE_STEP_TIMEOUT=30         Per-request timeout in seconds
+  PIPELINE_RETRY_BACKOFF=0.5       Base delay before a retry, in seconds
+
 Usage via HTTP:
     POST /v1/pipeline/{pipeline_name}
     Content-Type: application/json
     { "input": <initial_value>, "context": { ... optional extra fields ... } }
 
 Output:
-    { "pipeline": "voice", "steps": [...per-step results...], "output": <final_value> }
+    { "pipeline": "voice", "steps": [...per-step results...], "output": <final_value>,
+      "timings_ms": {"transcribe": 412.0, "llm": 2310.5, "speak": 388.1}, "elapsed_ms": 3111.2 }
 """
 
+import asyncio
 import json
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any, Optional
 
@@ -58,18 +79,85 @@ logger = logging.getLogger(__name__)
 
 _CHAIN_FILE = Path(os.environ.get("PROXY_CHAIN_FILE", "config/proxy_chain.json"))
 _STEP_TIMEOUT = float(os.environ.get("PIPELINE_STEP_TIMEOUT", "30"))
+_RETRY_BACKOFF = float(os.environ.get("PIPELINE_RETRY_BACKOFF", "0.5"))
+_MAX_BACKOFF = 10.0
+
+# (path, mtime_ns, size) → parsed "pipelines" section
+_definitions: tuple = (None, None, {})
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def _load_pipelines() -> dict:
-    """Load pipeline definitions from proxy_chain.json."""
+    """Load pipeline definitions from proxy_chain.json (cached until the file changes)."""
+    global _definitions
     try:
+        st = _CHAIN_FILE.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if _definitions[0] == _CHAIN_FILE and _definitions[1] == key:
+            return _definitions[2]
         data = json.loads(_CHAIN_FILE.read_text(encoding="utf-8"))
-        return data.get("pipelines", {})
+        pipelines = data.get("pipelines", {})
+        _definitions = (_CHAIN_FILE, key, pipelines)
+        return pipelines
     except Exception as e:
         logger.warning(f"Could not load pipelines from {_CHAIN_FILE}: {e}")
         return {}
 
 
+def _get_client() -> httpx.AsyncClient:
+    """Shared pooled client, recreated if closed or used from a different event loop.
+
+    A client replaced because of a loop change is closed rather than dropped:
+    on its own loop when that loop is still running, otherwise on this one.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        old, old_loop = _client, _client_loop
+        _client = httpx.AsyncClient(timeout=_STEP_TIMEOUT)
+        _client_loop = loop
+        if old is not None and not old.is_closed:
+            _retire_client(old, old_loop, loop)
+    return _client
+
+
+_retiring: set = set()
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Closing replaced pipeline client failed: {e}")
+
+
+def _retire_client(
+    client: httpx.AsyncClient,
+    old_loop: Optional[asyncio.AbstractEventLoop],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a replaced client without blocking the caller."""
+    if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+        try:
+            asyncio.run_coroutine_threadsafe(_close_quietly(client), old_loop)
+            return
+        except RuntimeError:  # loop closed between the check and the call
+            pass
+    task = loop.create_task(_close_quietly(client))
+    _retiring.add(task)
+    task.add_done_callback(_retiring.discard)
+
+
+async def close_client() -> None:
+    """Close the shared pipeline client (called on application shutdown)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 def _get_nested(obj: Any, path: str) -> Any:
     """
     Extract a value from a nested dict/list using dot notation.
@@ -98,6 +186,118 @@ def _set_nested(obj: dict, field: str, value: Any) -> dict:
     return obj
 
 
+async def _run_step(
+    client: httpx.AsyncClient,
+    name: str,
+    step: dict,
+    value: Any,
+    context: dict,
+    proxy_auth: dict,
+) -> dict:
+    """Run one HTTP step with retries; return its record (status "ok" or "error")."""
+    step_id = step.get("id", "step")
+    url = step.get("url", "")
+    method = step.get("method", "POST").upper()
+    input_field = step.get("input_field", "input")
+    output_field = step.get("output_field", "output")
+    max_retries = int(step.get("max_retries", 1))
+    backoff = float(step.get("retry_backoff", _RETRY_BACKOFF))
+    inherit_auth = step.get("inherit_auth", "")  # "openrouter"|"anthropic"|"openai"|""
+
+    # Build headers: start from step config, inject inherited auth if requested
+    headers = dict(step.get("headers", {}))
+    if inherit_auth and proxy_auth.get(inherit_auth):
+        auth_token = proxy_auth[inherit_auth]
+        if inherit_auth == "anthropic":
+            headers.setdefault("x-api-key", auth_token)
+            headers.setdefault("anthropic-version", "2023-06-01")
+        else:
+            headers.setdefault("Authorization", f"Bearer {auth_token}")
+
+    extra_body = step.get("extra_body", {})
+
+    # Build payload: start from extra_body, inject current value at input_field
+    payload = dict(extra_body)
+    payload.update(context)
+    _set_nested(payload, input_field, value)
+
+    step_record = {"id": step_id, "input": value}
+    last_err: Optional[str] = None
+    started = time.perf_counter()
+
+    for attempt in range(max(1, max_retries)):
+        if attempt and backoff > 0:
+            await asyncio.sleep(min(backoff * 2 ** (attempt - 1), _MAX_BACKOFF))
+        try:
+            if method == "GET":
+                resp = await client.get(url, headers=headers, params=payload)
+            else:
+                resp = await client.post(url, headers=headers, json=payload)
+
+            resp.raise_for_status()
+            resp_body = resp.json()
+            output_value = _get_nested(resp_body, output_field)
+
+            # Guard: if the expected output field was not found, fail loudly.
+            if output_value is None and output_field:
+                available = list(resp_body.keys()) if isinstance(resp_body, dict) else type(resp_body).__name__
+                raise ValueError(
+                    f"output_field '{output_field}' not found in response. "
+                    f"Available keys: {available}. "
+                    f"Check step config or inspect: GET /api/pipelines"
+                )
+
+            step_record["output"] = output_value
+            step_record["status"] = "ok"
+            if attempt > 0:
+                step_record["retries"] = attempt
+            logger.debug(f"Pipeline '{name}' step '{step_id}': OK (attempt {attempt+1}) → {type(output_value).__name__}")
+            last_err = None
+            break  # success — exit retry loop
+
+        except Exception as e:
+            last_err = str(e)[:200]
+            if attempt < max_retries - 1:
+                logger.warning(f"Pipeline '{name}' step '{step_id}' attempt {attempt+1} failed: {last_err} — retrying")
+            else:
+                logger.error(f"Pipeline '{name}' step '{step_id}' failed after {attempt+1} attempt(s): {last_err}")
+
+    step_record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    if last_err is not None:
+        step_record["status"] = "error"
+        step_record["error"] = last_err
+    return step_record
+
+
+async def _run_group(
+    client: httpx.AsyncClient,
+    name: str,
+    group: dict,
+    value: Any,
+    context: dict,
+    proxy_auth: dict,
+) -> dict:
+    """Run a "parallel" group concurrently; its output maps branch id → output."""
+    started = time.perf_counter()
+    branches = await asyncio.gather(
+        *(_run_step(client, name, step, value, context, proxy_auth) for step in group["parallel"])
+    )
+    record = {
+        "id": group.get("id", "parallel"),
+        "input": value,
+        "parallel": branches,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    failed = [b for b in branches if b["status"] == "error"]
+    if failed:
+        record["status"] = "error"
+        record["error"] = "; ".join(f"{b['id']}: {b['error']}" for b in failed)
+    else:
+        record["status"] = "ok"
+        record["output"] = {b["id"]: b["output"] for b in branches}
+    return record
+
+
 async def run_pipeline(
     name: str,
     initial_input: Any,
@@ -109,9 +309,12 @@ async def run_pipeline(
     Returns:
         {
             "pipeline": name,
-            "steps": [{"id": ..., "input": ..., "output": ..., "status": "ok"|"error", "error": ...}],
+            "steps": [{"id": ..., "input": ..., "output": ..., "status": "ok"|"error",
+                       "error": ..., "elapsed_ms": ...}],
             "output": <final step output>,
             "ok": bool,
+            "timings_ms": {step_id: elapsed_ms, ...},
+            "elapsed_ms": <total>,
         }
     """
     pipelines = _load_pipelines()
@@ -127,6 +330,8 @@ async def run_pipeline(
     context = context or {}
     current_value = initial_input
     step_results = []
+    timings = {}
+    started = time.perf_counter()
 
     # Resolve auth tokens for inherit_auth steps once upfront
     _proxy_auth = {
@@ -135,91 +340,34 @@ async def run_pipeline(
         "openai": os.environ.get("OPENAI_API_KEY", ""),
     }
 
-    async with httpx.AsyncClient(timeout=_STEP_TIMEOUT) as client:
-        for step in steps_cfg:
-            step_id = step.get("id", "step")
-            url = step.get("url", "")
-            method = step.get("method", "POST").upper()
-            input_field = step.get("input_field", "input")
-            output_field = step.get("output_field", "output")
-            max_retries = int(step.get("max_retries", 1))
-            inherit_auth = step.get("inherit_auth", "")  # "openrouter"|"anthropic"|"openai"|""
-
-            # Build headers: start from step config, inject inherited auth if requested
-            headers = dict(step.get("headers", {}))
-            if inherit_auth and _proxy_auth.get(inherit_auth):
-                auth_token = _proxy_auth[inherit_auth]
-                if inherit_auth == "anthropic":
-                    headers.setdefault("x-api-key", auth_token)
-                    headers.setdefault("anthropic-version", "2023-06-01")
-                else:
-                    headers.setdefault("Authorization", f"Bearer {auth_token}")
-
-            extra_body = step.get("extra_body", {})
-
-            # Build payload: start from extra_body, inject current value at input_field
-            payload = dict(extra_body)
-            payload.update(context)
-            _set_nested(payload, input_field, current_value)
-
-            step_record = {"id": step_id, "input": current_value}
-            last_err: Optional[str] = None
-
-            for attempt in range(max(1, max_retries)):
-                try:
-                    if method == "GET":
-                        resp = await client.get(url, headers=headers, params=payload)
-                    else:
-                        resp = await client.post(url, headers=headers, json=payload)
-
-                    resp.raise_for_status()
-                    resp_body = resp.json()
-                    output_value = _get_nested(resp_body, output_field)
-
-                    # Guard: if the expected output field was not found, fail loudly.
-                    if output_value is None and output_field:
-                        available = list(resp_body.keys()) if isinstance(resp_body, dict) else type(resp_body).__name__
-                        raise ValueError(
-                            f"output_field '{output_field}' not found in response. "
-                            f"Available keys: {available}. "
-                            f"Check step config or inspect: GET /api/pipelines"
-                        )
-
-                    step_record["output"] = output_value
-                    step_record["status"] = "ok"
-                    if attempt > 0:
-                        step_record["retries"] = attempt
-                    current_value = output_value
-                    logger.debug(f"Pipeline '{name}' step '{step_id}': OK (attempt {attempt+1}) → {type(output_value).__name__}")
-                    last_err = None
-                    break  # success — exit retry loop
-
-                except Exception as e:
-                    last_err = str(e)[:200]
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Pipeline '{name}' step '{step_id}' attempt {attempt+1} failed: {last_err} — retrying")
-                    else:
-                        logger.error(f"Pipeline '{name}' step '{step_id}' failed after {attempt+1} attempt(s): {last_err}")
-
-            if last_err is not None:
-                step_record["status"] = "error"
-                step_record["error"] = last_err
-                step_results.append(step_record)
-                return {
-                    "pipeline": name,
-                    "steps": step_results,
-                    "output": None,
-                    "ok": False,
-                    "error": f"Step '{step_id}' failed: {last_err}",
-                }
-
-            step_results.append(step_record)
+    client = _get_client()
+    for step in steps_cfg:
+        if "parallel" in step:
+            step_record = await _run_group(client, name, step, current_value, context, _proxy_auth)
+        else:
+            step_record = await _run_step(client, name, step, current_value, context, _proxy_auth)
+        step_results.append(step_record)
+        timings[step_record["id"]] = step_record["elapsed_ms"]
+
+        if step_record["status"] == "error":
+            return {
+                "pipeline": name,
+                "steps": step_results,
+                "output": None,
+                "ok": False,
+                "error": f"Step '{step_record['id']}' failed: {step_record['error']}",
+                "timings_ms": timings,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        current_value = step_record["output"]
 
     return {
         "pipeline": name,
         "steps": step_results,
         "output": current_value,
         "ok": True,
+        "timings_ms": timings,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
     }
 
 
@@ -229,7 +377,12 @@ def list_pipelines() -> dict:
     return {
         name: {
             "description": p.get("description", ""),
-            "steps": [s.get("id", f"step{i}") for i, s in enumerate(p.get("steps", []))],
+            "steps": [
+                {s.get("id", f"step{i}"): [b.get("id", f"branch{j}") for j, b in enumerate(s["parallel"])]}
+                if "parallel" in s
+                else s.get("id", f"step{i}")
+                for i, s in enumerate(p.get("steps", []))
+            ],
         }
         for name, p in pipelines.items()
     }
@@ -0,0 +1,92 @@
+"""
+Per-stage request timing, independent of any metrics backend.
+
+Breaks a /v1/messages request into request parsing, config snapshot,
+conversion, token counting, upstream time-to-first-byte, stream translation
+per upstream chunk and post-response logging. Call sites take
+``start = stage_start()`` and finish with ``observe_stage(stage, start)``.
+
+Durations go to observers registered with ``register_stage_observers`` —
+``src/api/metrics_api`` registers the proxy_stage_duration_seconds histogram
+when it is imported. Until something registers, or when disabled,
+``stage_start()`` returns 0.0 and ``observe_stage`` returns immediately.
+
+Configuration (env vars):
+    STAGE_METRICS   Record per-stage latency histograms (default: true)
+"""
+
+from __future__ import annotations
+
+import os
+from time import perf_counter
+from typing import AsyncIterator, Callable, Dict
+
+STAGE_METRICS = os.environ.get("STAGE_METRICS", "true").lower() in ("1", "true", "yes", "on")
+
+STAGES = (
+    "parse",
+    "config_snapshot",
+    "conversion",
+    "token_count",
+    "upstream_ttfb",
+    "stream_translate",
+    "post_response_log",
+)
+
+# stage → callable taking the duration in seconds
+_observers: Dict[str, Callable[[float], None]] = {}
+
+
+def register_stage_observers(observers: Dict[str, Callable[[float], None]]) -> None:
+    """Send durations for the given stages to ``observers[stage](seconds)``."""
+    _observers.update(observers)
+
+
+def stage_start() -> float:
+    """Start time for observe_stage(), or 0.0 when nothing would record it."""
+    return perf_counter() if STAGE_METRICS and _observers else 0.0
+
+
+def observe_stage(stage: str, start: float) -> None:
+    """Record the time since ``start`` (from stage_start()) against ``stage``."""
+    if start:
+        observer = _observers.get(stage)
+        if observer is not None:
+            observer(perf_counter() - start)
+
+
+def time_stream_translation(
+    upstream: AsyncIterator[str],
+    translate: Callable[[AsyncIterator[str]], AsyncIterator[str]],
+) -> AsyncIterator[str]:
+    """Return ``translate(upstream)``, observing stream_translate per upstream chunk.
+
+    Only the translator's own work is counted: time waiting on the upstream and
+    time the consumer holds each translated event are excluded.
+    """
+    observer = _observers.get("stream_translate")
+    if not STAGE_METRICS or observer is None:
+        return translate(upstream)
+    return _timed_translation(upstream, translate, observer)
+
+
+async def _timed_translation(upstream, translate, observer):
+    received = 0.0  # when the chunk being translated arrived
+    paused = 0.0  # consumer time since then
+
+    async def source():
+        nonlocal received, paused
+        try:
+            async for chunk in upstream:
+                received, paused = perf_counter(), 0.0
+                yield chunk
+                observer(perf_counter() - received - paused)
+        finally:
+            aclose = getattr(upstream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async for event in translate(source()):
+        suspended = perf_counter()
+        yield event
+        paused += perf_counter() - suspended
@@ -7,7 +7,6 @@ Provides hooks for integrating proxy request/response flow with the terminal das
 from typing import Dict, Any, Optional
 from src.core.config import config
 import time
-import asyncio
 
 
 class DashboardHooks:
@@ -75,11 +74,9 @@ class DashboardHooks:
             return
 
         try:
-            from src.api.websocket_dashboard import broadcast_dashboard_update
-            # Create async task to broadcast
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(broadcast_dashboard_update(message_type, data))
+            from src.api.websocket_dashboard import publish_dashboard_update
+            # Queues per client; never awaits a socket on the request path
+            publish_dashboard_update(message_type, data)
         except Exception:
             pass
 
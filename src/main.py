@@ -1,51 +1,11 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+# Core routers: the /v1/messages and /v1/chat/completions hot path plus /metrics
 from src.api.endpoints import router as api_router
-from src.api.web_ui import router as web_ui_router
-from src.api.config_api import router as config_api_router
-from src.api.websocket_dashboard import router as websocket_router
-from src.api.websocket_logs import router as ws_logs_router
-from src.api.analytics import router as analytics_router
-from src.api.analytics_api import router as analytics_api_router
-from src.api.audit_api import router as audit_api_router
-from src.api.billing import router as billing_router
-from src.api.benchmarks import router as benchmarks_router
-from src.api.users import router as users_router
 from src.api.openai_endpoints import router as openai_router
-from src.api.routing_profiles_api import router as routing_profiles_router
 from src.api.metrics_api import router as metrics_router
-from src.api.docs_routes import router as docs_router
-from src.api.rtk_stats import router as rtk_stats_router
-
-# NEW: System monitoring and live metrics
-from src.api.system_monitor import router as system_monitor_router
-from src.api.websocket_live import router as websocket_live_router
-from src.api.websocket_live import start_live_metrics, stop_live_metrics
-
-# NEW: Alert management and notifications (Phase 3)
-from src.api.alerts import router as alerts_router
-
-# NEW: Report generation (Phase 3)
-from src.api.reports import router as reports_router
-
-# NEW: Predictive alerting & analytics (Phase 4)
-from src.api.predictive import router as predictive_router
-
-# NEW: Third-party integrations (Phase 4)
-from src.api.integrations import router as integrations_router
-
-# NEW: Custom dashboard builder (Phase 4)
-from src.api.dashboards import router as dashboards_router
-
-# NEW: User management & RBAC (Phase 4)
-from src.api.users_rbac import router as users_rbac_router
-
-# NEW: Provider authentication (Kiro, etc.)
-from src.api.providers import router as providers_router
-
-# NEW: GraphQL API (Phase 4)
-from src.api.graphql_schema import get_graphql_router
+import importlib
 import uvicorn
 import sys
 import os
@@ -53,6 +13,50 @@ from pathlib import Path
 from src.core.config import config
 from contextlib import asynccontextmanager
 
+# Server profile (SERVER_PROFILE env var):
+#   full — import and mount every router and start every background service (default)
+#   lazy — core routers only; the optional routers and services load on the first
+#          request outside /v1/ (dashboards, web UI API, GraphQL, ...)
+#   core — core routers only; optional subsystems are never loaded
+SERVER_PROFILE = os.environ.get("SERVER_PROFILE", "full").lower()
+if SERVER_PROFILE not in ("full", "lazy", "core"):
+    print(f"⚠️  Unknown SERVER_PROFILE={SERVER_PROFILE!r}; using 'full'")
+    SERVER_PROFILE = "full"
+
+# Optional routers in mount order: (module, attribute, prefix). An attribute
+# starting with "get_" is a factory called to build the router.
+_OPTIONAL_ROUTERS = [
+    ("src.api.routing_profiles_api", "router", ""),  # /api/routing-profiles (Option C-slim)
+    ("src.api.web_ui", "router", ""),
+    ("src.api.config_api", "router", ""),  # unified config system (assignments, mappings, provenance)
+    ("src.api.websocket_dashboard", "router", ""),
+    ("src.api.websocket_logs", "router", ""),  # Live log streaming
+    ("src.api.analytics", "router", ""),
+    ("src.api.analytics_api", "router", ""),  # Per-assignment & per-model metrics (T074)
+    ("src.api.audit_api", "router", ""),  # Audit log API (T075)
+    ("src.api.billing", "router", ""),
+    ("src.api.benchmarks", "router", ""),
+    ("src.api.users", "router", ""),
+    ("src.api.docs_routes", "router", ""),  # Documentation API
+    ("src.api.rtk_stats", "router", ""),  # RTK cached token savings stats
+    ("src.api.system_monitor", "router", ""),  # System health and stats
+    ("src.api.websocket_live", "router", ""),  # Real-time WebSocket feed
+    ("src.api.alerts", "router", ""),  # Alert rules, history, notifications (Phase 3)
+    ("src.api.reports", "router", ""),  # Reports, templates, scheduling (Phase 3)
+    ("src.api.predictive", "router", ""),  # AI predictions, anomaly detection, forecasting (Phase 4)
+    ("src.api.integrations", "router", ""),  # Datadog, PagerDuty, Slack, etc. (Phase 4)
+    ("src.api.dashboards", "router", ""),  # Custom dashboards (Phase 4)
+    ("src.api.users_rbac", "router", ""),  # Authentication, users, API keys (Phase 4)
+    ("src.api.providers", "router", ""),  # Provider tokens and auth (Kiro, etc.)
+    ("src.api.graphql_schema", "get_graphql_router", "/graphql"),  # GraphQL API (Phase 4)
+]
+
+# Paths served without loading optional subsystems in the lazy profile
+_CORE_PATH_PREFIXES = ("/v1/", "/metrics", "/health")
+
+_optional_routers_mounted = False
+_optional_services_started = False
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -191,8 +195,100 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌  Failed to run DB migrations: {e}")
 
+    if SERVER_PROFILE == "full":
+        await _start_optional_services()
+
+    # Startup: Monitor VibeProxy health in the background when any tier routes to it
+    try:
+        from src.services.antigravity import vibeproxy_monitor
+
+        endpoints = [
+            config.openai_base_url,
+            config.big_endpoint,
+            config.middle_endpoint,
+            config.small_endpoint,
+        ]
+        if any(e and (":8317" in e) for e in endpoints):
+            vibeproxy_monitor.start()
+            if vibeproxy_monitor.running:
+                print("✅ VibeProxy health monitor started")
+    except Exception as e:
+        print(f"⚠️  Failed to start VibeProxy health monitor: {e}")
+
+    # Startup: bind model-scan snapshot if enabled. This is additive; disabled or invalid
+    # snapshots keep static assignments in place.
+    try:
+        from src.core.model_scan_runtime import reload_model_scan
+
+        summary = reload_model_scan()
+        if summary.get("enabled"):
+            scan_id = summary.get("scan_id")
+            changed = summary.get("changed")
+            print(f"✅ Model-scan bindings loaded (scan_id={scan_id}, changed={changed})")
+            if SERVER_PROFILE != "core":
+                try:
+                    import asyncio
+                    from src.core.proxy_chain import get_chain
+                    from src.services.observability.reliability_feedback import (
+                        reliability_feedback_loop,
+                    )
+
+                    reliability_task = asyncio.create_task(
+                        reliability_feedback_loop(
+                            get_chain().model_scan,
+                            config.usage_tracking_db_path,
+                        )
+                    )
+                    print("✅ Model-scan reliability feedback loop started")
+                except Exception as loop_err:
+                    print(f"⚠️  Failed to start model-scan reliability feedback: {loop_err}")
+    except Exception as e:
+        print(f"⚠️  Model-scan binding reload failed: {e}")
+
+    yield
+
+    if reliability_task is not None:
+        reliability_task.cancel()
+
+    # Shutdown: Flush pending model usage counts
+    try:
+        from src.services.models.model_filter import model_filter
+
+        model_filter.flush()
+    except Exception as e:
+        print(f"⚠️  Failed to flush model usage: {e}")
+
+    # Shutdown: Close the shared pipeline HTTP client
+    try:
+        from src.core.pipeline import close_client as close_pipeline_client
+
+        await close_pipeline_client()
+    except Exception as e:
+        print(f"⚠️  Failed to close pipeline client: {e}")
+
+    # Shutdown: Stop VibeProxy health monitor
+    try:
+        from src.services.antigravity import vibeproxy_monitor
+
+        await vibeproxy_monitor.stop()
+    except Exception as e:
+        print(f"⚠️  Failed to stop VibeProxy health monitor: {e}")
+
+    if _optional_services_started:
+        await _stop_optional_services()
+
+
+async def _start_optional_services():
+    """Start the dashboard/alerting background services (full profile, or lazily)."""
+    global _optional_services_started
+    if _optional_services_started:
+        return
+    _optional_services_started = True
+
     # Startup: Start live metrics system
     try:
+        from src.api.websocket_live import start_live_metrics
+
         await start_live_metrics()
         print("✅ Live metrics system started")
     except Exception as e:
@@ -236,40 +332,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️  Failed to start advanced scheduler: {e}")
 
-    # Startup: bind model-scan snapshot if enabled. This is additive; disabled or invalid
-    # snapshots keep static assignments in place.
-    try:
-        from src.core.model_scan_runtime import reload_model_scan
-
-        summary = reload_model_scan()
-        if summary.get("enabled"):
-            scan_id = summary.get("scan_id")
-            changed = summary.get("changed")
-            print(f"✅ Model-scan bindings loaded (scan_id={scan_id}, changed={changed})")
-            try:
-                import asyncio
-                from src.core.proxy_chain import get_chain
-                from src.services.observability.reliability_feedback import (
-                    reliability_feedback_loop,
-                )
-
-                reliability_task = asyncio.create_task(
-                    reliability_feedback_loop(
-                        get_chain().model_scan,
-                        config.usage_tracking_db_path,
-                    )
-                )
-                print("✅ Model-scan reliability feedback loop started")
-            except Exception as loop_err:
-                print(f"⚠️  Failed to start model-scan reliability feedback: {loop_err}")
-    except Exception as e:
-        print(f"⚠️  Model-scan binding reload failed: {e}")
-
-    yield
-
-    if reliability_task is not None:
-        reliability_task.cancel()
 
+async def _stop_optional_services():
     # Shutdown: Stop advanced scheduler
     try:
         from src.services.advanced_scheduler import advanced_scheduler
@@ -299,6 +363,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Stop live metrics system
     try:
+        from src.api.websocket_live import stop_live_metrics
+
         await stop_live_metrics()
         print("✅ Live metrics system stopped")
     except Exception as e:
@@ -310,42 +376,67 @@ app = FastAPI(title="The Ultimate Proxy", version="2.1.0", lifespan=lifespan)
 # Include API routers
 app.include_router(api_router)
 app.include_router(openai_router)  # OpenAI-compatible endpoint for cross-IDE support
-app.include_router(routing_profiles_router)  # /api/routing-profiles (Option C-slim)
 app.include_router(metrics_router)  # /metrics (Prometheus exposition)
-app.include_router(web_ui_router)
-app.include_router(
-    config_api_router
-)  # NEW: unified config system (assignments, mappings, provenance)
-app.include_router(websocket_router)
-app.include_router(ws_logs_router)  # Live log streaming
-app.include_router(analytics_router)
-app.include_router(analytics_api_router)  # Per-assignment & per-model metrics (T074)
-app.include_router(audit_api_router)  # Audit log API (T075)
-app.include_router(billing_router)
-app.include_router(benchmarks_router)
-app.include_router(users_router)
-app.include_router(docs_router)  # Documentation API
-app.include_router(rtk_stats_router)  # RTK cached token savings stats
-
-# NEW: Enhanced monitoring and live metrics
-app.include_router(system_monitor_router)  # System health and stats
-app.include_router(websocket_live_router)  # Real-time WebSocket feed
-# NEW: Alert management and notifications (Phase 3)
-app.include_router(alerts_router)  # Alert rules, history, notifications
-# NEW: Report generation (Phase 3)
-app.include_router(reports_router)  # Reports, templates, scheduling
-# NEW: Predictive alerting & analytics (Phase 4)
-app.include_router(predictive_router)  # AI predictions, anomaly detection, forecasting
-# NEW: Third-party integrations (Phase 4)
-app.include_router(integrations_router)  # Datadog, PagerDuty, Slack, etc.
-# NEW: Custom dashboard builder (Phase 4)
-app.include_router(dashboards_router)  # Custom dashboards
-# NEW: User management & RBAC (Phase 4)
-app.include_router(users_rbac_router)  # Authentication, users, API keys
-# NEW: Provider authentication (Kiro, etc.)
-app.include_router(providers_router)  # Provider tokens and auth
-# NEW: GraphQL API (Phase 4)
-app.include_router(get_graphql_router(), prefix="/graphql")
+
+
+def _mount_optional_routers():
+    """Import and mount the optional routers (dashboards, web UI API, GraphQL, ...).
+
+    Called at import time in the full profile and on first non-core request in the
+    lazy profile. Routers mounted after startup are spliced in ahead of the UI
+    fallback routes so the SPA catch-all keeps matching last.
+    """
+    global _optional_routers_mounted
+    if _optional_routers_mounted:
+        return
+    _optional_routers_mounted = True
+
+    routes = app.router.routes
+    fallback = routes[_fallback_index:] if _fallback_index is not None else []
+    del routes[len(routes) - len(fallback) :]
+    for module_name, attr, prefix in _OPTIONAL_ROUTERS:
+        try:
+            router = getattr(importlib.import_module(module_name), attr)
+            if attr.startswith("get_"):
+                router = router()
+            app.include_router(router, prefix=prefix)
+        except Exception as e:
+            print(f"⚠️  Failed to mount {module_name}: {e}")
+    routes.extend(fallback)
+    app.openapi_schema = None
+
+
+class LazyMountMiddleware:
+    """Mount optional routers and start their services on first non-core request (lazy profile)."""
+
+    def __init__(self, app):
+        self.app = app
+        self._lock = None
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not _optional_routers_mounted
+            and scope["type"] in ("http", "websocket")
+            and not scope["path"].startswith(_CORE_PATH_PREFIXES)
+        ):
+            import asyncio
+
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                if not _optional_routers_mounted:
+                    _mount_optional_routers()
+                    await _start_optional_services()
+        await self.app(scope, receive, send)
+
+
+# Index in app.router.routes where the UI fallback routes begin (set below)
+_fallback_index = None
+
+if SERVER_PROFILE == "full":
+    _mount_optional_routers()
+elif SERVER_PROFILE == "lazy":
+    app.add_middleware(LazyMountMiddleware)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # INTEGRATION HOOKS
@@ -357,8 +448,6 @@ app.include_router(get_graphql_router(), prefix="/graphql")
 @app.middleware("http")
 async def live_tracking_middleware(request, call_next):
     """Add live request tracking"""
-    from src.api.websocket_live import broadcast_request_event
-    from datetime import datetime
     import time
 
     start_time = time.time()
@@ -366,9 +455,15 @@ async def live_tracking_middleware(request, call_next):
     duration_ms = (time.time() - start_time) * 1000
 
     # If it's an API request and tracking is enabled, broadcast
-    if request.url.path.startswith("/v1/chat") and hasattr(request.state, "metrics"):
+    if (
+        _optional_services_started
+        and request.url.path.startswith("/v1/chat")
+        and hasattr(request.state, "metrics")
+    ):
         metrics = request.state.metrics
         try:
+            from src.api.websocket_live import broadcast_request_event
+
             await broadcast_request_event(
                 {
                     "path": request.url.path,
@@ -390,6 +485,8 @@ async def live_tracking_middleware(request, call_next):
 # STATIC FILE SERVING - Svelte Web UI
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_fallback_index = len(app.router.routes)
+
 # Priority 1: Serve pre-built Svelte web-ui if available
 svelte_build_dir = Path(__file__).parent.parent / "web-ui" / "build"
 legacy_static_dir = Path(__file__).parent / "static"
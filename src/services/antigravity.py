@@ -2,15 +2,24 @@
 
 This module provides functionality to extract OAuth tokens from the
 local Antigravity IDE installation and make API calls using those credentials.
+
+VibeProxy health is kept fresh by ``VibeProxyHealthMonitor``, a background
+task that probes every VIBEPROXY_HEALTH_INTERVAL seconds and pushes up/down
+transitions to the per-model circuit breakers of the tiers routed to VibeProxy
+(the ones the cascade checks before each attempt). Request paths call
+``read_vibeproxy_health()``, which only reads that state (starting the
+monitor on first use); the blocking ``check_vibeproxy_health()`` probe is
+left for callers without an event loop.
 """
 
+import asyncio
 import json
 import logging
 import os
 import sqlite3
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -18,10 +27,12 @@ logger = logging.getLogger(__name__)
 # VibeProxy configuration
 VIBEPROXY_BASE_URL = os.getenv("VIBEPROXY_URL", "http://127.0.0.1:1337")
 VIBEPROXY_HEALTH_TIMEOUT = float(os.getenv("VIBEPROXY_HEALTH_TIMEOUT", "2.0"))
+VIBEPROXY_HEALTH_INTERVAL = float(os.getenv("VIBEPROXY_HEALTH_INTERVAL", "10"))
 
 # Health check cache
 _vibeproxy_health_cache: Dict[str, Any] = {
     "available": None,
+    "error": None,
     "last_check": 0,
     "cache_ttl": 30.0,  # Cache health status for 30 seconds
 }
@@ -95,9 +106,171 @@ def check_vibeproxy_health(force_refresh: bool = False) -> Tuple[bool, Optional[
         return False, error_msg
 
 
+class VibeProxyHealthMonitor:
+    """Background VibeProxy prober; request paths only read its state."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        interval: float = VIBEPROXY_HEALTH_INTERVAL,
+        timeout: float = VIBEPROXY_HEALTH_TIMEOUT,
+        breaker_name: Optional[str] = None,
+    ):
+        self.base_url = base_url or VIBEPROXY_BASE_URL
+        self.interval = interval
+        self.timeout = timeout
+        self.breaker_name = breaker_name
+        self.available: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.last_check = 0.0
+        self.probes = 0
+        self.transitions = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def state(self) -> Tuple[bool, Optional[str]]:
+        """Current health without probing; unknown (no probe finished yet) reads as available."""
+        if self.available is None:
+            return True, None
+        return self.available, self.error
+
+    def start(self) -> None:
+        """Start probing on the running event loop (no-op if already running)."""
+        if self.interval > 0 and not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _loop(self) -> None:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            while True:
+                available, error = await self.probe(client)
+                self._apply(available, error)
+                await asyncio.sleep(self.interval)
+
+    async def probe(self, client: httpx.AsyncClient) -> Tuple[bool, Optional[str]]:
+        """One health probe: /health, falling back to /v1/models (CLIProxyAPI)."""
+        try:
+            response = await client.get(f"{self.base_url}/health")
+            if response.status_code == 404:
+                response = await client.get(
+                    f"{self.base_url}/v1/models",
+                    headers={"Authorization": f"Bearer {os.getenv('BIG_API_KEY', 'pass')}"},
+                )
+            if response.status_code == 200:
+                return True, None
+            return False, f"Status {response.status_code}"
+        except httpx.ConnectError:
+            return False, "VibeProxy not reachable (connection refused)"
+        except httpx.TimeoutException:
+            return False, f"VibeProxy health check timed out ({self.timeout}s)"
+        except Exception as e:
+            return False, f"VibeProxy health check error: {type(e).__name__}"
+
+    def _apply(self, available: bool, error: Optional[str]) -> None:
+        previous = self.available
+        self.available, self.error = available, error
+        self.last_check = time.time()
+        self.probes += 1
+        _vibeproxy_health_cache.update(available=available, error=error, last_check=self.last_check)
+
+        if previous is not available:
+            self.transitions += 1
+            if available:
+                logger.info(f"VibeProxy at {self.base_url} is available")
+            else:
+                logger.warning(f"VibeProxy at {self.base_url} is NOT available: {error}")
+        if previous is not available or not available:
+            try:
+                from src.core.client import _get_circuit_breaker
+
+                for name in self.breaker_names():
+                    _get_circuit_breaker(name).record_health(available, error or "")
+            except Exception as e:
+                logger.debug(f"VibeProxy breaker update failed: {e}")
+
+    def breaker_names(self) -> List[str]:
+        """Breakers driven by the probe: the explicit one, else the VibeProxy tier models."""
+        if self.breaker_name:
+            return [self.breaker_name]
+        return vibeproxy_tier_models()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "running": self.running,
+            "interval": self.interval,
+            "available": self.available,
+            "error": self.error,
+            "last_check": self.last_check,
+            "probes": self.probes,
+            "transitions": self.transitions,
+        }
+
+
+def _is_vibeproxy_url(url: Optional[str]) -> bool:
+    return bool(url) and ("127.0.0.1:8317" in url or "localhost:8317" in url)
+
+
+def vibeproxy_tier_models(cfg=None) -> List[str]:
+    """
+    Tier models whose requests go to VibeProxy.
+
+    The cascade keys circuit breakers by model name, so these are the breakers
+    the monitor must drive. A disabled tier, or one without its own endpoint,
+    routes to the default endpoint.
+    """
+    if cfg is None:
+        from src.core.config import config as cfg
+
+    models = []
+    for tier in ("big", "middle", "small"):
+        model = getattr(cfg, f"{tier}_model", None)
+        if not model:
+            continue
+        endpoint = getattr(cfg, f"{tier}_endpoint", None)
+        if not getattr(cfg, f"{tier}_enabled", True) or not endpoint:
+            endpoint = cfg.openai_base_url
+        if _is_vibeproxy_url(endpoint) and model not in models:
+            models.append(model)
+    return models
+
+
+# Module-level singleton
+vibeproxy_monitor = VibeProxyHealthMonitor()
+
+
+def read_vibeproxy_health() -> Tuple[bool, Optional[str]]:
+    """
+    VibeProxy health for request paths — never probes inline under an event loop.
+
+    Starts the background monitor on first use; without a running loop
+    (startup, scripts) falls back to the cached blocking check.
+    """
+    if not vibeproxy_monitor.running:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return check_vibeproxy_health()
+        vibeproxy_monitor.start()
+        if not vibeproxy_monitor.running:  # monitoring disabled (interval 0)
+            return check_vibeproxy_health()
+    return vibeproxy_monitor.state()
+
+
 def is_vibeproxy_available() -> bool:
-    """Quick check if VibeProxy is available (uses cache)."""
-    available, _ = check_vibeproxy_health()
+    """Quick check if VibeProxy is available (reads the monitored state)."""
+    available, _ = read_vibeproxy_health()
     return available
 
 
@@ -105,6 +278,7 @@ def clear_vibeproxy_health_cache():
     """Clear the health check cache to force fresh check."""
     global _vibeproxy_health_cache
     _vibeproxy_health_cache["available"] = None
+    _vibeproxy_health_cache["error"] = None
     _vibeproxy_health_cache["last_check"] = 0
 
 
@@ -0,0 +1,157 @@
+"""
+Per-session incremental Claude→OpenAI message conversion cache.
+
+Claude Code resends the whole conversation on every turn, so a long session
+re-converted (and re-validated) hundreds of identical messages per request.
+This cache remembers, per session, the OpenAI messages each Claude message
+converted to, along with the messages themselves. On the next request every
+message is compared with the stored one — by identity first (the fast
+request parser hands out the same validated object for an unchanged
+message), otherwise by value — and converted units are reused only up to the
+first message that differs; everything from there on is converted again.
+Claude message models are never mutated in place after parsing, which is
+what makes the identity shortcut sound.
+
+Reuse stops early (or entirely) when:
+  - a message changed anywhere in the history (compaction, cleared tool
+    results, edited history) — reconversion starts at the first mismatch,
+  - the first message changed (a different session key),
+  - a learned tool argument style changed (assistant tool calls bake in the
+    reverse rename, see ``tool_behavior_cache``).
+
+Sessions are keyed by metadata ``user_id`` + first-message digest + target
+provider + mapped model, in a bounded LRU.
+
+Configuration (env vars):
+  CONVERSION_CACHE_ENABLED=true    Enable/disable the cache (default: true)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.services.conversion.tool_behavior_cache import get_style_version
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("CONVERSION_CACHE_ENABLED", "true").lower() != "false"
+
+# (end_index, openai_messages) — see convert_claude_message_units()
+Unit = Tuple[int, List[Dict[str, Any]]]
+
+
+def _digest(msg: Any) -> bytes:
+    return hashlib.blake2b(
+        msg.model_dump_json().encode("utf-8"), digest_size=16
+    ).digest()
+
+
+class ConversionCache:
+    """LRU of per-session converted message prefixes."""
+
+    def __init__(self, enabled: bool = _ENABLED, max_sessions: int = 128):
+        self.enabled = enabled
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reused_messages = 0
+        self.converted_messages = 0
+
+    def convert(
+        self,
+        messages: Sequence[Any],
+        scope: Tuple[Any, ...],
+        convert_from: Callable[[int], List[Unit]],
+        session_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return ``(openai_messages, validated_upto)`` for ``messages``.
+
+        ``convert_from(start)`` converts ``messages[start:]`` into units.
+        ``validated_upto`` is how many of the returned messages were reused
+        from an earlier (already validated) request.
+        """
+        if not self.enabled or not messages:
+            units = convert_from(0)
+            return [m for _, out in units for m in out], 0
+
+        n = len(messages)
+        first = _digest(messages[0])
+        key = (str(session_id or ""), first, *scope)
+        version = get_style_version()
+
+        with self._lock:
+            state = self._sessions.get(key)
+            if state is not None:
+                self._sessions.move_to_end(key)
+
+        reused: List[Unit] = []
+        if state is not None and state["version"] == version:
+            seen = state["messages"]
+            match = 0
+            limit = min(len(seen), n)
+            while match < limit and (
+                seen[match] is messages[match] or seen[match] == messages[match]
+            ):
+                match += 1
+            # Only units that end before the first mismatch are kept, and the
+            # unit ending at it is redone too: an assistant message pairs with
+            # the tool results that may follow it.
+            for unit in state["units"]:
+                if unit[0] >= match:
+                    break
+                reused.append(unit)
+        start = reused[-1][0] if reused else 0
+
+        new_units = convert_from(start)
+        units = reused + new_units
+
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self.reused_messages += start
+            self.converted_messages += n - start
+            self._sessions[key] = {
+                "messages": list(messages),
+                "version": version,
+                "units": units,
+            }
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+        # Hand out copies: later stages replace message fields in place.
+        history = [dict(m) for _, out in units for m in out]
+        validated_upto = sum(len(out) for _, out in reused)
+        if reused:
+            logger.debug(
+                f"[conversion-cache] Reused {start}/{n} messages, converted {n - start}"
+            )
+        return history, validated_upto
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "sessions": len(self._sessions),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "reused_messages": self.reused_messages,
+                "converted_messages": self.converted_messages,
+            }
+
+
+# Module-level singleton
+conversion_cache = ConversionCache()
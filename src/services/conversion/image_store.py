@@ -0,0 +1,291 @@
+"""
+Content-addressed image store for the Claude→OpenAI request path.
+
+Claude Code resends every screenshot in the conversation on every turn, and
+``convert_claude_user_message`` used to rebuild a fresh ``data:`` URL string
+(a full copy of the base64 payload) for each of them on each request. The
+store keys images by media type + a content fingerprint and keeps one data
+URL per distinct image; every converted part references that shared string,
+so a repeated image costs a sampled hash and a compare instead of a fresh
+multi-megabyte allocation and copy. When the payload is the same string
+object as last time (the conversion cache, ``FAST_REQUEST_PARSE``'s message
+cache) the compare is an identity check.
+
+Older turns can also be slimmed before the request goes upstream
+(``IMAGE_HISTORY_POLICY``):
+  keep        send every image as-is (default)
+  strip       replace images outside the last N user turns with a short
+              text placeholder
+  downsample  re-encode those images to at most IMAGE_DOWNSAMPLE_MAX_PX on
+              the long side (needs Pillow; falls back to strip without it).
+              The downsampled URL is built lazily, once per image.
+
+The policy only rewrites the per-request message copies, never the cached
+conversion, and the bytes it removes are reported per request
+(``/api/image-store/stats``).
+
+OpenAI-compatible chat completions have no file-reference content part, so
+images are always sent inline as data URLs.
+
+Configuration (env vars):
+  IMAGE_STORE_ENABLED=true         Enable/disable the store (default: true)
+  IMAGE_HISTORY_POLICY=keep        keep | strip | downsample
+  IMAGE_KEEP_RECENT_TURNS=2        User turns whose images are always kept
+  IMAGE_DOWNSAMPLE_MAX_PX=512      Long-side limit for downsampled images
+"""
+
+import base64
+import binascii
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+
+    _HAS_PIL = True
+except ImportError:  # pragma: no cover - Pillow is optional
+    Image = None
+    _HAS_PIL = False
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("IMAGE_STORE_ENABLED", "true").lower() != "false"
+_POLICY = os.environ.get("IMAGE_HISTORY_POLICY", "keep").lower()
+_KEEP_RECENT = int(os.environ.get("IMAGE_KEEP_RECENT_TURNS", "2"))
+_MAX_PX = int(os.environ.get("IMAGE_DOWNSAMPLE_MAX_PX", "512"))
+
+POLICIES = ("keep", "strip", "downsample")
+
+# Payload + data-URL characters held before the least recently used image is
+# dropped (a dropped image is simply rebuilt the next time it is seen).
+_MAX_BYTES = 64 * 1024 * 1024
+
+
+def data_url(media_type: str, data: str) -> str:
+    return f"data:{media_type};base64,{data}"
+
+
+def _key(media_type: str, data: str) -> Tuple[str, int, int]:
+    # A strided sample of the payload: hashing every byte of a fresh
+    # multi-megabyte string would cost as much as the copy it saves. A hit
+    # is confirmed against the stored payload before its URL is reused.
+    return (media_type, len(data), hash(data[:: max(1, len(data) >> 10)]))
+
+
+class _Entry:
+    __slots__ = ("media_type", "data", "url", "small")
+
+    def __init__(self, media_type: str, data: str, url: str):
+        self.media_type = media_type
+        self.data = data  # the payload it was built from (== is identity-first)
+        self.url = url
+        self.small: Optional[str] = None  # downsampled URL ("" = no gain)
+
+
+class ImageStore:
+    """Deduplicated data URLs plus the old-turn image policy."""
+
+    def __init__(
+        self,
+        enabled: bool = _ENABLED,
+        policy: str = _POLICY,
+        keep_recent: int = _KEEP_RECENT,
+        max_px: int = _MAX_PX,
+        max_bytes: int = _MAX_BYTES,
+    ):
+        if policy not in POLICIES:
+            logger.warning(f"[image-store] Unknown IMAGE_HISTORY_POLICY={policy!r}, using 'keep'")
+            policy = "keep"
+        if policy == "downsample" and not _HAS_PIL:
+            logger.warning("[image-store] Pillow not installed; downsample policy falls back to strip")
+            policy = "strip"
+        self.enabled = enabled
+        self.policy = policy
+        self.keep_recent = max(1, keep_recent)
+        self.max_px = max_px
+        self.max_bytes = max_bytes
+        self._by_key: "OrderedDict[Tuple[str, int, int], _Entry]" = OrderedDict()
+        self._by_url: Dict[str, _Entry] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.images = 0
+        self.reused = 0
+        self.bytes_reused = 0
+        self.requests = 0
+        self.omitted = 0
+        self.downsampled = 0
+        self.bytes_saved = 0
+        self.last_request: Dict[str, int] = {}
+
+    # ── Conversion ───────────────────────────────────────────────────────────
+
+    def image_part(self, media_type: str, data: str) -> Dict[str, Any]:
+        """OpenAI ``image_url`` part for a base64 image, sharing its URL string."""
+        if not self.enabled:
+            return {"type": "image_url", "image_url": {"url": data_url(media_type, data)}}
+
+        key = _key(media_type, data)
+        with self._lock:
+            self.images += 1
+            entry = self._by_key.get(key)
+            if entry is not None and entry.data == data:
+                self._by_key.move_to_end(key)
+                self.reused += 1
+                self.bytes_reused += len(entry.url)
+            else:
+                entry = self._add(key, media_type, data, data_url(media_type, data))
+        return {"type": "image_url", "image_url": {"url": entry.url}}
+
+    def _add(self, key: Tuple[str, int, int], media_type: str, data: str, url: str) -> _Entry:
+        old = self._by_key.pop(key, None)
+        if old is not None:
+            self._forget(old)
+        entry = _Entry(media_type, data, url)
+        self._by_key[key] = entry
+        self._by_url[url] = entry
+        self._bytes += len(data) + len(url)
+        while self._bytes > self.max_bytes and len(self._by_key) > 1:
+            _, evicted = self._by_key.popitem(last=False)
+            self._forget(evicted)
+        return entry
+
+    def _forget(self, entry: _Entry) -> None:
+        self._by_url.pop(entry.url, None)
+        self._bytes -= len(entry.data) + len(entry.url)
+
+    # ── History policy ───────────────────────────────────────────────────────
+
+    def apply_history_policy(self, messages: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Apply the policy to ``messages`` in place and report the savings.
+
+        Only image parts of user messages before the last ``keep_recent``
+        image-bearing user turns are touched; each such message gets a new
+        content list (the dicts are per-request copies, the lists are not).
+        """
+        report = {"images": 0, "image_bytes": 0, "omitted": 0, "downsampled": 0, "bytes_saved": 0}
+        if not self.enabled:
+            return report
+
+        turns = []
+        for index, msg in enumerate(messages):
+            content = msg.get("content")
+            if msg.get("role") != "user" or not isinstance(content, list):
+                continue
+            has_image = False
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "image_url":
+                    has_image = True
+                    report["images"] += 1
+                    report["image_bytes"] += len(part.get("image_url", {}).get("url", ""))
+            if has_image:
+                turns.append(index)
+
+        if self.policy != "keep":
+            for index in turns[: -self.keep_recent]:
+                messages[index]["content"] = [
+                    self._slim(part, report) for part in messages[index]["content"]
+                ]
+
+        with self._lock:
+            self.requests += 1
+            self.omitted += report["omitted"]
+            self.downsampled += report["downsampled"]
+            self.bytes_saved += report["bytes_saved"]
+            self.last_request = report
+        if report["bytes_saved"]:
+            logger.info(
+                f"[image-store] {report['omitted']} image(s) omitted, {report['downsampled']} "
+                f"downsampled; saved {report['bytes_saved'] // 1024} KB of {report['image_bytes'] // 1024} KB"
+            )
+        return report
+
+    def _slim(self, part: Any, report: Dict[str, int]) -> Any:
+        if not isinstance(part, dict) or part.get("type") != "image_url":
+            return part
+        url = part.get("image_url", {}).get("url", "")
+        if not url.startswith("data:"):
+            return part
+
+        entry = self._entry_for_url(url)
+        if self.policy == "downsample":
+            small = self._downsampled(entry)
+            if small:
+                report["downsampled"] += 1
+                report["bytes_saved"] += len(url) - len(small)
+                return {"type": "image_url", "image_url": {"url": small}}
+            if small == "":
+                return part  # already small enough
+        report["omitted"] += 1
+        report["bytes_saved"] += len(url)
+        return {
+            "type": "text",
+            "text": f"[image omitted from an earlier turn: {entry.media_type}, {len(url) * 3 // 4 // 1024} KB]",
+        }
+
+    def _entry_for_url(self, url: str) -> _Entry:
+        with self._lock:
+            entry = self._by_url.get(url)
+            if entry is None:  # evicted, or built outside image_part()
+                media_type, _, data = url[5:].partition(";base64,")
+                entry = self._add(_key(media_type, data), media_type, data, url)
+        return entry
+
+    def _downsampled(self, entry: _Entry) -> Optional[str]:
+        """Downsampled data URL, ``""`` if it would not be smaller, None on error."""
+        if entry.small is not None:
+            return entry.small
+        try:
+            raw = base64.b64decode(entry.url.split(",", 1)[1], validate=True)
+            with Image.open(io.BytesIO(raw)) as image:
+                if max(image.size) <= self.max_px:
+                    entry.small = ""
+                    return entry.small
+                image.thumbnail((self.max_px, self.max_px))
+                if entry.media_type == "image/jpeg":
+                    fmt, media_type = "JPEG", "image/jpeg"
+                    if image.mode not in ("RGB", "L"):
+                        image = image.convert("RGB")
+                else:
+                    fmt, media_type = "PNG", "image/png"
+                buffer = io.BytesIO()
+                image.save(buffer, format=fmt, optimize=True)
+        except (binascii.Error, IndexError, OSError, ValueError, Image.DecompressionBombError) as e:
+            logger.debug(f"[image-store] Could not downsample {entry.media_type} image: {e}")
+            return None
+        small = data_url(media_type, base64.b64encode(buffer.getvalue()).decode("ascii"))
+        entry.small = small if len(small) < len(entry.url) else ""
+        return entry.small
+
+    # ── Introspection ────────────────────────────────────────────────────────
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_key.clear()
+            self._by_url.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "policy": self.policy,
+                "keep_recent_turns": self.keep_recent,
+                "unique_images": len(self._by_key),
+                "stored_bytes": self._bytes,
+                "images": self.images,
+                "reused": self.reused,
+                "bytes_reused": self.bytes_reused,
+                "requests": self.requests,
+                "omitted": self.omitted,
+                "downsampled": self.downsampled,
+                "bytes_saved": self.bytes_saved,
+                "last_request": dict(self.last_request),
+            }
+
+
+# Module-level singleton
+image_store = ImageStore()
@@ -0,0 +1,210 @@
+"""
+Prompt-prefix stabilization and upstream prompt-cache accounting.
+
+OpenAI, OpenRouter and DeepSeek cache prompts by exact prefix: the tool
+array and the system message must be byte-identical from one request to the
+next for the cached part to be reused. Claude Code sends the same tools every
+turn, but not always in the same order (MCP servers register as they
+connect), and anything that rewrites the system message mid-session silently
+drops the hit rate to zero.
+
+``stabilize`` runs at the end of ``convert_claude_to_openai``:
+  - tools keep the order a session first saw them in; tools that appear
+    later are appended after the known ones, so a late MCP server extends
+    the prefix instead of reshuffling it,
+  - the system prompt and tool names are fingerprinted per session and every
+    change is counted (and logged), so drift shows up in the stats.
+
+``cache_markers`` (``PROMPT_CACHE_MARKERS=true``) adds an explicit
+``cache_control`` breakpoint to the system message for upstreams that only
+cache on request: Anthropic and Gemini models behind OpenRouter. OpenAI and
+DeepSeek cache automatically and get no markers.
+
+``record_usage`` reads cached-token counts out of response usage —
+``prompt_tokens_details.cached_tokens`` (OpenAI, OpenRouter),
+``prompt_cache_hit_tokens`` (DeepSeek) or ``cache_read_input_tokens``
+(already converted) — and keeps hit rates per provider and per session
+(``/api/prompt-cache/stats``).
+
+Configuration (env vars):
+  PROMPT_PREFIX_STABILIZE=true     Sticky per-session tool order (default: true)
+  PROMPT_CACHE_MARKERS=false       Add cache_control to the system message on
+                                   OpenRouter Anthropic/Gemini models
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("PROMPT_PREFIX_STABILIZE", "true").lower() != "false"
+_MARKERS = os.environ.get("PROMPT_CACHE_MARKERS", "false").lower() == "true"
+
+# Model prefixes OpenRouter only caches when the request carries a breakpoint.
+_MARKER_MODELS = ("anthropic/", "google/gemini")
+
+
+def cached_tokens(usage: Dict[str, Any]) -> int:
+    """Cached prompt tokens in an OpenAI-, DeepSeek- or Claude-format usage dict."""
+    details = usage.get("prompt_tokens_details") or {}
+    return int(
+        details.get("cached_tokens")
+        or usage.get("prompt_cache_hit_tokens")
+        or usage.get("cache_read_input_tokens")
+        or usage.get("cached_tokens")
+        or 0
+    )
+
+
+def _rate(counts: Dict[str, int]) -> Dict[str, Any]:
+    prompt = counts["prompt_tokens"]
+    return {**counts, "hit_rate": round(counts["cached_tokens"] / prompt, 4) if prompt else 0.0}
+
+
+class PromptPrefixStabilizer:
+    """Per-session tool order, prefix drift and cached-token hit rates."""
+
+    def __init__(self, enabled: bool = _ENABLED, markers: bool = _MARKERS, max_sessions: int = 256):
+        self.enabled = enabled
+        self.markers = markers
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._usage_sessions: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._providers: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.reordered = 0
+        self.system_changes = 0
+        self.tool_changes = 0
+        self.marked = 0
+
+    # ── Request side ─────────────────────────────────────────────────────────
+
+    def stabilize(
+        self, openai_request: Dict[str, Any], session_id: Optional[str], provider: Optional[str]
+    ) -> Dict[str, Any]:
+        """Pin the tool order for the session and record prefix drift."""
+        if not self.enabled:
+            return openai_request
+
+        tools = openai_request.get("tools") or []
+        names = [t.get("function", {}).get("name", "") for t in tools]
+        system = hash(
+            tuple(
+                m.get("content") if isinstance(m.get("content"), str) else repr(m.get("content"))
+                for m in openai_request.get("messages", [])
+                if m.get("role") == "system"
+            )
+        )
+        key = (str(session_id or ""), provider or "")
+
+        with self._lock:
+            self.requests += 1
+            state = self._sessions.get(key)
+            if state is None:
+                state = {"order": {}, "names": None, "system": system}
+                self._sessions[key] = state
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(key)
+                if state["system"] != system:
+                    self.system_changes += 1
+                    logger.info(f"[prompt-prefix] System prompt changed mid-session ({provider})")
+                    state["system"] = system
+
+            if names != state["names"]:
+                order = state["order"]
+                if state["names"] is not None and set(names) != set(state["names"]):
+                    self.tool_changes += 1
+                for name in names:
+                    if name not in order:
+                        order[name] = len(order)
+                stable = sorted(range(len(names)), key=lambda i: order[names[i]])
+                if stable != list(range(len(names))):
+                    self.reordered += 1
+                    tools = [tools[i] for i in stable]
+                    names = [names[i] for i in stable]
+                    openai_request["tools"] = tools
+                state["names"] = names
+        return openai_request
+
+    def cache_markers(self, api_request: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        """``api_request`` with a cache breakpoint on the system message, if it needs one."""
+        if not self.markers or "openrouter.ai" not in base_url:
+            return api_request
+        if not str(api_request.get("model", "")).startswith(_MARKER_MODELS):
+            return api_request
+
+        messages = api_request.get("messages") or []
+        last_system = None
+        for index, msg in enumerate(messages):
+            if msg.get("role") != "system":
+                break
+            last_system = index
+        if last_system is None or not isinstance(messages[last_system].get("content"), str):
+            return api_request
+
+        messages = list(messages)
+        messages[last_system] = {
+            **messages[last_system],
+            "content": [
+                {
+                    "type": "text",
+                    "text": messages[last_system]["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+        with self._lock:
+            self.marked += 1
+        return {**api_request, "messages": messages}
+
+    # ── Response side ────────────────────────────────────────────────────────
+
+    def record_usage(self, provider: Optional[str], session_id: Optional[str], usage: Dict[str, Any]) -> None:
+        """Add one response's prompt and cached tokens to the hit-rate counters."""
+        if not usage:
+            return
+        prompt = int(usage.get("prompt_tokens") or usage.get("input_tokens") or 0)
+        cached = cached_tokens(usage)
+        with self._lock:
+            for table, key in ((self._providers, provider or "unknown"), (self._usage_sessions, str(session_id or ""))):
+                counts = table.get(key)
+                if counts is None:
+                    counts = table[key] = {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0}
+                counts["requests"] += 1
+                counts["prompt_tokens"] += prompt
+                counts["cached_tokens"] += cached
+            self._usage_sessions.move_to_end(str(session_id or ""))
+            while len(self._usage_sessions) > self.max_sessions:
+                self._usage_sessions.popitem(last=False)
+
+    # ── Introspection ────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "markers": self.markers,
+                "requests": self.requests,
+                "reordered": self.reordered,
+                "system_changes": self.system_changes,
+                "tool_changes": self.tool_changes,
+                "marked": self.marked,
+                "providers": {name: _rate(c) for name, c in self._providers.items()},
+                "sessions": {name: _rate(c) for name, c in self._usage_sessions.items()},
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._usage_sessions.clear()
+            self._providers.clear()
+
+
+# Module-level singleton
+prompt_prefix = PromptPrefixStabilizer()
@@ -14,9 +14,16 @@ from src.models.reasoning import (
 from src.services.models.model_filter import model_filter
 from src.core.constants import Constants
 from src.services.tools.tool_mapper import sanitize_tool_declarations
+from src.services.tools.tool_pipeline import tool_pipeline
 from src.services.conversion.tool_behavior_cache import get_tool_argument_style
+from src.services.conversion.conversion_cache import conversion_cache
+from src.services.conversion.image_store import image_store
+from src.services.conversion.prompt_prefix import prompt_prefix
+from src.services.conversion.tool_output_compactor import tool_output_compactor
+from src.services.logging.hot_log import get_hot_logger, lazy
 
 logger = logging.getLogger(__name__)
+hot_log = get_hot_logger(logger)
 
 # Tool output truncation settings (originally from Lynkr, designed for small-context models)
 # DISABLED by default — modern 1M-context models have no need to blindly truncate tool data.
@@ -109,6 +116,45 @@ def _strip_tool_schemas(openai_tools: list) -> list:
     return stripped
 
 
+def _build_openai_tools(
+    claude_tools: list, strict_provider: bool, target_provider: str = None
+) -> List[Dict[str, Any]]:
+    """Convert Claude tool definitions into the final OpenAI tool array."""
+    openai_tools = []
+    hot_log.debug("Converting %s tools to OpenAI format", len(claude_tools))
+    for tool in claude_tools:
+        if tool.name and tool.name.strip():
+            # Sanitize input schema to remove 'defer_loading' which causes Google API errors
+            input_schema = tool.input_schema.copy() if tool.input_schema else {}
+            if "defer_loading" in input_schema:
+                del input_schema["defer_loading"]
+
+            openai_tools.append(
+                {
+                    "type": Constants.TOOL_FUNCTION,
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description or "",
+                        "parameters": input_schema,
+                    },
+                }
+            )
+    if not openai_tools:
+        return openai_tools
+
+    # Sanitize tool names for provider compatibility (e.g., lowercase for Google/Gemini)
+    openai_tools = sanitize_tool_declarations(openai_tools)
+    if not strict_provider:
+        before_count = len(openai_tools)
+        openai_tools = _strip_tool_schemas(openai_tools)
+        after_count = len(openai_tools)
+        if after_count < before_count:
+            hot_log.debug("Tool dedup: %s → %s tools", before_count, after_count)
+    else:
+        hot_log.debug("Tool schema strip skipped for strict provider: %s", target_provider)
+    return openai_tools
+
+
 def truncate_tool_output(content: str, max_chars: int = None) -> Tuple[str, bool]:
     """
     Truncate large tool outputs for token efficiency.
@@ -149,7 +195,7 @@ def truncate_tool_output(content: str, max_chars: int = None) -> Tuple[str, bool
 
 
 def validate_tool_message_sequence(
-    messages: List[Dict[str, Any]], remove_orphans: bool = False
+    messages: List[Dict[str, Any]], remove_orphans: bool = False, start: int = 0
 ) -> List[Dict[str, Any]]:
     """
     Validate that tool role messages have matching tool_calls in preceding assistant messages.
@@ -160,6 +206,8 @@ def validate_tool_message_sequence(
     Args:
         messages: List of OpenAI-format messages
         remove_orphans: If True, remove orphaned tool messages. If False, just log warnings.
+        start: Messages before this index were already validated (e.g. a cached
+            history prefix); they are only used as context for later ones.
 
     Returns:
         Validated (and optionally cleaned) message list
@@ -167,10 +215,10 @@ def validate_tool_message_sequence(
     if not messages:
         return messages
 
-    validated = []
+    validated = list(messages[:start])
     orphan_count = 0
 
-    for i, msg in enumerate(messages):
+    for i, msg in enumerate(messages[start:], start):
         role = msg.get("role", "")
 
         if role == "tool":
@@ -399,67 +447,30 @@ def convert_claude_to_openai(
                 {"role": Constants.ROLE_SYSTEM, "content": system_text.strip()}
             )
 
-    # Process Claude messages
-    i = 0
-    while i < len(claude_request.messages):
-        msg = claude_request.messages[i]
-
-        if msg.role == Constants.ROLE_USER:
-            openai_message = convert_claude_user_message(msg)
-            openai_messages.append(openai_message)
-        elif msg.role == Constants.ROLE_ASSISTANT:
-            openai_message = convert_claude_assistant_message(
-                msg, target_provider, openai_model
-            )
-            openai_messages.append(openai_message)
-
-            # Check if next message contains tool results
-            if i + 1 < len(claude_request.messages):
-                next_msg = claude_request.messages[i + 1]
-                if (
-                    next_msg.role == Constants.ROLE_USER
-                    and isinstance(next_msg.content, list)
-                    and any(
-                        block.type == Constants.CONTENT_TOOL_RESULT
-                        for block in next_msg.content
-                        if hasattr(block, "type")
-                    )
-                ):
-                    # Process tool results
-                    i += 1  # Skip to tool result message
-                    tool_results = convert_claude_tool_results(next_msg)
-                    openai_messages.extend(tool_results)
-
-        elif msg.role == Constants.ROLE_SYSTEM:
-            # Tolerated inbound "system" message (see ClaudeMessage.role). Hoist
-            # its text into the OpenAI stream as a system message, preserving
-            # position. _normalize_system_role() downstream will fold it into
-            # "user" for backends that reject the system role.
-            content = msg.content
-            if isinstance(content, str):
-                text = content
-            else:
-                parts = []
-                for block in content or []:
-                    if hasattr(block, "type") and block.type == Constants.CONTENT_TEXT:
-                        parts.append(block.text)
-                    elif (
-                        isinstance(block, dict)
-                        and block.get("type") == Constants.CONTENT_TEXT
-                    ):
-                        parts.append(block.get("text", ""))
-                text = "\n\n".join(parts)
-            if text.strip():
-                openai_messages.append(
-                    {"role": Constants.ROLE_SYSTEM, "content": text.strip()}
-                )
+    # Process Claude messages — reusing this session's previously converted
+    # prefix, so only turns appended since the last request are converted.
+    history, validated_upto = conversion_cache.convert(
+        claude_request.messages,
+        (target_provider, openai_model),
+        lambda start: convert_claude_message_units(
+            claude_request.messages, start, target_provider, openai_model
+        ),
+        session_id=(claude_request.metadata or {}).get("user_id"),
+    )
+    openai_messages.extend(history)
 
-        i += 1
+    # Slim images in older turns per IMAGE_HISTORY_POLICY (per-request copies only)
+    image_store.apply_history_policy(openai_messages)
+    # Compact old tool results against the earlier conversation (TOOL_OUTPUT_COMPACTION)
+    tool_output_compactor.compact(openai_messages)
 
     # Validate tool message sequence - detect orphaned tool messages
-    # Set remove_orphans=True to auto-fix, False (default) to just warn
+    # Set remove_orphans=True to auto-fix, False (default) to just warn.
+    # The reused prefix was validated on an earlier turn.
     openai_messages = validate_tool_message_sequence(
-        openai_messages, remove_orphans=False
+        openai_messages,
+        remove_orphans=False,
+        start=len(openai_messages) - len(history) + validated_upto,
     )
 
     # Build OpenAI request
@@ -486,9 +497,12 @@ def convert_claude_to_openai(
         token_limit = claude_request.max_tokens
 
     if token_limit < claude_request.max_tokens:
-        logger.debug(
-            f"Capped max_tokens {claude_request.max_tokens} → {token_limit} "
-            f"(model {openai_model} output limit: {model_output_limit})"
+        hot_log.debug(
+            "Capped max_tokens %s → %s (model %s output limit: %s)",
+            claude_request.max_tokens,
+            token_limit,
+            openai_model,
+            model_output_limit,
         )
 
     openai_request = {
@@ -498,20 +512,27 @@ def convert_claude_to_openai(
     }
 
     # Log outgoing message summary (debug level to avoid noise)
-    logger.debug(f"OUTGOING REQUEST: {len(openai_messages)} messages")
-    if logger.isEnabledFor(logging.DEBUG):
+    hot_log.debug("OUTGOING REQUEST: %s messages", len(openai_messages))
+    if hot_log.enabled():
         for idx, msg in enumerate(openai_messages):
             role = msg.get("role", "?")
             content = str(msg.get("content", ""))[:80]
             tool_calls = "YES" if msg.get("tool_calls") else "NO"
             # Skip logging if content is empty or just placeholders to avoid token waste
             if content.strip() and "(no content)" not in content.lower():
-                logger.debug(
-                    f"  MSG[{idx}] role={role}, tool_calls={tool_calls}, content={content}..."
+                hot_log.debug(
+                    "  MSG[%s] role=%s, tool_calls=%s, content=%s...",
+                    idx,
+                    role,
+                    tool_calls,
+                    content,
                 )
             else:
-                logger.debug(
-                    f"  MSG[{idx}] role={role}, tool_calls={tool_calls}, content=[empty/placeholder]"
+                hot_log.debug(
+                    "  MSG[%s] role=%s, tool_calls=%s, content=[empty/placeholder]",
+                    idx,
+                    role,
+                    tool_calls,
                 )
 
     # Newer OpenAI models models (o1, o3, o4, gpt-5) require max_completion_tokens instead of max_tokens
@@ -519,15 +540,22 @@ def convert_claude_to_openai(
         openai_request["max_completion_tokens"] = token_limit
         # Newer reasoning models require temperature=1
         openai_request["temperature"] = 1
-        logger.debug(
-            f"Converted request (newer model): model={openai_model}, messages={len(openai_messages)}, max_completion_tokens={token_limit}, temperature=1"
+        hot_log.debug(
+            "Converted request (newer model): model=%s, messages=%s, max_completion_tokens=%s, temperature=1",
+            openai_model,
+            len(openai_messages),
+            token_limit,
         )
     else:
         openai_request["max_tokens"] = token_limit
         # Use client-requested temperature - no hardcoded overrides
         openai_request["temperature"] = claude_request.temperature
-        logger.debug(
-            f"Converted request: model={openai_model}, messages={len(openai_messages)}, max_tokens={token_limit}, temp={claude_request.temperature}"
+        hot_log.debug(
+            "Converted request: model=%s, messages=%s, max_tokens=%s, temp=%s",
+            openai_model,
+            len(openai_messages),
+            token_limit,
+            claude_request.temperature,
         )
     # Add optional parameters
     if claude_request.stop_sequences:
@@ -535,47 +563,27 @@ def convert_claude_to_openai(
     if claude_request.top_p is not None:
         openai_request["top_p"] = claude_request.top_p
 
-    # Convert tools
+    # Convert tools — the final array is memoized per tool set, since Claude
+    # Code sends the same tools every turn.
     if claude_request.tools:
-        openai_tools = []
-        logger.debug(f"Converting {len(claude_request.tools)} tools to OpenAI format")
-        for tool in claude_request.tools:
-            if tool.name and tool.name.strip():
-                # Sanitize input schema to remove 'defer_loading' which causes Google API errors
-                input_schema = tool.input_schema.copy() if tool.input_schema else {}
-                if "defer_loading" in input_schema:
-                    del input_schema["defer_loading"]
-
-                openai_tools.append(
-                    {
-                        "type": Constants.TOOL_FUNCTION,
-                        "function": {
-                            "name": tool.name,
-                            "description": tool.description or "",
-                            "parameters": input_schema,
-                        },
-                    }
-                )
+        # Strip verbose schema fields — skip for strict-mode providers that
+        # require explicit additionalProperties: false (OpenAI strict tool use).
+        # Also skip for Gemini direct endpoints that validate schemas strictly.
+        strict_provider = bool(
+            target_provider
+            and target_provider.lower() in ("openai", "azure", "gemini", "google")
+        )
+        openai_tools = tool_pipeline.openai_tools(
+            claude_request.tools,
+            strict_provider,
+            lambda tools: _build_openai_tools(tools, strict_provider, target_provider),
+        )
         if openai_tools:
-            # Sanitize tool names for provider compatibility (e.g., lowercase for Google/Gemini)
-            openai_tools = sanitize_tool_declarations(openai_tools)
-            # Strip verbose schema fields — skip for strict-mode providers that
-            # require explicit additionalProperties: false (OpenAI strict tool use).
-            # Also skip for Gemini direct endpoints that validate schemas strictly.
-            _strict_provider = target_provider and target_provider.lower() in (
-                "openai", "azure", "gemini", "google"
-            )
-            if not _strict_provider:
-                before_count = len(openai_tools)
-                openai_tools = _strip_tool_schemas(openai_tools)
-                after_count = len(openai_tools)
-                if after_count < before_count:
-                    logger.debug(f"Tool dedup: {before_count} → {after_count} tools")
-            else:
-                logger.debug(f"Tool schema strip skipped for strict provider: {target_provider}")
             openai_request["tools"] = openai_tools
-            logger.debug(
-                f"Added {len(openai_tools)} tools to OpenAI request: {[t['function']['name'] for t in openai_tools]}"
+            hot_log.debug(
+                "Added %s tools to OpenAI request: %s",
+                len(openai_tools),
+                lazy(lambda: [t["function"]["name"] for t in openai_tools]),
             )
 
     # Convert tool choice
@@ -614,8 +622,9 @@ def convert_claude_to_openai(
     ):
         # Only add verbosity for models that explicitly support it
         # Many models don't support this parameter or have restrictions
-        logger.debug(
-            f"Verbosity configured but skipped for {openai_model} to avoid compatibility issues"
+        hot_log.debug(
+            "Verbosity configured but skipped for %s to avoid compatibility issues",
+            openai_model,
         )
 
     # Inject custom system prompt if configured
@@ -626,10 +635,17 @@ def convert_claude_to_openai(
         openai_messages, model_size, model_manager.config
     )
 
-    # Normalise system-role messages for backends that reject "role": "system"
-    openai_messages = _normalize_system_role(openai_messages, model_manager.config)
-
+    # Pin the session's tool order and record system/tool prefix drift, so
+    # upstream prefix caching keeps hitting
     openai_request["messages"] = openai_messages
+    prompt_prefix.stabilize(
+        openai_request, (claude_request.metadata or {}).get("user_id"), target_provider
+    )
+
+    # Normalise system-role messages for backends that reject "role": "system"
+    openai_request["messages"] = _normalize_system_role(
+        openai_messages, model_manager.config
+    )
 
     return openai_request
 
@@ -799,6 +815,72 @@ def _get_model_size_from_model_id(model_id: str) -> str:
     return "middle"
 
 
+def convert_claude_message_units(
+    messages: List[ClaudeMessage],
+    start: int,
+    target_provider: str = None,
+    openai_model: str = None,
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """Convert ``messages[start:]`` into units of ``(end_index, openai_messages)``.
+
+    A unit is one Claude message, or an assistant message plus the user
+    message carrying its tool results; ``end_index`` is the index after the
+    last Claude message the unit consumed.
+    """
+    units: List[Tuple[int, List[Dict[str, Any]]]] = []
+    i = start
+    while i < len(messages):
+        msg = messages[i]
+        out: List[Dict[str, Any]] = []
+
+        if msg.role == Constants.ROLE_USER:
+            out.append(convert_claude_user_message(msg))
+        elif msg.role == Constants.ROLE_ASSISTANT:
+            out.append(convert_claude_assistant_message(msg, target_provider, openai_model))
+
+            # Check if next message contains tool results
+            if i + 1 < len(messages):
+                next_msg = messages[i + 1]
+                if (
+                    next_msg.role == Constants.ROLE_USER
+                    and isinstance(next_msg.content, list)
+                    and any(
+                        block.type == Constants.CONTENT_TOOL_RESULT
+                        for block in next_msg.content
+                        if hasattr(block, "type")
+                    )
+                ):
+                    # Process tool results
+                    i += 1  # Skip to tool result message
+                    out.extend(convert_claude_tool_results(next_msg))
+
+        elif msg.role == Constants.ROLE_SYSTEM:
+            # Tolerated inbound "system" message (see ClaudeMessage.role). Hoist
+            # its text into the OpenAI stream as a system message, preserving
+            # position. _normalize_system_role() downstream will fold it into
+            # "user" for backends that reject the system role.
+            content = msg.content
+            if isinstance(content, str):
+                text = content
+            else:
+                parts = []
+                for block in content or []:
+                    if hasattr(block, "type") and block.type == Constants.CONTENT_TEXT:
+                        parts.append(block.text)
+                    elif (
+                        isinstance(block, dict)
+                        and block.get("type") == Constants.CONTENT_TEXT
+                    ):
+                        parts.append(block.get("text", ""))
+                text = "\n\n".join(parts)
+            if text.strip():
+                out.append({"role": Constants.ROLE_SYSTEM, "content": text.strip()})
+
+        i += 1
+        units.append((i, out))
+    return units
+
+
 def convert_claude_user_message(msg: ClaudeMessage) -> Dict[str, Any]:
     """Convert Claude user message to OpenAI format."""
     if msg.content is None:
@@ -821,12 +903,7 @@ def convert_claude_user_message(msg: ClaudeMessage) -> Dict[str, Any]:
                 and "data" in block.source
             ):
                 openai_content.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{block.source['media_type']};base64,{block.source['data']}"
-                        },
-                    }
+                    image_store.image_part(block.source["media_type"], block.source["data"])
                 )
 
     if len(openai_content) == 1 and openai_content[0]["type"] == "text":
@@ -12,6 +12,9 @@ from src.services.providers.provider_detector import (
     get_normalization_level,
 )
 from src.services.conversion.tool_behavior_cache import record_tool_argument_style
+from src.services.conversion.streaming_json import tool_args_stream
+from src.services.conversion.text_tool_calls import TextToolCallScanner
+from src.services.conversion.tool_arg_rules import full_normalizer, light_normalizer
 
 # Debug flag for SSE tracing - enable to diagnose tool call streaming issues
 DEBUG_SSE = os.getenv("DEBUG_SSE", "false").lower() == "true"
@@ -21,26 +24,45 @@ sse_logger = logging.getLogger("sse_debug")
 # Matches: "timeout":"120" and converts to "timeout":120
 _NUMERIC_PARAM_RE = re.compile(r'"(timeout|offset|limit|cell_number)"\s*:\s*"(\d+)"')
 
-# Tool-call text extraction (models that emit tool calls as plain text)
-_TOOL_CALL_BLOCK_RE = re.compile(
-    r"<tool_call>(.*?)</tool_call>", re.IGNORECASE | re.DOTALL
-)
-
 
-def _coerce_int_fields(arguments: dict, fields: list) -> dict:
-    """Coerce string values to int for specified fields.
 
-    Gemini sometimes returns integer-typed parameters as strings
-    (e.g., "120" instead of 120). Claude Code CLI's strict validator
-    rejects these with InputValidationError.
-    """
-    for field in fields:
-        if field in arguments and isinstance(arguments[field], str):
-            try:
-                arguments[field] = int(arguments[field])
-            except (ValueError, TypeError):
-                pass  # Leave non-numeric strings unchanged
-    return arguments
+# Common tool name mappings
+# Includes direct lowercase→PascalCase restorations (sanitize_function_name lowercases
+# all tool names sent to CLIProxyAPI, so we must restore them here for Claude Code)
+_TOOL_NAME_ALIASES = {
+    # Direct lowercase restorations (from sanitize_function_name lowercasing)
+    "bash": "Bash",
+    "repl": "Repl",
+    "read": "Read",
+    "write": "Write",
+    "edit": "Edit",
+    "multiedit": "MultiEdit",
+    "glob": "Glob",
+    "grep": "Grep",
+    "ls": "LS",
+    "task": "Task",
+    "agentdispatch": "AgentDispatch",
+    "todowrite": "TodoWrite",
+    "todoread": "TodoRead",
+    "webfetch": "WebFetch",
+    "websearch": "WebSearch",
+    "browser": "Browser",
+    "notebookedit": "NotebookEdit",
+    "notebookread": "NotebookRead",
+    # Compound name variants (from models using alternative names)
+    "readfile": "Read",
+    "writefile": "Write",
+    "runcommand": "Bash",
+    "runbash": "Bash",
+    "listfiles": "LS",
+    "searchfiles": "Grep",
+    "search": "Grep",
+    "findfiles": "Glob",
+    "createtask": "Task",
+    "runtask": "Task",
+    "todolist": "TodoRead",
+    "browse": "Browser",
+}
 
 
 def _normalize_tool_name(tool_name: str, provider: str = "gemini") -> str:
@@ -49,47 +71,7 @@ def _normalize_tool_name(tool_name: str, provider: str = "gemini") -> str:
 
     For example, some models call "write_file" instead of "Write".
     """
-    tool_name_lower = tool_name.lower().replace("_", "")
-
-    # Common tool name mappings
-    # Includes direct lowercase→PascalCase restorations (sanitize_function_name lowercases
-    # all tool names sent to CLIProxyAPI, so we must restore them here for Claude Code)
-    name_mappings = {
-        # Direct lowercase restorations (from sanitize_function_name lowercasing)
-        "bash": "Bash",
-        "repl": "Repl",
-        "read": "Read",
-        "write": "Write",
-        "edit": "Edit",
-        "multiedit": "MultiEdit",
-        "glob": "Glob",
-        "grep": "Grep",
-        "ls": "LS",
-        "task": "Task",
-        "agentdispatch": "AgentDispatch",
-        "todowrite": "TodoWrite",
-        "todoread": "TodoRead",
-        "webfetch": "WebFetch",
-        "websearch": "WebSearch",
-        "browser": "Browser",
-        "notebookedit": "NotebookEdit",
-        "notebookread": "NotebookRead",
-        # Compound name variants (from models using alternative names)
-        "readfile": "Read",
-        "writefile": "Write",
-        "runcommand": "Bash",
-        "runbash": "Bash",
-        "listfiles": "LS",
-        "searchfiles": "Grep",
-        "search": "Grep",
-        "findfiles": "Glob",
-        "createtask": "Task",
-        "runtask": "Task",
-        "todolist": "TodoRead",
-        "browse": "Browser",
-    }
-
-    return name_mappings.get(tool_name_lower, tool_name)
+    return _TOOL_NAME_ALIASES.get(tool_name.lower().replace("_", ""), tool_name)
 
 
 def _extract_tool_calls_from_text(
@@ -102,66 +84,9 @@ def _extract_tool_calls_from_text(
         (remaining_text, tool_calls)
         tool_calls: list of {name: str, arguments: dict}
     """
-    tool_calls = []
-    remaining = buffer
-
-    for match in _TOOL_CALL_BLOCK_RE.finditer(buffer):
-        block = match.group(1)
-
-        # Extract tool name
-        name = None
-        name_match = re.search(
-            r'<function\s*=\s*"?([A-Za-z0-9_ -]+)"?\s*>',
-            block,
-            re.IGNORECASE,
-        )
-        if not name_match:
-            name_match = re.search(
-                r"<function\s+name=\"([^\"]+)\"\s*>",
-                block,
-                re.IGNORECASE,
-            )
-        if not name_match:
-            name_match = re.search(
-                r"<function>\s*([^<]+)\s*</function>",
-                block,
-                re.IGNORECASE,
-            )
-        if name_match:
-            name = name_match.group(1).strip()
-
-        if not name:
-            continue
-
-        # Extract arguments
-        args_text = None
-        params_match = re.search(
-            r"<parameters>\s*(.*?)\s*</parameters>",
-            block,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if params_match:
-            args_text = params_match.group(1)
-        else:
-            json_match = re.search(r"({.*})", block, re.DOTALL)
-            if json_match:
-                args_text = json_match.group(1)
-
-        if not args_text:
-            continue
-
-        try:
-            arguments = json.loads(args_text)
-        except json.JSONDecodeError:
-            continue
-
-        tool_calls.append({"name": name, "arguments": arguments})
-
-    # Strip extracted blocks from buffer
-    if tool_calls:
-        remaining = _TOOL_CALL_BLOCK_RE.sub("", buffer)
-
-    return remaining, tool_calls
+    scanner = TextToolCallScanner()
+    tool_calls = scanner.feed(buffer)
+    return (scanner.remaining() if tool_calls else buffer), tool_calls
 
 
 def _build_tool_use_delta_event(index: int, arguments: dict) -> str:
@@ -233,58 +158,9 @@ def _light_normalize(tool_name: str, arguments: dict) -> dict:
     Light normalization for OpenRouter and OpenAI-compatible providers.
 
     Handles common parameter mismatches that occur with non-Gemini providers.
+    Rules live in ``tool_arg_rules.LIGHT_RULES``.
     """
-    tool_name_lower = tool_name.lower() if tool_name else ""
-
-    # Bash/Repl: Most common mismatch
-    if tool_name_lower in ["bash", "repl"]:
-        if "prompt" in arguments and "command" not in arguments:
-            arguments["command"] = arguments.pop("prompt")
-            import logging
-
-            logging.getLogger("response_converter").warning(
-                f"⚠️ NORMALIZED {tool_name}: prompt -> command"
-            )
-        _coerce_int_fields(arguments, ["timeout"])
-
-    # Read: Common path variants
-    if tool_name_lower == "read":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "filePath" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filePath")
-        _coerce_int_fields(arguments, ["offset", "limit"])
-
-    # Write: Claude CLI expects 'file_path' + 'content'
-    # Models often send: path, filePath, filename → file_path
-    #                    text, contents, data → content
-    if tool_name_lower == "write":
-        # Path variants
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "filePath" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filePath")
-        elif "filename" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filename")
-        elif "file" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("file")
-
-        # Content variants
-        if "text" in arguments and "content" not in arguments:
-            arguments["content"] = arguments.pop("text")
-        elif "contents" in arguments and "content" not in arguments:
-            arguments["content"] = arguments.pop("contents")
-        elif "data" in arguments and "content" not in arguments:
-            arguments["content"] = arguments.pop("data")
-
-    # Edit: Claude CLI expects 'file_path', 'old_text', 'new_text'
-    if tool_name_lower == "edit":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "filePath" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filePath")
-
-    return arguments
+    return light_normalizer(tool_name, arguments)
 
 
 def _full_normalize(tool_name: str, arguments: dict) -> dict:
@@ -292,225 +168,9 @@ def _full_normalize(tool_name: str, arguments: dict) -> dict:
     Full normalization for Gemini provider.
 
     Handles all 18+ Claude Code CLI tools with comprehensive parameter mapping.
+    Rules live in ``tool_arg_rules.FULL_RULES``.
     """
-    tool_name_lower = tool_name.lower() if tool_name else ""
-
-    # ============================================================
-    # TIER 1: Core File Operations
-    # ============================================================
-
-    # Bash/Repl: Claude CLI expects 'command', Gemini may output 'prompt' or 'code'
-    if tool_name_lower in ["bash", "repl"]:
-        if "prompt" in arguments and "command" not in arguments:
-            arguments["command"] = arguments.pop("prompt")
-        elif "code" in arguments and "command" not in arguments:
-            arguments["command"] = arguments.pop("code")
-        _coerce_int_fields(arguments, ["timeout"])
-
-    # Read: Claude CLI expects 'file_path', Gemini may output 'path' or 'filename'
-    if tool_name_lower == "read":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "filename" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filename")
-        elif "file" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("file")
-        _coerce_int_fields(arguments, ["offset", "limit"])
-
-    # Write: Claude CLI expects 'file_path' + 'content'
-    if tool_name_lower == "write":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "filename" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("filename")
-        elif "file" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("file")
-        # Content variants
-        if "text" in arguments and "content" not in arguments:
-            arguments["content"] = arguments.pop("text")
-        elif "data" in arguments and "content" not in arguments:
-            arguments["content"] = arguments.pop("data")
-
-    # Edit: Claude CLI expects 'file_path', 'old_text', 'new_text'
-    if tool_name_lower == "edit":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "file" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("file")
-        # Text variants
-        if "original" in arguments and "old_text" not in arguments:
-            arguments["old_text"] = arguments.pop("original")
-        elif "before" in arguments and "old_text" not in arguments:
-            arguments["old_text"] = arguments.pop("before")
-        if "replacement" in arguments and "new_text" not in arguments:
-            arguments["new_text"] = arguments.pop("replacement")
-        elif "after" in arguments and "new_text" not in arguments:
-            arguments["new_text"] = arguments.pop("after")
-
-    # MultiEdit: Claude CLI expects 'file_path' + 'edits' array
-    if tool_name_lower == "multiedit":
-        if "path" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("path")
-        elif "file" in arguments and "file_path" not in arguments:
-            arguments["file_path"] = arguments.pop("file")
-        # Edits array variants
-        if "changes" in arguments and "edits" not in arguments:
-            arguments["edits"] = arguments.pop("changes")
-        elif "modifications" in arguments and "edits" not in arguments:
-            arguments["edits"] = arguments.pop("modifications")
-
-    # ============================================================
-    # TIER 2: Search & Navigation
-    # ============================================================
-
-    # Glob: Claude CLI expects 'pattern'
-    if tool_name_lower == "glob":
-        if "glob" in arguments and "pattern" not in arguments:
-            arguments["pattern"] = arguments.pop("glob")
-        elif "glob_pattern" in arguments and "pattern" not in arguments:
-            arguments["pattern"] = arguments.pop("glob_pattern")
-
-    # Grep: Claude CLI expects 'pattern' + optional 'path'
-    if tool_name_lower == "grep":
-        if "query" in arguments and "pattern" not in arguments:
-            arguments["pattern"] = arguments.pop("query")
-        elif "search" in arguments and "pattern" not in arguments:
-            arguments["pattern"] = arguments.pop("search")
-        elif "regex" in arguments and "pattern" not in arguments:
-            arguments["pattern"] = arguments.pop("regex")
-        # Path variants
-        if "directory" in arguments and "path" not in arguments:
-            arguments["path"] = arguments.pop("directory")
-        elif "dir" in arguments and "path" not in arguments:
-            arguments["path"] = arguments.pop("dir")
-
-    # LS: Claude CLI expects 'path'
-    if tool_name_lower == "ls":
-        if "directory" in arguments and "path" not in arguments:
-            arguments["path"] = arguments.pop("directory")
-        elif "dir" in arguments and "path" not in arguments:
-            arguments["path"] = arguments.pop("dir")
-        elif "folder" in arguments and "path" not in arguments:
-            arguments["path"] = arguments.pop("folder")
-
-    # ============================================================
-    # TIER 3: Task & Agent
-    # ============================================================
-
-    # Task: Claude CLI expects 'prompt' + 'description' + 'subagent_type'
-    if tool_name_lower == "task":
-        if "description" in arguments and "prompt" not in arguments:
-            arguments["prompt"] = arguments["description"]
-        elif "prompt" in arguments and "description" not in arguments:
-            arguments["description"] = arguments["prompt"]
-        # Check agent type variants FIRST before setting default
-        if "agent_type" in arguments and "subagent_type" not in arguments:
-            arguments["subagent_type"] = arguments.pop("agent_type")
-        elif "type" in arguments and "subagent_type" not in arguments:
-            arguments["subagent_type"] = arguments.pop("type")
-        # Apply default LAST if still missing
-        if "subagent_type" not in arguments:
-            arguments["subagent_type"] = "Explore"
-
-    # AgentDispatch: Claude CLI expects 'agent_id' + 'task'
-    if tool_name_lower == "agentdispatch":
-        if "id" in arguments and "agent_id" not in arguments:
-            arguments["agent_id"] = arguments.pop("id")
-        if "prompt" in arguments and "task" not in arguments:
-            arguments["task"] = arguments.pop("prompt")
-        elif "instruction" in arguments and "task" not in arguments:
-            arguments["task"] = arguments.pop("instruction")
-
-    # ============================================================
-    # TIER 4: Todo Management
-    # ============================================================
-
-    # TodoWrite: tasks → todos + normalize status values
-    if tool_name_lower == "todowrite":
-        if "tasks" in arguments and "todos" not in arguments:
-            arguments["todos"] = arguments["tasks"]
-        if "tasks" in arguments:
-            del arguments["tasks"]
-        # Items variant
-        if "items" in arguments and "todos" not in arguments:
-            arguments["todos"] = arguments.pop("items")
-        if "todos" in arguments and isinstance(arguments["todos"], list):
-            valid_statuses = {"pending", "in_progress", "completed"}
-            for todo in arguments["todos"]:
-                if isinstance(todo, dict) and "status" in todo:
-                    status = todo["status"]
-                    if status not in valid_statuses:
-                        if "complete" in status.lower():
-                            todo["status"] = "completed"
-                        elif "progress" in status.lower():
-                            todo["status"] = "in_progress"
-                        else:
-                            todo["status"] = "pending"
-
-    # TodoRead: No parameters typically, but handle variants
-    if tool_name_lower == "todoread":
-        # No normalization needed - usually parameterless
-        pass
-
-    # ============================================================
-    # TIER 5: Web & Browser
-    # ============================================================
-
-    # WebFetch: Claude CLI expects 'url'
-    if tool_name_lower == "webfetch":
-        if "link" in arguments and "url" not in arguments:
-            arguments["url"] = arguments.pop("link")
-        elif "href" in arguments and "url" not in arguments:
-            arguments["url"] = arguments.pop("href")
-        elif "address" in arguments and "url" not in arguments:
-            arguments["url"] = arguments.pop("address")
-
-    # WebSearch: Claude CLI expects 'query'
-    if tool_name_lower == "websearch":
-        if "search" in arguments and "query" not in arguments:
-            arguments["query"] = arguments.pop("search")
-        elif "q" in arguments and "query" not in arguments:
-            arguments["query"] = arguments.pop("q")
-        elif "term" in arguments and "query" not in arguments:
-            arguments["query"] = arguments.pop("term")
-
-    # Browser: Claude CLI expects 'url' + 'action'
-    if tool_name_lower == "browser":
-        if "link" in arguments and "url" not in arguments:
-            arguments["url"] = arguments.pop("link")
-        elif "address" in arguments and "url" not in arguments:
-            arguments["url"] = arguments.pop("address")
-        # Action variants
-        if "command" in arguments and "action" not in arguments:
-            arguments["action"] = arguments.pop("command")
-        elif "operation" in arguments and "action" not in arguments:
-            arguments["action"] = arguments.pop("operation")
-
-    # ============================================================
-    # TIER 6: Notebook Operations
-    # ============================================================
-
-    # NotebookEdit: Claude CLI expects 'notebook_path' + 'cell_id' + 'content'
-    if tool_name_lower == "notebookedit":
-        if "path" in arguments and "notebook_path" not in arguments:
-            arguments["notebook_path"] = arguments.pop("path")
-        elif "file" in arguments and "notebook_path" not in arguments:
-            arguments["notebook_path"] = arguments.pop("file")
-        # Cell ID variants
-        if "cell" in arguments and "cell_id" not in arguments:
-            arguments["cell_id"] = arguments.pop("cell")
-        elif "index" in arguments and "cell_id" not in arguments:
-            arguments["cell_id"] = arguments.pop("index")
-        _coerce_int_fields(arguments, ["cell_number"])
-
-    # NotebookRead: Claude CLI expects 'notebook_path'
-    if tool_name_lower == "notebookread":
-        if "path" in arguments and "notebook_path" not in arguments:
-            arguments["notebook_path"] = arguments.pop("path")
-        elif "file" in arguments and "notebook_path" not in arguments:
-            arguments["notebook_path"] = arguments.pop("file")
-
-    return arguments
+    return full_normalizer(tool_name, arguments)
 
 
 def streaming_transform_partial(
@@ -693,7 +353,7 @@ async def convert_openai_streaming_to_claude(
 
     # Track usage if available
     usage_data = {"input_tokens": 0, "output_tokens": 0}
-    tool_text_buffer = ""
+    tool_text_scanner = None  # TextToolCallScanner once "<tool_call>" appears
     tool_text_mode = False
     tool_text_parsed_any = False
 
@@ -833,11 +493,10 @@ async def convert_openai_streaming_to_claude(
                             yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {payload}\n\n"
                             reasoning_active = False
                         if tool_text_mode or "<tool_call>" in text_content:
+                            if tool_text_scanner is None:
+                                tool_text_scanner = TextToolCallScanner()
                             tool_text_mode = True
-                            tool_text_buffer += text_content
-                            tool_text_buffer, extracted_calls = (
-                                _extract_tool_calls_from_text(tool_text_buffer)
-                            )
+                            extracted_calls = tool_text_scanner.feed(text_content)
                             if extracted_calls:
                                 tool_text_parsed_any = True
                                 if current_block_type in ["thinking", "text"]:
@@ -893,7 +552,7 @@ async def convert_openai_streaming_to_claude(
                                 current_tool_calls[tc_index] = {
                                     "id": None,
                                     "name": None,
-                                    "args_buffer": "",
+                                    "args_stream": None,
                                     "json_sent": False,
                                     "claude_index": None,
                                     "started": False,
@@ -934,11 +593,15 @@ async def convert_openai_streaming_to_claude(
                                 and function_data["arguments"] is not None
                             ):
                                 partial_args = function_data["arguments"]
-                                tool_call["args_buffer"] += partial_args
 
-                                # Use provider-aware streaming transformation
-                                transformed_partial = streaming_transform_partial(
-                                    partial_args, tool_call["name"], provider
+                                # Rewrite keys/values on-the-fly; the tokenizer
+                                # also sees keys split across fragments
+                                if tool_call["args_stream"] is None:
+                                    tool_call["args_stream"] = tool_args_stream(
+                                        tool_call["name"]
+                                    )
+                                transformed_partial = tool_call["args_stream"].feed(
+                                    partial_args
                                 )
 
                                 # Send transformed delta - skip the inline transformations below
@@ -968,11 +631,16 @@ async def convert_openai_streaming_to_claude(
                             for tc_index, tool_call in current_tool_calls.items():
                                 if tool_call["started"] and tool_call["name"]:
                                     try:
-                                        if not tool_call["args_buffer"]:
+                                        args_stream = tool_call["args_stream"]
+                                        if args_stream is None:
                                             continue
-                                        complete_args = json.loads(
-                                            tool_call["args_buffer"]
-                                        )
+                                        # Decoded while streaming; re-parse only
+                                        # if the tokenizer gave up
+                                        complete_args = args_stream.value()
+                                        if complete_args is None:
+                                            complete_args = json.loads(
+                                                args_stream.raw()
+                                            )
                                         tool_name = _normalize_tool_name(
                                             tool_call["name"], provider
                                         )
@@ -992,7 +660,7 @@ async def convert_openai_streaming_to_claude(
                                     except json.JSONDecodeError as e:
                                         if DEBUG_SSE:
                                             sse_logger.warning(
-                                                f"Failed to parse args_buffer for '{tool_call['name']}': {e}"
+                                                f"Failed to parse arguments for '{tool_call['name']}': {e}"
                                             )
 
                         elif finish_reason == "stop":
@@ -1025,6 +693,7 @@ async def convert_openai_streaming_to_claude(
         return
 
     # Send final SSE events
+    tool_text_buffer = tool_text_scanner.text() if tool_text_scanner else ""
     if tool_text_mode and not tool_text_parsed_any and tool_text_buffer.strip():
         # Fallback: emit buffered text if we never parsed a tool call
         if current_block_type != "text":
@@ -1108,7 +777,7 @@ async def convert_openai_streaming_to_claude_with_cancellation(
     actual_model = original_request.model  # Track cascade fallback model
     _output_chars = 0  # Track output chars for token estimation
     _output_text_parts: list = []  # Accumulate actual text for accurate tiktoken count
-    tool_text_buffer = ""
+    tool_text_scanner = None  # TextToolCallScanner once "<tool_call>" appears
     tool_text_mode = False
     tool_text_parsed_any = False
 
@@ -1128,6 +797,11 @@ async def convert_openai_streaming_to_claude_with_cancellation(
             if await http_request.is_disconnected():
                 logger.info(f"Client disconnected, cancelling request {request_id}")
                 openai_client.cancel_request(request_id)
+                # A coalesced (single-flight) stream is not registered under this
+                # request id; closing our iterator drops the subscription instead.
+                aclose = getattr(openai_stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
                 break
 
             if line.strip():
@@ -1273,11 +947,10 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                             yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {payload}\n\n"
                             reasoning_active = False
                         if tool_text_mode or "<tool_call>" in text_content:
+                            if tool_text_scanner is None:
+                                tool_text_scanner = TextToolCallScanner()
                             tool_text_mode = True
-                            tool_text_buffer += text_content
-                            tool_text_buffer, extracted_calls = (
-                                _extract_tool_calls_from_text(tool_text_buffer)
-                            )
+                            extracted_calls = tool_text_scanner.feed(text_content)
                             if extracted_calls:
                                 tool_text_parsed_any = True
                                 if current_block_type in ["thinking", "text"]:
@@ -1449,7 +1122,7 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                                     current_tool_calls[tc_index] = {
                                         "id": tc_id,
                                         "name": None,
-                                        "args_buffer": "",
+                                        "args_stream": None,
                                         "claude_index": target_claude_index,
                                     }
                                 tool_call_state = current_tool_calls[tc_index]
@@ -1478,14 +1151,16 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                                 and function_data["arguments"] is not None
                             ):
                                 partial_args = function_data["arguments"]
-                                tool_call_state["args_buffer"] += partial_args
 
-                                # Use provider-aware streaming transformation
-                                transformed_partial = streaming_transform_partial(
-                                    partial_args,
-                                    tool_call_state.get("name", ""),
-                                    provider,
-                                )
+                                # Rewrite keys/values on-the-fly; the tokenizer
+                                # also sees keys split across fragments
+                                if tool_call_state["args_stream"] is None:
+                                    tool_call_state["args_stream"] = tool_args_stream(
+                                        tool_call_state.get("name")
+                                    )
+                                transformed_partial = tool_call_state[
+                                    "args_stream"
+                                ].feed(partial_args)
 
                                 # Send transformed delta
                                 yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_DELTA, 'index': target_claude_index, 'delta': {'type': Constants.DELTA_INPUT_JSON, 'partial_json': transformed_partial}}, ensure_ascii=False)}\n\n"
@@ -1514,11 +1189,16 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                             for tc_index, tool_call in current_tool_calls.items():
                                 if tool_call.get("name"):
                                     try:
-                                        if not tool_call["args_buffer"]:
+                                        args_stream = tool_call["args_stream"]
+                                        if args_stream is None:
                                             continue
-                                        complete_args = json.loads(
-                                            tool_call["args_buffer"]
-                                        )
+                                        # Decoded while streaming; re-parse only
+                                        # if the tokenizer gave up
+                                        complete_args = args_stream.value()
+                                        if complete_args is None:
+                                            complete_args = json.loads(
+                                                args_stream.raw()
+                                            )
                                         tool_name = _normalize_tool_name(
                                             tool_call["name"], provider
                                         )
@@ -1538,7 +1218,7 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                                     except json.JSONDecodeError as e:
                                         if DEBUG_SSE:
                                             sse_logger.warning(
-                                                f"Failed to parse args_buffer for '{tool_call['name']}': {e}"
+                                                f"Failed to parse arguments for '{tool_call['name']}': {e}"
                                             )
 
                         elif finish_reason == "stop":
@@ -1622,6 +1302,7 @@ async def convert_openai_streaming_to_claude_with_cancellation(
 
     # Send final SSE events
     stream_error = None
+    tool_text_buffer = tool_text_scanner.text() if tool_text_scanner else ""
     if tool_text_mode and not tool_text_parsed_any and tool_text_buffer.strip():
         # Fallback: emit buffered text if we never parsed a tool call
         if current_block_type != "text":
@@ -0,0 +1,292 @@
+"""
+Incremental JSON tokenizer for streamed tool-call arguments.
+
+OpenAI-format providers stream a tool call's ``arguments`` as arbitrary string
+fragments. The converter used to regex-rewrite every fragment on its own
+(missing keys split across fragments) and ``json.loads`` the whole accumulated
+buffer at the end. ``StreamingToolArgs`` instead tracks the structure of the
+top-level arguments object as fragments arrive:
+
+  - top-level keys are held until they close, then emitted (renamed when
+    listed in ``renames``, e.g. ``prompt`` → ``command`` for Bash);
+  - top-level string values of ``int_fields`` are held until they close and
+    emitted as bare integers when they are all digits (``"120"`` → ``120``);
+  - everything else is passed through as soon as it arrives.
+
+String bodies are skipped with a C-level regex, so each fragment costs
+O(len(fragment)). Each top-level value is decoded once when it closes, so the
+final object (``value()``) needs no re-parse of the buffer. It is the object
+the upstream actually sent — the rewrites only apply to the emitted text — so
+argument-style learning still sees the provider's own key names.
+
+Anything that is not a JSON object at the top level, or is malformed, switches
+the tokenizer to plain passthrough; ``value()`` then returns ``None`` and the
+caller falls back to ``json.loads(raw())``.
+"""
+
+import json
+import re
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional
+
+# Body of a JSON string up to (not including) the closing quote, a trailing
+# lone backslash, or the end of the fragment.
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_WS = re.compile(r"[ \t\r\n]*")
+_SCALAR = re.compile(r"[^,}\s]*")
+_NESTED_PLAIN = re.compile(r'[^"\[\]{}]*')
+_DIGITS = re.compile(r"[0-9]+")
+
+# Tokenizer states; _DONE and _PASS (>= _DONE) pass fragments through as-is.
+_START, _KEY_OR_END, _COLON, _VALUE, _KEY, _STRING, _SCALAR_VALUE, _NESTED, _NEXT, _DONE, _PASS = range(11)
+
+
+class StreamingToolArgs:
+    """Incrementally tokenize, rewrite and decode one tool call's arguments."""
+
+    __slots__ = (
+        "renames",
+        "int_fields",
+        "_state",
+        "_raw",
+        "_pieces",
+        "_held",
+        "_escape",
+        "_key",
+        "_depth",
+        "_nested_in_string",
+        "_result",
+    )
+
+    def __init__(
+        self,
+        renames: Optional[Mapping[str, str]] = None,
+        int_fields: FrozenSet[str] = frozenset(),
+    ):
+        self.renames = renames or {}
+        self.int_fields = int_fields
+        self._state = _START
+        self._raw: List[str] = []  # every fragment, for the fallback parse
+        self._pieces: List[str] = []  # raw text of the key/value being read
+        self._held = False  # current string value is held back (int coercion)
+        self._escape = False  # previous fragment ended inside an escape
+        self._key: Optional[str] = None
+        self._depth = 0
+        self._nested_in_string = False
+        self._result: Dict[str, Any] = {}
+
+    # ── public API ───────────────────────────────────────────────────────
+    def feed(self, fragment: str) -> str:
+        """Consume ``fragment``; return the (rewritten) text to emit now."""
+        self._raw.append(fragment)
+        if self._state >= _DONE:
+            if self._state == _DONE and fragment.strip():
+                self._state = _PASS  # trailing garbage: not a single JSON value
+            return fragment
+        out: List[str] = []
+        self._consume(fragment, out)
+        return "".join(out)
+
+    def value(self) -> Optional[Dict[str, Any]]:
+        """The decoded arguments object, once the closing ``}`` has arrived."""
+        return self._result if self._state == _DONE else None
+
+    def raw(self) -> str:
+        """Every fragment received so far, unmodified."""
+        return "".join(self._raw)
+
+    # ── internals ────────────────────────────────────────────────────────
+    def _consume(self, s: str, out: List[str]) -> None:
+        i, n = 0, len(s)
+        try:
+            while i < n:
+                i = self._step(s, i, n, out)
+        except ValueError:
+            # Malformed: release anything held back and stop rewriting. The
+            # caller re-parses raw() for the final object.
+            if self._state == _KEY or (self._state == _STRING and self._held):
+                out.append('"' + "".join(self._pieces))
+            self._state = _PASS
+            self._pieces = []
+            out.append(s[i:])
+
+    def _step(self, s: str, i: int, n: int, out: List[str]) -> int:
+        """Advance past one token (or the fragment's share of one); return the new index."""
+        state = self._state
+        if state <= _VALUE:
+            j = _WS.match(s, i).end()
+            if j > i:
+                out.append(s[i:j])
+                i = j
+                if i >= n:
+                    return i
+            c = s[i]
+            if state == _START:
+                if c != "{":
+                    self._state = _PASS
+                    out.append(s[i:])
+                    return n
+                self._state = _KEY_OR_END
+            elif state == _KEY_OR_END:
+                if c == '"':
+                    self._state = _KEY
+                    self._pieces = []
+                    return i + 1  # the key is emitted once it closes
+                if c != "}" or self._result:
+                    raise ValueError(c)
+                self._state = _DONE
+            elif state == _COLON:
+                if c != ":":
+                    raise ValueError(c)
+                self._state = _VALUE
+            else:  # _VALUE
+                self._pieces = []
+                if c == '"':
+                    self._held = self._key in self.int_fields
+                    self._state = _STRING
+                    if self._held:
+                        return i + 1
+                elif c in "{[":
+                    self._depth = 1
+                    self._nested_in_string = False
+                    self._pieces.append(c)
+                    self._state = _NESTED
+                else:
+                    self._state = _SCALAR_VALUE
+                    return i  # the scalar starts at this character
+            out.append(c)
+            return i + 1
+
+        if state == _NEXT:
+            j = _WS.match(s, i).end()
+            if j > i:
+                out.append(s[i:j])
+                i = j
+                if i >= n:
+                    return i
+            c = s[i]
+            if c == ",":
+                self._state = _KEY_OR_END
+            elif c == "}":
+                self._state = _DONE if not s[i + 1 :].strip() else _PASS
+                out.append(s[i:])  # trailing text is passed through
+                return n
+            else:
+                raise ValueError(c)
+            out.append(c)
+            return i + 1
+
+        if state == _KEY or state == _STRING:
+            j = self._string_body(s, i, out, emit=state == _STRING and not self._held)
+            if j < 0:
+                return n  # the string continues in the next fragment
+            body = "".join(self._pieces)
+            if state == _KEY:
+                self._key = json.loads('"' + body + '"')
+                new_key = self.renames.get(self._key)
+                if new_key is not None:
+                    body = json.dumps(new_key)[1:-1]
+                out.append('"' + body + '"')
+                self._state = _COLON
+            else:
+                self._result[self._key] = json.loads('"' + body + '"')
+                if not self._held:
+                    out.append('"')
+                elif _DIGITS.fullmatch(body):
+                    out.append(body)
+                else:
+                    out.append('"' + body + '"')
+            if state == _STRING:
+                self._held = False
+                self._state = _NEXT
+            return j + 1  # past the closing quote
+
+        if state == _SCALAR_VALUE:
+            j = _SCALAR.match(s, i).end()
+            if j > i:
+                self._pieces.append(s[i:j])
+                out.append(s[i:j])
+            if j >= n:
+                return n
+            self._result[self._key] = json.loads("".join(self._pieces))
+            self._state = _NEXT
+            return j
+
+        # _NESTED
+        j = self._nested(s, i, out)
+        if j < 0:
+            return n
+        self._result[self._key] = json.loads("".join(self._pieces))
+        self._state = _NEXT
+        return j
+
+    def _string_body(self, s: str, i: int, out: List[str], emit: bool) -> int:
+        """Read string content from ``s[i:]``; return the closing quote's index or -1."""
+        n = len(s)
+        start = i
+        if self._escape:
+            self._escape = False
+            i += 1  # the escaped character
+        i = _STRING_BODY.match(s, i).end()
+        if i < n and s[i] == "\\":
+            # Lone trailing backslash: escape continues in the next fragment.
+            self._escape = True
+            i = n
+        chunk = s[start:i]
+        self._pieces.append(chunk)
+        if emit and chunk:
+            out.append(chunk)
+        return i if i < n else -1
+
+    def _nested(self, s: str, i: int, out: List[str]) -> int:
+        """Copy a nested array/object; return the index after it closes or -1."""
+        n = len(s)
+        start = i
+        while i < n:
+            if self._nested_in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                i = _STRING_BODY.match(s, i).end()
+                if i >= n:
+                    break
+                if s[i] == "\\":
+                    self._escape = True
+                    i = n
+                    break
+                self._nested_in_string = False
+                i += 1
+                continue
+            i = _NESTED_PLAIN.match(s, i).end()
+            if i >= n:
+                break
+            c = s[i]
+            i += 1
+            if c == '"':
+                self._nested_in_string = True
+            elif c in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pieces.append(s[start:i])
+                    out.append(s[start:i])
+                    return i
+        self._pieces.append(s[start:])
+        out.append(s[start:])
+        return -1
+
+
+# Tool-specific streaming rewrites (same scope as streaming_transform_partial).
+_INT_FIELDS = frozenset({"timeout", "offset", "limit", "cell_number"})
+_BASH_TOOLS = frozenset({"bash", "repl", "runcommand", "runbash"})
+_NUMERIC_TOOLS = frozenset({"read", "readfile", "notebookedit"})
+
+
+def tool_args_stream(tool_name: Optional[str]) -> StreamingToolArgs:
+    """Tokenizer configured with the streaming rewrites for ``tool_name``."""
+    name = (tool_name or "").lower()
+    if name in _BASH_TOOLS:
+        return StreamingToolArgs({"prompt": "command"}, _INT_FIELDS)
+    if name in _NUMERIC_TOOLS:
+        return StreamingToolArgs(None, _INT_FIELDS)
+    return StreamingToolArgs()
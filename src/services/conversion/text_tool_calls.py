@@ -0,0 +1,116 @@
+"""
+Incremental scanner for tool calls written as text markup.
+
+Some weaker models emit tool calls inside the text stream instead of as
+structured ``tool_calls``::
+
+    <tool_call><function="bash"><parameters>{"command": "ls"}</parameters></tool_call>
+
+The stream converter used to append every text delta to a buffer and re-run
+the ``<tool_call>(.*?)</tool_call>`` regex over the whole buffer, which is
+quadratic in the length of the reply (and worse while a block is still open,
+since the lazy match scans to the end of the buffer from every marker).
+``TextToolCallScanner`` is a small state machine over the deltas instead:
+outside a block it only searches new text (plus a marker-length overlap) for
+``<tool_call>``; inside a block it only searches new text for
+``</tool_call>``; each completed block is parsed exactly once.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+_OPEN = "<tool_call>"
+_CLOSE = "</tool_call>"
+_OPEN_RE = re.compile(re.escape(_OPEN), re.IGNORECASE)
+_CLOSE_RE = re.compile(re.escape(_CLOSE), re.IGNORECASE)
+
+_NAME_RES = (
+    re.compile(r'<function\s*=\s*"?([A-Za-z0-9_ -]+)"?\s*>', re.IGNORECASE),
+    re.compile(r"<function\s+name=\"([^\"]+)\"\s*>", re.IGNORECASE),
+    re.compile(r"<function>\s*([^<]+)\s*</function>", re.IGNORECASE),
+)
+_PARAMS_RE = re.compile(r"<parameters>\s*(.*?)\s*</parameters>", re.IGNORECASE | re.DOTALL)
+_JSON_RE = re.compile(r"({.*})", re.DOTALL)
+
+
+def parse_tool_call_block(block: str) -> Optional[Dict[str, Any]]:
+    """Parse the body of one ``<tool_call>`` block into ``{name, arguments}``."""
+    name = None
+    for name_re in _NAME_RES:
+        name_match = name_re.search(block)
+        if name_match:
+            name = name_match.group(1).strip()
+            break
+    if not name:
+        return None
+
+    params_match = _PARAMS_RE.search(block)
+    if params_match:
+        args_text = params_match.group(1)
+    else:
+        json_match = _JSON_RE.search(block)
+        args_text = json_match.group(1) if json_match else None
+    if not args_text:
+        return None
+
+    try:
+        arguments = json.loads(args_text)
+    except json.JSONDecodeError:
+        return None
+    return {"name": name, "arguments": arguments}
+
+
+class TextToolCallScanner:
+    """Resumable ``<tool_call>`` block extraction over a text stream."""
+
+    def __init__(self):
+        self._chunks: List[str] = []  # everything fed, for the text fallback
+        self._outside: List[str] = []  # text outside blocks and unparsed blocks
+        self._carry = ""  # unscanned tail that may hold a split marker
+        self._block: Optional[List[str]] = None  # pieces of the open block
+        self.parsed = 0
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume a text delta; return the tool calls it completed."""
+        self._chunks.append(text)
+        calls: List[Dict[str, Any]] = []
+        data = self._carry + text
+        pos = 0
+        while True:
+            if self._block is None:
+                match = _OPEN_RE.search(data, pos)
+                if match is None:
+                    keep = max(pos, len(data) - (len(_OPEN) - 1))
+                    self._outside.append(data[pos:keep])
+                    self._carry = data[keep:]
+                    return calls
+                self._outside.append(data[pos : match.start()])
+                self._block = [match.group(0)]
+                pos = match.end()
+            else:
+                match = _CLOSE_RE.search(data, pos)
+                if match is None:
+                    keep = max(pos, len(data) - (len(_CLOSE) - 1))
+                    self._block.append(data[pos:keep])
+                    self._carry = data[keep:]
+                    return calls
+                self._block.append(data[pos : match.start()])
+                opener, body = self._block[0], "".join(self._block[1:])
+                self._block = None
+                pos = match.end()
+                call = parse_tool_call_block(body)
+                if call is None:
+                    self._outside.append(opener + body + match.group(0))
+                else:
+                    self.parsed += 1
+                    calls.append(call)
+
+    def remaining(self) -> str:
+        """Text with every parsed block removed (unparsed blocks are kept)."""
+        block = "".join(self._block) if self._block is not None else ""
+        return "".join(self._outside) + block + self._carry
+
+    def text(self) -> str:
+        """Everything fed so far, unmodified."""
+        return "".join(self._chunks)
@@ -0,0 +1,252 @@
+"""
+Declarative tool-argument normalization rules.
+
+Models served through non-Anthropic providers often call Claude Code tools
+with the wrong parameter names (``path`` for ``file_path``, ``prompt`` for
+Bash's ``command``) or with integers as strings. The fixes are listed here as
+data, one rule list per tool and normalization level, and compiled once at
+import into a single closure per tool. ``normalize_tool_arguments`` (used by
+both the ``/v1/messages`` and ``/v1/chat/completions`` paths) then does one
+dict lookup per tool call instead of walking a chain of name comparisons.
+
+Rule forms (applied in order, mutating the arguments dict):
+  ("rename", target, (variants...))  move the first variant present to
+                                     ``target`` unless ``target`` is set
+  ("rename_warn", target, variants)  same, logging a warning when it fires
+  ("int", (fields...))               coerce numeric strings to int
+  ("mirror", a, b)                   copy ``b`` → ``a`` if only ``b`` is set,
+                                     else ``a`` → ``b`` if only ``a`` is set
+  ("drop", key)                      delete ``key`` if present
+  ("default", key, value)            set ``key`` if missing
+  ("todo_status", key)               map free-form todo statuses onto
+                                     pending / in_progress / completed
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Rule = Tuple[Any, ...]
+Normalizer = Callable[[dict], dict]
+
+_FILE_PATH = ("path", "filename", "file")
+
+# Light: OpenRouter, Kiro, OpenAI-compatible and unknown providers.
+LIGHT_RULES: Dict[str, List[Rule]] = {
+    "bash": [("rename_warn", "command", ("prompt",)), ("int", ("timeout",))],
+    "repl": [("rename_warn", "command", ("prompt",)), ("int", ("timeout",))],
+    "read": [("rename", "file_path", ("path", "filePath")), ("int", ("offset", "limit"))],
+    "write": [
+        ("rename", "file_path", ("path", "filePath", "filename", "file")),
+        ("rename", "content", ("text", "contents", "data")),
+    ],
+    "edit": [("rename", "file_path", ("path", "filePath"))],
+}
+
+# Full: Gemini (and Anthropic-format upstreams).
+FULL_RULES: Dict[str, List[Rule]] = {
+    # Tier 1: core file operations
+    "bash": [("rename", "command", ("prompt", "code")), ("int", ("timeout",))],
+    "repl": [("rename", "command", ("prompt", "code")), ("int", ("timeout",))],
+    "read": [("rename", "file_path", _FILE_PATH), ("int", ("offset", "limit"))],
+    "write": [
+        ("rename", "file_path", _FILE_PATH),
+        ("rename", "content", ("text", "data")),
+    ],
+    "edit": [
+        ("rename", "file_path", ("path", "file")),
+        ("rename", "old_text", ("original", "before")),
+        ("rename", "new_text", ("replacement", "after")),
+    ],
+    "multiedit": [
+        ("rename", "file_path", ("path", "file")),
+        ("rename", "edits", ("changes", "modifications")),
+    ],
+    # Tier 2: search & navigation
+    "glob": [("rename", "pattern", ("glob", "glob_pattern"))],
+    "grep": [
+        ("rename", "pattern", ("query", "search", "regex")),
+        ("rename", "path", ("directory", "dir")),
+    ],
+    "ls": [("rename", "path", ("directory", "dir", "folder"))],
+    # Tier 3: task & agent
+    "task": [
+        ("mirror", "prompt", "description"),
+        ("rename", "subagent_type", ("agent_type", "type")),
+        ("default", "subagent_type", "Explore"),
+    ],
+    "agentdispatch": [
+        ("rename", "agent_id", ("id",)),
+        ("rename", "task", ("prompt", "instruction")),
+    ],
+    # Tier 4: todo management
+    "todowrite": [
+        ("rename", "todos", ("tasks",)),
+        ("drop", "tasks"),
+        ("rename", "todos", ("items",)),
+        ("todo_status", "todos"),
+    ],
+    # Tier 5: web & browser
+    "webfetch": [("rename", "url", ("link", "href", "address"))],
+    "websearch": [("rename", "query", ("search", "q", "term"))],
+    "browser": [
+        ("rename", "url", ("link", "address")),
+        ("rename", "action", ("command", "operation")),
+    ],
+    # Tier 6: notebook operations
+    "notebookedit": [
+        ("rename", "notebook_path", ("path", "file")),
+        ("rename", "cell_id", ("cell", "index")),
+        ("int", ("cell_number",)),
+    ],
+    "notebookread": [("rename", "notebook_path", ("path", "file"))],
+}
+
+_VALID_TODO_STATUSES = frozenset({"pending", "in_progress", "completed"})
+
+
+def _rename(target: str, variants: Sequence[str], warn_tool: Optional[str] = None) -> Normalizer:
+    variants = tuple(variants)
+
+    def step(arguments: dict) -> dict:
+        if target not in arguments:
+            for variant in variants:
+                if variant in arguments:
+                    arguments[target] = arguments.pop(variant)
+                    if warn_tool:
+                        logging.getLogger("response_converter").warning(
+                            f"⚠️ NORMALIZED {warn_tool}: {variant} -> {target}"
+                        )
+                    break
+        return arguments
+
+    return step
+
+
+def _coerce_int(fields: Sequence[str]) -> Normalizer:
+    fields = tuple(fields)
+
+    def step(arguments: dict) -> dict:
+        for field in fields:
+            value = arguments.get(field)
+            if isinstance(value, str):
+                try:
+                    arguments[field] = int(value)
+                except ValueError:
+                    pass  # Leave non-numeric strings unchanged
+        return arguments
+
+    return step
+
+
+def _mirror(a: str, b: str) -> Normalizer:
+    def step(arguments: dict) -> dict:
+        if b in arguments and a not in arguments:
+            arguments[a] = arguments[b]
+        elif a in arguments and b not in arguments:
+            arguments[b] = arguments[a]
+        return arguments
+
+    return step
+
+
+def _drop(key: str) -> Normalizer:
+    def step(arguments: dict) -> dict:
+        arguments.pop(key, None)
+        return arguments
+
+    return step
+
+
+def _default(key: str, value: Any) -> Normalizer:
+    def step(arguments: dict) -> dict:
+        if key not in arguments:
+            arguments[key] = value
+        return arguments
+
+    return step
+
+
+def _todo_status(key: str) -> Normalizer:
+    def step(arguments: dict) -> dict:
+        todos = arguments.get(key)
+        if isinstance(todos, list):
+            for todo in todos:
+                if isinstance(todo, dict) and "status" in todo:
+                    status = todo["status"]
+                    if status not in _VALID_TODO_STATUSES:
+                        if "complete" in status.lower():
+                            todo["status"] = "completed"
+                        elif "progress" in status.lower():
+                            todo["status"] = "in_progress"
+                        else:
+                            todo["status"] = "pending"
+        return arguments
+
+    return step
+
+
+def _compile_rule(tool: str, rule: Rule) -> Normalizer:
+    kind = rule[0]
+    if kind == "rename":
+        return _rename(rule[1], rule[2])
+    if kind == "rename_warn":
+        return _rename(rule[1], rule[2], warn_tool=tool)
+    if kind == "int":
+        return _coerce_int(rule[1])
+    if kind == "mirror":
+        return _mirror(rule[1], rule[2])
+    if kind == "drop":
+        return _drop(rule[1])
+    if kind == "default":
+        return _default(rule[1], rule[2])
+    if kind == "todo_status":
+        return _todo_status(rule[1])
+    raise ValueError(f"Unknown tool argument rule: {kind!r}")
+
+
+def _compile_tool(tool: str, rules: Sequence[Rule]) -> Normalizer:
+    steps = tuple(_compile_rule(tool, rule) for rule in rules)
+    if len(steps) == 1:
+        return steps[0]
+
+    def normalize(arguments: dict) -> dict:
+        for step in steps:
+            step(arguments)
+        return arguments
+
+    normalize.__name__ = f"normalize_{tool}"
+    return normalize
+
+
+def compile_rules(table: Dict[str, Sequence[Rule]]) -> Dict[str, Normalizer]:
+    """Compile a rule table into a ``{lowercase tool name: normalizer}`` dict."""
+    return {tool: _compile_tool(tool, rules) for tool, rules in table.items()}
+
+
+class ToolArgumentNormalizer:
+    """Per-level dispatch of compiled tool normalizers."""
+
+    def __init__(self, table: Dict[str, Sequence[Rule]]):
+        self._by_lower = compile_rules(table)
+        # Exact-name hits skip ``.lower()`` for names seen before; bounded
+        # by the distinct tool names models actually use.
+        self._by_name: Dict[str, Optional[Normalizer]] = {}
+
+    def lookup(self, tool_name: str) -> Optional[Normalizer]:
+        try:
+            return self._by_name[tool_name]
+        except KeyError:
+            normalizer = self._by_lower.get(tool_name.lower() if tool_name else "")
+            if len(self._by_name) < 1024:
+                self._by_name[tool_name] = normalizer
+            return normalizer
+
+    def __call__(self, tool_name: str, arguments: dict) -> dict:
+        normalizer = self.lookup(tool_name)
+        if normalizer is None:
+            return arguments
+        return normalizer(arguments)
+
+
+light_normalizer = ToolArgumentNormalizer(LIGHT_RULES)
+full_normalizer = ToolArgumentNormalizer(FULL_RULES)
@@ -6,6 +6,9 @@ from typing import Dict, Optional, Tuple
 
 _lock = threading.Lock()
 _preferences: Dict[Tuple[str, str], str] = {}
+# Bumped whenever a learned style changes, so converted-message caches that
+# baked in a reverse rename know to reconvert.
+_version = 0
 
 
 def record_tool_argument_style(
@@ -25,8 +28,11 @@ def record_tool_argument_style(
         style = "command"
 
     if style:
+        global _version
         with _lock:
-            _preferences[(provider_key, tool_key)] = style
+            if _preferences.get((provider_key, tool_key)) != style:
+                _preferences[(provider_key, tool_key)] = style
+                _version += 1
 
 
 def get_tool_argument_style(
@@ -40,3 +46,8 @@ def get_tool_argument_style(
     tool_key = tool_name.lower()
     with _lock:
         return _preferences.get((provider_key, tool_key))
+
+
+def get_style_version() -> int:
+    """Counter that changes whenever any learned argument style changes."""
+    return _version
@@ -0,0 +1,268 @@
+"""
+Content-aware compaction of old tool results.
+
+Long Claude Code sessions are mostly tool output: the same file read three
+times, a test log with hundreds of identical lines, a file re-read after a
+one-line edit. ``truncate_tool_output`` can only cut blindly at a character
+limit. This stage rewrites tool results older than the last few assistant
+turns, using only what the conversation already contains:
+
+  - a result identical to an earlier one becomes a back-reference to it,
+  - runs of lines that appeared contiguously in one earlier tool result
+    (found through 4-line windows, then extended line by line against that
+    result, ignoring Read's ``   12→`` line-number prefixes) collapse into one
+    ``[... lines 40-120 unchanged, shown earlier ...]`` marker,
+  - runs of identical consecutive lines collapse into one line plus a
+    repeat count.
+
+Recent turns are always sent verbatim. Each message is only ever rewritten
+against messages before it, so its compacted form stays the same from one
+request to the next (upstream prefix caching keeps working), and it is
+memoized per position in the history. The rewrite applies to the
+per-request message copies only; savings are reported per request
+(``/api/tool-compaction/stats``, tokens estimated at 4 chars each).
+
+Configuration (env vars):
+  TOOL_OUTPUT_COMPACTION=false     Enable compaction (default: false)
+  TOOL_COMPACT_KEEP_RECENT=4       Assistant turns whose tool results are kept verbatim
+  TOOL_COMPACT_MIN_CHARS=1000      Smaller results are never rewritten
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("TOOL_OUTPUT_COMPACTION", "false").lower() == "true"
+_KEEP_RECENT = int(os.environ.get("TOOL_COMPACT_KEEP_RECENT", "4"))
+_MIN_CHARS = int(os.environ.get("TOOL_COMPACT_MIN_CHARS", "1000"))
+
+_WINDOW = 4  # lines per fingerprinted window
+_MIN_ELIDE = 12  # shortest run of already-shown lines worth eliding
+_MIN_REPEAT = 3  # shortest run of identical lines worth collapsing
+_MAX_CANDIDATES = 8  # earlier occurrences of one window tried as match starts
+
+_LINE_NUMBER = re.compile(r"^\s*(\d+)[→\t]")
+
+
+class SeenLines:
+    """Earlier tool results (number-stripped lines), indexed by 4-line window."""
+
+    def __init__(self):
+        self.sources: List[List[str]] = []
+        # window hash -> [(source index, line offset), ...]
+        self.windows: Dict[int, List[Tuple[int, int]]] = {}
+        # Sources not yet in ``windows``: most requests only replay memoized
+        # results and never call match(), so the index is built on demand.
+        self._pending: List[Tuple[int, List[int]]] = []
+
+    @staticmethod
+    def window_hashes(bare: List[str]) -> List[int]:
+        return [hash(tuple(bare[i : i + _WINDOW])) for i in range(len(bare) - _WINDOW + 1)]
+
+    def add(self, bare: List[str], hashes: Optional[List[int]] = None) -> None:
+        self._pending.append((len(self.sources), hashes))
+        self.sources.append(bare)
+
+    def _index(self) -> None:
+        windows = self.windows
+        for src, hashes in self._pending:
+            if hashes is None:
+                hashes = self.window_hashes(self.sources[src])
+            for i, h in enumerate(hashes):
+                spots = windows.get(h)
+                if spots is None:
+                    windows[h] = [(src, i)]
+                elif len(spots) < _MAX_CANDIDATES:
+                    spots.append((src, i))
+        self._pending.clear()
+
+    def match(self, bare: List[str], start: int) -> int:
+        """Length of the longest run from ``bare[start]`` found contiguously in one source."""
+        if self._pending:
+            self._index()
+        best = 0
+        n = len(bare)
+        for src, offset in self.windows.get(hash(tuple(bare[start : start + _WINDOW])), ()):
+            source = self.sources[src]
+            length = 0
+            while (
+                start + length < n
+                and offset + length < len(source)
+                and source[offset + length] == bare[start + length]
+            ):
+                length += 1
+            best = max(best, length)
+        return best
+
+
+def _strip_numbers(lines: List[str]) -> List[str]:
+    return [_LINE_NUMBER.sub("", line, count=1) for line in lines]
+
+
+def _label(lines: List[str], start: int, end: int) -> str:
+    first = _LINE_NUMBER.match(lines[start])
+    last = _LINE_NUMBER.match(lines[end - 1])
+    if first and last:
+        return f"[... lines {first.group(1)}-{last.group(1)} unchanged, shown earlier ...]"
+    return f"[... {end - start} lines unchanged, shown earlier ...]"
+
+
+def _collapse_repeats(lines: List[str]) -> List[str]:
+    out: List[str] = []
+    i = 0
+    while i < len(lines):
+        j = i + 1
+        while j < len(lines) and lines[j] == lines[i]:
+            j += 1
+        out.append(lines[i])
+        if j - i >= _MIN_REPEAT:
+            out.append(f"[previous line repeated {j - i - 1} more times]")
+        else:
+            out.extend(lines[i + 1 : j])
+        i = j
+    return out
+
+
+def compact_text(content: str, seen: SeenLines) -> str:
+    """``content`` with runs shown earlier (see ``SeenLines``) elided and repeats collapsed."""
+    lines = content.split("\n")
+    bare = _strip_numbers(lines)
+    out: List[str] = []
+    kept = 0  # start of the pending run of lines sent as-is
+    i = 0
+    while i < len(lines):
+        run = seen.match(bare, i) if i + _WINDOW <= len(lines) else 0
+        if run >= _MIN_ELIDE:
+            out.extend(_collapse_repeats(lines[kept:i]))
+            out.append(_label(lines, i, i + run))
+            i += run
+            kept = i
+        else:
+            i += 1
+    out.extend(_collapse_repeats(lines[kept:]))
+    return "\n".join(out)
+
+
+class ToolOutputCompactor:
+    """Rewrites old tool results against the earlier conversation."""
+
+    def __init__(
+        self,
+        enabled: bool = _ENABLED,
+        keep_recent: int = _KEEP_RECENT,
+        min_chars: int = _MIN_CHARS,
+        max_memo: int = 1024,
+    ):
+        self.enabled = enabled
+        self.keep_recent = max(1, keep_recent)
+        self.min_chars = min_chars
+        self.max_memo = max_memo
+        # chain digest of (everything before, this result)
+        #   → (compacted, stripped lines, their window hashes)
+        self._memo: "OrderedDict[int, Tuple[str, List[str], List[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.compacted = 0
+        self.deduplicated = 0
+        self.chars_saved = 0
+        self.memo_hits = 0
+        self.last_request: Dict[str, int] = {}
+
+    def compact(self, messages: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Compact old tool results in ``messages`` in place; return the savings."""
+        report = {"tool_results": 0, "compacted": 0, "deduplicated": 0, "chars_saved": 0, "est_tokens_saved": 0}
+        if not self.enabled:
+            return report
+
+        assistant_turns = [i for i, m in enumerate(messages) if m.get("role") == "assistant"]
+        if len(assistant_turns) <= self.keep_recent:
+            return self._finish(report)
+        boundary = assistant_turns[-self.keep_recent]
+
+        seen = SeenLines()
+        first_seen: Dict[str, Any] = {}
+        chain = 0
+        for index in range(boundary):
+            msg = messages[index]
+            content = msg.get("content")
+            if msg.get("role") != "tool" or not isinstance(content, str):
+                continue
+            report["tool_results"] += 1
+            chain = hash((chain, content))
+            if len(content) < self.min_chars:
+                continue
+
+            original_id = first_seen.get(content)
+            if original_id is not None:
+                compacted = f"[identical to the earlier result of tool call {original_id}]"
+                report["deduplicated"] += 1
+            else:
+                first_seen[content] = msg.get("tool_call_id", "?")
+                compacted = self._compact_one(chain, content, seen)
+
+            if compacted != content:
+                msg["content"] = compacted
+                report["compacted"] += 1
+                report["chars_saved"] += len(content) - len(compacted)
+
+        report["est_tokens_saved"] = report["chars_saved"] // 4
+        return self._finish(report)
+
+    def _compact_one(self, chain: int, content: str, seen: SeenLines) -> str:
+        with self._lock:
+            memo = self._memo.get(chain)
+            if memo is not None:
+                self._memo.move_to_end(chain)
+                self.memo_hits += 1
+        if memo is None:
+            bare = _strip_numbers(content.split("\n"))
+            memo = (compact_text(content, seen), bare, SeenLines.window_hashes(bare))
+            with self._lock:
+                self._memo[chain] = memo
+                while len(self._memo) > self.max_memo:
+                    self._memo.popitem(last=False)
+        seen.add(memo[1], memo[2])
+        return memo[0]
+
+    def _finish(self, report: Dict[str, int]) -> Dict[str, int]:
+        with self._lock:
+            self.requests += 1
+            self.compacted += report["compacted"]
+            self.deduplicated += report["deduplicated"]
+            self.chars_saved += report["chars_saved"]
+            self.last_request = report
+        if report["chars_saved"]:
+            logger.info(
+                f"[tool-compaction] {report['compacted']}/{report['tool_results']} old tool results "
+                f"compacted, ~{report['est_tokens_saved']:,} tokens saved"
+            )
+        return report
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "keep_recent_turns": self.keep_recent,
+                "min_chars": self.min_chars,
+                "requests": self.requests,
+                "compacted": self.compacted,
+                "deduplicated": self.deduplicated,
+                "chars_saved": self.chars_saved,
+                "est_tokens_saved": self.chars_saved // 4,
+                "memo_hits": self.memo_hits,
+                "memo_entries": len(self._memo),
+                "last_request": dict(self.last_request),
+            }
+
+
+# Module-level singleton
+tool_output_compactor = ToolOutputCompactor()
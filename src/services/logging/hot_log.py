@@ -0,0 +1,135 @@
+"""
+Hot-path logging facade — level-guarded, lazily formatted, sampled.
+
+The /v1/messages path, client selection and the cascade emit dozens of
+debug lines per request. Written as ``logger.debug(f"...")`` each one pays
+for string formatting (plus a ``time.strftime`` timestamp and token
+previews) even when DEBUG is off. This facade keeps those call sites
+cheap at INFO:
+
+  - ``debug(msg, *args)`` checks the level before doing anything and uses
+    %-style arguments, so nothing is formatted unless the line is emitted.
+  - ``TIMESTAMP`` and ``lazy(fn, ...)`` defer work (strftime, previews,
+    summaries) until a handler actually renders the record.
+  - Sampled requests: with LOG_DEBUG_SAMPLE_RATE=N, one request in N has its
+    hot-path debug lines emitted at INFO (prefixed ``[sampled]``), giving full
+    detail for a slice of production traffic without turning on DEBUG.
+
+Usage:
+    from src.services.logging.hot_log import get_hot_logger, TIMESTAMP, lazy
+
+    hot_log = get_hot_logger(logger)
+    hot_log.begin_request()                       # once, at request entry
+    hot_log.debug("[Client %s] %s → %s", TIMESTAMP, tier, provider)
+
+Environment:
+    LOG_DEBUG_SAMPLE_RATE  — emit full debug detail for 1 in N requests (default: 0 = off)
+"""
+
+import contextvars
+import itertools
+import logging
+import os
+import time
+from typing import Any, Callable
+
+_SAMPLE_RATE = int(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0"))
+
+# Per-request sampling decision. Each ASGI request runs in its own task with a
+# copied context, so setting this at request entry never leaks across requests.
+_sampled: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "hot_log_sampled", default=False
+)
+_request_counter = itertools.count(1)
+
+
+class Lazy:
+    """Defer an expensive value until the log record is rendered."""
+
+    __slots__ = ("_fn", "_args")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any):
+        self._fn = fn
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._fn(*self._args))
+
+    __repr__ = __str__
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+
+def lazy(fn: Callable[..., Any], *args: Any) -> Lazy:
+    """Wrap ``fn(*args)`` so it only runs if the message is emitted."""
+    return Lazy(fn, *args)
+
+
+def _preview(value: Any, length: int) -> str:
+    if not value:
+        return "None"
+    return str(value)[:length]
+
+
+def preview(value: Any, length: int = 20) -> Lazy:
+    """Lazy ``value[:length]`` — for token/key previews in debug lines."""
+    return Lazy(_preview, value, length)
+
+
+# "%H:%M:%S" rendered at emit time instead of once per call site per request.
+TIMESTAMP = Lazy(time.strftime, "%H:%M:%S")
+
+
+def set_sample_rate(rate: int) -> None:
+    """Override LOG_DEBUG_SAMPLE_RATE at runtime (0 disables sampling)."""
+    global _SAMPLE_RATE
+    _SAMPLE_RATE = max(0, int(rate))
+
+
+def begin_request() -> bool:
+    """Decide whether the current request is sampled. Call once per request."""
+    rate = _SAMPLE_RATE
+    sampled = rate > 0 and next(_request_counter) % rate == 0
+    _sampled.set(sampled)
+    return sampled
+
+
+def is_sampled() -> bool:
+    return _sampled.get()
+
+
+class HotPathLogger:
+    """Thin wrapper over a stdlib logger for per-request debug call sites."""
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    begin_request = staticmethod(begin_request)
+
+    def enabled(self) -> bool:
+        """True when a debug line would be emitted — guard multi-line summaries with this."""
+        return self._logger.isEnabledFor(logging.DEBUG) or _sampled.get()
+
+    def debug(self, msg: str, *args: Any) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(msg, *args, stacklevel=2)
+        elif _sampled.get():
+            self._logger.info("[sampled] " + msg, *args, stacklevel=2)
+
+
+_hot_loggers: dict[str, HotPathLogger] = {}
+
+
+def get_hot_logger(logger: logging.Logger) -> HotPathLogger:
+    """Return the (cached) hot-path facade for ``logger``."""
+    hot = _hot_loggers.get(logger.name)
+    if hot is None:
+        hot = _hot_loggers[logger.name] = HotPathLogger(logger)
+    return hot
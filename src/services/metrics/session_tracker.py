@@ -10,6 +10,9 @@ Tracks per-session metrics in real-time:
 - Request latency
 
 Data is stored in-memory for real-time access and periodically flushed to database.
+Only sessions changed since the last flush are written, in one batched
+statement on a worker thread; the tracker lock is held just long enough to
+snapshot the changed rows.
 """
 
 import asyncio
@@ -119,7 +122,10 @@ class SessionMetricsTracker:
         self.db_path = db_path
         self._lock = threading.Lock()
         self._cleanup_interval = 3600  # 1 hour
-        self._flush_interval = 60  # 30 seconds
+        self._flush_interval = 60  # seconds
+        self._dirty: set = set()  # session ids changed since the last flush
+        self._db_lock = threading.Lock()  # serializes flushes on the shared connection
+        self._conn: Optional[sqlite3.Connection] = None
         
         # Start background tasks
         self._running = True
@@ -138,7 +144,7 @@ class SessionMetricsTracker:
         """Flush metrics to database periodically."""
         while self._running:
             await asyncio.sleep(self._flush_interval)
-            self._flush_to_database()
+            await asyncio.to_thread(self._flush_to_database)
     
     def _cleanup_stale_sessions(self):
         """Remove sessions inactive for more than 24 hours."""
@@ -157,14 +163,11 @@ class SessionMetricsTracker:
         if stale:
             logger.info(f"Cleaned up {len(stale)} stale sessions")
     
-    def _flush_to_database(self):
-        """Flush current metrics to database."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create table if not exists
-            cursor.execute("""
+    def _connect(self) -> sqlite3.Connection:
+        """Open the flush connection and create the table (once)."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS session_metrics (
                     session_id TEXT PRIMARY KEY,
                     started_at TEXT,
@@ -186,10 +189,45 @@ class SessionMetricsTracker:
                     tool_call_names TEXT
                 )
             """)
-            
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _row(metrics: SessionMetrics) -> tuple:
+        return (
+            metrics.session_id,
+            metrics.started_at,
+            metrics.last_activity,
+            metrics.input_tokens,
+            metrics.output_tokens,
+            metrics.thinking_tokens,
+            metrics.cached_tokens,
+            metrics.total_tokens,
+            metrics.requests,
+            metrics.total_latency_ms,
+            metrics.estimated_cost,
+            metrics.tool_calls_total,
+            metrics.tool_calls_success,
+            metrics.tool_calls_failure,
+            metrics.cache_hits,
+            metrics.cache_misses,
+            json.dumps(metrics.models_used),
+            json.dumps(metrics.tool_call_names)
+        )
+
+    def _flush_to_database(self) -> int:
+        """Write sessions changed since the last flush; return the number of rows written."""
+        with self._db_lock:
             with self._lock:
-                for session_id, metrics in self.sessions.items():
-                    cursor.execute("""
+                dirty, self._dirty = self._dirty, set()
+                rows = [self._row(self.sessions[sid]) for sid in dirty if sid in self.sessions]
+            if not rows:
+                return 0
+
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany("""
                         INSERT OR REPLACE INTO session_metrics 
                         (session_id, started_at, last_activity, input_tokens, output_tokens,
                          thinking_tokens, cached_tokens, total_tokens, requests,
@@ -197,31 +235,14 @@ class SessionMetricsTracker:
                          tool_calls_success, tool_calls_failure, cache_hits,
                          cache_misses, models_used, tool_call_names)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        session_id,
-                        metrics.started_at,
-                        metrics.last_activity,
-                        metrics.input_tokens,
-                        metrics.output_tokens,
-                        metrics.thinking_tokens,
-                        metrics.cached_tokens,
-                        metrics.total_tokens,
-                        metrics.requests,
-                        metrics.total_latency_ms,
-                        metrics.estimated_cost,
-                        metrics.tool_calls_total,
-                        metrics.tool_calls_success,
-                        metrics.tool_calls_failure,
-                        metrics.cache_hits,
-                        metrics.cache_misses,
-                        json.dumps(metrics.models_used),
-                        json.dumps(metrics.tool_call_names)
-                    ))
-            
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            logger.error(f"Failed to flush session metrics: {e}")
+                    """, rows)
+                return len(rows)
+            except Exception as e:
+                # Keep the rows pending for the next flush
+                with self._lock:
+                    self._dirty.update(row[0] for row in rows)
+                logger.error(f"Failed to flush session metrics: {e}")
+                return 0
     
     def _get_model_pricing(self, model: str) -> tuple:
         """Get pricing for a model (input, output per 1M tokens)."""
@@ -283,6 +304,7 @@ class SessionMetricsTracker:
             metrics.total_latency_ms += latency_ms
             metrics.estimated_cost += cost
             metrics.last_activity = datetime.utcnow().isoformat()
+            self._dirty.add(session_id)
             
             # Track models used
             if model not in metrics.models_used:
@@ -318,6 +340,7 @@ class SessionMetricsTracker:
                 metrics.tool_call_names.append(tool_name)
             
             metrics.last_activity = datetime.utcnow().isoformat()
+            self._dirty.add(session_id)
         
         logger.debug(
             f"Session {session_id[:8]}: Tool {tool_name} - {'success' if success else 'failure'}"
@@ -345,6 +368,7 @@ class SessionMetricsTracker:
                 metrics.cache_misses += 1
             
             metrics.last_activity = datetime.utcnow().isoformat()
+            self._dirty.add(session_id)
     
     def get_session_metrics(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get metrics for a specific session."""
@@ -406,6 +430,10 @@ class SessionMetricsTracker:
         """Stop background tasks and flush final metrics."""
         self._running = False
         self._flush_to_database()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
         logger.info("Session metrics tracker stopped")
 
 
@@ -1,7 +1,17 @@
-"""Smart model filtering for OpenRouter and other providers."""
+"""Smart model filtering for OpenRouter and other providers.
 
+Usage counts are kept in memory and flushed to ``data/model_usage.json`` at
+most once per flush interval (and at shutdown), written atomically via a
+temp file + rename, instead of rewriting the file on every request.
+
+Configuration (env vars):
+  MODEL_USAGE_FLUSH_SECONDS=5      Debounce interval for usage-file writes
+"""
+
+import atexit
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Set
 from pathlib import Path
@@ -9,6 +19,8 @@ from src.services.models.free_model_rankings import get_top_free_models
 from src.services.models.selection_history import get_recent_models
 from src.services.models.model_family import detect_model_family, ModelFamily
 
+_FLUSH_SECONDS = float(os.environ.get("MODEL_USAGE_FLUSH_SECONDS", "5"))
+
 
 class ModelFilter:
     """Filter and prioritize models based on usage, popularity, and cost."""
@@ -59,15 +71,26 @@ class ModelFilter:
         "deepseek/deepseek-chat",
     ]
 
-    def __init__(self, usage_file: str = "data/model_usage.json"):
+    def __init__(
+        self,
+        usage_file: str = "data/model_usage.json",
+        flush_interval: float = _FLUSH_SECONDS,
+    ):
         """
         Initialize model filter.
 
         Args:
             usage_file: Path to file tracking model usage
+            flush_interval: Seconds to batch usage updates before writing
         """
         self.usage_file = Path(usage_file)
+        self.flush_interval = flush_interval
         self.usage_data = self._load_usage_data()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self.writes = 0
 
     def _load_usage_data(self) -> Dict:
         """Load model usage data from file."""
@@ -81,34 +104,75 @@ class ModelFilter:
             return {"models": {}, "last_updated": None}
 
     def _save_usage_data(self):
-        """Save model usage data to file."""
-        try:
-            self.usage_data["last_updated"] = datetime.now().isoformat()
-            with open(self.usage_file, "w") as f:
-                json.dump(self.usage_data, f, indent=2)
-        except Exception:
-            pass
+        """Save model usage data to file (atomically: temp file + rename).
+
+        The payload is snapshotted inside the write lock so concurrent flushes
+        write in snapshot order and the newest counts always land last.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._dirty = False
+                self.usage_data["last_updated"] = datetime.now().isoformat()
+                payload = json.dumps(self.usage_data, indent=2)
+            try:
+                self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.usage_file.with_suffix(".tmp")
+                tmp_path.write_text(payload)
+                tmp_path.replace(self.usage_file)
+                self.writes += 1
+            except Exception:
+                with self._lock:
+                    self._dirty = True
+                    self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Start the flush timer if none is pending. Caller holds ``_lock``."""
+        if self.flush_interval > 0 and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Write pending usage updates now (no-op when nothing changed)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+        self._save_usage_data()
+
+    def _flush_from_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
 
     def track_model_usage(self, model_name: str):
         """
         Track that a model was used.
 
+        The count is updated in memory; the file is written at most once per
+        ``flush_interval`` (immediately when the interval is 0).
+
         Args:
             model_name: Name of the model that was used
         """
-        models = self.usage_data.get("models", {})
-
-        if model_name not in models:
-            models[model_name] = {
-                "count": 0,
-                "last_used": None,
-                "first_used": datetime.now().isoformat(),
-            }
-
-        models[model_name]["count"] += 1
-        models[model_name]["last_used"] = datetime.now().isoformat()
-
-        self.usage_data["models"] = models
+        now = datetime.now().isoformat()
+        with self._lock:
+            models = self.usage_data.setdefault("models", {})
+            if model_name not in models:
+                models[model_name] = {
+                    "count": 0,
+                    "last_used": None,
+                    "first_used": now,
+                }
+            models[model_name]["count"] += 1
+            models[model_name]["last_used"] = now
+            self._dirty = True
+
+            if self.flush_interval > 0:
+                self._schedule_flush()
+                return
         self._save_usage_data()
 
     def get_recently_used_models(self, limit: int = 20) -> List[str]:
@@ -121,11 +185,12 @@ class ModelFilter:
         Returns:
             List of model names sorted by most recent usage
         """
-        models = self.usage_data.get("models", {})
+        with self._lock:
+            items = list(self.usage_data.get("models", {}).items())
 
         # Sort by last_used timestamp
         sorted_models = sorted(
-            models.items(), key=lambda x: x[1].get("last_used", ""), reverse=True
+            items, key=lambda x: x[1].get("last_used") or "", reverse=True
         )
 
         return [model for model, _ in sorted_models[:limit]]
@@ -140,11 +205,12 @@ class ModelFilter:
         Returns:
             List of model names sorted by usage count
         """
-        models = self.usage_data.get("models", {})
+        with self._lock:
+            items = list(self.usage_data.get("models", {}).items())
 
         # Sort by count
         sorted_models = sorted(
-            models.items(), key=lambda x: x[1].get("count", 0), reverse=True
+            items, key=lambda x: x[1].get("count", 0), reverse=True
         )
 
         return [model for model, _ in sorted_models[:limit]]
@@ -302,6 +368,7 @@ class ModelFilter:
 
 # Global instance
 model_filter = ModelFilter()
+atexit.register(model_filter.flush)
 
 
 def filter_models(all_models: List[str], **kwargs) -> List[str]:
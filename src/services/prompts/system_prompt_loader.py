@@ -1,11 +1,16 @@
 """
 System prompt loader for custom model prompts.
 Supports file-based loading and inline prompts.
+
+File prompts are cached by path: each request costs one ``os.stat`` and a
+dict lookup, and the file is re-read and re-validated only when its mtime
+or size changes, so edits made while the proxy runs apply on the next
+request.
 """
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class SecurityError(Exception):
@@ -13,6 +18,81 @@ class SecurityError(Exception):
     pass
 
 
+# Allowed base directory for prompt files (path traversal check)
+_BASE_DIR = Path(__file__).parent.parent.parent.resolve()
+
+# "path:" value → resolved path that passed the traversal check
+_resolved_paths: Dict[str, Path] = {}
+# resolved path → (mtime_ns, size, validated content)
+_file_cache: Dict[Path, Tuple[int, int, str]] = {}
+
+
+def _resolve_prompt_path(file_path: str) -> Path:
+    resolved = _resolved_paths.get(file_path)
+    if resolved is not None:
+        return resolved
+
+    # Security: Check for path traversal attempts
+    try:
+        resolved = Path(file_path).resolve()
+
+        # Check if the resolved path is within the allowed base directory
+        resolved.relative_to(_BASE_DIR)
+    except (ValueError, OSError) as e:
+        # ValueError: path is not relative to base_dir
+        # OSError: path resolution failed
+        raise SecurityError(f"Unsafe file path (path traversal attempt): {file_path}")
+
+    # Only absolute paths are memoized; relative ones depend on the cwd
+    if os.path.isabs(file_path):
+        _resolved_paths[file_path] = resolved
+    return resolved
+
+
+def _load_prompt_file(file_path: str) -> str:
+    """Load a prompt file, reusing the cached text while mtime and size match."""
+    file_path_resolved = _resolve_prompt_path(file_path)
+
+    try:
+        st = os.stat(file_path_resolved)
+    except FileNotFoundError:
+        _file_cache.pop(file_path_resolved, None)
+        raise FileNotFoundError(f"System prompt file not found: {file_path}")
+    except OSError as e:
+        raise RuntimeError(f"Error loading system prompt from {file_path}: {str(e)}")
+
+    cached = _file_cache.get(file_path_resolved)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        with open(file_path_resolved, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+
+            # Validate content length
+            if len(content) > 50000:  # 50KB limit
+                raise ValueError(f"System prompt too long ({len(content)} chars). Max 50,000 characters.")
+
+            if len(content) < 3:
+                raise ValueError(f"System prompt too short ({len(content)} chars). Minimum 3 characters.")
+
+    except FileNotFoundError:
+        raise FileNotFoundError(f"System prompt file not found: {file_path}")
+    except UnicodeDecodeError as e:
+        raise RuntimeError(f"File encoding error: {file_path}. Use UTF-8 encoding. {str(e)}")
+    except Exception as e:
+        raise RuntimeError(f"Error loading system prompt from {file_path}: {str(e)}")
+
+    _file_cache[file_path_resolved] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
+def clear_prompt_cache() -> None:
+    """Drop all cached prompt files (the next load re-reads from disk)."""
+    _resolved_paths.clear()
+    _file_cache.clear()
+
+
 def load_system_prompt(prompt_source: str) -> str:
     """
     Load system prompt from various sources.
@@ -39,40 +119,7 @@ def load_system_prompt(prompt_source: str) -> str:
 
     # Check if it's a file path
     if prompt_source.startswith("path:"):
-        file_path = prompt_source[5:]  # Remove "path:" prefix
-
-        # Security: Check for path traversal attempts
-        try:
-            # Define allowed base directory (project root or specific prompts directory)
-            base_dir = Path(__file__).parent.parent.parent.resolve()
-            file_path_resolved = Path(file_path).resolve()
-
-            # Check if the resolved path is within the allowed base directory
-            file_path_resolved.relative_to(base_dir)
-        except (ValueError, OSError) as e:
-            # ValueError: path is not relative to base_dir
-            # OSError: path resolution failed
-            raise SecurityError(f"Unsafe file path (path traversal attempt): {file_path}")
-
-        try:
-            with open(file_path_resolved, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-
-                # Validate content length
-                if len(content) > 50000:  # 50KB limit
-                    raise ValueError(f"System prompt too long ({len(content)} chars). Max 50,000 characters.")
-
-                if len(content) < 3:
-                    raise ValueError(f"System prompt too short ({len(content)} chars). Minimum 3 characters.")
-
-                return content
-
-        except FileNotFoundError:
-            raise FileNotFoundError(f"System prompt file not found: {file_path}")
-        except UnicodeDecodeError as e:
-            raise RuntimeError(f"File encoding error: {file_path}. Use UTF-8 encoding. {str(e)}")
-        except Exception as e:
-            raise RuntimeError(f"Error loading system prompt from {file_path}: {str(e)}")
+        return _load_prompt_file(prompt_source[5:])  # Remove "path:" prefix
 
     # Return as inline prompt
     # Validate inline prompt length
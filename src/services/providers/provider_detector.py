@@ -93,6 +93,18 @@ def detect_provider(base_url: str) -> str:
     return Provider.OPENAI_COMPATIBLE.value
 
 
+# Built once: called for every tool call on the response path
+_NORMALIZATION_MAP = {
+    Provider.GEMINI.value: NormalizationLevel.FULL.value,
+    Provider.OPENROUTER.value: NormalizationLevel.LIGHT.value,
+    Provider.OPENAI.value: NormalizationLevel.NONE.value,
+    Provider.ANTHROPIC.value: NormalizationLevel.SCHEMA_CONVERT.value,
+    Provider.AZURE.value: NormalizationLevel.NONE.value,
+    Provider.KIRO.value: NormalizationLevel.LIGHT.value,
+    Provider.OPENAI_COMPATIBLE.value: NormalizationLevel.LIGHT.value,
+}
+
+
 def get_normalization_level(provider: str) -> str:
     """
     Get the appropriate normalization level for a provider.
@@ -103,17 +115,7 @@ def get_normalization_level(provider: str) -> str:
     Returns:
         NormalizationLevel value
     """
-    normalization_map = {
-        Provider.GEMINI.value: NormalizationLevel.FULL.value,
-        Provider.OPENROUTER.value: NormalizationLevel.LIGHT.value,
-        Provider.OPENAI.value: NormalizationLevel.NONE.value,
-        Provider.ANTHROPIC.value: NormalizationLevel.SCHEMA_CONVERT.value,
-        Provider.AZURE.value: NormalizationLevel.NONE.value,
-        Provider.KIRO.value: NormalizationLevel.LIGHT.value,
-        Provider.OPENAI_COMPATIBLE.value: NormalizationLevel.LIGHT.value,
-    }
-    
-    return normalization_map.get(provider, NormalizationLevel.LIGHT.value)
+    return _NORMALIZATION_MAP.get(provider, NormalizationLevel.LIGHT.value)
 
 
 def get_auth_type(provider: str) -> str:
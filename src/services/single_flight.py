@@ -0,0 +1,260 @@
+"""
+Single-flight coalescing of identical concurrent upstream calls.
+
+Claude Code retries, and several sessions firing the same background request
+(title generation, haiku-tier summarization) at once, each used to hit the
+provider independently. This layer keys every converted ``openai_request`` by
+a canonical hash (model, messages, tools, sampling params; proxy-internal
+``_``-prefixed keys ignored) and shares one upstream call among all requests
+with the same key that are in flight at the same time:
+
+  - Non-streaming: the first caller starts the call as a task; every caller
+    (first included) awaits it and gets the same response (or the same
+    upstream exception). The task is cancelled only once all callers are gone.
+  - Streaming: the first caller's upstream stream is pumped by a background
+    task into a shared chunk buffer. Every subscriber — including ones that
+    join mid-stream — replays the chunks already received, then follows live.
+    The upstream is closed once the last subscriber goes away.
+
+The shared upstream must not carry any one client's cancellation: callers open
+it under ``shared_request_id(request_id)`` rather than their own request id, so
+one client disconnecting only drops its subscription.
+
+Once a call finishes its key is released, so later identical requests go
+upstream again (cross-time reuse is the semantic cache's job).
+
+Configuration (env vars):
+  SINGLE_FLIGHT_ENABLED=true    Enable/disable coalescing (default: true)
+
+Usage:
+  from src.services.single_flight import single_flight
+
+  key = single_flight.key(openai_request)
+  response = await single_flight.call(key, lambda: client.create_chat_completion(req))
+  stream = single_flight.stream(key, lambda: client.create_chat_completion_stream(req))
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("SINGLE_FLIGHT_ENABLED", "true").lower() != "false"
+
+# Keys that change how the proxy talks to the SDK, not what the model sees.
+_IGNORED_KEYS = frozenset({"stream_options"})
+
+
+def _usage_tokens(usage: Any) -> int:
+    if not isinstance(usage, dict):
+        return 0
+    total = usage.get("total_tokens")
+    if total:
+        return int(total)
+    return int(usage.get("prompt_tokens") or 0) + int(usage.get("completion_tokens") or 0)
+
+
+class _Broadcast:
+    """Chunks from one upstream stream, replayable by any number of subscribers."""
+
+    __slots__ = ("chunks", "done", "error", "tokens", "subscribers", "task", "_changed")
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.tokens = 0
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self) -> None:
+        await self._changed.wait()
+
+
+class _Flight:
+    """One shared non-streaming upstream call and the callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce identical in-flight upstream calls."""
+
+    def __init__(self, enabled: bool = _ENABLED):
+        self.enabled = enabled
+        self._calls: Dict[str, _Flight] = {}
+        self._streams: Dict[str, _Broadcast] = {}
+        self._upstream_calls = 0
+        self._coalesced_calls = 0
+        self._saved_tokens = 0
+
+    @staticmethod
+    def key(openai_request: Dict[str, Any], *scope: Any) -> str:
+        """Canonical hash of everything the provider sees.
+
+        ``scope`` adds routing inputs that are not part of the request body
+        (cascade tier, passthrough API key, upstream endpoint, assignment) so
+        requests only coalesce when they would reach the same upstream with
+        the same credentials.
+        """
+        canonical = {
+            k: v
+            for k, v in openai_request.items()
+            if not k.startswith("_") and k not in _IGNORED_KEYS
+        }
+        payload = json.dumps(
+            [canonical, [str(s) for s in scope]],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def shared_request_id(self, request_id: str) -> str:
+        """Request id for an upstream call that other clients may share.
+
+        Per-client cancellation (``cancel_request(request_id)`` on disconnect)
+        must not reach a coalesced call; it is cancelled when its last caller
+        leaves instead.
+        """
+        return f"{request_id}:shared" if self.enabled else request_id
+
+    # ── non-streaming ────────────────────────────────────────────────────
+    async def call(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory()`` once for all concurrent callers with ``key``."""
+        if not self.enabled:
+            return await factory()
+
+        flight = self._calls.get(key)
+        follower = flight is not None
+        if follower:
+            self._coalesced_calls += 1
+            logger.info(f"[single-flight] Coalesced with in-flight call {key[:8]}")
+        else:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._calls[key] = flight
+            self._upstream_calls += 1
+            flight.task.add_done_callback(lambda _t: self._release(key, flight))
+
+        flight.waiters += 1
+        try:
+            response = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()  # every caller went away
+        if not follower:
+            return response
+        self._saved_tokens += _usage_tokens(
+            response.get("usage") if isinstance(response, dict) else None
+        )
+        # Callers convert/annotate the response in place; don't share one dict.
+        return copy.deepcopy(response)
+
+    def _release(self, key: str, flight: _Flight) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        if not flight.task.cancelled():
+            flight.task.exception()  # retrieved here; waiters re-raise it
+
+    # ── streaming ────────────────────────────────────────────────────────
+    async def _pump(self, key: str, broadcast: _Broadcast, upstream: AsyncIterator[str]) -> None:
+        try:
+            async for chunk in upstream:
+                broadcast.chunks.append(chunk)
+                if '"usage": {' in chunk:
+                    try:
+                        broadcast.tokens = _usage_tokens(
+                            json.loads(chunk[len("data: "):]).get("usage")
+                        )
+                    except (ValueError, AttributeError):
+                        pass
+                broadcast.notify()
+        except asyncio.CancelledError:
+            broadcast.error = asyncio.CancelledError()
+            raise
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            broadcast.done = True
+            broadcast.notify()
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
+            aclose = getattr(upstream, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    pass
+
+    async def stream(
+        self, key: str, factory: Callable[[], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """Yield the chunks of one shared upstream stream for ``key``."""
+        if not self.enabled:
+            async for chunk in factory():
+                yield chunk
+            return
+
+        broadcast = self._streams.get(key)
+        follower = broadcast is not None
+        if follower:
+            self._coalesced_calls += 1
+            logger.info(
+                f"[single-flight] Joined in-flight stream {key[:8]} "
+                f"(replaying {len(broadcast.chunks)} chunks)"
+            )
+        else:
+            broadcast = _Broadcast()
+            self._streams[key] = broadcast
+            self._upstream_calls += 1
+            broadcast.task = asyncio.create_task(self._pump(key, broadcast, factory()))
+
+        broadcast.subscribers += 1
+        index = 0
+        try:
+            while True:
+                while index < len(broadcast.chunks):
+                    yield broadcast.chunks[index]
+                    index += 1
+                if broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    if follower:
+                        self._saved_tokens += broadcast.tokens
+                    return
+                await broadcast.wait()
+        finally:
+            broadcast.subscribers -= 1
+            if broadcast.subscribers == 0 and not broadcast.done and broadcast.task:
+                broadcast.task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self._upstream_calls + self._coalesced_calls
+        return {
+            "enabled": self.enabled,
+            "upstream_calls": self._upstream_calls,
+            "coalesced_calls": self._coalesced_calls,
+            "coalesce_rate": round(self._coalesced_calls / total, 4) if total else 0.0,
+            "saved_tokens": self._saved_tokens,
+            "in_flight_calls": len(self._calls),
+            "in_flight_streams": len(self._streams),
+        }
+
+
+# Module-level singleton
+single_flight = SingleFlight()
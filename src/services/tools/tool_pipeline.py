@@ -0,0 +1,151 @@
+"""
+Memoized tool-declaration pipeline.
+
+Claude Code sends the same 30-50 tool definitions on every turn of a session.
+Each request used to rebuild the OpenAI tool array from them (copying every
+``input_schema``), run ``sanitize_tool_declarations`` and ``_strip_tool_schemas``,
+and serialize the tool list again for token counting. This cache keys the raw
+tool list by a content hash and keeps, per hash:
+
+  - the final OpenAI tool array for each target-provider variant, stored as a
+    tuple and shared between requests (treat the dicts as read-only — they
+    can't be real mappingproxies, the SDK JSON-encodes them),
+  - the token count of the tool header used for input-token estimates.
+
+The hash of the most recent tool list object is remembered, so the converter
+and the token estimate of one request hash the list once.
+
+Configuration (env vars):
+  TOOL_PIPELINE_CACHE_ENABLED=true    Enable/disable the cache (default: true)
+
+Usage:
+  from src.services.tools.tool_pipeline import tool_pipeline
+
+  tools = tool_pipeline.openai_tools(claude_request.tools, provider_key, build)
+  tokens = tool_pipeline.token_count(claude_request.tools)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from pydantic_core import to_json
+
+logger = logging.getLogger(__name__)
+
+_ENABLED = os.environ.get("TOOL_PIPELINE_CACHE_ENABLED", "true").lower() != "false"
+
+
+def tool_header_text(tools: Sequence[Any]) -> str:
+    """Compact name/description text counted toward the stable input tokens."""
+    return json.dumps(
+        [{"name": t.name, "desc": t.description or ""} for t in tools if t.name],
+        separators=(",", ":"),
+    )
+
+
+class ToolPipelineCache:
+    """Content-hash keyed cache of converted tool arrays and their token counts."""
+
+    def __init__(self, enabled: bool = _ENABLED, max_entries: int = 32):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # (tool list object, digest) of the last list hashed
+        self._last: Optional[Tuple[Any, str]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, tools: Sequence[Any]) -> str:
+        last = self._last
+        if last is not None and last[0] is tools:
+            return last[1]
+        # pydantic-core's serializer + sha256: roughly a third of the
+        # pipeline it lets us skip (json.dumps + blake2b cost more than it).
+        payload = to_json(
+            [[t.name, t.description, t.input_schema] for t in tools],
+            fallback=str,
+        )
+        digest = hashlib.sha256(payload).hexdigest()
+        self._last = (tools, digest)
+        return digest
+
+    def _entry(self, digest: str) -> Dict[str, Any]:
+        # Caller holds the lock.
+        entry = self._entries.get(digest)
+        if entry is None:
+            entry = {"tools": {}, "tokens": None}
+            self._entries[digest] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(digest)
+        return entry
+
+    def openai_tools(
+        self,
+        tools: Sequence[Any],
+        variant: Hashable,
+        build: Callable[[Sequence[Any]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Final OpenAI tool array for ``tools``; ``build`` runs on a miss.
+
+        ``variant`` distinguishes pipelines that produce different output for
+        the same tools (e.g. whether schema stripping applies).
+        """
+        if not self.enabled:
+            return build(tools)
+
+        digest = self.digest(tools)
+        with self._lock:
+            cached = self._entry(digest)["tools"].get(variant)
+            if cached is not None:
+                self.hits += 1
+                return list(cached)
+            self.misses += 1
+
+        built = tuple(build(tools))
+        with self._lock:
+            self._entry(digest)["tools"][variant] = built
+        return list(built)
+
+    def token_count(self, tools: Sequence[Any]) -> int:
+        """Token count of ``tool_header_text(tools)``, computed once per tool set."""
+        from src.services.token_cache import count_tokens
+
+        if not self.enabled:
+            return count_tokens(tool_header_text(tools))
+
+        digest = self.digest(tools)
+        with self._lock:
+            tokens = self._entry(digest)["tokens"]
+        if tokens is None:
+            tokens = count_tokens(tool_header_text(tools))
+            with self._lock:
+                self._entry(digest)["tokens"] = tokens
+        return tokens
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._last = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "tool_sets": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+# Module-level singleton
+tool_pipeline = ToolPipelineCache()
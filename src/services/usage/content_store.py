@@ -0,0 +1,181 @@
+"""
+Content-addressed blob store for logged request/response bodies.
+
+Claude Code resends the same multi-KB system prompt, tool schemas and
+conversation prefix on every turn. Storing each body inline makes the usage
+DB grow with (turns x context size). Instead a body is split into chunks —
+one per top-level list element (each message, system block, tool) plus any
+large top-level string and a small "envelope" holding the remaining scalar
+fields — and each chunk is stored once, keyed by its SHA-256, compressed
+with zlib. A request row only keeps a compact JSON manifest of chunk hashes,
+so storage is proportional to *unique* content and a whole session can be
+replayed by reassembling manifests.
+
+Manifest format (stored in ``api_requests.request_manifest`` /
+``response_manifest``)::
+
+    {"v": 1, "envelope": "<hash>", "fields": {"messages": ["<hash>", ...],
+                                              "system": "<hash>"}}
+    {"v": 1, "raw": "<hash>"}          # body was not a JSON object
+
+Reassembly returns an equivalent JSON object (keys are re-serialized in
+sorted order), not a byte-identical copy of the original body.
+"""
+
+import hashlib
+import json
+import sqlite3
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+# Top-level strings at least this long get their own chunk (e.g. a string
+# ``system`` prompt); shorter ones stay in the envelope.
+_STRING_CHUNK_MIN = 256
+
+# Chunks shorter than this are stored uncompressed — zlib only adds overhead.
+_COMPRESS_MIN = 64
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS content_blobs (
+        hash TEXT PRIMARY KEY,
+        codec TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        stored_size INTEGER NOT NULL,
+        data BLOB NOT NULL
+    )
+"""
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def chunk_content(content: str) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """Split a body into ``(manifest, {hash: chunk_bytes})``."""
+    try:
+        body = json.loads(content)
+    except (TypeError, ValueError):
+        body = None
+
+    chunks: Dict[str, bytes] = {}
+
+    def put(data: bytes) -> str:
+        digest = _hash(data)
+        chunks[digest] = data
+        return digest
+
+    if not isinstance(body, dict):
+        return {"v": MANIFEST_VERSION, "raw": put(content.encode("utf-8"))}, chunks
+
+    envelope: Dict[str, Any] = {}
+    fields: Dict[str, Any] = {}
+    for key, value in body.items():
+        if isinstance(value, list):
+            fields[key] = [put(_canonical(item)) for item in value]
+        elif isinstance(value, str) and len(value) >= _STRING_CHUNK_MIN:
+            fields[key] = put(_canonical(value))
+        else:
+            envelope[key] = value
+
+    manifest = {
+        "v": MANIFEST_VERSION,
+        "envelope": put(_canonical(envelope)),
+        "fields": fields,
+    }
+    return manifest, chunks
+
+
+def _encode(data: bytes) -> Tuple[str, bytes]:
+    if len(data) >= _COMPRESS_MIN:
+        packed = zlib.compress(data, 6)
+        if len(packed) < len(data):
+            return "zlib", packed
+    return "raw", data
+
+
+def _decode(codec: str, data: bytes) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    return bytes(data)
+
+
+def store_content(cursor: sqlite3.Cursor, content: str) -> str:
+    """Store ``content``'s chunks (skipping ones already present); return the manifest JSON."""
+    manifest, chunks = chunk_content(content)
+    rows = []
+    for digest, data in chunks.items():
+        codec, packed = _encode(data)
+        rows.append((digest, codec, len(data), len(packed), packed))
+    cursor.executemany(
+        "INSERT OR IGNORE INTO content_blobs (hash, codec, size, stored_size, data) "
+        "VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    return json.dumps(manifest, separators=(",", ":"))
+
+
+def _manifest_hashes(manifest: Dict[str, Any]) -> Iterable[str]:
+    if "raw" in manifest:
+        yield manifest["raw"]
+        return
+    yield manifest["envelope"]
+    for ref in manifest.get("fields", {}).values():
+        if isinstance(ref, list):
+            yield from ref
+        else:
+            yield ref
+
+
+def _load_blobs(cursor: sqlite3.Cursor, hashes: List[str]) -> Dict[str, bytes]:
+    blobs: Dict[str, bytes] = {}
+    wanted = list(dict.fromkeys(hashes))
+    # Stay well under SQLite's default host-parameter limit.
+    for start in range(0, len(wanted), 500):
+        batch = wanted[start : start + 500]
+        placeholders = ",".join("?" * len(batch))
+        cursor.execute(
+            f"SELECT hash, codec, data FROM content_blobs WHERE hash IN ({placeholders})",
+            batch,
+        )
+        for digest, codec, data in cursor.fetchall():
+            blobs[digest] = _decode(codec, data)
+    return blobs
+
+
+def load_content(
+    cursor: sqlite3.Cursor, manifest_json: Optional[str]
+) -> Optional[Any]:
+    """Reassemble a body from its manifest. Returns a dict (JSON bodies) or str."""
+    if not manifest_json:
+        return None
+    manifest = json.loads(manifest_json)
+    blobs = _load_blobs(cursor, list(_manifest_hashes(manifest)))
+
+    if "raw" in manifest:
+        return blobs[manifest["raw"]].decode("utf-8")
+
+    body = json.loads(blobs[manifest["envelope"]])
+    for key, ref in manifest.get("fields", {}).items():
+        if isinstance(ref, list):
+            body[key] = [json.loads(blobs[h]) for h in ref]
+        else:
+            body[key] = json.loads(blobs[ref])
+    return body
+
+
+def content_stats(cursor: sqlite3.Cursor) -> Dict[str, int]:
+    """Unique blob count and raw vs stored byte totals."""
+    cursor.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) "
+        "FROM content_blobs"
+    )
+    count, size, stored = cursor.fetchone()
+    return {"unique_chunks": count, "unique_bytes": size, "stored_bytes": stored}
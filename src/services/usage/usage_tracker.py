@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import logging
 
+from src.services.usage import content_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -286,12 +288,18 @@ class UsageTracker:
             "ALTER TABLE api_requests ADD COLUMN cached_tokens INTEGER DEFAULT 0",
             "ALTER TABLE api_requests ADD COLUMN transformed INTEGER DEFAULT 0",
             "ALTER TABLE api_requests ADD COLUMN transform_type TEXT",
+            # Full-content logging: JSON manifests of content_blobs hashes.
+            "ALTER TABLE api_requests ADD COLUMN request_manifest TEXT",
+            "ALTER TABLE api_requests ADD COLUMN response_manifest TEXT",
         ):
             try:
                 cursor.execute(_ddl)
             except sqlite3.OperationalError:
                 pass  # column already exists
 
+        # Content-addressed, deduplicated request/response chunks
+        cursor.execute(content_store.CREATE_TABLE_SQL)
+
         # Model usage summary (aggregated view)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS model_usage_summary (
@@ -624,6 +632,27 @@ class UsageTracker:
             except sqlite3.OperationalError:
                 pass  # very old schema without these columns
 
+            # Full bodies go to the deduplicated blob store; the row keeps only
+            # chunk-hash manifests (the inline columns above stay as previews).
+            if self.log_full_content and (request_content or response_content):
+                cursor.execute(
+                    """
+                    UPDATE api_requests SET
+                        request_manifest = ?, response_manifest = ?
+                    WHERE request_id = ? AND attempt_index = ?
+                """,
+                    (
+                        content_store.store_content(cursor, request_content)
+                        if request_content
+                        else None,
+                        content_store.store_content(cursor, response_content)
+                        if response_content
+                        else None,
+                        request_id,
+                        attempt_index,
+                    ),
+                )
+
             # Update model summary
             cursor.execute(
                 """
@@ -954,6 +983,98 @@ class UsageTracker:
             logger.error(f"Failed to get terminal output: {e}")
             return None
 
+    def get_request_content(
+        self, request_id: str, attempt_index: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """Reassemble the full request/response bodies stored for one request."""
+        if not self.enabled:
+            return None
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT request_manifest, response_manifest FROM api_requests
+                WHERE request_id = ? AND attempt_index = ?
+            """,
+                (request_id, attempt_index),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                conn.close()
+                return None
+            result = {
+                "request": content_store.load_content(cursor, row[0]),
+                "response": content_store.load_content(cursor, row[1]),
+            }
+            conn.close()
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to load request content: {e}")
+            return None
+
+    def replay_session(self, session_id: str) -> List[Dict[str, Any]]:
+        """Return every stored request/response body of a session, oldest first."""
+        if not self.enabled:
+            return []
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT request_id, attempt_index, timestamp, routed_model,
+                       request_manifest, response_manifest
+                FROM api_requests
+                WHERE session_id = ?
+                  AND (request_manifest IS NOT NULL OR response_manifest IS NOT NULL)
+                ORDER BY timestamp, id
+            """,
+                (session_id,),
+            )
+            rows = cursor.fetchall()
+            turns = [
+                {
+                    "request_id": request_id,
+                    "attempt_index": attempt_index,
+                    "timestamp": timestamp,
+                    "routed_model": routed_model,
+                    "request": content_store.load_content(cursor, req_manifest),
+                    "response": content_store.load_content(cursor, resp_manifest),
+                }
+                for (
+                    request_id,
+                    attempt_index,
+                    timestamp,
+                    routed_model,
+                    req_manifest,
+                    resp_manifest,
+                ) in rows
+            ]
+            conn.close()
+            return turns
+
+        except Exception as e:
+            logger.error(f"Failed to replay session {session_id}: {e}")
+            return []
+
+    def get_content_store_stats(self) -> Dict[str, int]:
+        """Unique chunk count and raw/stored bytes of the content blob store."""
+        if not self.enabled:
+            return {}
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            stats = content_store.content_stats(conn.cursor())
+            conn.close()
+            return stats
+
+        except Exception as e:
+            logger.error(f"Failed to get content store stats: {e}")
+            return {}
+
     def get_top_models(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most used models by request count."""
         if not self.enabled:
@@ -0,0 +1,66 @@
+"""Per-request config cost as the number of registered fields grows.
+
+One simulated ``/v1/messages`` request = ``config_snapshot_dep`` taking a
+snapshot plus 30 ``ConfigField``-style reads. Before: ``snapshot()``
+re-resolved every field (lock, layer walk, ``${VAR}`` expansion, cast) and
+each read resolved again. After: the resolver hands out the same frozen
+snapshot until a layer changes, and reads are dict lookups with memoized
+casts — flat in the number of fields.
+"""
+
+from __future__ import annotations
+
+import time
+
+from src.core.config_resolver import ConfigLayer, ConfigResolver, FieldSchema
+
+READS = 30
+REQUESTS = 200
+
+
+def _resolver(fields: int) -> ConfigResolver:
+    r = ConfigResolver()
+    r._initialized = True
+    for i in range(fields):
+        r.register_schema(f"field_{i}", FieldSchema(type=int, default=0))
+        r._layers[ConfigLayer.DOTENV][f"field_{i}"] = str(i)
+    return r
+
+
+def _old_request(r: ConfigResolver) -> None:
+    with r._lock:
+        snap = {fp: r._resolve_layers(fp, {}) for fp in list(r._schemas)}
+    for i in range(READS):
+        with r._lock:
+            int(r._resolve_layers(f"field_{i}", {}).value)
+    assert len(snap) == len(r._schemas)
+
+
+def _new_request(r: ConfigResolver) -> None:
+    snap = r.snapshot()
+    for i in range(READS):
+        snap.cast(f"field_{i}", int)
+
+
+def _cpu_us(fn, r: ConfigResolver) -> float:
+    fn(r)
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        fn(r)
+    return (time.process_time() - start) / REQUESTS * 1e6
+
+
+def test_config_snapshot_cost_is_flat() -> None:
+    afters = {}
+    for fields in (50, 500, 5000):
+        r = _resolver(fields)
+        before = min(_cpu_us(_old_request, r) for _ in range(3))
+        after = min(_cpu_us(_new_request, r) for _ in range(3))
+        afters[fields] = after
+        print(f"\n{fields} fields: before={before:.1f}µs/request after={after:.1f}µs/request")
+        assert after < before
+    assert afters[5000] < afters[50] * 3
+
+
+if __name__ == "__main__":
+    test_config_snapshot_cost_is_flat()
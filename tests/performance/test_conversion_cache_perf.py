@@ -0,0 +1,104 @@
+"""Per-request conversion CPU over a long, append-only Claude Code session.
+
+Replays a synthetic 300-turn session (user prompt, assistant text + tool call,
+tool result, assistant reply per turn) the way a client sends it: request N
+carries the whole history up to turn N. Each request's messages are converted
+without the cache (before: the whole history every time) and through the
+per-session conversion cache (after: only the turns appended since the last
+request). Reports total and last-request cost.
+"""
+
+from __future__ import annotations
+
+import time
+
+from src.models.claude import ClaudeMessage
+from src.services.conversion.conversion_cache import ConversionCache
+from src.services.conversion.request_converter import (
+    convert_claude_message_units,
+    validate_tool_message_sequence,
+)
+
+TURNS = 300
+
+
+def _turn(i: int) -> list:
+    return [
+        ClaudeMessage(role="user", content=f"step {i}: fix the failing test in module_{i}.py"),
+        ClaudeMessage(
+            role="assistant",
+            content=[
+                {"type": "text", "text": f"Let me look at module_{i}.py first. " * 4},
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{i:04d}",
+                    "name": "Read",
+                    "input": {"file_path": f"/repo/src/module_{i}.py"},
+                },
+            ],
+        ),
+        ClaudeMessage(
+            role="user",
+            content=[
+                {
+                    "type": "tool_result",
+                    "tool_use_id": f"toolu_{i:04d}",
+                    "content": "\n".join(f"{n:4d}  def f_{n}(x): return x + {n}" for n in range(60)),
+                }
+            ],
+        ),
+        ClaudeMessage(role="assistant", content=f"Fixed the off-by-one in module_{i}.py."),
+    ]
+
+
+_HISTORY = [m for i in range(TURNS) for m in _turn(i)]
+# Request N = history of turns < N plus the user prompt opening turn N.
+_REQUESTS = [_HISTORY[: 4 * n + 1] for n in range(TURNS)]
+
+
+def _uncached(messages) -> list:
+    out = [m for _, unit in convert_claude_message_units(messages, 0, "openrouter", "gpt-4o") for m in unit]
+    return validate_tool_message_sequence(out)
+
+
+def _cached(cache: ConversionCache):
+    def run(messages) -> list:
+        history, validated_upto = cache.convert(
+            messages,
+            ("openrouter", "gpt-4o"),
+            lambda start: convert_claude_message_units(messages, start, "openrouter", "gpt-4o"),
+            session_id="perf-session",
+        )
+        return validate_tool_message_sequence(history, start=validated_upto)
+
+    return run
+
+
+def _cpu_ms(fn) -> tuple:
+    start = time.process_time()
+    for messages in _REQUESTS[:-1]:
+        fn(messages)
+    last_start = time.process_time()
+    fn(_REQUESTS[-1])
+    end = time.process_time()
+    return (end - start) * 1e3, (end - last_start) * 1e3
+
+
+def test_conversion_cache_session_cpu() -> None:
+    cached = _cached(ConversionCache(enabled=True))
+    assert cached(_REQUESTS[5]) == _uncached(_REQUESTS[5])
+
+    before_total, before_last = _cpu_ms(_uncached)
+    after_total, after_last = _cpu_ms(_cached(ConversionCache(enabled=True)))
+    print(
+        f"\n{TURNS}-turn session conversion CPU: "
+        f"before={before_total:.0f}ms (last request {before_last:.2f}ms) "
+        f"after={after_total:.0f}ms (last request {after_last:.2f}ms)"
+    )
+    assert after_total < before_total, (
+        f"cached conversion ({after_total:.0f}ms) not cheaper than full ({before_total:.0f}ms)"
+    )
+
+
+if __name__ == "__main__":
+    test_conversion_cache_session_cpu()
@@ -0,0 +1,47 @@
+"""Wall time of a four-model memory-paradigm crosstalk session.
+
+Model calls are simulated with 30-120 ms latencies. Before: every call in a
+round awaited in turn (reproduced with ``max_concurrency=1``). After:
+independent calls in a round run concurrently (default cap 4), so each round
+costs about as much as its slowest model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.conversation.crosstalk import CrosstalkOrchestrator, CrosstalkParadigm, CrosstalkSession
+
+_DELAYS = {"big": 0.12, "middle": 0.06, "small": 0.03}
+MODELS = ["big", "middle", "small", "middle"]
+
+
+class _Orchestrator(CrosstalkOrchestrator):
+    async def _call_model(self, model, prompt, system_prompt=""):
+        await asyncio.sleep(_DELAYS[model])
+        return f"{model} insight"
+
+
+def _wall_ms(max_concurrency: int) -> float:
+    orch = _Orchestrator(SimpleNamespace(), max_concurrency=max_concurrency)
+    session = CrosstalkSession(
+        session_id="perf", models=MODELS, system_prompts={}, paradigm=CrosstalkParadigm.MEMORY,
+        iterations=1, topic="cache invalidation",
+    )
+    start = time.perf_counter()
+    asyncio.run(orch._execute_paradigm(session))
+    assert len(session.history) == 2 * len(MODELS)
+    return (time.perf_counter() - start) * 1e3
+
+
+def test_crosstalk_rounds_run_concurrently() -> None:
+    before = _wall_ms(1)
+    after = _wall_ms(4)
+    print(f"\n4-model memory session: before={before:.0f}ms after={after:.0f}ms")
+    assert after < before
+
+
+if __name__ == "__main__":
+    test_crosstalk_rounds_run_concurrently()
@@ -0,0 +1,112 @@
+"""Per-request CPU spent in hot-path debug logging at INFO level.
+
+Replays the debug call pattern of one /v1/messages request (create_message,
+get_client_for_model, _create_client, cascade, convert_claude_to_openai)
+twice: as eager ``logger.debug(f"...")`` with a ``time.strftime`` timestamp
+(before), and through the hot_log facade (after). Both run with the logger
+at INFO, so every line is discarded — the difference is pure overhead.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from src.services.logging.hot_log import TIMESTAMP, get_hot_logger, lazy
+
+REQUESTS = 2_000
+
+_logger = logging.getLogger("perf.hot_log")
+_logger.setLevel(logging.INFO)
+_hot = get_hot_logger(_logger)
+
+_REQ = {
+    "request_id": "5f0c7a8e-3a1b-4f7e-9d2c-0a1b2c3d4e5f",
+    "model": "claude-sonnet-4-20250514",
+    "routed": "openrouter/qwen/qwen3-coder",
+    "endpoint": "https://openrouter.ai/api/v1",
+    "token": "sk-or-v1-" + "a" * 64,
+    "headers": {"HTTP-Referer": "https://github.com", "X-Title": "proxy"},
+    "cascade": ["qwen/qwen3-coder", "moonshotai/kimi-k2", "z-ai/glm-4.6"],
+    "tools": [{"function": {"name": f"tool_{i}"}} for i in range(40)],
+    "messages": 120,
+}
+
+
+def _eager(r: dict) -> None:
+    timestamp = time.strftime("%H:%M:%S")
+    _logger.debug(f"Processing Claude request: model={r['model']}, stream=True")
+    _logger.debug(f"Request ID: {r['request_id']}")
+    _logger.debug("Request deduplication check passed")
+    for tier in ("BIG", "MIDDLE", "SMALL"):
+        _logger.debug(f"[Client Selection {timestamp}] {tier} tier DISABLED — skipping")
+    _logger.debug(f"[Client Selection {timestamp}] BIG→provider 'default' for '{r['routed']}'")
+    _logger.debug(f"[VibeProxy {timestamp}] Endpoint: {r['endpoint']}")
+    _logger.debug(f"[VibeProxy {timestamp}] Token in use (first 20 chars): {r['token'][:20]}...")
+    _logger.debug(f"[VibeProxy {timestamp}] Custom headers: {r['headers']}")
+    _logger.debug(f"OUTGOING REQUEST: {r['messages']} messages")
+    _logger.debug(
+        f"Converted request: model={r['routed']}, messages={r['messages']}, "
+        f"max_tokens=32000, temp=1.0"
+    )
+    _logger.debug(f"Converting {len(r['tools'])} tools to OpenAI format")
+    _logger.debug(
+        f"Added {len(r['tools'])} tools to OpenAI request: "
+        f"{[t['function']['name'] for t in r['tools']]}"
+    )
+    _logger.debug(f"Request {r['request_id']}: Routing to endpoint: {r['endpoint']}")
+    _logger.debug(f"Request {r['request_id']}: Using model: {r['routed']}")
+    for model in r["cascade"]:
+        _logger.debug(f"[CASCADE {time.strftime('%H:%M:%S')}] ⚡ Circuit OPEN for {model} — skipping")
+        _logger.debug(f"[CASCADE] Timeout on {model} (1/2)")
+    _logger.debug(f"OpenAI stream created for request_id: {r['request_id']}")
+
+
+def _lazy(r: dict) -> None:
+    _hot.debug("Processing Claude request: model=%s, stream=True", r["model"])
+    _hot.debug("Request ID: %s", r["request_id"])
+    _hot.debug("Request deduplication check passed")
+    for tier in ("BIG", "MIDDLE", "SMALL"):
+        _hot.debug("[Client Selection %s] %s tier DISABLED — skipping", TIMESTAMP, tier)
+    _hot.debug("[Client Selection %s] BIG→provider 'default' for '%s'", TIMESTAMP, r["routed"])
+    _hot.debug("[VibeProxy %s] Endpoint: %s", TIMESTAMP, r["endpoint"])
+    _hot.debug("[VibeProxy %s] Token in use (first 20 chars): %s...", TIMESTAMP, r["token"][:20])
+    _hot.debug("[VibeProxy %s] Custom headers: %s", TIMESTAMP, r["headers"])
+    _hot.debug("OUTGOING REQUEST: %s messages", r["messages"])
+    _hot.debug(
+        "Converted request: model=%s, messages=%s, max_tokens=32000, temp=1.0",
+        r["routed"],
+        r["messages"],
+    )
+    _hot.debug("Converting %s tools to OpenAI format", len(r["tools"]))
+    _hot.debug(
+        "Added %s tools to OpenAI request: %s",
+        len(r["tools"]),
+        lazy(lambda: [t["function"]["name"] for t in r["tools"]]),
+    )
+    _hot.debug("Request %s: Routing to endpoint: %s", r["request_id"], r["endpoint"])
+    _hot.debug("Request %s: Using model: %s", r["request_id"], r["routed"])
+    for model in r["cascade"]:
+        _hot.debug("[CASCADE %s] ⚡ Circuit OPEN for %s — skipping", TIMESTAMP, model)
+        _hot.debug("[CASCADE] Timeout on %s (1/2)", model)
+    _hot.debug("OpenAI stream created for request_id: %s", r["request_id"])
+
+
+def _cpu_per_request_us(fn) -> float:
+    for _ in range(100):
+        fn(_REQ)
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        fn(_REQ)
+    return (time.process_time() - start) / REQUESTS * 1e6
+
+
+def test_hot_log_overhead_at_info() -> None:
+    before = min(_cpu_per_request_us(_eager) for _ in range(3))
+    after = min(_cpu_per_request_us(_lazy) for _ in range(3))
+    print(f"\nlogging CPU/request @INFO: before={before:.1f}µs after={after:.1f}µs")
+    assert after < before, f"lazy logging ({after:.1f}µs) not cheaper than eager ({before:.1f}µs)"
+
+
+if __name__ == "__main__":
+    test_hot_log_overhead_at_info()
@@ -0,0 +1,66 @@
+"""Identifier-mapping lookup latency as the number of mappings grows.
+
+Before: ``lookup_by_incoming_identifier`` took the registry lock, scanned
+every mapping and sorted the candidates on each call. After: a dict lookup
+in an index rebuilt only when the mappings change — flat from 10 to 10,000
+mappings.
+"""
+
+from __future__ import annotations
+
+import time
+
+from src.core.identifier_mapping import IdentifierMapping, IdentifierMappingRegistry
+from src.core.proxy_chain import ProxyChain
+
+LOOKUPS = 2000
+
+
+class _Registry(IdentifierMappingRegistry):
+    def __init__(self, chain):
+        super().__init__()
+        self.chain = chain
+
+    def _chain(self):
+        return self.chain
+
+
+def _old_lookup(registry, incoming):
+    with registry._lock:
+        candidates = [
+            m
+            for m in registry._chain().identifier_mappings
+            if m.enabled and m.incoming_identifier == incoming
+        ]
+        if not candidates:
+            return None
+        candidates.sort(key=lambda m: m.priority, reverse=True)
+        return candidates[0]
+
+
+def _cpu_us(fn, registry, names) -> float:
+    fn(registry, names[0])
+    start = time.process_time()
+    for i in range(LOOKUPS):
+        fn(registry, names[i % len(names)])
+    return (time.process_time() - start) / LOOKUPS * 1e6
+
+
+def test_identifier_mapping_lookup_is_flat() -> None:
+    afters = {}
+    for size in (10, 1000, 10000):
+        names = [f"model-{i}" for i in range(size)]
+        registry = _Registry(
+            ProxyChain(identifier_mappings=[IdentifierMapping(n, "big", priority=i % 3) for i, n in enumerate(names)])
+        )
+        new = IdentifierMappingRegistry.lookup_by_incoming_identifier
+        before = min(_cpu_us(_old_lookup, registry, names) for _ in range(3))
+        after = min(_cpu_us(new, registry, names) for _ in range(3))
+        afters[size] = after
+        print(f"\n{size} mappings: before={before:.2f}µs/lookup after={after:.2f}µs/lookup")
+        assert after <= before
+    assert afters[10000] < afters[10] * 3
+
+
+if __name__ == "__main__":
+    test_identifier_mapping_lookup_is_flat()
@@ -0,0 +1,70 @@
+"""Image cost of a screenshot-heavy session.
+
+A 40-request session where every other user turn attaches a new 256 KB
+screenshot and each request resends all earlier ones. Before: a ``data:``
+URL built per image per request. After: ``ImageStore.image_part`` — one URL
+per distinct image, shared by every later request. Measured twice: with the
+payload strings reused across requests (``FAST_REQUEST_PARSE``'s message
+cache hands back the same objects), and with a freshly parsed body per
+request, where the win is the shared URL rather than CPU. With the ``strip``
+policy, the upstream image bytes of the last request drop to its two most
+recent image turns.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import time
+
+from src.services.conversion.image_store import ImageStore, data_url
+
+REQUESTS = 40
+
+_SHOTS = [base64.b64encode(os.urandom(192 * 1024)).decode("ascii") for _ in range(REQUESTS // 2)]
+
+# The screenshots attached before request i — the same string objects every
+# time, or new ones as a freshly parsed body would hold.
+_CACHED = [_SHOTS[: (i + 1) // 2] for i in range(1, REQUESTS + 1)]
+_FRESH = [["".join([s[:1], s[1:]]) for s in shots] for shots in _CACHED]
+
+
+def _rebuild(bodies, _store) -> list:
+    last = []
+    for shots in bodies:
+        last = [{"type": "image_url", "image_url": {"url": data_url("image/png", s)}} for s in shots]
+    return last
+
+
+def _stored(bodies, store) -> list:
+    last = []
+    for shots in bodies:
+        last = [store.image_part("image/png", s) for s in shots]
+    return last
+
+
+def _cpu_ms(fn, bodies, store) -> float:
+    start = time.process_time()
+    fn(bodies, store)
+    return (time.process_time() - start) * 1e3
+
+
+def test_image_store_cpu_and_upstream_bytes() -> None:
+    assert _stored(_FRESH, ImageStore(enabled=True)) == _rebuild(_FRESH, None)
+    for name, bodies in (("reused payloads", _CACHED), ("fresh payloads", _FRESH)):
+        before = min(_cpu_ms(_rebuild, bodies, None) for _ in range(3))
+        after = min(_cpu_ms(_stored, bodies, ImageStore(enabled=True)) for _ in range(3))
+        print(f"\n{REQUESTS} requests, {len(_SHOTS)} screenshots, {name}: before={before:.1f}ms after={after:.1f}ms")
+        if bodies is _CACHED:
+            assert after < before
+
+    store = ImageStore(enabled=True, policy="strip", keep_recent=2)
+    last = [{"role": "user", "content": [part]} for part in _stored(_CACHED[-1:], store)]
+    report = store.apply_history_policy(last)
+    sent = report["image_bytes"] - report["bytes_saved"]
+    print(f"last request image bytes: keep={report['image_bytes'] // 1024} KB strip={sent // 1024} KB")
+    assert sent < report["image_bytes"] // 5
+
+
+if __name__ == "__main__":
+    test_image_store_cpu_and_upstream_bytes()
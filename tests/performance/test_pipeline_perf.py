@@ -0,0 +1,70 @@
+"""Wall time of a fan-out/fan-in pipeline.
+
+Three independent 40 ms lookups followed by a join step, served by an
+in-process transport. Before: the definitions re-read from disk, a new
+``AsyncClient`` per run and every step awaited in turn. After: cached
+definitions, one shared client and the three lookups declared as a
+``parallel`` group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from src.core import pipeline
+
+RUNS = 10
+_LOOKUPS = [{"id": f"lookup{i}", "url": "http://svc/lookup", "output_field": "text"} for i in range(3)]
+_JOIN = {"id": "join", "url": "http://svc/join", "output_field": "text"}
+
+
+async def _handler(request):
+    if request.url.path == "/lookup":
+        await asyncio.sleep(0.04)
+    return httpx.Response(200, json={"text": "ok"})
+
+
+def _wall_ms(name: str, shared: bool) -> float:
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            if not shared:
+                pipeline._definitions = (None, None, {})
+                client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            pipeline._get_client = lambda: client
+            result = await pipeline.run_pipeline(name, "x")
+            assert result["ok"]
+            if not shared:
+                await client.aclose()
+        return (time.perf_counter() - start) / RUNS * 1e3
+
+    return asyncio.run(scenario())
+
+
+def test_parallel_pipeline_is_faster() -> None:
+    saved = (pipeline._CHAIN_FILE, pipeline._get_client)
+    with tempfile.TemporaryDirectory() as tmp:
+        chain = Path(tmp) / "proxy_chain.json"
+        chain.write_text(json.dumps({"pipelines": {
+            "sequential": {"steps": _LOOKUPS + [_JOIN]},
+            "parallel": {"steps": [{"id": "lookups", "parallel": _LOOKUPS}, _JOIN]},
+        }}))
+        pipeline._CHAIN_FILE = chain
+        try:
+            before = _wall_ms("sequential", shared=False)
+            after = _wall_ms("parallel", shared=True)
+        finally:
+            pipeline._CHAIN_FILE, pipeline._get_client = saved
+    print(f"\nfan-out pipeline: before={before:.1f}ms/run after={after:.1f}ms/run")
+    assert after < before
+
+
+if __name__ == "__main__":
+    test_parallel_pipeline_is_faster()
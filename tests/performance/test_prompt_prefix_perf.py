@@ -0,0 +1,86 @@
+"""Cacheable prompt prefix across a session whose tool order drifts.
+
+30 requests with 40 built-in tools and three MCP servers whose tools arrive
+in connection order, which varies per request; a fourth server connects at
+request 10. The prefix an upstream cache can reuse is the common prefix of
+consecutive requests' serialized tools + system message. Before: tools
+forwarded in arrival order. After: ``PromptPrefixStabilizer.stabilize`` —
+the session's first-seen order, new tools appended.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+
+from src.services.conversion.prompt_prefix import PromptPrefixStabilizer
+
+REQUESTS = 30
+
+_SYSTEM = "You are Claude Code. " + "Follow the repository conventions. " * 400
+_BUILTIN = [f"Tool{i}" for i in range(40)]
+_MCP = {server: [f"mcp__{server}__op{i}" for i in range(8)] for server in ("db", "docs", "browser")}
+_LATE = [f"mcp__jira__op{i}" for i in range(8)]
+
+
+def _tool(name):
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": f"{name} " + "does useful things. " * 20,
+            "parameters": {"type": "object", "properties": {"arg": {"type": "string"}}},
+        },
+    }
+
+
+def _session():
+    rng = random.Random(7)
+    for i in range(REQUESTS):
+        servers = list(_MCP)
+        rng.shuffle(servers)
+        names = _BUILTIN + [n for server in servers for n in _MCP[server]]
+        if i >= 10:
+            names += _LATE
+        yield {
+            "model": "gpt-4o",
+            "messages": [{"role": "system", "content": _SYSTEM}, {"role": "user", "content": f"turn {i}"}],
+            "tools": [_tool(n) for n in names],
+        }
+
+
+def _prefix(request) -> str:
+    return json.dumps(request["tools"]) + json.dumps(request["messages"][0])
+
+
+def _shared_prefix_ratio(requests) -> float:
+    shared = total = 0
+    previous = None
+    for request in requests:
+        current = _prefix(request)
+        if previous is not None:
+            shared += len(os.path.commonprefix([previous, current]))
+            total += len(current)
+        previous = current
+    return shared / total
+
+
+def test_stabilized_prefix_is_reusable() -> None:
+    before = _shared_prefix_ratio(_session())
+    stabilizer = PromptPrefixStabilizer(enabled=True)
+    requests = list(_session())
+    start = time.process_time()
+    stabilized = [stabilizer.stabilize(r, "session", "openrouter") for r in requests]
+    per_request_us = (time.process_time() - start) / REQUESTS * 1e6
+    after = _shared_prefix_ratio(stabilized)
+    print(
+        f"\ncacheable prefix across {REQUESTS} requests: before={before:.0%} after={after:.0%} "
+        f"(stabilize {per_request_us:.0f}µs/request)"
+    )
+    assert after > before
+
+
+if __name__ == "__main__":
+    test_stabilized_prefix_is_reusable()
@@ -0,0 +1,109 @@
+"""/v1/messages request-parse latency for 10 KB, 200 KB and 2 MB bodies.
+
+Each body is a Claude Code-style session (user prompt, assistant text +
+tool_use, tool_result with file content) with 40 tools. Before: what FastAPI
+does for a ``ClaudeMessagesRequest`` body param — ``json.loads`` then full
+pydantic validation. After: the FAST_REQUEST_PARSE parser on the next turn of
+the same session, i.e. with every message but the new tail already validated.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+
+from src.api.request_parser import MessagesRequestParser
+from src.models.claude import ClaudeMessagesRequest
+
+_TOOLS = [
+    {
+        "name": f"Tool{i}",
+        "description": f"Tool {i} does a specific thing. " * 20,
+        "input_schema": {
+            "type": "object",
+            "properties": {f"p{j}": {"type": "string", "description": "x " * 30} for j in range(4)},
+        },
+    }
+    for i in range(40)
+]
+
+
+def _turn(i: int, result_chars: int) -> list:
+    return [
+        {"role": "user", "content": f"step {i}: look at module_{i}.py"},
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Reading module_{i}.py."},
+                {"type": "tool_use", "id": f"toolu_{i}", "name": "Tool1", "input": {"p0": f"module_{i}.py"}},
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{i}", "content": "y" * result_chars}
+            ],
+        },
+        {"role": "assistant", "content": f"Done with module_{i}.py."},
+    ]
+
+
+def _body(turns: int, result_chars: int, tools=True) -> bytes:
+    messages = [m for i in range(turns) for m in _turn(i, result_chars)]
+    messages.append({"role": "user", "content": f"step {turns}"})
+    return json.dumps(
+        {
+            "model": "claude-sonnet-4",
+            "max_tokens": 4096,
+            "stream": True,
+            "tools": _TOOLS if tools else None,
+            "messages": messages,
+        }
+    ).encode()
+
+
+# (label, turns, tool_result chars, tools)
+SIZES = [("10KB", 6, 1_000, False), ("200KB", 40, 2_500, True), ("2MB", 300, 6_000, True)]
+
+
+def _full(body: bytes) -> ClaudeMessagesRequest:
+    return ClaudeMessagesRequest.model_validate(json.loads(body))
+
+
+def _timed(fn) -> float:
+    # Collector pauses on a 2 MB object graph dwarf the difference being measured.
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def test_request_parse_latency() -> None:
+    for label, turns, chars, tools in SIZES:
+        previous, current = _body(turns - 1, chars, tools), _body(turns, chars, tools)
+        repeat = 15 if turns > 100 else 20
+
+        # Interleaved best-of-N, so load spikes hit both sides alike.
+        before = after = float("inf")
+        for _ in range(repeat):
+            before = min(before, _timed(lambda: _full(current)))
+            parser = MessagesRequestParser()
+            parser.parse(previous)  # the session's earlier turn
+            after = min(after, _timed(lambda: parser.parse(current)))
+        before, after = before * 1e3, after * 1e3
+
+        parser = MessagesRequestParser()
+        parser.parse(previous)
+        assert parser.parse(current) == _full(current)
+
+        print(f"\n{label} ({len(current) / 1024:.0f} KiB) parse: before={before:.2f}ms after={after:.2f}ms")
+        if turns > 100:  # smaller bodies are within timer noise here
+            assert after < before, f"{label}: fast parse ({after:.2f}ms) not faster than full ({before:.2f}ms)"
+
+
+if __name__ == "__main__":
+    test_request_parse_latency()
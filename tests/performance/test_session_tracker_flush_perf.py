@@ -0,0 +1,100 @@
+"""Session-metrics flush stall with 5000 tracked sessions, 50 active per interval.
+
+Before: every 60 s the flush ran on the event loop, opened a connection,
+re-ran CREATE TABLE and issued one INSERT OR REPLACE per tracked session
+while holding the tracker lock — the loop and every ``record_*`` call
+stalled for the whole write. After: only the 50 changed sessions are
+snapshotted under the lock and written with one ``executemany`` on a
+worker thread over a reused connection. Reported: time the lock is held
+(what request handlers wait on) and the flush's total time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.services.metrics.session_tracker import SessionMetricsTracker
+
+SESSIONS = 5000
+ACTIVE = 50
+FLUSHES = 5
+
+
+class _TimedLock:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.held = 0.0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.held += time.perf_counter() - self._start
+        self._lock.release()
+
+
+def _old_flush(tracker: SessionMetricsTracker) -> None:
+    conn = sqlite3.connect(tracker.db_path)
+    cursor = conn.cursor()
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS session_metrics (session_id TEXT PRIMARY KEY, started_at TEXT, "
+        "last_activity TEXT, input_tokens INTEGER, output_tokens INTEGER, thinking_tokens INTEGER, "
+        "cached_tokens INTEGER, total_tokens INTEGER, requests INTEGER, total_latency_ms REAL, "
+        "estimated_cost REAL, tool_calls_total INTEGER, tool_calls_success INTEGER, "
+        "tool_calls_failure INTEGER, cache_hits INTEGER, cache_misses INTEGER, models_used TEXT, "
+        "tool_call_names TEXT)"
+    )
+    with tracker._lock:
+        for metrics in tracker.sessions.values():
+            cursor.execute(
+                f"INSERT OR REPLACE INTO session_metrics VALUES ({', '.join('?' * 18)})", tracker._row(metrics)
+            )
+    conn.commit()
+    conn.close()
+
+
+def _run(db_path: Path, new: bool) -> tuple[float, float]:
+    async def scenario():
+        tracker = SessionMetricsTracker(db_path=str(db_path))
+        tracker._cleanup_task.cancel()
+        tracker._flush_task.cancel()
+        for i in range(SESSIONS):
+            tracker.record_request(f"session-{i}", "gpt-4o", input_tokens=100, output_tokens=20)
+        tracker._flush_to_database()
+        tracker._lock = _TimedLock()
+        total = 0.0
+        for round_ in range(FLUSHES):
+            for i in range(ACTIVE):
+                tracker.record_request(f"session-{round_ * ACTIVE + i}", "gpt-4o", input_tokens=10)
+            tracker._lock.held = 0.0
+            start = time.perf_counter()
+            if new:
+                await asyncio.to_thread(tracker._flush_to_database)
+            else:
+                _old_flush(tracker)
+            total += time.perf_counter() - start
+        return tracker._lock.held / FLUSHES * 1e3, total / FLUSHES * 1e3
+
+    return asyncio.run(scenario())
+
+
+def test_session_flush_is_incremental() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        before_lock, before_total = _run(Path(tmp) / "before.db", new=False)
+        after_lock, after_total = _run(Path(tmp) / "after.db", new=True)
+    print(
+        f"\nlock held per flush: before={before_lock:.2f}ms after={after_lock:.2f}ms; "
+        f"flush total: before={before_total:.1f}ms after={after_total:.1f}ms"
+    )
+    assert after_lock < before_lock
+    assert after_total < before_total
+
+
+if __name__ == "__main__":
+    test_session_flush_is_incremental()
@@ -0,0 +1,99 @@
+"""CPU per streamed chunk on the /v1/chat/completions streaming path.
+
+Streams 2,000 content chunks plus a usage chunk from a local fake upstream
+through an AsyncOpenAI client. Before: the SDK path — parse each chunk into
+a ChatCompletionChunk, ``model_dump()``, ``json.dumps``. After: the raw
+passthrough — ``with_streaming_response`` bytes, SSE line split and a byte
+scan, parsing only the usage chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from src.api.openai_endpoints import _chunk_needs_transform, _iter_sse_data
+
+CHUNKS = 2_000
+
+
+def _chunk(i: int) -> str:
+    return json.dumps(
+        {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "qwen/qwen3-coder",
+            "choices": [{"index": 0, "delta": {"content": f"tok{i} "}, "finish_reason": None}],
+            "usage": None,
+        }
+    )
+
+
+_BODY = (
+    "".join(f"data: {_chunk(i)}\n\n" for i in range(CHUNKS))
+    + 'data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1700000000,'
+    '"model":"qwen/qwen3-coder","choices":[],"usage":{"prompt_tokens":900,"completion_tokens":2000,'
+    '"total_tokens":2900}}\n\n'
+    + "data: [DONE]\n\n"
+).encode()
+
+
+def _client() -> AsyncOpenAI:
+    def handler(request):
+        return httpx.Response(200, content=_BODY, headers={"content-type": "text/event-stream"})
+
+    return AsyncOpenAI(
+        api_key="k",
+        base_url="http://upstream/v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+_REQUEST = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+
+async def _sdk(client: AsyncOpenAI) -> int:
+    out = 0
+    stream = await client.chat.completions.create(**_REQUEST, stream=True)
+    async for chunk in stream:
+        out += len(f"data: {json.dumps(chunk.model_dump())}\n\n")
+    return out
+
+
+async def _passthrough(client: AsyncOpenAI) -> int:
+    out = 0
+    async with client.chat.completions.with_streaming_response.create(
+        **_REQUEST, stream=True
+    ) as response:
+        async for payload in _iter_sse_data(response.iter_bytes()):
+            if payload == b"[DONE]":
+                break
+            if _chunk_needs_transform(payload):
+                out += len(f"data: {json.dumps(json.loads(payload))}\n\n")
+            else:
+                out += len(b"data: " + payload + b"\n\n")
+    return out
+
+
+def _cpu_per_chunk_us(fn) -> float:
+    client = _client()
+    asyncio.run(fn(client))
+    start = time.process_time()
+    asyncio.run(fn(client))
+    return (time.process_time() - start) / CHUNKS * 1e6
+
+
+def test_stream_passthrough_cpu() -> None:
+    before = min(_cpu_per_chunk_us(_sdk) for _ in range(3))
+    after = min(_cpu_per_chunk_us(_passthrough) for _ in range(3))
+    print(f"\nstream CPU/chunk: before={before:.1f}µs after={after:.1f}µs")
+    assert after < before, f"passthrough ({after:.1f}µs) not cheaper than SDK path ({before:.1f}µs)"
+
+
+if __name__ == "__main__":
+    test_stream_passthrough_cpu()
@@ -0,0 +1,62 @@
+"""CPU spent on the arguments of one large streamed tool call.
+
+A Write call with ~256 KB of file content arrives as 64-character argument
+fragments, the way OpenAI-format providers stream it. Before: each fragment
+appended to the tool call's ``args_buffer`` string (a full copy per fragment,
+since it lives in a dict), rewritten by ``streaming_transform_partial``, and
+the whole buffer ``json.loads``-ed at finish. After: the incremental tokenizer
+— O(fragment) per delta, and the object decoded as values close.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from src.services.conversion.response_converter import streaming_transform_partial
+from src.services.conversion.streaming_json import tool_args_stream
+
+FRAGMENT = 64
+
+_CONTENT = "".join(f'    line_{i} = "value {i}"  # comment\n' for i in range(7_000))
+_ARGS = json.dumps({"file_path": "/tmp/big_module.py", "content": _CONTENT})
+_FRAGMENTS = [_ARGS[i : i + FRAGMENT] for i in range(0, len(_ARGS), FRAGMENT)]
+
+
+def _buffered(tool_name: str) -> dict:
+    tool_call = {"args_buffer": ""}
+    for partial in _FRAGMENTS:
+        tool_call["args_buffer"] += partial
+        streaming_transform_partial(partial, tool_name)
+    return json.loads(tool_call["args_buffer"])
+
+
+def _incremental(tool_name: str) -> dict:
+    stream = tool_args_stream(tool_name)
+    for partial in _FRAGMENTS:
+        stream.feed(partial)
+    return stream.value()
+
+
+def _cpu_ms(fn, tool_name: str) -> float:
+    fn(tool_name)
+    start = time.process_time()
+    for _ in range(5):
+        fn(tool_name)
+    return (time.process_time() - start) / 5 * 1e3
+
+
+def test_streaming_tool_args_cpu() -> None:
+    assert _incremental("Write") == _buffered("Write")
+    for tool_name in ("Write", "Bash"):
+        before = min(_cpu_ms(_buffered, tool_name) for _ in range(3))
+        after = min(_cpu_ms(_incremental, tool_name) for _ in range(3))
+        print(
+            f"\n{tool_name} call, {len(_ARGS) // 1024} KB in {len(_FRAGMENTS)} fragments: "
+            f"before={before:.1f}ms after={after:.1f}ms"
+        )
+        assert after < before, f"incremental ({after:.1f}ms) not cheaper than buffered ({before:.1f}ms)"
+
+
+if __name__ == "__main__":
+    test_streaming_tool_args_cpu()
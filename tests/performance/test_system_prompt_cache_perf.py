@@ -0,0 +1,51 @@
+"""Per-request cost of a file-based custom system prompt.
+
+A 12 KB prompt file loaded through ``load_system_prompt("path:...")``.
+Before: every request resolved the path, opened, read, stripped and
+length-checked the file (reproduced by clearing the cache before each
+load). After: one ``os.stat`` plus a dict lookup while mtime and size match.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.prompts import system_prompt_loader as loader
+
+REQUESTS = 5000
+
+
+def _cpu_us(fn) -> float:
+    fn()
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        fn()
+    return (time.process_time() - start) / REQUESTS * 1e6
+
+
+def test_system_prompt_file_is_cached() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp).resolve()
+        prompt = base / "prompt.txt"
+        prompt.write_text("Follow the repository conventions strictly.\n" * 280)
+        source = f"path:{prompt}"
+        saved_base = loader._BASE_DIR
+        loader._BASE_DIR = base
+        try:
+            def uncached():
+                loader.clear_prompt_cache()
+                return loader.load_system_prompt(source)
+
+            before = min(_cpu_us(uncached) for _ in range(3))
+            after = min(_cpu_us(lambda: loader.load_system_prompt(source)) for _ in range(3))
+        finally:
+            loader._BASE_DIR = saved_base
+            loader.clear_prompt_cache()
+    print(f"\n12 KB prompt: before={before:.1f}µs/request after={after:.1f}µs/request")
+    assert after < before
+
+
+if __name__ == "__main__":
+    test_system_prompt_file_is_cached()
@@ -0,0 +1,102 @@
+"""Text scanning on pathological inputs.
+
+Tool-call markup: a reply that opens ``<tool_call>`` early and then streams a
+~40 KB Write call in 24-character deltas. Before: append each delta to a
+buffer and re-run ``<tool_call>(.*?)</tool_call>`` over the whole buffer
+(the lazy match rescans the open block on every delta). After:
+``TextToolCallScanner`` — each delta is searched once.
+
+JSON detection: 200-400 KB of unbalanced, shallow-nested and template-like
+brace soup. Before: the two-level nested-brace regex plus
+``json.loads`` per match. After: ``iter_json_values``, one forward pass.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+
+from src.core.json_detector import JSONDetector
+from src.services.conversion.text_tool_calls import TextToolCallScanner, parse_tool_call_block
+
+DELTA = 24
+
+_BLOCK_RE = re.compile(r"<tool_call>(.*?)</tool_call>", re.IGNORECASE | re.DOTALL)
+_JSON_PATTERN = re.compile(
+    r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}|\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]"
+)
+
+_WRITE_ARGS = json.dumps(
+    {"file_path": "/tmp/out.py", "content": "".join(f"x_{i} = {i}\n" for i in range(3_000))}
+)
+_REPLY = (
+    "I'll write the file now.\n<tool_call><function=\"write\"><parameters>"
+    + _WRITE_ARGS
+    + "</parameters></tool_call>"
+)
+_DELTAS = [_REPLY[i : i + DELTA] for i in range(0, len(_REPLY), DELTA)]
+
+_SOUPS = {
+    "nested braces": "{ " + "{a} " * 100_000,
+    "brace pairs": "{" + "{}" * 100_000,
+    "unclosed arrays": "[" + "[1] " * 100_000,
+    "template prose": "x {y} [z] " * 40_000,
+}
+
+
+def _rescan(deltas) -> list:
+    buffer, calls = "", []
+    for delta in deltas:
+        buffer += delta
+        found = [c for c in map(parse_tool_call_block, _BLOCK_RE.findall(buffer)) if c]
+        if found:
+            buffer = _BLOCK_RE.sub("", buffer)
+            calls += found
+    return calls
+
+
+def _scan(deltas) -> list:
+    scanner, calls = TextToolCallScanner(), []
+    for delta in deltas:
+        calls += scanner.feed(delta)
+    return calls
+
+
+def _regex_detect(text: str) -> int:
+    total = 0
+    for match in _JSON_PATTERN.finditer(text):
+        try:
+            json.loads(match.group(0))
+        except ValueError:
+            continue
+        if len(match.group(0)) >= JSONDetector.MIN_JSON_SIZE:
+            total += len(match.group(0))
+    return total
+
+
+def _cpu_ms(fn, arg) -> float:
+    start = time.process_time()
+    fn(arg)
+    return (time.process_time() - start) * 1e3
+
+
+def test_tool_call_scanner_cpu() -> None:
+    assert _scan(_DELTAS) == _rescan(_DELTAS) == [{"name": "write", "arguments": json.loads(_WRITE_ARGS)}]
+    before = min(_cpu_ms(_rescan, _DELTAS) for _ in range(3))
+    after = min(_cpu_ms(_scan, _DELTAS) for _ in range(3))
+    print(f"\ntext tool call, {len(_REPLY) // 1024} KB in {len(_DELTAS)} deltas: before={before:.1f}ms after={after:.1f}ms")
+    assert after < before
+
+
+def test_json_detector_cpu() -> None:
+    for name, text in _SOUPS.items():
+        before = min(_cpu_ms(_regex_detect, text) for _ in range(3))
+        after = min(_cpu_ms(JSONDetector.detect_json_in_text, text) for _ in range(3))
+        print(f"\njson detection, {name} ({len(text) // 1024} KB): before={before:.1f}ms after={after:.1f}ms")
+        assert after < before, name
+
+
+if __name__ == "__main__":
+    test_tool_call_scanner_cpu()
+    test_json_detector_cpu()
@@ -0,0 +1,72 @@
+"""Upstream tool-output size of a long edit/test session.
+
+60 assistant turns cycling through: read a 400-line module, edit one line
+and re-read it, re-read it unchanged, run a test suite that prints a
+PASSED line per test. Before: every tool result resent verbatim on every
+request. After: ``ToolOutputCompactor`` with the default 4 verbatim turns —
+tool characters on the last request, and the compaction CPU summed over all
+60 requests (memoized, so each result is compacted once).
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+
+from src.services.conversion.tool_output_compactor import ToolOutputCompactor
+
+TURNS = 60
+
+_MODULE = [f"    value_{i} = compute({i}, scale=2)" for i in range(400)]
+
+
+def _read(lines):
+    return "\n".join(f"{n:>6}→{line}" for n, line in enumerate(lines, 1))
+
+
+def _result(i):
+    kind = i % 4
+    if kind == 0:
+        return _read(_MODULE)
+    if kind == 1:
+        edited = list(_MODULE)
+        edited[(i * 37) % 400] = f"    value_edit = {i}"
+        return _read(edited)
+    if kind == 2:
+        return _read(_MODULE)
+    return "\n".join(["collecting 300 items"] + ["tests/test_mod.py PASSED"] * 300 + ["300 passed"])
+
+
+def _requests():
+    messages = [{"role": "user", "content": "refactor the module"}]
+    for i in range(TURNS):
+        messages = messages + [
+            {"role": "assistant", "content": None, "tool_calls": [{"id": f"call_{i}", "type": "function"}]},
+            {"role": "tool", "tool_call_id": f"call_{i}", "content": _result(i)},
+        ]
+        yield messages
+
+
+def _tool_chars(messages) -> int:
+    return sum(len(m["content"]) for m in messages if m["role"] == "tool")
+
+
+def test_tool_output_compaction() -> None:
+    requests = [[dict(m) for m in r] for r in _requests()]
+    before = _tool_chars(requests[-1])
+    compactor = ToolOutputCompactor(enabled=True)
+    copies = copy.deepcopy(requests)
+    start = time.process_time()
+    for messages in copies:
+        compactor.compact(messages)
+    cpu_ms = (time.process_time() - start) * 1e3
+    after = _tool_chars(copies[-1])
+    print(
+        f"\nlast request tool output: before={before // 1024} KB after={after // 1024} KB "
+        f"(~{(before - after) // 4:,} tokens saved); compaction CPU over {TURNS} requests={cpu_ms:.0f}ms"
+    )
+    assert after < before // 3
+
+
+if __name__ == "__main__":
+    test_tool_output_compaction()
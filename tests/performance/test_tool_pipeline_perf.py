@@ -0,0 +1,85 @@
+"""Per-request CPU spent preparing tool declarations.
+
+Each request parses a fresh copy of a Claude Code-sized tool set (40 tools
+with long descriptions and multi-property schemas) from JSON, then prepares
+the OpenAI tool array and the tool-header token count. Before: the full
+convert → sanitize → strip pipeline plus the header ``json.dumps`` on every
+request. After: the tool-set hash and a tool_pipeline cache hit.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+from src.models.claude import ClaudeMessagesRequest
+from src.services.conversion.request_converter import _build_openai_tools
+from src.services.token_cache import count_tokens
+from src.services.tools.tool_pipeline import ToolPipelineCache, tool_header_text
+
+REQUESTS = 300
+
+_BODY = json.dumps(
+    {
+        "model": "claude-sonnet-4",
+        "max_tokens": 1024,
+        "messages": [{"role": "user", "content": "hi"}],
+        "tools": [
+            {
+                "name": f"Tool{i}",
+                "description": f"Tool {i} does a specific thing. " * 40,
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        f"param_{j}": {
+                            "type": "string",
+                            "description": f"What param_{j} controls and its accepted values. " * 4,
+                            "default": "",
+                        }
+                        for j in range(6)
+                    },
+                    "required": ["param_0"],
+                    "additionalProperties": False,
+                },
+            }
+            for i in range(40)
+        ],
+    }
+)
+_TOOL_SETS = [ClaudeMessagesRequest.model_validate_json(_BODY).tools for _ in range(REQUESTS)]
+
+
+def _uncached(tools) -> int:
+    _build_openai_tools(tools, False)
+    return count_tokens(tool_header_text(tools))
+
+
+def _cached(cache: ToolPipelineCache):
+    def run(tools) -> int:
+        cache.openai_tools(tools, False, lambda t: _build_openai_tools(t, False))
+        return cache.token_count(tools)
+
+    return run
+
+
+def _cpu_per_request_us(fn) -> float:
+    fn(_TOOL_SETS[0])
+    start = time.process_time()
+    for tools in _TOOL_SETS:
+        fn(tools)
+    return (time.process_time() - start) / REQUESTS * 1e6
+
+
+def test_tool_pipeline_cache_cpu() -> None:
+    cache = ToolPipelineCache(enabled=True)
+    before = min(_cpu_per_request_us(_uncached) for _ in range(3))
+    after = min(_cpu_per_request_us(_cached(cache)) for _ in range(3))
+    print(
+        f"\ntool pipeline CPU/request: before={before:.0f}µs after={after:.0f}µs "
+        f"(hit rate {cache.stats()['hit_rate']:.0%})"
+    )
+    assert after < before, f"cached pipeline ({after:.0f}µs) not cheaper than full ({before:.0f}µs)"
+
+
+if __name__ == "__main__":
+    test_tool_pipeline_cache_cpu()
@@ -0,0 +1,67 @@
+"""Request-path cost of the VibeProxy health check.
+
+A local fake VibeProxy answers health probes in 50 ms. Before: once the
+30 s cache expired, the next request ran the probe inline (reproduced by
+clearing the cache before each check). After: requests read the state kept
+by the background monitor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.services import antigravity
+
+CHECKS = 20
+
+
+class _SlowHealth(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(0.05)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_health_reads_do_not_block() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHealth)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    saved = (antigravity.VIBEPROXY_BASE_URL, antigravity.vibeproxy_monitor)
+    try:
+        antigravity.VIBEPROXY_BASE_URL = url
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            antigravity.clear_vibeproxy_health_cache()
+            assert antigravity.check_vibeproxy_health()[0]
+        before = (time.perf_counter() - start) / CHECKS * 1e3
+
+        monitor = antigravity.vibeproxy_monitor = antigravity.VibeProxyHealthMonitor(url, interval=0.05)
+
+        async def scenario():
+            antigravity.read_vibeproxy_health()
+            await asyncio.sleep(0.2)
+            start = time.perf_counter()
+            for _ in range(CHECKS):
+                assert antigravity.read_vibeproxy_health()[0]
+            elapsed = (time.perf_counter() - start) / CHECKS * 1e3
+            await monitor.stop()
+            return elapsed
+
+        after = asyncio.run(scenario())
+    finally:
+        antigravity.VIBEPROXY_BASE_URL, antigravity.vibeproxy_monitor = saved
+        antigravity.clear_vibeproxy_health_cache()
+        server.shutdown()
+        server.server_close()
+    print(f"\nhealth check on the request path: before={before:.1f}ms after={after * 1000:.1f}µs")
+    assert after < before
+
+
+if __name__ == "__main__":
+    test_health_reads_do_not_block()
@@ -0,0 +1,56 @@
+"""Versioned, immutable resolver snapshots."""
+
+import pytest
+
+from src.core.config_resolver import ConfigLayer, ConfigResolver, FieldSchema
+
+
+@pytest.fixture
+def resolver() -> ConfigResolver:
+    r = ConfigResolver()
+    r._initialized = True
+    r.register_schema("port", FieldSchema(type=int, default=8082))
+    r.register_schema("endpoint", FieldSchema(type=str, default=""))
+    return r
+
+
+def test_same_snapshot_until_a_layer_changes(resolver):
+    first = resolver.snapshot()
+    assert resolver.snapshot() is first
+    assert first["port"].value == 8082
+
+    resolver._layers[ConfigLayer.CLI]["port"] = "9000"  # direct write, as the CLI overlay does
+    second = resolver.snapshot()
+    assert second is not first
+    assert second["port"].value == 9000 and second["port"].source_layer == ConfigLayer.CLI
+    assert first["port"].value == 8082  # earlier snapshots are frozen
+    with pytest.raises(TypeError):
+        first["port"] = None
+
+    resolver._layers[ConfigLayer.CLI].pop("port")
+    assert resolver.resolve("port").value == 8082
+
+
+def test_env_references_invalidate_the_snapshot(resolver, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_TEST_HOST", "a.example")
+    resolver._layers[ConfigLayer.DOTENV]["endpoint"] = "https://${SNAPSHOT_TEST_HOST}/v1"
+    assert resolver.resolve("endpoint").value == "https://a.example/v1"
+    snap = resolver.snapshot()
+
+    monkeypatch.setenv("SNAPSHOT_TEST_HOST", "b.example")
+    assert resolver.snapshot() is not snap
+    assert resolver.resolve("endpoint").value == "https://b.example/v1"
+
+
+def test_cast_results_are_memoized_per_snapshot(resolver):
+    calls = []
+
+    def cast(value):
+        calls.append(value)
+        return int(value) + 1
+
+    snap = resolver.snapshot()
+    assert snap.cast("port", cast) == snap.cast("port", cast) == 8083
+    assert calls == [8082]
+    resolver.set("port", 1234, ConfigLayer.CLI)
+    assert resolver.snapshot().cast("port", cast) == 1235
@@ -0,0 +1,102 @@
+"""Content-addressed request/response store: dedup across turns and session replay."""
+
+import json
+
+from src.services.usage.usage_tracker import UsageTracker
+
+SYSTEM = [{"type": "text", "text": "You are Claude Code. " * 400}]
+TOOLS = [
+    {
+        "name": f"tool_{i}",
+        "description": "Does a thing. " * 40,
+        "input_schema": {"type": "object", "properties": {"path": {"type": "string"}}},
+    }
+    for i in range(30)
+]
+
+
+def _session_requests(turns):
+    messages = []
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"step {turn}: " + "edit the file " * 20})
+        yield {
+            "model": "claude-sonnet-4",
+            "max_tokens": 8192,
+            "stream": True,
+            "system": SYSTEM,
+            "tools": TOOLS,
+            "messages": list(messages),
+        }
+        messages.append({"role": "assistant", "content": f"done {turn}"})
+
+
+def _tracker(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_FULL_CONTENT", "true")
+    return UsageTracker(db_path=str(tmp_path / "usage.db"), enabled=True)
+
+
+def test_session_storage_is_proportional_to_unique_content(tmp_path, monkeypatch):
+    tracker = _tracker(tmp_path, monkeypatch)
+    bodies = [json.dumps(body) for body in _session_requests(40)]
+    for i, body in enumerate(bodies):
+        assert tracker.log_request(
+            request_id=f"req-{i}",
+            original_model="claude-sonnet-4",
+            routed_model="openrouter/qwen/qwen3-coder",
+            provider="openrouter",
+            endpoint="chat/completions",
+            session_id="s1",
+            request_content=body,
+            response_content=json.dumps({"choices": [{"message": {"content": f"done {i}"}}]}),
+        )
+
+    stats = tracker.get_content_store_stats()
+    inline_bytes = sum(len(b) for b in bodies)
+    # System prompt and tool schemas are stored once, each message once.
+    assert stats["unique_bytes"] < inline_bytes / 10
+    assert stats["stored_bytes"] < stats["unique_bytes"]
+
+
+def test_replay_session_reassembles_bodies_in_order(tmp_path, monkeypatch):
+    tracker = _tracker(tmp_path, monkeypatch)
+    bodies = list(_session_requests(5))
+    for i, body in enumerate(bodies):
+        tracker.log_request(
+            request_id=f"req-{i}",
+            original_model="claude-sonnet-4",
+            routed_model="openrouter/qwen/qwen3-coder",
+            provider="openrouter",
+            endpoint="chat/completions",
+            session_id="s1",
+            request_content=json.dumps(body),
+        )
+    tracker.log_request(
+        request_id="plain",
+        original_model="m",
+        routed_model="m",
+        provider="p",
+        endpoint="e",
+        session_id="s2",
+        request_content="not json at all",
+    )
+
+    turns = tracker.replay_session("s1")
+    assert [t["request_id"] for t in turns] == [f"req-{i}" for i in range(5)]
+    assert [t["request"] for t in turns] == bodies
+    assert turns[0]["response"] is None
+    assert tracker.get_request_content("plain")["request"] == "not json at all"
+
+
+def test_content_not_stored_without_full_content_logging(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_FULL_CONTENT", "false")
+    tracker = UsageTracker(db_path=str(tmp_path / "usage.db"), enabled=True)
+    tracker.log_request(
+        request_id="r",
+        original_model="m",
+        routed_model="m",
+        provider="p",
+        endpoint="e",
+        request_content=json.dumps(next(_session_requests(1))),
+    )
+    assert tracker.get_content_store_stats()["unique_chunks"] == 0
+    assert tracker.get_request_content("r") == {"request": None, "response": None}
@@ -0,0 +1,109 @@
+"""Per-session incremental Claude→OpenAI message conversion cache."""
+
+from src.models.claude import ClaudeMessage
+from src.services.conversion import tool_behavior_cache
+from src.services.conversion.conversion_cache import ConversionCache
+from src.services.conversion.request_converter import convert_claude_message_units
+
+
+def _turn(i):
+    return [
+        {"role": "user", "content": f"step {i}: run the tests"},
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Running tests ({i})"},
+                {"type": "tool_use", "id": f"call_{i}", "name": "Bash", "input": {"command": "pytest"}},
+            ],
+        },
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": f"call_{i}", "content": f"{i} passed"}],
+        },
+        {"role": "assistant", "content": f"All {i} passed."},
+    ]
+
+
+def _session(turns):
+    # Append-only, as a client resends it: the last user message of one
+    # request opens the next turn.
+    return [ClaudeMessage(**m) for i in range(turns) for m in _turn(i)] + [
+        ClaudeMessage(**_turn(turns)[0])
+    ]
+
+
+def _convert(cache, messages, calls=None, provider="openrouter"):
+    def convert_from(start):
+        if calls is not None:
+            calls.append(start)
+        return convert_claude_message_units(messages, start, provider, "gpt-4o")
+
+    return cache.convert(messages, (provider, "gpt-4o"), convert_from, session_id="s1")
+
+
+def _uncached(messages, provider="openrouter"):
+    return [m for _, out in convert_claude_message_units(messages, 0, provider, "gpt-4o") for m in out]
+
+
+def test_only_new_turns_are_converted_and_output_matches():
+    cache = ConversionCache(enabled=True)
+    calls = []
+    _convert(cache, _session(50), calls)
+    grown = _session(51)
+    history, validated_upto = _convert(cache, grown, calls)
+
+    assert history == _uncached(grown)
+    # Everything up to the last-seen message's unit is reused.
+    assert calls == [0, 200]
+    assert validated_upto == len(_uncached(_session(50))) - 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_handed_out_messages_do_not_alias_the_cache():
+    cache = ConversionCache(enabled=True)
+    history, _ = _convert(cache, _session(3))
+    history[0]["content"] = "mutated downstream"
+    again, _ = _convert(cache, _session(4))
+    assert again[0]["content"] == "step 0: run the tests"
+
+
+def test_rewritten_history_reconverts_from_the_edit():
+    cache = ConversionCache(enabled=True)
+    calls = []
+    _convert(cache, _session(10), calls)
+
+    compacted = _session(11)
+    compacted[40] = ClaudeMessage(role="user", content="summary of earlier work")
+    history, _ = _convert(cache, compacted, calls)
+    assert calls[-1] < 40
+    assert history == _uncached(compacted)
+
+
+def test_edited_middle_tool_result_is_reconverted():
+    # Old tool output cleared in place; count, first and last message unchanged.
+    cache = ConversionCache(enabled=True)
+    calls = []
+    messages = _session(10)
+    _convert(cache, messages, calls)
+
+    edited = _session(10)
+    edited[18] = ClaudeMessage(
+        role="user",
+        content=[{"type": "tool_result", "tool_use_id": "call_4", "content": "[cleared]"}],
+    )
+    history, validated_upto = _convert(cache, edited, calls)
+    assert history == _uncached(edited)
+    tool_4 = next(m for m in history if m.get("tool_call_id") == "call_4")
+    assert tool_4["content"] == "[cleared]"
+    assert 0 < calls[-1] <= 18
+    assert validated_upto <= calls[-1]
+
+
+def test_learned_style_change_forces_full_reconversion(monkeypatch):
+    monkeypatch.setattr(tool_behavior_cache, "_preferences", {})
+    cache = ConversionCache(enabled=True)
+    calls = []
+    _convert(cache, _session(10), calls)
+    tool_behavior_cache.record_tool_argument_style("openrouter", "Bash", {"prompt": "x"})
+    _convert(cache, _session(11), calls)
+    assert calls == [0, 0]
@@ -0,0 +1,55 @@
+"""Concurrent independent rounds in crosstalk paradigms."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.conversation.crosstalk import CrosstalkOrchestrator, CrosstalkParadigm, CrosstalkSession
+
+_DELAYS = {"big": 0.15, "middle": 0.05, "small": 0.10}
+
+
+class _Orchestrator(CrosstalkOrchestrator):
+    def __init__(self, max_concurrency=4):
+        super().__init__(SimpleNamespace(), max_concurrency=max_concurrency)
+        self.in_flight = self.peak = 0
+
+    async def _call_model(self, model, prompt, system_prompt=""):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(_DELAYS[model])
+        self.in_flight -= 1
+        return f"{model}:{'review' if 'insights from other' in prompt else 'reply'}"
+
+
+def _session(paradigm, models, iterations=1):
+    return CrosstalkSession(
+        session_id="s", models=models, system_prompts={}, paradigm=paradigm, iterations=iterations, topic="t"
+    )
+
+
+def test_memory_rounds_run_concurrently_in_model_order():
+    orch = _Orchestrator()
+    session = _session(CrosstalkParadigm.MEMORY, ["big", "middle", "small", "middle"])
+    start = time.perf_counter()
+    asyncio.run(orch._execute_paradigm(session))
+    elapsed = time.perf_counter() - start
+
+    assert [(m.speaker, m.iteration) for m in session.history] == [
+        (model, it) for it in (0, 1) for model in ["big", "middle", "small", "middle"]
+    ]
+    assert session.history[4].content == "big:review"
+    assert elapsed < 2 * 0.15 + 0.12  # ~ the slowest model per round, not the sum
+    assert orch.peak == 4
+
+
+def test_debate_respects_the_concurrency_cap():
+    orch = _Orchestrator(max_concurrency=2)
+    session = _session(CrosstalkParadigm.DEBATE, ["small", "big", "middle"], iterations=3)
+    asyncio.run(orch._execute_paradigm(session))
+
+    assert orch.peak == 2
+    challenges = [(m.speaker, m.listener, m.iteration) for m in session.history if m.message_type == "challenge"]
+    assert challenges == [
+        (s, o, it) for it in (1, 2) for s, o in [("small", "big"), ("big", "middle"), ("middle", "small")]
+    ]
@@ -0,0 +1,61 @@
+"""Hot-path logging facade: level guard, lazy formatting and 1-in-N sampling."""
+
+import contextvars
+import logging
+
+from src.services.logging import hot_log
+from src.services.logging.hot_log import get_hot_logger, lazy
+
+
+def _capture(name, level):
+    records = []
+
+    class _Handler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    lg = logging.getLogger(name)
+    lg.handlers = [_Handler()]
+    lg.propagate = False
+    lg.setLevel(level)
+    return lg, records
+
+
+def test_lazy_args_not_evaluated_at_info():
+    lg, records = _capture("test.hot_log.info", logging.INFO)
+    hot = get_hot_logger(lg)
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "summary"
+
+    contextvars.Context().run(lambda: hot.debug("tools: %s", lazy(expensive)))
+    assert calls == []
+    assert records == []
+
+
+def test_debug_level_formats_on_emit():
+    lg, records = _capture("test.hot_log.debug", logging.DEBUG)
+    hot = get_hot_logger(lg)
+    hot.debug("[Client %s] %s", hot_log.TIMESTAMP, lazy(lambda: "routed"))
+    assert len(records) == 1
+    assert records[0].levelno == logging.DEBUG
+    assert records[0].getMessage().endswith("] routed")
+
+
+def test_sampled_request_promotes_debug_to_info(monkeypatch):
+    lg, records = _capture("test.hot_log.sampled", logging.INFO)
+    hot = get_hot_logger(lg)
+    monkeypatch.setattr(hot_log, "_SAMPLE_RATE", 4)
+
+    def one_request(i):
+        sampled = hot.begin_request()
+        hot.debug("request %s", i)
+        return sampled
+
+    sampled = [contextvars.Context().run(one_request, i) for i in range(40)]
+    assert sum(sampled) == 10
+    assert len(records) == 10
+    assert all(r.levelno == logging.INFO for r in records)
+    assert all(r.getMessage().startswith("[sampled] request ") for r in records)
@@ -0,0 +1,58 @@
+"""Indexed identifier-mapping lookups keep the scan's precedence rules."""
+
+import random
+
+import pytest
+
+from src.core.identifier_mapping import IdentifierMapping, IdentifierMappingRegistry
+from src.core.proxy_chain import ProxyChain
+
+
+class _Registry(IdentifierMappingRegistry):
+    def __init__(self, chain):
+        super().__init__()
+        self.chain = chain
+
+    def _chain(self):
+        return self.chain
+
+
+def _scan(mappings, incoming):
+    candidates = [m for m in mappings if m.enabled and m.incoming_identifier == incoming]
+    candidates.sort(key=lambda m: m.priority, reverse=True)
+    return candidates[0] if candidates else None
+
+
+@pytest.fixture
+def registry():
+    return _Registry(ProxyChain())
+
+
+def test_index_matches_linear_scan(registry):
+    rng = random.Random(7)
+    names = [f"claude-{i}" for i in range(30)]
+    registry.chain.identifier_mappings = [
+        IdentifierMapping(rng.choice(names), f"a{i}", enabled=rng.random() > 0.3, priority=rng.randint(0, 3))
+        for i in range(300)
+    ]
+    for name in names + ["unknown"]:
+        assert registry.lookup_by_incoming_identifier(name) is _scan(registry.chain.identifier_mappings, name)
+
+
+def test_index_follows_in_place_edits_and_list_changes(registry):
+    low = IdentifierMapping("claude-opus-4", "big", priority=1)
+    high = IdentifierMapping("claude-opus-4", "middle", priority=5)
+    registry.chain.identifier_mappings = [low, high]
+    assert registry.lookup_by_incoming_identifier("claude-opus-4") is high
+
+    high.enabled = False  # as the resolver's STORED write-back does
+    assert registry.lookup_by_incoming_identifier("claude-opus-4") is low
+
+    registry.chain.identifier_mappings.append(IdentifierMapping("hermes:planner", "small"))
+    assert registry.lookup_by_incoming_identifier("hermes:planner").assignment_id == "small"
+
+    registry.chain.identifier_mappings[0] = IdentifierMapping("claude-opus-4", "small", priority=9)
+    assert registry.lookup_by_incoming_identifier("claude-opus-4").assignment_id == "small"
+
+    registry.chain = ProxyChain()  # reload_chain()
+    assert registry.lookup_by_incoming_identifier("claude-opus-4") is None
@@ -0,0 +1,87 @@
+"""Content-addressed image store and the old-turn image policy."""
+
+import base64
+import io
+
+import pytest
+
+from src.models.claude import ClaudeMessage
+from src.services.conversion import request_converter
+from src.services.conversion.image_store import ImageStore, data_url
+from src.services.conversion.request_converter import convert_claude_user_message
+
+
+def _png(size, color=(200, 30, 30)):
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+_DATA = base64.b64encode(bytes(range(256)) * 64).decode("ascii")
+
+
+def _user(text, data=_DATA):
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": text},
+            {"type": "image_url", "image_url": {"url": data_url("image/png", data)}},
+        ],
+    }
+
+
+def test_repeated_images_share_one_url(monkeypatch):
+    store = ImageStore(enabled=True)
+    monkeypatch.setattr(request_converter, "image_store", store)
+
+    def message():
+        # A fresh copy of the payload, as a newly parsed request would carry.
+        source = {"type": "base64", "media_type": "image/png", "data": "".join(list(_DATA))}
+        return ClaudeMessage(
+            role="user",
+            content=[{"type": "text", "text": "look"}, {"type": "image", "source": source}],
+        )
+
+    first = convert_claude_user_message(message())
+    second = convert_claude_user_message(message())
+
+    assert first == second == _user("look")
+    assert first["content"][1]["image_url"]["url"] is second["content"][1]["image_url"]["url"]
+    stats = store.stats()
+    assert (stats["images"], stats["unique_images"], stats["reused"]) == (2, 1, 1)
+
+
+def test_strip_policy_keeps_recent_turns_and_cached_lists():
+    store = ImageStore(enabled=True, policy="strip", keep_recent=2)
+    turns = [_user(f"shot {i}") for i in range(4)]
+    cached_contents = [turn["content"] for turn in turns]
+    messages = [{"role": "system", "content": "sys"}] + [dict(turn) for turn in turns]
+
+    report = store.apply_history_policy(messages)
+
+    assert [m["content"][1]["type"] for m in messages[1:]] == ["text", "text", "image_url", "image_url"]
+    assert messages[1]["content"][1]["text"].startswith("[image omitted from an earlier turn: image/png")
+    assert report["omitted"] == 2
+    assert report["bytes_saved"] == 2 * len(data_url("image/png", _DATA))
+    # The conversion cache's content lists are never modified.
+    assert all(turn["content"] is content for turn, content in zip(turns, cached_contents))
+    assert all(content[1]["type"] == "image_url" for content in cached_contents)
+
+
+def test_downsample_policy_reencodes_large_images():
+    large, small = _png((1600, 1200)), _png((64, 64))
+    store = ImageStore(enabled=True, policy="downsample", keep_recent=1, max_px=256)
+    messages = [_user("big", large), _user("tiny", small), _user("now", large)]
+
+    report = store.apply_history_policy(messages)
+    again = store.apply_history_policy([_user("big", large), _user("now", large)])
+
+    url = messages[0]["content"][1]["image_url"]["url"]
+    Image = pytest.importorskip("PIL.Image")
+    with Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1]))) as image:
+        assert max(image.size) == 256
+    assert messages[1]["content"][1]["image_url"]["url"] == data_url("image/png", small)
+    assert messages[2]["content"][1]["image_url"]["url"] == data_url("image/png", large)
+    assert (report["downsampled"], report["omitted"]) == (1, 0)
+    assert again["bytes_saved"] == report["bytes_saved"] > 0
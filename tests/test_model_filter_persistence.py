@@ -0,0 +1,79 @@
+"""Debounced, atomic persistence of model usage counts."""
+
+import json
+import threading
+
+from src.services.models.model_filter import ModelFilter
+
+
+def test_concurrent_usage_is_counted_exactly_with_bounded_writes(tmp_path):
+    usage_file = tmp_path / "data" / "model_usage.json"
+    mf = ModelFilter(usage_file=str(usage_file), flush_interval=60)
+    threads, per_thread = 16, 50
+    barrier = threading.Barrier(threads)
+
+    def worker(i):
+        barrier.wait()
+        for _ in range(per_thread):
+            mf.track_model_usage("openai/gpt-4o" if i % 2 else "deepseek/deepseek-chat")
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    assert mf.writes == 0 and not usage_file.exists()  # nothing written before the interval
+    mf.flush()
+    mf.flush()  # clean: no second write
+    assert mf.writes == 1
+
+    saved = json.loads(usage_file.read_text())["models"]
+    assert sum(m["count"] for m in saved.values()) == threads * per_thread
+    assert saved["openai/gpt-4o"]["count"] == saved["deepseek/deepseek-chat"]["count"] == 400
+    assert not usage_file.with_suffix(".tmp").exists()
+    assert ModelFilter(usage_file=str(usage_file)).usage_data["models"] == saved
+
+
+def test_timer_flushes_once_per_interval(tmp_path):
+    usage_file = tmp_path / "model_usage.json"
+    mf = ModelFilter(usage_file=str(usage_file), flush_interval=0.05)
+    for _ in range(200):
+        mf.track_model_usage("x-ai/grok-2")
+    timer = mf._timer
+    timer.join(2)
+    assert mf.writes == 1
+    assert json.loads(usage_file.read_text())["models"]["x-ai/grok-2"]["count"] == 200
+
+
+def test_zero_interval_writes_through(tmp_path):
+    usage_file = tmp_path / "model_usage.json"
+    mf = ModelFilter(usage_file=str(usage_file), flush_interval=0)
+    mf.track_model_usage("openai/o1")
+    mf.track_model_usage("openai/o1")
+    assert mf.writes == 2
+    assert json.loads(usage_file.read_text())["models"]["openai/o1"]["count"] == 2
+
+
+def test_failed_write_is_retried_on_the_next_interval(tmp_path, monkeypatch):
+    usage_file = tmp_path / "model_usage.json"
+    mf = ModelFilter(usage_file=str(usage_file), flush_interval=0.05)
+    mf.track_model_usage("openai/o1")
+
+    real_replace = type(usage_file).replace
+    failures = []
+
+    def flaky_replace(self, target):
+        if not failures:
+            failures.append(self)
+            raise OSError("disk full")
+        return real_replace(self, target)
+
+    monkeypatch.setattr(type(usage_file), "replace", flaky_replace)
+    mf._timer.join(2)
+    assert failures and mf.writes == 0
+    retry = mf._timer
+    assert retry is not None  # re-armed after the failure
+    retry.join(2)
+    assert mf.writes == 1
+    assert json.loads(usage_file.read_text())["models"]["openai/o1"]["count"] == 1
@@ -0,0 +1,92 @@
+"""Byte-level SSE passthrough for /v1/chat/completions streaming."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.api.openai_endpoints import _chunk_needs_transform, _iter_sse_data, _raise_stream_error
+
+
+def _chunk(delta, usage=None, finish=None):
+    return json.dumps(
+        {
+            "id": "c1",
+            "object": "chat.completion.chunk",
+            "created": 1,
+            "model": "m",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            "usage": usage,
+        }
+    )
+
+
+def test_only_tool_call_and_usage_chunks_need_parsing():
+    assert not _chunk_needs_transform(_chunk({"content": "hi"}).encode())
+    assert not _chunk_needs_transform(_chunk({"content": 'say "usage" or tool_calls'}).encode())
+    assert _chunk_needs_transform(
+        _chunk({"tool_calls": [{"index": 0, "function": {"arguments": "{}"}}]}).encode()
+    )
+    assert _chunk_needs_transform(
+        _chunk({}, usage={"prompt_tokens": 1, "completion_tokens": 2}, finish="stop").encode()
+    )
+    assert not _chunk_needs_transform(b'{"choices":[],"usage": null}')
+
+
+def test_in_stream_errors_are_parsed_and_raised_wherever_the_key_is():
+    for payload in (
+        b'{ "error": {"message": "overloaded"}}',
+        b'{"id":"c1","object":"chat.completion.chunk","error":{"message":"overloaded"}}',
+    ):
+        assert _chunk_needs_transform(payload)
+        with pytest.raises(RuntimeError, match="overloaded"):
+            _raise_stream_error(json.loads(payload))
+
+    with pytest.raises(RuntimeError, match="An error occurred during streaming"):
+        _raise_stream_error({"error": "boom"})
+    _raise_stream_error({"error": None, "choices": []})
+    _raise_stream_error(json.loads(_chunk({"content": "no error here"})))
+
+
+def test_sse_payloads_survive_arbitrary_byte_boundaries():
+    body = (
+        b": keep-alive\n\n"
+        + b"".join(f"data: {_chunk({'content': str(i)})}\r\n\r\n".encode() for i in range(5))
+        + b"data: [DONE]\n\n"
+    )
+
+    async def pieces():
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    async def collect():
+        return [p async for p in _iter_sse_data(pieces())]
+
+    payloads = asyncio.run(collect())
+    assert payloads[-1] == b"[DONE]"
+    assert [json.loads(p)["choices"][0]["delta"]["content"] for p in payloads[:-1]] == list("01234")
+
+
+def test_raw_stream_through_sdk_client():
+    body = "".join(f"data: {_chunk({'content': c})}\n\n" for c in "abc") + "data: [DONE]\n\n"
+
+    def handler(request):
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content=body.encode(), headers={"content-type": "text/event-stream"})
+
+    async def scenario():
+        client = AsyncOpenAI(
+            api_key="k",
+            base_url="http://upstream/v1",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        async with client.chat.completions.with_streaming_response.create(
+            model="m", messages=[{"role": "user", "content": "hi"}], stream=True
+        ) as response:
+            return [p async for p in _iter_sse_data(response.iter_bytes())]
+
+    payloads = asyncio.run(scenario())
+    assert payloads[-1] == b"[DONE]"
+    assert len(payloads) == 4
@@ -0,0 +1,111 @@
+"""Pooled, concurrent pipeline execution."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from src.core import pipeline
+
+_PIPELINES = {
+    "fan": {
+        "steps": [
+            {"id": "clean", "url": "http://svc/clean", "input_field": "text", "output_field": "text"},
+            {
+                "id": "enrich",
+                "parallel": [
+                    {"id": "summary", "url": "http://svc/slow", "input_field": "text", "output_field": "text"},
+                    {"id": "tags", "url": "http://svc/slow", "input_field": "text", "output_field": "text"},
+                ],
+            },
+            {"id": "join", "url": "http://svc/join", "input_field": "parts", "output_field": "text"},
+        ]
+    },
+    "flaky": {
+        "steps": [
+            {"id": "once", "url": "http://svc/flaky", "output_field": "text", "max_retries": 3, "retry_backoff": 0.01}
+        ]
+    },
+}
+
+
+@pytest.fixture
+def chain_file(tmp_path, monkeypatch):
+    path = tmp_path / "proxy_chain.json"
+    path.write_text(json.dumps({"pipelines": _PIPELINES}))
+    monkeypatch.setattr(pipeline, "_CHAIN_FILE", path)
+    return path
+
+
+def _client(monkeypatch, calls):
+    async def handler(request):
+        body = json.loads(request.content or b"{}")
+        calls.append((request.url.path, time.perf_counter()))
+        if request.url.path == "/slow":
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"text": body["text"].upper()})
+        if request.url.path == "/join":
+            return httpx.Response(200, json={"text": "+".join(sorted(body["parts"].values()))})
+        if request.url.path == "/flaky" and len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"text": str(body.get("text", "ok")).strip()})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(pipeline, "_get_client", lambda: client)
+    return client
+
+
+def test_parallel_group_fans_into_next_step(chain_file, monkeypatch):
+    calls = []
+    _client(monkeypatch, calls)
+    result = asyncio.run(pipeline.run_pipeline("fan", " hi "))
+
+    assert result["ok"] and result["output"] == "HI+HI"
+    enrich = result["steps"][1]
+    assert enrich["output"] == {"summary": "HI", "tags": "HI"}
+    assert [b["id"] for b in enrich["parallel"]] == ["summary", "tags"]
+    assert enrich["elapsed_ms"] < 350  # both 200 ms branches overlapped
+    assert set(result["timings_ms"]) == {"clean", "enrich", "join"}
+    assert pipeline.list_pipelines()["fan"]["steps"][1] == {"enrich": ["summary", "tags"]}
+
+
+def test_retries_back_off_and_definitions_are_cached(chain_file, monkeypatch):
+    calls = []
+    _client(monkeypatch, calls)
+    result = asyncio.run(pipeline.run_pipeline("flaky", "x"))
+    assert result["ok"] and result["steps"][0]["retries"] == 2
+    gaps = [b[1] - a[1] for a, b in zip(calls, calls[1:])]
+    assert gaps[1] > gaps[0] >= 0.009
+
+    assert pipeline._load_pipelines() is pipeline._load_pipelines()
+    chain_file.write_text(json.dumps({"pipelines": {"other": {"steps": []}}, "pad": 1}))
+    assert list(pipeline._load_pipelines()) == ["other"]
+
+
+def test_shared_client_is_reused_within_a_loop():
+    async def scenario():
+        first = pipeline._get_client()
+        assert pipeline._get_client() is first
+        await pipeline.close_client()
+        assert first.is_closed and pipeline._get_client() is not first
+        await pipeline.close_client()
+
+    asyncio.run(scenario())
+
+
+def test_client_from_a_previous_loop_is_closed_when_replaced():
+    async def open_client():
+        return pipeline._get_client()
+
+    async def replace():
+        client = pipeline._get_client()
+        await asyncio.gather(*pipeline._retiring)  # the old client's close
+        return client
+
+    first = asyncio.run(open_client())
+    second = asyncio.run(replace())
+    assert second is not first and first.is_closed and not second.is_closed
+    asyncio.run(pipeline.close_client())
+    assert second.is_closed
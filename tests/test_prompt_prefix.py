@@ -0,0 +1,72 @@
+"""Prompt-prefix stabilization and cached-token accounting."""
+
+from src.services.conversion.prompt_prefix import PromptPrefixStabilizer, cached_tokens
+
+
+def _tool(name):
+    return {"type": "function", "function": {"name": name, "parameters": {"type": "object"}}}
+
+
+def _request(names, system="You are a helpful assistant."):
+    return {
+        "model": "gpt-4o",
+        "messages": [{"role": "system", "content": system}, {"role": "user", "content": "hi"}],
+        "tools": [_tool(n) for n in names],
+    }
+
+
+def _names(request):
+    return [t["function"]["name"] for t in request["tools"]]
+
+
+def test_tool_order_is_sticky_per_session_and_new_tools_are_appended():
+    stabilizer = PromptPrefixStabilizer(enabled=True)
+    assert _names(stabilizer.stabilize(_request(["Bash", "Read", "Edit"]), "s1", "openrouter")) == [
+        "Bash",
+        "Read",
+        "Edit",
+    ]
+    # An MCP server connected and the client reshuffled its list.
+    second = stabilizer.stabilize(_request(["mcp__db__query", "Edit", "Bash", "Read"]), "s1", "openrouter")
+    assert _names(second) == ["Bash", "Read", "Edit", "mcp__db__query"]
+    # Another session keeps its own order.
+    other = stabilizer.stabilize(_request(["Edit", "Bash"]), "s2", "openrouter")
+    assert _names(other) == ["Edit", "Bash"]
+
+    stabilizer.stabilize(_request(["Bash", "Read", "Edit"], system="changed"), "s1", "openrouter")
+    stats = stabilizer.stats()
+    assert (stats["reordered"], stats["tool_changes"], stats["system_changes"]) == (1, 2, 1)
+
+
+def test_cache_markers_only_for_openrouter_models_that_need_them():
+    stabilizer = PromptPrefixStabilizer(enabled=True, markers=True)
+    request = {**_request(["Bash"]), "model": "anthropic/claude-sonnet-4"}
+
+    marked = stabilizer.cache_markers(request, "https://openrouter.ai/api/v1")
+    assert marked["messages"][0]["content"] == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert request["messages"][0]["content"] == "You are a helpful assistant."
+    assert stabilizer.cache_markers({**request, "model": "openai/gpt-4o"}, "https://openrouter.ai/api/v1") is not marked
+    assert stabilizer.cache_markers(request, "https://api.deepseek.com/v1") is request
+
+
+def test_hit_rates_from_each_usage_format():
+    assert cached_tokens({"prompt_tokens": 100, "prompt_tokens_details": {"cached_tokens": 64}}) == 64
+    assert cached_tokens({"prompt_tokens": 100, "prompt_cache_hit_tokens": 32}) == 32
+    assert cached_tokens({"input_tokens": 100, "cache_read_input_tokens": 16}) == 16
+    assert cached_tokens({"prompt_tokens": 100, "prompt_tokens_details": None}) == 0
+
+    stabilizer = PromptPrefixStabilizer(enabled=True)
+    stabilizer.record_usage("openrouter", "s1", {"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 0}})
+    stabilizer.record_usage("openrouter", "s1", {"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 900}})
+    stabilizer.record_usage("deepseek", "s2", {"prompt_tokens": 500, "prompt_cache_hit_tokens": 500})
+
+    stats = stabilizer.stats()
+    assert stats["providers"]["openrouter"] == {
+        "requests": 2,
+        "prompt_tokens": 2000,
+        "cached_tokens": 900,
+        "hit_rate": 0.45,
+    }
+    assert stats["sessions"]["s2"]["hit_rate"] == 1.0
@@ -0,0 +1,127 @@
+"""RequestDeduplicator: ordered expiry, incremental session hashing, in-flight coalescing."""
+
+import asyncio
+
+from src.api.endpoints import RequestDeduplicator
+from src.models.claude import ClaudeMessagesRequest
+
+
+def _request(turns, stream=False):
+    # Append-only conversation, as a client resends it each turn.
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [{"type": "tool_use", "id": f"t{i}", "name": "Read", "input": {}}],
+            }
+        )
+    messages.append({"role": "user", "content": f"question {turns}"})
+    return ClaudeMessagesRequest(
+        model="claude-sonnet-4",
+        max_tokens=1024,
+        stream=stream,
+        metadata={"user_id": "session-a"},
+        messages=messages,
+    )
+
+
+def test_incremental_hash_matches_full_hash():
+    dedup = RequestDeduplicator()
+    dedup._compute_hash(_request(100))
+    incremental = dedup._compute_hash(_request(101))
+    assert incremental == RequestDeduplicator()._compute_hash(_request(101))
+
+
+def test_reused_message_objects_are_not_rehashed(monkeypatch):
+    dedup = RequestDeduplicator()
+    first = _request(100)
+    dedup._compute_hash(first)
+    full = _request(101)
+    expected = RequestDeduplicator()._compute_hash(full)
+    # Next turn as the fast parser builds it: earlier messages are the same objects
+    following = ClaudeMessagesRequest(
+        model=first.model,
+        max_tokens=first.max_tokens,
+        stream=first.stream,
+        metadata=first.metadata,
+        messages=list(first.messages) + full.messages[-2:],
+    )
+    assert following.messages[0] is first.messages[0]
+
+    hashed = []
+    digest = RequestDeduplicator._message_digest
+    monkeypatch.setattr(
+        RequestDeduplicator, "_message_digest", staticmethod(lambda msg: hashed.append(msg) or digest(msg))
+    )
+    assert dedup._compute_hash(following) == expected
+    assert len(hashed) == 2 and all(a is b for a, b in zip(hashed, following.messages[-2:]))
+
+
+def test_rewritten_history_falls_back_to_full_rehash():
+    dedup = RequestDeduplicator()
+    dedup._compute_hash(_request(10))
+    rewritten = _request(12)
+    rewritten.messages[0].content = "compacted summary"
+    assert dedup._compute_hash(rewritten) == RequestDeduplicator()._compute_hash(rewritten)
+
+
+def test_edited_middle_message_changes_the_hash():
+    dedup = RequestDeduplicator()
+    original = dedup._compute_hash(_request(10))
+    edited = _request(10)
+    edited.messages[8].content = "question 4 (edited)"  # first and last untouched
+    assert dedup._compute_hash(edited) != original
+    assert dedup._compute_hash(edited) == RequestDeduplicator()._compute_hash(edited)
+
+
+def test_expiry_pops_stale_entries_from_front(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.api.endpoints.time.monotonic", lambda: now[0])
+    dedup = RequestDeduplicator(window_seconds=10.0)
+    for i in range(5):
+        dedup.check_duplicate(_request(i, stream=True))
+        now[0] += 1.0
+    assert len(dedup._cache) == 5
+    now[0] += 7.5  # entries from t=1000..1002 are now older than the window
+    dedup.check_duplicate(_request(9, stream=True))
+    assert len(dedup._cache) == 3
+
+
+def test_identical_in_flight_requests_share_one_response():
+    async def scenario():
+        dedup = RequestDeduplicator()
+        upstream_calls = 0
+
+        async def handle(request):
+            nonlocal upstream_calls
+            is_dup, request_hash, cached = dedup.check_duplicate(request)
+            if is_dup and isinstance(cached, asyncio.Future):
+                return await dedup.wait_for(cached)
+            try:
+                upstream_calls += 1
+                await asyncio.sleep(0.01)
+                response = {"id": "msg_1", "content": "hi"}
+                dedup.cache_response(request_hash, response)
+                return response
+            finally:
+                dedup.release(request_hash)
+
+        results = await asyncio.gather(*(handle(_request(3)) for _ in range(5)))
+        assert upstream_calls == 1
+        assert all(r == {"id": "msg_1", "content": "hi"} for r in results)
+
+    asyncio.run(scenario())
+
+
+def test_failed_original_releases_waiters():
+    async def scenario():
+        dedup = RequestDeduplicator()
+        _, first_hash, _ = dedup.check_duplicate(_request(2))
+        is_dup, _, pending = dedup.check_duplicate(_request(2))
+        assert is_dup and isinstance(pending, asyncio.Future)
+        dedup.release(first_hash)
+        assert await dedup.wait_for(pending) is None
+
+    asyncio.run(scenario())
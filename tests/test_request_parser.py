@@ -0,0 +1,83 @@
+"""Opt-in raw-body fast path for /v1/messages request parsing."""
+
+import json
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from src.api.request_parser import MessagesRequestParser, parse_messages_request
+from src.models.claude import ClaudeMessagesRequest
+
+
+def _body(turns, **extra):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": f"answer {i}"},
+                    {"type": "tool_use", "id": f"t{i}", "name": "Read", "input": {"path": f"{i}.py"}},
+                ],
+            }
+        )
+    messages.append({"role": "user", "content": f"question {turns}"})
+    return json.dumps(
+        {
+            "model": "claude-sonnet-4",
+            "max_tokens": 1024,
+            "stream": True,
+            "system": [{"type": "text", "text": "You are helpful."}],
+            "tools": [{"name": "Read", "input_schema": {"type": "object"}}],
+            "messages": messages,
+            **extra,
+        }
+    ).encode()
+
+
+def test_fast_parse_matches_full_validation_and_reuses_history():
+    parser = MessagesRequestParser()
+    first = parser.parse(_body(20))
+    assert first == ClaudeMessagesRequest.model_validate_json(_body(20))
+    assert first.model_fields_set == ClaudeMessagesRequest.model_validate_json(_body(20)).model_fields_set
+    assert parser.stats()["validated_messages"] == 41
+
+    second = parser.parse(_body(21))
+    assert second == ClaudeMessagesRequest.model_validate_json(_body(21))
+    # Only the new assistant turn and user question were validated.
+    assert parser.stats()["validated_messages"] == 43
+    assert second.messages[0] is first.messages[0]
+    assert second.tools is first.tools
+
+
+def test_invalid_body_raises_the_full_validation_error():
+    parser = MessagesRequestParser()
+    bad = _body(2, max_tokens="lots")
+    with pytest.raises(ValidationError) as fast:
+        parser.parse(bad)
+    with pytest.raises(ValidationError) as full:
+        ClaudeMessagesRequest.model_validate_json(bad)
+    assert fast.value.errors() == full.value.errors()
+
+    bad_block = json.loads(_body(1))
+    bad_block["messages"][1]["content"][1].pop("id")
+    with pytest.raises(ValidationError):
+        parser.parse(json.dumps(bad_block).encode())
+
+
+def test_dependency_returns_422_with_body_locations():
+    app = FastAPI()
+
+    @app.post("/v1/messages")
+    async def endpoint(request: Annotated[ClaudeMessagesRequest, Depends(parse_messages_request)]):
+        return {"messages": len(request.messages)}
+
+    client = TestClient(app)
+    assert client.post("/v1/messages", content=_body(3)).json() == {"messages": 7}
+    response = client.post("/v1/messages", content=_body(1, max_tokens="lots"))
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "max_tokens"]
@@ -0,0 +1,58 @@
+"""SERVER_PROFILE: core-only deployments never import the optional subsystems, lazy ones
+mount them on the first non-core request, full keeps today's eager behaviour.
+
+Each case imports src.main in a fresh interpreter since the profile is read at import.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import json, sys
+from fastapi.testclient import TestClient
+import src.main as m
+
+before = {"reports": "src.api.reports" in sys.modules, "graphql": "src.api.graphql_schema" in sys.modules}
+client = TestClient(m.app)
+client.get("/v1/models")
+core_hit = {"reports": "src.api.reports" in sys.modules}
+status = client.get("/api/routing-profiles").status_code
+after = {"reports": "src.api.reports" in sys.modules, "graphql": "src.api.graphql_schema" in sys.modules, "status": status}
+last = type(m.app.router.routes[-1]).__name__, getattr(m.app.router.routes[-1], "path", None)
+print("RESULT" + json.dumps({"before": before, "core_hit": core_hit, "after": after, "last": last}))
+"""
+
+
+def _probe(profile: str) -> dict:
+    env = dict(os.environ, SERVER_PROFILE=profile, PYTHONPATH=str(ROOT))
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    line = next(l for l in out.stdout.splitlines() if l.startswith("RESULT"))
+    return json.loads(line[len("RESULT"):])
+
+
+def test_core_profile_never_loads_optional_routers():
+    r = _probe("core")
+    assert r["before"] == {"reports": False, "graphql": False}
+    assert r["after"]["reports"] is False and r["after"]["graphql"] is False
+    assert r["after"]["status"] != 200
+
+
+def test_lazy_profile_mounts_on_first_non_core_request():
+    r = _probe("lazy")
+    assert r["before"] == {"reports": False, "graphql": False}
+    assert r["core_hit"]["reports"] is False
+    assert r["after"] == {"reports": True, "graphql": True, "status": 200}
+    # UI fallback routes stay behind the lazily mounted routers
+    assert r["last"] == ["APIRoute", "/settings-legacy"]
+
+
+def test_full_profile_mounts_everything_at_import():
+    r = _probe("full")
+    assert r["before"] == {"reports": True, "graphql": True}
+    assert r["after"]["status"] == 200
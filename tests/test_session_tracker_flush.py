@@ -0,0 +1,52 @@
+"""Dirty-only, batched flushing of session metrics."""
+
+import asyncio
+import sqlite3
+
+from src.services.metrics.session_tracker import SessionMetricsTracker
+
+
+def _tracker(db_path) -> SessionMetricsTracker:
+    async def create():
+        tracker = SessionMetricsTracker(db_path=str(db_path))
+        tracker._cleanup_task.cancel()
+        tracker._flush_task.cancel()
+        return tracker
+
+    return asyncio.run(create())
+
+
+def _rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT session_id, requests FROM session_metrics").fetchall())
+
+
+def test_only_changed_sessions_are_written(tmp_path):
+    db = tmp_path / "usage.db"
+    tracker = _tracker(db)
+    for i in range(500):
+        tracker.record_request(f"s{i}", "gpt-4o", input_tokens=10, output_tokens=5)
+
+    assert tracker._flush_to_database() == 500
+    assert tracker._flush_to_database() == 0
+
+    tracker.record_request("s1", "gpt-4o")
+    tracker.record_tool_call("s2", "Bash", success=False)
+    tracker.record_cache_usage("s3", cache_hit=True)
+    assert tracker._flush_to_database() == 3
+    rows = _rows(db)
+    assert len(rows) == 500 and rows["s1"] == 2 and rows["s0"] == 1
+
+    tracker.record_request("s4", "gpt-4o")
+    tracker.stop()  # final flush, then the connection is closed
+    assert _rows(db)["s4"] == 2 and tracker._conn is None
+
+
+def test_failed_flush_keeps_rows_pending(tmp_path):
+    tracker = _tracker(tmp_path / "missing-dir" / "usage.db")
+    tracker.record_request("s1", "gpt-4o")
+    assert tracker._flush_to_database() == 0
+    assert tracker._dirty == {"s1"}
+
+    tracker.db_path = str(tmp_path / "usage.db")
+    assert tracker._flush_to_database() == 1
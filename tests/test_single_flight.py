@@ -0,0 +1,248 @@
+"""Single-flight coalescing of identical concurrent upstream calls."""
+
+import asyncio
+import json
+
+from src.services.single_flight import SingleFlight
+
+REQUEST = {
+    "model": "openai/gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Summarize this conversation in 5 words"}],
+    "max_tokens": 32,
+    "temperature": 0,
+}
+
+
+def test_key_ignores_internal_fields_but_not_scope():
+    sf = SingleFlight()
+    tagged = {**REQUEST, "_session_fingerprint": "abc", "stream_options": {"include_usage": True}}
+    assert sf.key(REQUEST) == sf.key(tagged)
+    assert sf.key(REQUEST, "small") != sf.key(REQUEST, "big")
+    assert sf.key(REQUEST) != sf.key({**REQUEST, "temperature": 1})
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"choices": [], "usage": {"prompt_tokens": 90, "completion_tokens": 10}}
+
+        key = sf.key(REQUEST)
+        results = await asyncio.gather(*(sf.call(key, upstream) for _ in range(4)))
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+        assert results[1] is not results[0]  # followers get their own copy
+        stats = sf.stats()
+        assert stats["coalesced_calls"] == 3
+        assert stats["saved_tokens"] == 300
+        assert stats["in_flight_calls"] == 0
+
+        # Released once finished: the next call goes upstream again.
+        await sf.call(key, upstream)
+        assert calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_upstream_error_is_shared_by_waiters():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("429 rate limited")
+
+        key = sf.key(REQUEST)
+        results = await asyncio.gather(
+            *(sf.call(key, upstream) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    asyncio.run(scenario())
+
+
+def _sse(i):
+    return "data: " + json.dumps({"choices": [{"delta": {"content": str(i)}}], "usage": None})
+
+
+def test_stream_is_teed_with_replay_for_late_joiners():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        opened = 0
+        gate = asyncio.Event()
+
+        async def upstream():
+            nonlocal opened
+            opened += 1
+            for i in range(3):
+                yield _sse(i)
+            await gate.wait()
+            yield "data: " + json.dumps(
+                {"choices": [], "usage": {"prompt_tokens": 40, "completion_tokens": 2}}
+            )
+            yield "data: [DONE]"
+
+        key = sf.key(REQUEST, "stream")
+        first = sf.stream(key, upstream)
+        received_first = [await first.__anext__() for _ in range(3)]
+
+        late = sf.stream(key, upstream)
+        received_late = [await late.__anext__() for _ in range(3)]
+        assert received_late == received_first  # replayed
+
+        gate.set()
+        received_first += [c async for c in first]
+        received_late += [c async for c in late]
+        assert opened == 1
+        assert received_first == received_late
+        assert received_first[-1] == "data: [DONE]"
+        assert sf.stats()["saved_tokens"] == 42
+        assert sf.stats()["in_flight_streams"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_upstream_closed_when_last_subscriber_leaves():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        closed = asyncio.Event()
+
+        async def upstream():
+            try:
+                yield _sse(0)
+                await asyncio.sleep(10)
+                yield _sse(1)
+            finally:
+                closed.set()
+
+        stream = sf.stream(sf.key(REQUEST), upstream)
+        assert await stream.__anext__() == _sse(0)
+        await stream.aclose()
+        await asyncio.wait_for(closed.wait(), 1)
+
+    asyncio.run(scenario())
+
+
+def test_disabled_passes_through():
+    async def scenario():
+        sf = SingleFlight(enabled=False)
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {}
+
+        await asyncio.gather(*(sf.call("k", upstream) for _ in range(3)))
+        assert calls == 3
+
+    asyncio.run(scenario())
+
+
+
+class _CancellableClient:
+    """Registers upstream calls by request id, like OpenAIClient.active_requests."""
+
+    def __init__(self):
+        self.active_requests = {}
+
+    def cancel_request(self, request_id):
+        if request_id in self.active_requests:
+            self.active_requests[request_id].set()
+
+    async def stream(self, request_id, gate):
+        cancel = self.active_requests[request_id] = asyncio.Event()
+        for i in range(4):
+            if i == 2:
+                await gate.wait()
+            if cancel.is_set():
+                raise RuntimeError("Request cancelled by client")
+            yield _sse(i)
+
+
+def test_leader_disconnect_does_not_cancel_shared_stream_for_follower():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        client = _CancellableClient()
+        gate = asyncio.Event()
+        key = sf.key(REQUEST, "stream")
+
+        leader = sf.stream(key, lambda: client.stream(sf.shared_request_id("req-leader"), gate))
+        assert await leader.__anext__() == _sse(0)
+        follower = sf.stream(key, lambda: client.stream(sf.shared_request_id("req-follower"), gate))
+        assert await follower.__anext__() == _sse(0)
+
+        # Leader's client goes away mid-stream: the converter cancels its own id and closes.
+        client.cancel_request("req-leader")
+        await leader.aclose()
+        gate.set()
+
+        rest = [c async for c in follower]
+        assert rest == [_sse(1), _sse(2), _sse(3)]
+
+    asyncio.run(scenario())
+
+
+def test_leader_cancelled_call_keeps_running_for_follower():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        calls = 0
+
+        async def upstream():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"choices": ["ok"]}
+
+        key = sf.key(REQUEST)
+        leader = asyncio.create_task(sf.call(key, upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(sf.call(key, upstream))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == {"choices": ["ok"]}
+        assert calls == 1
+        assert leader.cancelled()
+
+    asyncio.run(scenario())
+
+
+def test_call_cancelled_when_every_caller_leaves():
+    async def scenario():
+        sf = SingleFlight(enabled=True)
+        cancelled = asyncio.Event()
+
+        async def upstream():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(sf.call(sf.key(REQUEST), upstream))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert sf.stats()["in_flight_calls"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_endpoint_key_scopes_by_upstream_and_assignment():
+    from types import SimpleNamespace
+
+    from src.api.endpoints import _coalesce_key
+
+    client = SimpleNamespace(default_base_url="https://openrouter.ai/api/v1")
+    base = _coalesce_key(REQUEST, "call", "", "pass", "https://openrouter.ai/api/v1", client, None)
+    assert base == _coalesce_key(REQUEST, "call", "", "pass", "https://openrouter.ai/api/v1", client, None)
+    assert base != _coalesce_key(REQUEST, "call", "", "pass", "http://127.0.0.1:8317/v1", client, None)
+    assert base != _coalesce_key(REQUEST, "call", "", "pass", "https://openrouter.ai/api/v1", client, "coding")
+    bypass = SimpleNamespace(default_base_url="https://api.openai.com/v1")
+    assert base != _coalesce_key(REQUEST, "call", "", "pass", "https://openrouter.ai/api/v1", bypass, None)
@@ -0,0 +1,89 @@
+"""Per-stage latency histograms (proxy_stage_duration_seconds) and their off switch."""
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from src.api import metrics_api as M
+from src.core import stage_timing as T
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _count(stage):
+    return M.REGISTRY.get_sample_value("proxy_stage_duration_seconds_count", {"stage": stage}) or 0
+
+
+def _sum(stage):
+    return M.REGISTRY.get_sample_value("proxy_stage_duration_seconds_sum", {"stage": stage}) or 0
+
+
+def test_observe_stage_records_and_is_exposed():
+    before = _count("conversion")
+    start = T.stage_start()
+    T.observe_stage("conversion", start)
+    assert _count("conversion") == before + 1
+    assert b'proxy_stage_duration_seconds_bucket{le="0.0001",stage="conversion"}' in M.generate_latest(M.REGISTRY)
+
+
+def test_disabled_stage_metrics_record_nothing(monkeypatch):
+    monkeypatch.setattr(T, "STAGE_METRICS", False)
+    before = _count("token_count")
+    start = T.stage_start()
+    T.observe_stage("token_count", start)
+    assert start == 0.0 and _count("token_count") == before
+
+    upstream = object()
+    assert T.time_stream_translation(upstream, lambda s: ("translated", s)) == ("translated", upstream)
+
+
+def test_stream_translation_excludes_upstream_and_consumer_time():
+    async def upstream():
+        for i in range(5):
+            await asyncio.sleep(0.02)  # network wait
+            yield f"chunk {i}"
+
+    async def translate(stream):
+        async for chunk in stream:
+            deadline = time.perf_counter() + 0.002  # translator work
+            while time.perf_counter() < deadline:
+                pass
+            yield chunk.upper()
+            yield "ping"
+
+    async def consume():
+        out = []
+        async for event in T.time_stream_translation(upstream(), translate):
+            await asyncio.sleep(0.01)  # client socket write
+            out.append(event)
+        return out
+
+    count, total = _count("stream_translate"), _sum("stream_translate")
+    out = asyncio.run(consume())
+    assert out[0] == "CHUNK 0" and len(out) == 10
+    assert _count("stream_translate") == count + 5
+    observed = _sum("stream_translate") - total
+    assert 0.009 < observed < 0.05  # ~5 × 2 ms, not the 100 ms upstream or 100 ms consumer time
+
+
+def test_config_snapshot_dependency_is_timed():
+    from src.api.endpoints import config_snapshot_dep
+
+    async def run():
+        gen = config_snapshot_dep()
+        await gen.__anext__()
+        await gen.aclose()
+
+    before = _count("config_snapshot")
+    asyncio.run(run())
+    assert _count("config_snapshot") == before + 1
+
+
+def test_core_timing_does_not_load_the_metrics_layer():
+    probe = (
+        "import sys, src.core.client, src.api.request_parser\n"
+        "print(sorted(m for m in sys.modules if m == 'src.api.metrics_api' or m.startswith('prometheus_client')))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,91 @@
+"""Incremental tokenizer for streamed tool-call arguments."""
+
+import asyncio
+import json
+
+from src.models.claude import ClaudeMessagesRequest
+from src.services.conversion.response_converter import convert_openai_streaming_to_claude
+from src.services.conversion.streaming_json import tool_args_stream
+
+
+def _feed(tool_name, fragments):
+    stream = tool_args_stream(tool_name)
+    return "".join(stream.feed(f) for f in fragments), stream
+
+
+def test_rewrites_keys_and_numbers_split_across_fragments():
+    text, stream = _feed(
+        "Bash",
+        ['{"pro', 'mpt": "echo \\"hi\\"', ' \\\\', 'n", "time', 'out": "1', '20"}'],
+    )
+    assert json.loads(text) == {"command": 'echo "hi" \\n', "timeout": 120}
+    # The decoded object is what the upstream sent, for argument-style learning.
+    assert stream.value() == {"prompt": 'echo "hi" \\n', "timeout": "120"}
+
+
+def test_other_tools_and_nested_values_pass_through():
+    fragments = [
+        '{"file_path": "/a.py", "edits": [{"old',
+        '_string": "{[", "new_string": "]}"}], "n": 1.5',
+        "}",
+    ]
+    text, stream = _feed("MultiEdit", fragments)
+    assert text == "".join(fragments)
+    assert stream.value() == json.loads(text)
+
+    text, stream = _feed("Read", ['{"limit": "abc", "offset": "', '10"}'])
+    assert json.loads(text) == {"limit": "abc", "offset": 10}
+
+
+def test_malformed_input_falls_back_to_passthrough():
+    text, stream = _feed("Bash", ['{"prompt" ', "oops", ', "x": 1}'])
+    assert text == '{"command" oops, "x": 1}'
+    assert stream.value() is None
+    assert stream.raw() == '{"prompt" oops, "x": 1}'
+
+    text, stream = _feed("Bash", ["[1, 2]"])
+    assert (text, stream.value()) == ("[1, 2]", None)
+
+
+def test_streaming_converter_emits_rewritten_deltas():
+    def chunk(delta, finish=None):
+        return "data: " + json.dumps({"choices": [{"delta": delta, "finish_reason": finish}]})
+
+    def call(arguments):
+        return {"tool_calls": [{"index": 0, "function": {"arguments": arguments}}]}
+
+    start = {"tool_calls": [{"index": 0, "id": "call_1", "function": {"name": "Bash", "arguments": ""}}]}
+    lines = [
+        chunk(start),
+        chunk(call('{"prom')),
+        chunk(call('pt": "ls", "timeout": "')),
+        chunk(call('30"}')),
+        chunk({}, finish="tool_calls"),
+        "data: [DONE]",
+    ]
+
+    async def stream():
+        for line in lines:
+            yield line
+
+    async def scenario():
+        request = ClaudeMessagesRequest(
+            model="claude-sonnet-4", max_tokens=100, messages=[{"role": "user", "content": "hi"}]
+        )
+        return [
+            event
+            async for event in convert_openai_streaming_to_claude(stream(), request, _Logger(), "openai")
+        ]
+
+    events = asyncio.run(scenario())
+    partials = [
+        json.loads(e.split("data: ", 1)[1])["delta"]["partial_json"]
+        for e in events
+        if '"input_json_delta"' in e
+    ]
+    assert json.loads("".join(partials)) == {"command": "ls", "timeout": 30}
+
+
+class _Logger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
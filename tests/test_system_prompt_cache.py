@@ -0,0 +1,51 @@
+"""Cached, change-aware system prompt file loading."""
+
+import os
+
+import pytest
+
+from src.services.prompts import system_prompt_loader as loader
+
+
+@pytest.fixture
+def prompt_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "_BASE_DIR", tmp_path.resolve())
+    loader.clear_prompt_cache()
+    yield tmp_path / "prompt.txt"
+    loader.clear_prompt_cache()
+
+
+def test_file_is_read_once_until_it_changes(prompt_file, monkeypatch):
+    prompt_file.write_text("You are a careful reviewer.\n")
+    reads = []
+    real_open = open
+    monkeypatch.setattr(loader, "open", lambda *a, **k: reads.append(a[0]) or real_open(*a, **k), raising=False)
+
+    source = f"path:{prompt_file}"
+    assert loader.load_system_prompt(source) == "You are a careful reviewer."
+    assert loader.load_system_prompt(source) == "You are a careful reviewer."
+    assert len(reads) == 1
+
+    prompt_file.write_text("You are a terse reviewer.")
+    st = prompt_file.stat()
+    os.utime(prompt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert loader.load_system_prompt(source) == "You are a terse reviewer."
+    assert len(reads) == 2
+
+
+def test_invalid_and_missing_files_are_not_cached(prompt_file):
+    source = f"path:{prompt_file}"
+    prompt_file.write_text("x")
+    with pytest.raises(RuntimeError, match="too short"):
+        loader.load_system_prompt(source)
+    prompt_file.write_text("long enough now")
+    assert loader.load_system_prompt(source) == "long enough now"
+
+    prompt_file.unlink()
+    with pytest.raises(FileNotFoundError):
+        loader.load_system_prompt(source)
+
+
+def test_paths_outside_the_project_are_rejected():
+    with pytest.raises(loader.SecurityError):
+        loader.load_system_prompt("path:/etc/hostname")
@@ -0,0 +1,57 @@
+"""Resumable extraction of text-markup tool calls and JSON spans."""
+
+import json
+import random
+
+from src.core.json_detector import JSONDetector, iter_json_values
+from src.services.conversion.text_tool_calls import TextToolCallScanner
+
+_REPLY = (
+    "Let me check. <TOOL_CALL><function=\"bash\"><parameters>{\"command\": \"ls </tool\"}"
+    "</parameters></tool_call> then <tool_call><function name=\"Read\">"
+    "{\"file_path\": \"a.py\"}</tool_call><tool_call>not a call</tool_call> done <tool_c"
+)
+
+
+def test_scanner_matches_one_shot_for_any_chunking():
+    whole = TextToolCallScanner()
+    expected = whole.feed(_REPLY)
+    assert expected == [
+        {"name": "bash", "arguments": {"command": "ls </tool"}},
+        {"name": "Read", "arguments": {"file_path": "a.py"}},
+    ]
+    assert whole.remaining() == "Let me check.  then <tool_call>not a call</tool_call> done <tool_c"
+
+    rng = random.Random(7)
+    for _ in range(200):
+        scanner = TextToolCallScanner()
+        calls, pos = [], 0
+        while pos < len(_REPLY):
+            step = rng.randint(1, 15)
+            calls += scanner.feed(_REPLY[pos : pos + step])
+            pos += step
+        assert calls == expected
+        assert scanner.remaining() == whole.remaining()
+        assert scanner.text() == _REPLY
+
+
+def test_json_values_found_at_any_depth_in_one_pass():
+    nested = {"a": {"b": {"c": {"d": list(range(40))}}}}
+    text = f"see {{ stray and {json.dumps(nested)} plus [1, 2 and " + "{ " * 1000
+    values = list(iter_json_values(text, min_size=50))
+    assert [value for _, _, value in values] == [nested]
+
+    has_json, total, objects = JSONDetector.detect_json_in_text(text)
+    assert has_json and total == len(json.dumps(nested))
+    assert objects == [{"size": total, "type": "object", "depth": 5}]
+
+
+def test_valid_json_inside_a_malformed_outer_value_is_found():
+    inner = {"rows": [{"id": i, "name": f"item-{i}"} for i in range(12)]}
+    inner_text = json.dumps(inner)
+    text = 'log: {"partial": ' + inner_text + " junk"
+    assert [value for _, _, value in iter_json_values(text, min_size=100)] == [inner]
+
+    has_json, total, objects = JSONDetector.detect_json_in_text(text)
+    assert has_json and total == len(inner_text)
+    assert objects[0]["type"] == "object"
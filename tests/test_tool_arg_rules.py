@@ -0,0 +1,41 @@
+"""Compiled tool-argument rules against a golden corpus of tool calls.
+
+``fixtures/tool_calls/golden_normalization.json`` holds tool calls as models
+emit them (wrong parameter names, string-typed integers, aliased tool names)
+for every provider normalization level, with the output of the original
+if-chain normalizer.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services.conversion.response_converter import normalize_tool_arguments
+from src.services.conversion.tool_arg_rules import ToolArgumentNormalizer
+
+_CORPUS = json.loads(
+    (Path(__file__).parent / "fixtures" / "tool_calls" / "golden_normalization.json").read_text()
+)
+
+
+@pytest.mark.parametrize(
+    "case", _CORPUS, ids=[f"{c['provider']}-{c['tool']}-{i}" for i, c in enumerate(_CORPUS)]
+)
+def test_golden_corpus(case):
+    result = normalize_tool_arguments(case["tool"], copy.deepcopy(case["arguments"]), case["provider"])
+    assert result == case["expected"]
+    assert list(result) == list(case["expected"])
+
+
+def test_rules_compile_to_one_normalizer_per_tool():
+    normalizer = ToolArgumentNormalizer(
+        {"bash": [("rename", "command", ("prompt", "cmd")), ("int", ("timeout",))]}
+    )
+    assert normalizer("BASH", {"cmd": "ls", "timeout": "5"}) == {"timeout": 5, "command": "ls"}
+    assert normalizer.lookup("Bash") is normalizer.lookup("bash")
+    assert normalizer.lookup("Grep") is None
+
+    with pytest.raises(ValueError):
+        ToolArgumentNormalizer({"bash": [("rewrite", "command")]})
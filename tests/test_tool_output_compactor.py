@@ -0,0 +1,79 @@
+"""Content-aware compaction of old tool results."""
+
+from src.services.conversion.tool_output_compactor import SeenLines, ToolOutputCompactor, compact_text
+
+
+def _read(lines, start=1):
+    return "\n".join(f"{n:>6}→{line}" for n, line in enumerate(lines, start))
+
+
+_FILE = [f"def handler_{i}(request):\n    return respond({i})" for i in range(60)]
+_FILE_LINES = "\n".join(_FILE).split("\n")
+
+
+def _turn(i, result):
+    return [
+        {"role": "assistant", "content": None, "tool_calls": [{"id": f"call_{i}", "type": "function"}]},
+        {"role": "tool", "tool_call_id": f"call_{i}", "content": result},
+    ]
+
+
+def _session(results, recent=4):
+    messages = [{"role": "user", "content": "fix the handlers"}]
+    for i, result in enumerate(results + ["ok"] * recent):
+        messages += _turn(i, result)
+    return messages
+
+
+def test_old_results_are_compacted_and_recent_turns_kept():
+    edited = list(_FILE_LINES)
+    edited[70] = "    return respond(-1)"
+    log = "\n".join(["collecting ..."] + ["PASSED"] * 200 + ["200 passed"])
+    messages = _session([_read(_FILE_LINES), _read(_FILE_LINES), _read(edited), log])
+    originals = [m.get("content") for m in messages]
+
+    report = ToolOutputCompactor(enabled=True, keep_recent=4, min_chars=100).compact(messages)
+
+    tool = [m["content"] for m in messages if m["role"] == "tool"]
+    assert tool[0] == originals[2]  # first read is kept
+    assert tool[1] == "[identical to the earlier result of tool call call_0]"
+    assert tool[2].split("\n") == [
+        "[... lines 1-70 unchanged, shown earlier ...]",
+        "    71→    return respond(-1)",
+        "[... lines 72-120 unchanged, shown earlier ...]",
+    ]
+    assert tool[3] == "collecting ...\nPASSED\n[previous line repeated 199 more times]\n200 passed"
+    assert tool[4:] == ["ok"] * 4
+    assert (report["compacted"], report["deduplicated"]) == (3, 1)
+    assert report["chars_saved"] == sum(map(len, originals[2::2][:4])) - sum(map(len, tool[:4]))
+
+
+def test_compaction_is_stable_and_memoized_across_requests():
+    compactor = ToolOutputCompactor(enabled=True, keep_recent=2, min_chars=100)
+    results = [_read(_FILE_LINES[:60]), _read(_FILE_LINES[30:], 31), _read(_FILE_LINES)]
+    first = _session(results, recent=2)
+    compactor.compact(first)
+    second = _session(results, recent=3)  # one more turn on the next request
+    compactor.compact(second)
+
+    assert [m["content"] for m in second[: len(first) - 4]] == [m["content"] for m in first[: len(first) - 4]]
+    assert compactor.stats()["memo_hits"] >= 2
+
+
+def test_short_unseen_runs_are_kept():
+    text = "\n".join(f"line {i}" for i in range(20))
+    assert compact_text(text, SeenLines()) == text
+
+
+def test_runs_stitched_from_different_results_are_kept():
+    # Every 4-line window of the block appeared earlier, but never the block as a whole.
+    block = [f"line {i}" for i in range(16)]
+    seen = SeenLines()
+    seen.add(block[:6] + ["other a"])
+    seen.add(["other b"] + block[3:11])
+    seen.add(block[8:] + ["other c"])
+    text = "\n".join(block)
+    assert compact_text(text, seen) == text
+
+    seen.add(["x"] + block + ["y"])
+    assert compact_text(text, seen) == "[... 16 lines unchanged, shown earlier ...]"
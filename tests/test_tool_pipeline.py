@@ -0,0 +1,63 @@
+"""Memoized tool-declaration pipeline keyed by tool-set hash."""
+
+from src.models.claude import ClaudeTool
+from src.services.conversion.request_converter import _build_openai_tools
+from src.services.tools.tool_pipeline import ToolPipelineCache
+
+
+def _tools(description="Run a shell command"):
+    return [
+        ClaudeTool(
+            name="Bash",
+            description=description,
+            input_schema={
+                "type": "object",
+                "properties": {"command": {"type": "string", "default": ""}},
+                "required": ["command"],
+                "additionalProperties": False,
+            },
+        ),
+        ClaudeTool(name="Read", input_schema={"type": "object", "properties": {}}),
+    ]
+
+
+def _build(calls, strict=False):
+    def build(tools):
+        calls.append(len(tools))
+        return _build_openai_tools(tools, strict)
+
+    return build
+
+
+def test_same_tool_set_built_once_per_variant():
+    cache = ToolPipelineCache(enabled=True)
+    calls = []
+    first = cache.openai_tools(_tools(), False, _build(calls))
+    # A new request carries equal but distinct tool objects.
+    second = cache.openai_tools(_tools(), False, _build(calls))
+    assert calls == [2]
+    assert first == second == _build_openai_tools(_tools(), False)
+    assert "additionalProperties" not in first[0]["function"]["parameters"]
+
+    strict = cache.openai_tools(_tools(), True, _build(calls, strict=True))
+    assert calls == [2, 2]
+    assert strict[0]["function"]["parameters"]["additionalProperties"] is False
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["tool_sets"]) == (1, 2, 1)
+
+
+def test_changed_tools_miss_and_token_count_is_memoized(monkeypatch):
+    cache = ToolPipelineCache(enabled=True)
+    calls = []
+    cache.openai_tools(_tools(), False, _build(calls))
+    cache.openai_tools(_tools("Run a command in bash"), False, _build(calls))
+    assert calls == [2, 2]
+
+    counted = []
+    monkeypatch.setattr(
+        "src.services.token_cache.count_tokens", lambda text: counted.append(text) or 7
+    )
+    assert cache.token_count(_tools()) == 7
+    assert cache.token_count(_tools()) == 7
+    assert len(counted) == 1
@@ -0,0 +1,109 @@
+"""Background VibeProxy health monitoring against a toggling local endpoint."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core import client as client_module
+from src.core.circuit_breaker import CircuitState
+from src.services import antigravity
+
+
+class _FakeVibeProxy(BaseHTTPRequestHandler):
+    up = True
+
+    def do_GET(self):
+        time.sleep(0.1)  # a slow probe: any request that waited on it would show
+        self.send_response(200 if type(self).up else 503)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeVibeProxy)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _FakeVibeProxy.up = True
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    client_module._circuit_breakers.pop("vibeproxy-test", None)
+
+
+def test_requests_read_state_while_endpoint_toggles(fake_endpoint, monkeypatch):
+    monitor = antigravity.VibeProxyHealthMonitor(fake_endpoint, interval=0.05, breaker_name="vibeproxy-test")
+    monkeypatch.setattr(antigravity, "vibeproxy_monitor", monitor)
+    monkeypatch.setattr(antigravity, "check_vibeproxy_health", lambda *a, **k: pytest.fail("inline probe"))
+
+    async def scenario():
+        reads = []
+        seen = set()
+
+        async def read_for(seconds):
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                start = time.perf_counter()
+                available, _ = antigravity.read_vibeproxy_health()  # starts the monitor on first use
+                reads.append(time.perf_counter() - start)
+                seen.add(available)
+                await asyncio.sleep(0.01)
+
+        await read_for(0.4)
+        assert monitor.available is True
+        _FakeVibeProxy.up = False
+        await read_for(0.5)
+        assert monitor.available is False and monitor.error == "Status 503"
+        breaker = client_module._circuit_breakers["vibeproxy-test"]
+        assert breaker.state == CircuitState.OPEN
+        _FakeVibeProxy.up = True
+        await read_for(0.5)
+        await monitor.stop()
+        return reads, seen, breaker
+
+    reads, seen, breaker = asyncio.run(scenario())
+    assert seen == {True, False}
+    assert monitor.transitions == 3  # unknown → up → down → up
+    assert breaker.state == CircuitState.CLOSED
+    assert max(reads) < 0.02  # no read ever waited on a 100 ms probe
+    assert not monitor.running
+
+
+def test_without_event_loop_falls_back_to_cached_check(monkeypatch):
+    monitor = antigravity.VibeProxyHealthMonitor("http://127.0.0.1:9", interval=0.05)
+    monkeypatch.setattr(antigravity, "vibeproxy_monitor", monitor)
+    monkeypatch.setattr(antigravity, "check_vibeproxy_health", lambda *a, **k: (False, "down"))
+    assert antigravity.read_vibeproxy_health() == (False, "down")
+    assert not monitor.running
+
+
+def test_vibeproxy_tier_models_follow_tier_endpoints():
+    cfg = SimpleNamespace(
+        openai_base_url="https://openrouter.ai/api/v1",
+        big_model="gemini-2.5-pro", big_endpoint="http://127.0.0.1:8317/v1", big_enabled=True,
+        middle_model="gpt-4o", middle_endpoint="", middle_enabled=True,
+        small_model="gemini-2.5-flash", small_endpoint="http://localhost:8317/v1", small_enabled=False,
+    )
+    assert antigravity.vibeproxy_tier_models(cfg) == ["gemini-2.5-pro"]
+    cfg.openai_base_url = "http://127.0.0.1:8317/v1"
+    assert antigravity.vibeproxy_tier_models(cfg) == ["gemini-2.5-pro", "gpt-4o", "gemini-2.5-flash"]
+
+
+def test_transitions_drive_the_breakers_the_cascade_checks(monkeypatch):
+    model = "vibeproxy-tier-test"
+    monkeypatch.setattr(antigravity, "vibeproxy_tier_models", lambda cfg=None: [model])
+    monitor = antigravity.VibeProxyHealthMonitor("http://127.0.0.1:9", interval=0)
+    try:
+        monitor._apply(False, "down")
+        assert client_module._is_cb_open(model)
+        assert "vibeproxy" not in client_module._circuit_breakers
+        monitor._apply(True, None)
+        assert not client_module._is_cb_open(model)
+    finally:
+        client_module._circuit_breakers.pop(model, None)
@@ -0,0 +1,121 @@
+"""WebSocket fan-out hub: per-client queues, drop-oldest, coalescing, topics."""
+
+import asyncio
+import json
+
+from src.api.websocket_hub import FanoutHub
+
+
+class _FakeSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame):
+        if self.fail:
+            raise RuntimeError("client gone")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(frame)
+
+
+async def _drain():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_slow_client_does_not_delay_fast_client():
+    async def scenario():
+        hub = FanoutHub("test")
+        fast, slow = _FakeSocket(), _FakeSocket(delay=10)
+        await hub.connect(fast)
+        await hub.connect(slow)
+        for i in range(50):
+            assert hub.publish({"i": i}) == 2
+        await _drain()
+        assert [json.loads(f)["i"] for f in fast.frames] == list(range(50))
+        assert slow.frames == []
+        hub.disconnect(fast)
+        hub.disconnect(slow)
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_drops_oldest_and_coalesces_by_key():
+    async def scenario():
+        hub = FanoutHub("test", max_queue=3)
+        ws = _FakeSocket()
+        sub = hub.attach(ws)  # sender task not run until we yield
+        for i in range(5):
+            hub.publish({"log": i})
+        for i in range(4):
+            hub.publish({"metrics": i}, coalesce_key="metrics")
+        await _drain()
+        frames = [json.loads(f) for f in ws.frames]
+        assert frames == [{"log": 3}, {"log": 4}, {"metrics": 3}]
+        stats = sub.stats()
+        assert stats["dropped"] == 3
+        assert stats["coalesced"] == 3
+        assert stats["sent"] == 3
+        hub.disconnect(ws)
+
+    asyncio.run(scenario())
+
+
+def test_topic_filter_serialize_once_and_failed_client_removed():
+    async def scenario():
+        hub = FanoutHub("test")
+        cascade_only, everything, broken = _FakeSocket(), _FakeSocket(), _FakeSocket(fail=True)
+        await hub.connect(cascade_only, topics={"cascade"})
+        await hub.connect(everything)
+        await hub.connect(broken)
+        assert hub.publish({"m": "log"}, topic="log") == 2
+        assert hub.publish({"m": "switch"}, topic="cascade") == 3
+        await _drain()
+        assert cascade_only.frames == ['{"m": "switch"}']
+        assert everything.frames == ['{"m": "log"}', '{"m": "switch"}']
+        # Same string object handed to every client.
+        assert everything.frames[1] is cascade_only.frames[0]
+        assert hub.client_count == 2
+        assert hub.stats()["published"] == 2
+        hub.disconnect(cascade_only)
+        hub.disconnect(everything)
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_another_thread_while_clients_churn():
+    import threading
+
+    async def scenario():
+        hub = FanoutHub("test")
+        keeper = _FakeSocket()
+        await hub.connect(keeper)
+        stop = threading.Event()
+        errors = []
+
+        def producer():
+            try:
+                while not stop.is_set():
+                    hub.publish({"tick": 1})
+            except Exception as e:  # "dictionary changed size during iteration"
+                errors.append(e)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        for _ in range(300):
+            ws = _FakeSocket()
+            await hub.connect(ws)
+            await asyncio.sleep(0)
+            hub.disconnect(ws)
+        stop.set()
+        thread.join()
+        await _drain()
+        assert errors == []
+        assert keeper.frames
+
+    asyncio.run(scenario())